@@ -0,0 +1,70 @@
+"""Rolling completion-rate analytics for 200 habits × 3 years of history.
+
+Usage: python -m benchmarks.bench_analytics [habits]
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+
+from daily_event.domain.models import DailyCompletion, DailyEvent
+from daily_event.infra.database import Database
+from daily_event.services import analytics
+from daily_event.services.daily_event_service import DailyEventService
+
+
+def _time(fn, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best * 1000
+
+
+def main(habits: int = 200) -> None:
+    today = date.today()
+    db = Database(os.path.join(tempfile.mkdtemp(), "bench.db"))
+    rng = random.Random(1)
+    rules = ["daily", "workday", "weekdays:0,2,4", "every:2d"]
+    with db.session_scope() as session:
+        events = [
+            DailyEvent(
+                title=f"habit {i}",
+                recurrence_rule=rules[i % len(rules)],
+                created_at=datetime.combine(today - timedelta(3 * 365), datetime.min.time()),
+            )
+            for i in range(habits)
+        ]
+        session.add_all(events)
+        session.flush()
+        session.add_all(
+            DailyCompletion(event_id=ev.id, completed_date=today - timedelta(k))
+            for ev in events
+            for k in range(3 * 365)
+            if rng.random() < 0.6
+        )
+    service = DailyEventService(db)
+
+    def uncached():
+        service._cache.clear()
+        service.get_trends(today)
+
+    print(f"{habits} habits: get_trends {_time(uncached):.1f} ms (cached {_time(lambda: service.get_trends(today)):.3f} ms)")
+
+    done_rows = [[rng.random() < 0.6 for _ in range(analytics.SPAN_DAYS)] for _ in range(habits)]
+    due_rows = [[1] * analytics.SPAN_DAYS for _ in range(habits)]
+    py_ms = _time(lambda: analytics.compute_trends(done_rows, due_rows, use_numpy=False))
+    print(f"  compute_trends python {py_ms:.2f} ms")
+    if analytics.HAVE_NUMPY:
+        np_ms = _time(lambda: analytics.compute_trends(done_rows, due_rows, use_numpy=True))
+        print(f"  compute_trends numpy  {np_ms:.2f} ms")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:2]))
@@ -0,0 +1,81 @@
+"""Month load with N old completed events in work_events vs after archiving them.
+
+Usage: python -m benchmarks.bench_archive [completed]
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import insert
+
+from daily_event.domain.models import WorkEvent
+from daily_event.infra.color_allocator import ColorAllocator
+from daily_event.infra.database import Database
+from daily_event.services.work_archive import WorkArchiver
+from daily_event.services.work_event_service import WorkEventService
+
+
+def _ms(fn, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, (time.perf_counter() - t0) * 1000)
+    return best
+
+
+def main(completed: int = 1_000_000) -> None:
+    db = Database(os.path.join(tempfile.mkdtemp(), "bench.db"))
+    now = datetime(2026, 6, 15, 12, 0)
+    base = date(2016, 1, 1)
+    with db.session_scope() as session:
+        session.execute(
+            insert(WorkEvent),
+            [
+                {
+                    "title": f"done {i}",
+                    "start_date": base + timedelta(days=i % 3650),
+                    "end_date": base + timedelta(days=i % 3650 + 2),
+                    "is_completed": True,
+                    "completed_at": datetime(2016, 1, 1) + timedelta(minutes=4 * i),
+                    "created_at": now,
+                }
+                for i in range(completed)
+            ],
+        )
+        session.execute(
+            insert(WorkEvent),
+            [
+                {
+                    "title": f"open {i}",
+                    "start_date": date(2026, 6, 1 + i % 28),
+                    "end_date": date(2026, 6, 1 + i % 28),
+                    "created_at": now,
+                }
+                for i in range(200)
+            ],
+        )
+    service = WorkEventService(db, ColorAllocator())
+    month = (2026, 6)
+
+    hot = _ms(lambda: service._query_month(month))
+    archiver = WorkArchiver(db, older_than_days=90, batch_size=5000, clock=lambda: now)
+    t0 = time.perf_counter()
+    moved = archiver.archive_all()
+    took = time.perf_counter() - t0
+    cold = _ms(lambda: service._query_month(month))
+    assert len(service._query_month(month)) == 200
+    print(
+        f"{completed} completed events: month query {hot:.1f} ms in hot table, "
+        f"{cold:.2f} ms after archiving {moved} rows ({took:.1f} s)"
+    )
+    service.shutdown()
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:2]))
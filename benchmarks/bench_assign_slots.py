@@ -0,0 +1,56 @@
+"""Slot assignment for 10k segments: heap sweep vs the previous linear probe.
+
+Usage: python -m benchmarks.bench_assign_slots [segments]
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import time
+from collections import defaultdict
+
+from daily_event.services.calendar_service import CalendarService, EventSegment
+
+
+def _linear_probe(segments: list[EventSegment]) -> None:
+    by_row: dict[int, list[EventSegment]] = defaultdict(list)
+    for seg in segments:
+        by_row[seg.row].append(seg)
+    for row_segs in by_row.values():
+        row_segs.sort(key=lambda s: (s.start_col, s.event_id))
+        occupied: list[tuple[int, int]] = []
+        for seg in row_segs:
+            used = {slot for end_col, slot in occupied if end_col >= seg.start_col}
+            slot = 0
+            while slot in used:
+                slot += 1
+            seg.slot = slot
+            occupied.append((seg.end_col, slot))
+
+
+def main(n: int = 10_000) -> None:
+    rng = random.Random(1)
+    segments = []
+    for i in range(n):
+        start = rng.randrange(7)
+        segments.append(EventSegment(rng.randrange(6), start, rng.randrange(start, 7), "#000", i, "T"))
+
+    t0 = time.perf_counter()
+    CalendarService.assign_slots(segments)
+    heap_ms = (time.perf_counter() - t0) * 1000
+    heap = [s.slot for s in segments]
+
+    t0 = time.perf_counter()
+    _linear_probe(segments)
+    linear_ms = (time.perf_counter() - t0) * 1000
+    assert heap == [s.slot for s in segments]
+
+    t0 = time.perf_counter()
+    CalendarService.overflow_counts(segments, 3)
+    overflow_ms = (time.perf_counter() - t0) * 1000
+    print(f"{n} segments: heap {heap_ms:.1f} ms, linear probe {linear_ms:.1f} ms, overflow counts {overflow_ms:.1f} ms")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:2]))
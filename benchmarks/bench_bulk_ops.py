@@ -0,0 +1,63 @@
+"""Per-event writes vs the set-based bulk API on a selection of Work Events.
+
+Usage: python -m benchmarks.bench_bulk_ops [selected]
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+from daily_event.infra.color_allocator import ColorAllocator
+from daily_event.infra.database import Database
+from daily_event.services.work_event_service import WorkEventService
+
+
+def _service() -> tuple[WorkEventService, list[int]]:
+    service = WorkEventService(Database(os.path.join(tempfile.mkdtemp(), "bench.db")), ColorAllocator())
+    start = date(2026, 1, 1)
+    ids = [
+        service.create(f"work {i}", start + timedelta(days=i % 300), start + timedelta(days=i % 300 + 2))
+        for i in range(2000)
+    ]
+    return service, ids
+
+
+def _ms(fn) -> float:
+    t0 = time.perf_counter()
+    fn()
+    return (time.perf_counter() - t0) * 1000
+
+
+def _shift_each(service: WorkEventService, ids: list[int], days: int) -> None:
+    delta = timedelta(days=days)
+    for i in ids:
+        ev = service.get_by_id(i)
+        service.update(i, start_date=ev.start_date + delta, end_date=ev.end_date + delta)
+
+
+CASES = [
+    (
+        "complete",
+        lambda s, ids: [s.set_completed(i, True) for i in ids],
+        lambda s, ids: s.bulk_set_completed(ids, True),
+    ),
+    ("shift +3d", lambda s, ids: _shift_each(s, ids, 3), lambda s, ids: s.bulk_shift(ids, 3)),
+    ("delete", lambda s, ids: [s.delete(i) for i in ids], lambda s, ids: s.bulk_delete(ids)),
+]
+
+
+def main(selected: int = 200) -> None:
+    print(f"{selected} selected events:")
+    for label, single, bulk in CASES:
+        service, ids = _service()
+        one_by_one = _ms(lambda: single(service, ids[:selected]))
+        set_based = _ms(lambda: bulk(service, ids[selected:2 * selected]))
+        service.shutdown()
+        print(f"  {label:<10} one by one {one_by_one:8.1f} ms   bulk {set_based:6.1f} ms")
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:2]))
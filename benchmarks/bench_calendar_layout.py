@@ -0,0 +1,70 @@
+"""Calendar layout cost for N events in one month: full rebuild vs incremental.
+
+Usage: python -m benchmarks.bench_calendar_layout [events]
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import time
+from dataclasses import dataclass
+from datetime import date, timedelta
+
+from daily_event.infra.color_allocator import ColorAllocator
+from daily_event.services.calendar_service import CalendarService
+
+GRID = date(2026, 2, 1)
+
+
+@dataclass
+class _Ev:
+    id: int
+    start_date: date
+    end_date: date
+    title: str
+    color_index: int
+
+
+def _full(events, color_for):
+    segments = []
+    for ev in events:
+        segments += CalendarService.split_range_to_segments(
+            ev.start_date, ev.end_date, GRID, color_for(ev.color_index), ev.id, ev.title
+        )
+    CalendarService.assign_slots(segments)
+    return segments
+
+
+def main(n: int = 500) -> None:
+    rng = random.Random(1)
+    color_for = ColorAllocator().get_color
+    events = []
+    for i in range(n):
+        start = date(2026, 2, 1) + timedelta(days=rng.randrange(28))
+        events.append(_Ev(i + 1, start, start + timedelta(days=rng.randrange(6)), f"work {i}", i % 12))
+
+    t0 = time.perf_counter()
+    _full(events, color_for)
+    full_ms = (time.perf_counter() - t0) * 1000
+
+    service = CalendarService()
+    service.layout(GRID, events, 0, color_for)
+    t0 = time.perf_counter()
+    service.layout(GRID, events, 0, color_for)
+    hit_ms = (time.perf_counter() - t0) * 1000
+
+    edits = 50
+    t0 = time.perf_counter()
+    for v in range(1, edits + 1):
+        k = rng.randrange(n)
+        ev = events[k]
+        events[k] = _Ev(ev.id, ev.start_date, ev.end_date + timedelta(days=1), ev.title, ev.color_index)
+        service.layout(GRID, events, v, color_for)
+    inc_ms = (time.perf_counter() - t0) * 1000 / edits
+
+    print(f"{n} events: full rebuild {full_ms:.2f} ms, single-event update {inc_ms:.2f} ms, cache hit {hit_ms:.4f} ms")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:2]))
@@ -0,0 +1,67 @@
+"""Row vs bitmap completion storage — DB size and query latency.
+
+Usage: python -m benchmarks.bench_daily_storage [habits] [years]
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import sqlite3
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+from daily_event.domain.models import DailyCompletion, DailyEvent
+from daily_event.infra.database import Database
+from daily_event.services.daily_event_service import DailyEventService
+
+
+def _populate(db: Database, habits: int, years: int, today: date) -> int:
+    rng = random.Random(42)
+    total = 0
+    with db.session_scope() as session:
+        events = [DailyEvent(title=f"habit {i}") for i in range(habits)]
+        session.add_all(events)
+        session.flush()
+        for ev in events:
+            for k in range(years * 365):
+                if rng.random() < 0.7:
+                    session.add(DailyCompletion(event_id=ev.id, completed_date=today - timedelta(k)))
+                    total += 1
+    return total
+
+
+def _timeit(fn, repeat: int = 20) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best * 1000
+
+
+def main(habits: int = 50, years: int = 3) -> None:
+    today = date.today()
+    tmp = tempfile.mkdtemp()
+    print(f"{habits} habits x {years} years")
+    for storage in ("rows", "bitmap"):
+        path = os.path.join(tmp, f"{storage}.db")
+        rows = _populate(Database(path), habits, years, today)
+        service = DailyEventService(Database(path), storage=storage)
+        service.sync_storage()
+        conn = sqlite3.connect(path)
+        conn.execute("VACUUM")
+        conn.close()
+        size_kb = os.path.getsize(path) / 1024
+        visible = _timeit(lambda: service.get_visible(today))
+        stats = _timeit(service.get_all_stats)
+        print(
+            f"  {storage:<7} {rows} completions  db={size_kb:8.1f} KiB  "
+            f"get_visible={visible:7.2f} ms  get_all_stats={stats:7.2f} ms"
+        )
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:3]))
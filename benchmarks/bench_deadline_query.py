@@ -0,0 +1,70 @@
+"""Deadline reminders: one indexed query per day vs scanning every open event.
+
+Usage: python -m benchmarks.bench_deadline_query [events]
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+
+from sqlalchemy import select
+
+from daily_event.domain.models import WorkEvent
+from daily_event.infra.database import Database
+from daily_event.services.deadline_reminders import DeadlineReminders
+
+
+class _Silent:
+    def notify(self, title: str, message: str) -> None:
+        pass
+
+
+def _ms(fn, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, (time.perf_counter() - t0) * 1000)
+    return best
+
+
+def main(events: int = 100000) -> None:
+    db = Database(os.path.join(tempfile.mkdtemp(), "bench.db"))
+    rng = random.Random(42)
+    base = date(2024, 1, 1)
+    with db.session_scope() as session:
+        for i in range(events):
+            start = base + timedelta(days=rng.randrange(1500))
+            session.add(
+                WorkEvent(
+                    title=f"work {i}",
+                    start_date=start,
+                    end_date=start + timedelta(days=rng.randrange(14)),
+                    is_completed=rng.random() < 0.7,
+                )
+            )
+
+    today = date(2026, 6, 10)
+    reminders = DeadlineReminders(db, _Silent(), clock=lambda: datetime(2026, 6, 10, 7, 0))
+    planned = len(reminders.plan())
+
+    def scan() -> int:
+        wanted = {today, today + timedelta(days=1)}
+        with db.session_scope() as session:
+            rows = session.scalars(select(WorkEvent).where(WorkEvent.is_completed == False))  # noqa: E712
+            return sum(1 for ev in rows if ev.end_date in wanted)
+
+    assert scan() == planned
+    print(
+        f"{events} events, {planned} reminders: indexed plan {_ms(reminders.plan):.2f} ms, "
+        f"full scan {_ms(scan, 3):.1f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:2]))
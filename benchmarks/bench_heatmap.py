@@ -0,0 +1,61 @@
+"""Heatmap open time for 50 habits — query plus (if PySide6 is present) widgets.
+
+Usage: python -m benchmarks.bench_heatmap [habits]
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import date, timedelta
+
+from daily_event.domain.models import DailyCompletion, DailyEvent
+from daily_event.infra.database import Database
+from daily_event.services.daily_event_service import DailyEventService
+
+
+def main(habits: int = 50) -> None:
+    today = date.today()
+    db = Database(os.path.join(tempfile.mkdtemp(), "bench.db"))
+    rng = random.Random(1)
+    with db.session_scope() as session:
+        events = [DailyEvent(title=f"habit {i}") for i in range(habits)]
+        session.add_all(events)
+        session.flush()
+        for ev in events:
+            for k in range(3 * 365):
+                if rng.random() < 0.6:
+                    session.add(DailyCompletion(event_id=ev.id, completed_date=today - timedelta(k)))
+    service = DailyEventService(db)
+
+    t0 = time.perf_counter()
+    heatmaps = service.get_heatmaps(today)
+    query_ms = (time.perf_counter() - t0) * 1000
+    print(f"{habits} habits: get_heatmaps {query_ms:.1f} ms")
+
+    try:
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+        from PySide6.QtWidgets import QApplication
+
+        from daily_event.ui.heatmap_page import HeatmapPage
+    except ImportError:
+        print("PySide6 not installed — skipping widget timing")
+        return
+    app = QApplication.instance() or QApplication(sys.argv)
+    t0 = time.perf_counter()
+    page = HeatmapPage(heatmaps)
+    page.resize(700, 600)
+    page.grab()
+    open_ms = (time.perf_counter() - t0) * 1000
+    t0 = time.perf_counter()
+    page.grab()
+    repaint_ms = (time.perf_counter() - t0) * 1000
+    print(f"  dialog build + first paint {open_ms:.1f} ms, cached repaint {repaint_ms:.1f} ms")
+    app.processEvents()
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:2]))
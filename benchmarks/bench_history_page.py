@@ -0,0 +1,62 @@
+"""History open time: full load vs the first keyset page, and deep-page cost.
+
+Usage: python -m benchmarks.bench_history_page [events]
+"""
+
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+import time
+from datetime import date, datetime, timedelta
+
+from daily_event.domain.models import WorkEvent
+from daily_event.infra.color_allocator import ColorAllocator
+from daily_event.infra.database import Database
+from daily_event.services.work_event_service import WorkEventService
+
+
+def _ms(fn) -> float:
+    t0 = time.perf_counter()
+    fn()
+    return (time.perf_counter() - t0) * 1000
+
+
+def main(events: int = 20000) -> None:
+    db = Database(os.path.join(tempfile.mkdtemp(), "bench.db"))
+    base = datetime(2020, 1, 1)
+    with db.session_scope() as session:
+        session.add_all(
+            WorkEvent(
+                title=f"work {i}",
+                start_date=date(2020, 1, 1),
+                end_date=date(2020, 1, 2),
+                is_completed=True,
+                completed_at=base + timedelta(minutes=37 * i),
+            )
+            for i in range(events)
+        )
+    service = WorkEventService(db, ColorAllocator())
+
+    full = _ms(service.get_history)
+    first = _ms(service.get_history_page)
+
+    cursor, times = None, []
+    while True:
+        t0 = time.perf_counter()
+        batch = service.get_history_page(cursor=cursor)
+        times.append((time.perf_counter() - t0) * 1000)
+        if batch.next_cursor is None:
+            break
+        cursor = batch.next_cursor
+    print(
+        f"{events} completed events: full load {full:.1f} ms, first page {first:.2f} ms, "
+        f"{len(times)} pages: first half median {sorted(times[:len(times) // 2])[len(times) // 4]:.2f} ms, "
+        f"second half median {sorted(times[len(times) // 2:])[len(times) // 4]:.2f} ms"
+    )
+    service.shutdown()
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:2]))
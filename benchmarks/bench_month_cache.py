@@ -0,0 +1,53 @@
+"""Month flip latency with and without the WorkEventService month cache.
+
+Usage: python -m benchmarks.bench_month_cache [events]
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import sys
+import tempfile
+import time
+from concurrent.futures import wait
+from datetime import date, timedelta
+
+from daily_event.domain.models import WorkEvent
+from daily_event.infra.color_allocator import ColorAllocator
+from daily_event.infra.database import Database
+from daily_event.services.work_event_service import WorkEventService
+
+
+def main(events: int = 5000) -> None:
+    db = Database(os.path.join(tempfile.mkdtemp(), "bench.db"))
+    rng = random.Random(1)
+    origin = date(2024, 1, 1)
+    with db.session_scope() as session:
+        for i in range(events):
+            start = origin + timedelta(days=rng.randrange(3 * 365))
+            session.add(
+                WorkEvent(title=f"work {i}", start_date=start, end_date=start + timedelta(days=rng.randrange(10)))
+            )
+    service = WorkEventService(db, ColorAllocator())
+
+    months = [(2025, m) for m in range(1, 13)]
+    t0 = time.perf_counter()
+    for y, m in months:
+        service._query_month((y, m))
+    cold_ms = (time.perf_counter() - t0) * 1000 / len(months)
+
+    # Navigate the way the UI does: show a month, prefetch its neighbours.
+    service.get_for_month(2025, 1)
+    worst = 0.0
+    for y, m in months[1:]:
+        wait(service.prefetch_adjacent(*months[months.index((y, m)) - 1]))
+        t0 = time.perf_counter()
+        service.get_for_month(y, m)
+        worst = max(worst, (time.perf_counter() - t0) * 1000)
+    print(f"{events} events: uncached month query {cold_ms:.2f} ms, prefetched flip worst {worst:.3f} ms")
+    service.shutdown()
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:2]))
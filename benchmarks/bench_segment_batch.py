@@ -0,0 +1,52 @@
+"""Segment splitting for 5k events: per-event function vs batch API.
+
+Usage: python -m benchmarks.bench_segment_batch [events]
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import time
+from datetime import date, timedelta
+
+from daily_event.services import calendar_service
+from daily_event.services.calendar_service import CalendarService
+
+GRID = date(2026, 2, 1)
+
+
+def _best(fn, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, time.perf_counter() - t0)
+    return best * 1000
+
+
+def main(n: int = 5000) -> None:
+    rng = random.Random(1)
+    starts, ends, ids = [], [], []
+    for i in range(n):
+        s = GRID + timedelta(days=rng.randrange(-10, 42))
+        starts.append(s)
+        ends.append(s + timedelta(days=rng.randrange(20)))
+        ids.append(i)
+    s_ord = [d.toordinal() for d in starts]
+    e_ord = [d.toordinal() for d in ends]
+
+    def per_event():
+        for s, e, eid in zip(starts, ends, ids):
+            CalendarService.split_range_to_segments(s, e, GRID, "#000", eid, "T")
+
+    base = _best(per_event)
+    py = _best(lambda: CalendarService.split_ranges_batch(s_ord, e_ord, ids, GRID, use_numpy=False))
+    print(f"{n} events: per-event {base:.2f} ms, batch python {py:.2f} ms ({base / py:.1f}x)")
+    if calendar_service.np is not None:
+        npy = _best(lambda: CalendarService.split_ranges_batch(s_ord, e_ord, ids, GRID, use_numpy=True))
+        print(f"  batch numpy {npy:.2f} ms ({base / npy:.1f}x)")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:2]))
@@ -0,0 +1,51 @@
+"""Occurrence expansion cost for a month view over many recurring series.
+
+Usage: python -m benchmarks.bench_series_expand [series]
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import time
+from datetime import date, timedelta
+
+from daily_event.services.work_series import SeriesEntry, SeriesIndex
+
+RULES = ["daily", "workday", "weekly", "every_3_days", "weekdays:0,2,4", "every:2w", "monthly:15", "monthly:2:1"]
+
+
+def main(series: int = 1000) -> None:
+    rng = random.Random(1)
+    origin = date(2024, 1, 1)
+    index = SeriesIndex(
+        SeriesEntry(
+            i + 1,
+            f"series {i}",
+            "",
+            rng.choice(RULES),
+            origin + timedelta(days=rng.randrange(700)),
+            rng.randrange(3),
+            None,
+            i % 12,
+            [origin + timedelta(days=rng.randrange(900)) for _ in range(rng.randrange(4))],
+        )
+        for i in range(series)
+    )
+
+    # The month grid the calendar shows: 42 days starting on a Sunday.
+    start, end = date(2025, 6, 1), date(2025, 7, 12)
+    runs = []
+    for _ in range(50):
+        t0 = time.perf_counter()
+        occurrences = index.expand(start, end)
+        runs.append((time.perf_counter() - t0) * 1000)
+    runs.sort()
+    print(
+        f"{series} series -> {len(occurrences)} occurrences in a 42-day window: "
+        f"median {runs[len(runs) // 2]:.2f} ms, best {runs[0]:.2f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:2]))
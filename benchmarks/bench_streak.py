@@ -0,0 +1,55 @@
+"""Jump-walk streaks vs. a day-by-day scan over a 5-year history.
+
+Usage: python -m benchmarks.bench_streak
+"""
+
+from __future__ import annotations
+
+import time
+from datetime import date, timedelta
+
+from daily_event.services.daily_event_service import calc_recurring_streak
+from daily_event.services.recurrence import compile_rule
+
+
+def _day_scan(completed, rule, today):
+    streak = 0
+    d = today
+    pending = True
+    while True:
+        if rule.is_due(d):
+            if d in completed:
+                streak += 1
+            elif not pending:
+                break
+            pending = False
+        d -= timedelta(days=1)
+        if d < today - timedelta(days=365 * 6):
+            break
+    return streak
+
+
+def _bench(fn, repeat: int = 50) -> float:
+    t0 = time.perf_counter()
+    for _ in range(repeat):
+        fn()
+    return (time.perf_counter() - t0) / repeat * 1000
+
+
+def main() -> None:
+    today = date(2026, 3, 1)
+    anchor = today - timedelta(days=365 * 5)
+    for rule_text in ("daily", "workday", "every_3_days", "weekly", "monthly:1"):
+        rule = compile_rule(rule_text, anchor)
+        completed = set(rule.due_dates(anchor, today))
+        jump = _bench(lambda: calc_recurring_streak(completed, rule, today, 1))
+        scan = _bench(lambda: _day_scan(completed, rule, today))
+        streak, _ = calc_recurring_streak(completed, rule, today, 1)
+        print(
+            f"{rule_text:<13} streak={streak:5d}  jump={jump:7.3f} ms  "
+            f"day-scan={scan:7.3f} ms  ({scan / jump:4.1f}x)"
+        )
+
+
+if __name__ == "__main__":
+    main()
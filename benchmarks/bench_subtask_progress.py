@@ -0,0 +1,70 @@
+"""Subtask progress for a list of N events: grouped aggregate vs per-event relationship loads.
+
+Usage: python -m benchmarks.bench_subtask_progress [events]
+"""
+
+from __future__ import annotations
+
+import os
+import random
+import sys
+import tempfile
+import time
+from datetime import date
+
+from sqlalchemy import select
+
+from daily_event.domain.models import WorkEvent, WorkSubtask
+from daily_event.infra.color_allocator import ColorAllocator
+from daily_event.infra.database import Database
+from daily_event.services.work_event_service import WorkEventService
+
+
+def _ms(fn, repeat: int = 3) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, (time.perf_counter() - t0) * 1000)
+    return best
+
+
+def main(events: int = 500) -> None:
+    db = Database(os.path.join(tempfile.mkdtemp(), "bench.db"))
+    rng = random.Random(44)
+    with db.session_scope() as session:
+        rows = [
+            WorkEvent(title=f"work {i}", start_date=date(2026, 6, 1), end_date=date(2026, 6, 5))
+            for i in range(events)
+        ]
+        session.add_all(rows)
+        session.flush()
+        session.add_all(
+            WorkSubtask(event_id=ev.id, title=f"step {k}", is_done=rng.random() < 0.5, position=k)
+            for ev in rows
+            for k in range(rng.randrange(8))
+        )
+        ids = [ev.id for ev in rows]
+    service = WorkEventService(db, ColorAllocator())
+
+    def per_event():
+        # What a list view would do by touching each event's checklist.
+        out = {}
+        with db.session_scope() as session:
+            for eid in ids:
+                tasks = session.execute(select(WorkSubtask).where(WorkSubtask.event_id == eid)).scalars().all()
+                if tasks:
+                    out[eid] = (sum(t.is_done for t in tasks), len(tasks))
+        return out
+
+    grouped = service.get_progress(ids)
+    assert {k: (v.done, v.total) for k, v in grouped.items()} == per_event()
+    print(
+        f"{events} events: grouped aggregate {_ms(lambda: service.get_progress(ids)):.1f} ms, "
+        f"per-event loads {_ms(per_event):.1f} ms"
+    )
+    service.shutdown()
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:2]))
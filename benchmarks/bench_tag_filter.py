@@ -0,0 +1,72 @@
+"""Tag filter cost on one month of N Work Events: bitmap mask vs per-item set checks.
+
+Usage: python -m benchmarks.bench_tag_filter [events]
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import time
+from dataclasses import dataclass
+from datetime import date, timedelta
+
+from daily_event.infra.color_allocator import ColorAllocator
+from daily_event.services.calendar_service import CalendarService
+from daily_event.services.tag_index import TagIndex
+
+GRID = date(2026, 2, 1)
+TAGS = ["客户A", "客户B", "内部", "紧急", "评审", "文档", "运维", "招聘"]
+
+
+@dataclass
+class _Ev:
+    id: int
+    start_date: date
+    end_date: date
+    title: str
+    color_index: int
+
+
+def _ms(fn, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, (time.perf_counter() - t0) * 1000)
+    return best
+
+
+def main(n: int = 10000) -> None:
+    rng = random.Random(43)
+    events, tags_by_id = [], {}
+    for i in range(n):
+        start = GRID + timedelta(days=rng.randrange(35))
+        events.append(_Ev(i + 1, start, start + timedelta(days=rng.randrange(6)), f"work {i}", i % 12))
+        tags_by_id[i + 1] = rng.sample(TAGS, rng.randrange(4))
+    segments = CalendarService().layout(GRID, events, 1, ColorAllocator().get_color)
+
+    build = _ms(lambda: TagIndex(events, tags_by_id))
+    index = TagIndex(events, tags_by_id)
+    wanted = ["客户A", "紧急"]
+
+    def naive():
+        return [ev for ev in events if set(wanted) <= set(tags_by_id[ev.id])]
+
+    assert index.filter(wanted) == naive()
+    mask = _ms(lambda: index.filter(wanted))
+    scan = _ms(naive)
+    visible = {ev.id for ev in index.filter(wanted)}
+    repack = _ms(lambda: CalendarService.filter_segments(segments, visible))
+    broad = {ev.id for ev in index.filter(["内部", "紧急"], match_all=False)}
+    repack_broad = _ms(lambda: CalendarService.filter_segments(segments, broad))
+    print(
+        f"{n} events ({len(segments)} segments), index build {build:.1f} ms\n"
+        f"  all of {wanted}: {len(visible)} match, bitmap {mask:.2f} ms vs set scan {scan:.1f} ms, "
+        f"re-slot {repack:.1f} ms\n"
+        f"  any of 内部/紧急: {len(broad)} match, re-slot {repack_broad:.1f} ms"
+    )
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:2]))
@@ -0,0 +1,63 @@
+"""Workload / overlap detection: sweep line vs pairwise comparison.
+
+Usage: python -m benchmarks.bench_workload [events]
+"""
+
+from __future__ import annotations
+
+import random
+import sys
+import time
+from datetime import date
+
+from daily_event.services.calendar_service import GRID_DAYS, CalendarService, np
+
+
+def _ms(fn, repeat: int = 5) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        t0 = time.perf_counter()
+        fn()
+        best = min(best, (time.perf_counter() - t0) * 1000)
+    return best
+
+
+def _pairwise(starts, ends, threshold) -> set[int]:
+    """Reference: for every event, count the events overlapping each of its days."""
+    n = len(starts)
+    overloaded = set()
+    for i in range(n):
+        overlapping = [j for j in range(n) if starts[j] <= ends[i] and starts[i] <= ends[j]]
+        for day in range(starts[i], ends[i] + 1):
+            if sum(1 for j in overlapping if starts[j] <= day <= ends[j]) > threshold:
+                overloaded.add(day)
+    return overloaded
+
+
+def main(events: int = 20000) -> None:
+    rng = random.Random(41)
+    first = date(2026, 1, 1)
+    f0 = first.toordinal()
+    starts = [f0 + rng.randrange(365) for _ in range(events)]
+    ends = [s + rng.randrange(10) for s in starts]
+    ids = list(range(1, events + 1))
+    average = sum(e - s + 1 for s, e in zip(starts, ends)) / 365
+    threshold = int(average * 1.05)  # a little above the average load
+
+    found = CalendarService.workload(starts, ends, ids, first, 365, threshold).conflicts
+    print(f"{events} events over a year, threshold {threshold}, {len(found)} conflict runs:")
+    for days, label in ((365, "year"), (GRID_DAYS, "month grid")):
+        py = _ms(lambda: CalendarService.workload(starts, ends, ids, first, days, threshold, use_numpy=False))
+        line = f"  {label:<10} sweep (pure Python) {py:7.2f} ms"
+        if np is not None:
+            vec = _ms(lambda: CalendarService.workload(starts, ends, ids, first, days, threshold, use_numpy=True))
+            line += f"   sweep (NumPy counts) {vec:7.2f} ms"
+        print(line)
+
+    sample = 1000
+    t = _ms(lambda: _pairwise(starts[:sample], ends[:sample], int(average * sample / events)), repeat=1)
+    print(f"  pairwise on {sample} events: {t:.0f} ms (O(n^2): ~{t * (events / sample) ** 2 / 1000:.0f} s at {events})")
+
+
+if __name__ == "__main__":
+    main(*(int(a) for a in sys.argv[1:2]))
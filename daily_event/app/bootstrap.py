@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import sys
+from datetime import timedelta
 from pathlib import Path
 
 from PySide6.QtCore import QLockFile
@@ -13,11 +14,14 @@ from daily_event.app.container import Container
 from daily_event.infra.color_allocator import ColorAllocator
 from daily_event.infra.database import Database
 from daily_event.infra.notification import NotificationService
+from daily_event.infra.notification_dispatcher import NotificationDispatcher
 from daily_event.infra.sound import SoundService
 from daily_event.services.alarm_service import AlarmService
 from daily_event.services.calendar_service import CalendarService
 from daily_event.services.config_service import ConfigService
 from daily_event.services.daily_event_service import DailyEventService
+from daily_event.services.deadline_reminders import DeadlineReminders, parse_remind_at
+from daily_event.services.work_archive import WorkArchiver
 from daily_event.services.work_event_service import WorkEventService
 from daily_event.ui.main_window import MainWindow
 
@@ -49,12 +53,48 @@ def create_container() -> Container:
     color_allocator = ColorAllocator()
     container.register("color_allocator", color_allocator)
 
-    notification = NotificationService()
-    sound = SoundService(enabled=config.get("sound_enabled", True))
-
-    container.register("daily_service", DailyEventService(db))
-    container.register("work_service", WorkEventService(db, color_allocator))
-    container.register("alarm_service", AlarmService(db, notification, sound))
+    # Toasts and sounds go through one worker thread (prewarmed, bursts merged).
+    notifier = NotificationDispatcher(
+        NotificationService(), SoundService(enabled=config.get("sound_enabled", True))
+    )
+    notifier.prewarm()
+    container.register("notifier", notifier)
+
+    daily_service = DailyEventService(
+        db,
+        storage=config.get("daily_storage", "rows"),
+        streak_grace_days=config.get("streak_grace_days", 0),
+    )
+    daily_service.sync_storage()
+    container.register("daily_service", daily_service)
+    container.register(
+        "work_service",
+        WorkEventService(
+            db, color_allocator, cache_capacity=config.get("work_cache_capacity", 12)
+        ),
+    )
+    container.register(
+        "alarm_service",
+        AlarmService(
+            db,
+            notifier,
+            notifier,
+            catch_up=config.get("alarm_catch_up", "summarize"),
+            stale_after=timedelta(minutes=config.get("alarm_stale_minutes", 60)),
+        ),
+    )
+    container.register(
+        "deadline_reminders",
+        DeadlineReminders(
+            db,
+            notifier,
+            days_before=config.get("deadline_reminder_days", [1, 0]),
+            remind_at=parse_remind_at(config.get("deadline_reminder_time", "09:00")),
+        ),
+    )
+    container.register(
+        "work_archiver", WorkArchiver(db, older_than_days=config.get("archive_after_days", 90))
+    )
     container.register("calendar_service", CalendarService())
 
     return container
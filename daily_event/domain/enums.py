@@ -4,9 +4,11 @@ from enum import Enum
 class AlarmMode(str, Enum):
     COUNTDOWN = "countdown"
     SCHEDULED = "scheduled"
+    RECURRING = "recurring"
 
 
 class AlarmStatus(str, Enum):
     PENDING = "pending"
     FIRED = "fired"
     CANCELLED = "cancelled"
+    MISSED = "missed"
@@ -3,7 +3,7 @@ from __future__ import annotations
 from datetime import date, datetime
 from typing import Optional
 
-from sqlalchemy import String, Text, ForeignKey, UniqueConstraint
+from sqlalchemy import Index, LargeBinary, String, Text, ForeignKey, UniqueConstraint
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 
 
@@ -18,11 +18,14 @@ class DailyEvent(Base):
     title: Mapped[str] = mapped_column(String(200), nullable=False)
     created_at: Mapped[datetime] = mapped_column(default=datetime.now)
     is_archived: Mapped[bool] = mapped_column(default=False)
-    recurrence_rule: Mapped[str] = mapped_column(String(30), default="daily")
+    recurrence_rule: Mapped[str] = mapped_column(String(200), default="daily")
 
     completions: Mapped[list[DailyCompletion]] = relationship(
         back_populates="event", cascade="all, delete-orphan"
     )
+    completion_bitmaps: Mapped[list[DailyCompletionBitmap]] = relationship(
+        back_populates="event", cascade="all, delete-orphan"
+    )
 
 
 class DailyCompletion(Base):
@@ -39,8 +42,33 @@ class DailyCompletion(Base):
     __table_args__ = (UniqueConstraint("event_id", "completed_date"),)
 
 
+class DailyCompletionBitmap(Base):
+    """One bitset per (event, year); bit *i* = day-of-year *i* completed."""
+
+    __tablename__ = "daily_completion_bitmaps"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    event_id: Mapped[int] = mapped_column(
+        ForeignKey("daily_events.id", ondelete="CASCADE")
+    )
+    year: Mapped[int] = mapped_column(nullable=False)
+    bits: Mapped[bytes] = mapped_column(LargeBinary, nullable=False)
+
+    event: Mapped[DailyEvent] = relationship(back_populates="completion_bitmaps")
+
+    __table_args__ = (UniqueConstraint("event_id", "year"),)
+
+
 class WorkEvent(Base):
     __tablename__ = "work_events"
+    __table_args__ = (
+        # Keyset pagination of the history (newest completion first).
+        Index("ix_work_events_history", "is_completed", "completed_at", "id"),
+        # Deadline reminders: open events ending on given days.
+        Index("ix_work_events_deadline", "is_completed", "end_date"),
+        # Ids are never reused, so an archived event keeps a unique id.
+        {"sqlite_autoincrement": True},
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True)
     title: Mapped[str] = mapped_column(String(200), nullable=False)
@@ -52,6 +80,142 @@ class WorkEvent(Base):
     completed_at: Mapped[Optional[datetime]] = mapped_column(default=None)
     created_at: Mapped[datetime] = mapped_column(default=datetime.now)
 
+    tag_links: Mapped[list[WorkEventTag]] = relationship(cascade="all, delete-orphan")
+    # Never lazy-loaded: the edit dialog queries subtasks explicitly and list
+    # views use the grouped counts of WorkEventService.get_progress.
+    subtasks: Mapped[list[WorkSubtask]] = relationship(
+        back_populates="event",
+        cascade="all, delete-orphan",
+        order_by="WorkSubtask.position",
+        lazy="raise_on_sql",
+        passive_deletes=True,
+    )
+
+
+class WorkSubtask(Base):
+    """One checklist item of a Work Event."""
+
+    __tablename__ = "work_subtasks"
+    __table_args__ = (Index("ix_work_subtasks_event", "event_id", "is_done"),)
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    event_id: Mapped[int] = mapped_column(
+        ForeignKey("work_events.id", ondelete="CASCADE")
+    )
+    title: Mapped[str] = mapped_column(String(200), nullable=False)
+    is_done: Mapped[bool] = mapped_column(default=False)
+    position: Mapped[int] = mapped_column(default=0)
+    created_at: Mapped[datetime] = mapped_column(default=datetime.now)
+
+    event: Mapped[WorkEvent] = relationship(back_populates="subtasks")
+
+
+class WorkEventArchive(Base):
+    """Completed Work Events moved out of ``work_events`` by the archiver (same ids)."""
+
+    __tablename__ = "work_events_archive"
+    __table_args__ = (Index("ix_work_events_archive_history", "completed_at", "id"),)
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=False)
+    title: Mapped[str] = mapped_column(String(200), nullable=False)
+    start_date: Mapped[date] = mapped_column(nullable=False)
+    end_date: Mapped[date] = mapped_column(nullable=False)
+    note: Mapped[Optional[str]] = mapped_column(Text, default="")
+    color_index: Mapped[int] = mapped_column(default=0)
+    is_completed: Mapped[bool] = mapped_column(default=True)
+    completed_at: Mapped[datetime] = mapped_column(nullable=False)
+    created_at: Mapped[datetime] = mapped_column(default=datetime.now)
+    archived_at: Mapped[datetime] = mapped_column(default=datetime.now)
+
+
+class Tag(Base):
+    __tablename__ = "tags"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    name: Mapped[str] = mapped_column(String(50), nullable=False, unique=True)
+    created_at: Mapped[datetime] = mapped_column(default=datetime.now)
+
+
+class WorkEventTag(Base):
+    __tablename__ = "work_event_tags"
+    __table_args__ = (Index("ix_work_event_tags_tag", "tag_id", "event_id"),)
+
+    event_id: Mapped[int] = mapped_column(
+        ForeignKey("work_events.id", ondelete="CASCADE"), primary_key=True
+    )
+    tag_id: Mapped[int] = mapped_column(
+        ForeignKey("tags.id", ondelete="CASCADE"), primary_key=True
+    )
+
+
+class WorkSeries(Base):
+    """A recurring Work Event; occurrences are expanded on demand, never stored."""
+
+    __tablename__ = "work_series"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    title: Mapped[str] = mapped_column(String(200), nullable=False)
+    note: Mapped[Optional[str]] = mapped_column(Text, default="")
+    recurrence_rule: Mapped[str] = mapped_column(String(200), nullable=False)
+    anchor_date: Mapped[date] = mapped_column(nullable=False)
+    duration_days: Mapped[int] = mapped_column(default=0)
+    until_date: Mapped[Optional[date]] = mapped_column(default=None)
+    color_index: Mapped[int] = mapped_column(default=0)
+    created_at: Mapped[datetime] = mapped_column(default=datetime.now)
+
+    exceptions: Mapped[list[WorkSeriesException]] = relationship(
+        back_populates="series", cascade="all, delete-orphan"
+    )
+    completions: Mapped[list[WorkOccurrenceCompletion]] = relationship(
+        back_populates="series", cascade="all, delete-orphan"
+    )
+
+
+class WorkSeriesException(Base):
+    """An occurrence removed from its series (deleted or detached into a WorkEvent)."""
+
+    __tablename__ = "work_series_exceptions"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    series_id: Mapped[int] = mapped_column(
+        ForeignKey("work_series.id", ondelete="CASCADE")
+    )
+    occurrence_date: Mapped[date] = mapped_column(nullable=False)
+
+    series: Mapped[WorkSeries] = relationship(back_populates="exceptions")
+
+    __table_args__ = (UniqueConstraint("series_id", "occurrence_date"),)
+
+
+class WorkOccurrenceCompletion(Base):
+    __tablename__ = "work_occurrence_completions"
+
+    id: Mapped[int] = mapped_column(primary_key=True)
+    series_id: Mapped[int] = mapped_column(
+        ForeignKey("work_series.id", ondelete="CASCADE")
+    )
+    occurrence_date: Mapped[date] = mapped_column(nullable=False)
+    completed_at: Mapped[datetime] = mapped_column(default=datetime.now)
+
+    series: Mapped[WorkSeries] = relationship(back_populates="completions")
+
+    __table_args__ = (UniqueConstraint("series_id", "occurrence_date"),)
+
+
+class DeadlineReminderSent(Base):
+    """A deadline reminder already delivered, so a restart does not repeat it.
+
+    Rows are keyed like ``Reminder.key``; work event ids are never reused, and
+    rows whose deadline has passed are pruned when a new day is planned.
+    """
+
+    __tablename__ = "deadline_reminders_sent"
+
+    event_id: Mapped[int] = mapped_column(primary_key=True)
+    end_date: Mapped[date] = mapped_column(primary_key=True)
+    days_left: Mapped[int] = mapped_column(primary_key=True)
+    sent_at: Mapped[datetime] = mapped_column(default=datetime.now)
+
 
 class Alarm(Base):
     __tablename__ = "alarms"
@@ -63,6 +227,8 @@ class Alarm(Base):
     duration_seconds: Mapped[Optional[int]] = mapped_column(default=None)
     status: Mapped[str] = mapped_column(String(20), default="pending")
     sound_enabled: Mapped[bool] = mapped_column(default=True)
+    # Empty for one-shot alarms; otherwise a recurrence.py day rule or "hours:N".
+    repeat_rule: Mapped[str] = mapped_column(String(100), default="")
     created_at: Mapped[datetime] = mapped_column(default=datetime.now)
 
 
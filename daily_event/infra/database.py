@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import re
 from contextlib import contextmanager
 from pathlib import Path
 from typing import Generator
@@ -11,7 +12,9 @@ from sqlalchemy.orm import Session, sessionmaker
 
 from daily_event.domain.models import Base, SchemaVersion
 
-CURRENT_SCHEMA_VERSION = 4
+_ADD_COLUMN = re.compile(r"ALTER TABLE (\w+) ADD COLUMN (\w+)", re.IGNORECASE)
+
+CURRENT_SCHEMA_VERSION = 13
 
 MIGRATIONS: dict[int, list[str]] = {
     2: [
@@ -23,6 +26,116 @@ MIGRATIONS: dict[int, list[str]] = {
     4: [
         "ALTER TABLE daily_events ADD COLUMN recurrence_rule VARCHAR(30) NOT NULL DEFAULT 'daily'",
     ],
+    5: [
+        "CREATE TABLE IF NOT EXISTS daily_completion_bitmaps ("
+        "id INTEGER NOT NULL PRIMARY KEY, "
+        "event_id INTEGER NOT NULL REFERENCES daily_events (id) ON DELETE CASCADE, "
+        "year INTEGER NOT NULL, "
+        "bits BLOB NOT NULL, "
+        "UNIQUE (event_id, year))",
+    ],
+    6: [
+        "CREATE TABLE IF NOT EXISTS work_series ("
+        "id INTEGER NOT NULL PRIMARY KEY, "
+        "title VARCHAR(200) NOT NULL, "
+        "note TEXT, "
+        "recurrence_rule VARCHAR(200) NOT NULL, "
+        "anchor_date DATE NOT NULL, "
+        "duration_days INTEGER NOT NULL DEFAULT 0, "
+        "until_date DATE, "
+        "color_index INTEGER NOT NULL DEFAULT 0, "
+        "created_at DATETIME NOT NULL)",
+        "CREATE TABLE IF NOT EXISTS work_series_exceptions ("
+        "id INTEGER NOT NULL PRIMARY KEY, "
+        "series_id INTEGER NOT NULL REFERENCES work_series (id) ON DELETE CASCADE, "
+        "occurrence_date DATE NOT NULL, "
+        "UNIQUE (series_id, occurrence_date))",
+        "CREATE TABLE IF NOT EXISTS work_occurrence_completions ("
+        "id INTEGER NOT NULL PRIMARY KEY, "
+        "series_id INTEGER NOT NULL REFERENCES work_series (id) ON DELETE CASCADE, "
+        "occurrence_date DATE NOT NULL, "
+        "completed_at DATETIME NOT NULL, "
+        "UNIQUE (series_id, occurrence_date))",
+    ],
+    7: [
+        "CREATE INDEX IF NOT EXISTS ix_work_events_history "
+        "ON work_events (is_completed, completed_at, id)",
+    ],
+    8: [
+        "CREATE INDEX IF NOT EXISTS ix_work_events_deadline "
+        "ON work_events (is_completed, end_date)",
+    ],
+    9: [
+        "CREATE TABLE IF NOT EXISTS tags ("
+        "id INTEGER NOT NULL PRIMARY KEY, "
+        "name VARCHAR(50) NOT NULL UNIQUE, "
+        "created_at DATETIME NOT NULL)",
+        "CREATE TABLE IF NOT EXISTS work_event_tags ("
+        "event_id INTEGER NOT NULL REFERENCES work_events (id) ON DELETE CASCADE, "
+        "tag_id INTEGER NOT NULL REFERENCES tags (id) ON DELETE CASCADE, "
+        "PRIMARY KEY (event_id, tag_id))",
+        "CREATE INDEX IF NOT EXISTS ix_work_event_tags_tag "
+        "ON work_event_tags (tag_id, event_id)",
+    ],
+    10: [
+        "CREATE TABLE IF NOT EXISTS work_subtasks ("
+        "id INTEGER NOT NULL PRIMARY KEY, "
+        "event_id INTEGER NOT NULL REFERENCES work_events (id) ON DELETE CASCADE, "
+        "title VARCHAR(200) NOT NULL, "
+        "is_done BOOLEAN NOT NULL DEFAULT 0, "
+        "position INTEGER NOT NULL DEFAULT 0, "
+        "created_at DATETIME NOT NULL)",
+        "CREATE INDEX IF NOT EXISTS ix_work_subtasks_event "
+        "ON work_subtasks (event_id, is_done)",
+    ],
+    11: [
+        # Rebuild work_events with AUTOINCREMENT so ids of archived events are
+        # never handed out again.
+        "CREATE TABLE work_events_v11 ("
+        "id INTEGER NOT NULL PRIMARY KEY AUTOINCREMENT, "
+        "title VARCHAR(200) NOT NULL, "
+        "start_date DATE NOT NULL, "
+        "end_date DATE NOT NULL, "
+        "note TEXT, "
+        "color_index INTEGER NOT NULL DEFAULT 0, "
+        "is_completed BOOLEAN NOT NULL DEFAULT 0, "
+        "completed_at DATETIME, "
+        "created_at DATETIME NOT NULL)",
+        "INSERT INTO work_events_v11 "
+        "(id, title, start_date, end_date, note, color_index, is_completed, completed_at, created_at) "
+        "SELECT id, title, start_date, end_date, note, color_index, is_completed, completed_at, created_at "
+        "FROM work_events",
+        "DROP TABLE work_events",
+        "ALTER TABLE work_events_v11 RENAME TO work_events",
+        "CREATE INDEX IF NOT EXISTS ix_work_events_history "
+        "ON work_events (is_completed, completed_at, id)",
+        "CREATE INDEX IF NOT EXISTS ix_work_events_deadline "
+        "ON work_events (is_completed, end_date)",
+        "CREATE TABLE IF NOT EXISTS work_events_archive ("
+        "id INTEGER NOT NULL PRIMARY KEY, "
+        "title VARCHAR(200) NOT NULL, "
+        "start_date DATE NOT NULL, "
+        "end_date DATE NOT NULL, "
+        "note TEXT, "
+        "color_index INTEGER NOT NULL DEFAULT 0, "
+        "is_completed BOOLEAN NOT NULL DEFAULT 1, "
+        "completed_at DATETIME NOT NULL, "
+        "created_at DATETIME NOT NULL, "
+        "archived_at DATETIME NOT NULL)",
+        "CREATE INDEX IF NOT EXISTS ix_work_events_archive_history "
+        "ON work_events_archive (completed_at, id)",
+    ],
+    12: [
+        "ALTER TABLE alarms ADD COLUMN repeat_rule VARCHAR(100) NOT NULL DEFAULT ''",
+    ],
+    13: [
+        "CREATE TABLE IF NOT EXISTS deadline_reminders_sent ("
+        "event_id INTEGER NOT NULL, "
+        "end_date DATE NOT NULL, "
+        "days_left INTEGER NOT NULL, "
+        "sent_at DATETIME NOT NULL, "
+        "PRIMARY KEY (event_id, end_date, days_left))",
+    ],
 }
 
 
@@ -49,10 +162,21 @@ class Database:
         for version in range(current + 1, CURRENT_SCHEMA_VERSION + 1):
             if version in MIGRATIONS:
                 for sql in MIGRATIONS[version]:
-                    session.execute(text(sql))
+                    if not self._already_applied(session, sql):
+                        session.execute(text(sql))
                 ver = session.execute(select(SchemaVersion)).scalar_one()
                 ver.version = version
 
+    @staticmethod
+    def _already_applied(session: Session, sql: str) -> bool:
+        """True for an ADD COLUMN whose column exists (``create_all`` ran first)."""
+        match = _ADD_COLUMN.match(sql)
+        if not match:
+            return False
+        table, column = match.groups()
+        columns = session.execute(text(f"PRAGMA table_info({table})")).all()
+        return any(row[1] == column for row in columns)
+
     @contextmanager
     def session_scope(self) -> Generator[Session, None, None]:
         session = self._session_factory()
@@ -4,6 +4,14 @@ from __future__ import annotations
 
 
 class NotificationService:
+    def prewarm(self) -> None:
+        """Import plyer and resolve its platform backend ahead of the first toast."""
+        try:
+            from plyer import notification
+            notification.notify  # noqa: B018 — the proxy imports the platform module on first access
+        except Exception:
+            pass
+
     def notify(self, title: str, message: str) -> None:
         try:
             from plyer import notification
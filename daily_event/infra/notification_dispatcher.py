@@ -0,0 +1,139 @@
+"""Background dispatch of notifications and alarm sounds, with burst coalescing."""
+
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+import time
+from typing import Optional, Union
+
+from daily_event.infra.notification import NotificationService
+from daily_event.infra.sound import SoundService
+
+logger = logging.getLogger(__name__)
+
+COALESCE_WINDOW = 0.3  # seconds to keep collecting after the first item of a burst
+MAX_SUMMARY_LINES = 5
+
+_SOUND = object()
+_STOP = object()
+
+_Item = Union[tuple[str, str], object]
+
+
+def coalesce(items: list[tuple[str, str]]) -> list[tuple[str, str]]:
+    """Merge notifications sharing a title into one summary each, in first-seen order."""
+    groups: dict[str, list[str]] = {}
+    for title, message in items:
+        groups.setdefault(title, []).append(message)
+    merged = []
+    for title, messages in groups.items():
+        if len(messages) == 1:
+            merged.append((title, messages[0]))
+            continue
+        lines = messages[:MAX_SUMMARY_LINES]
+        if len(messages) > MAX_SUMMARY_LINES:
+            lines.append(f"…等 {len(messages)} 项")
+        merged.append((f"{title}（{len(messages)} 项）", "\n".join(lines)))
+    return merged
+
+
+class NotificationDispatcher:
+    """Queues ``notify`` / ``play_alarm`` calls for a single worker thread.
+
+    Drop-in for ``NotificationService`` and ``SoundService``: callers on the
+    GUI thread only enqueue and return. The worker collects a burst (items
+    arriving within ``COALESCE_WINDOW`` of the first), merges same-title
+    notifications into one summary, plays the sound at most once per burst,
+    then hands everything to the real backends. A backend call or queued
+    callable that raises is logged and skipped, so the worker keeps running.
+    ``prewarm`` loads the notification backend on the worker at startup, so
+    the first alarm does not pay for the plyer import.
+    """
+
+    def __init__(
+        self,
+        notification: NotificationService,
+        sound: SoundService,
+        window: float = COALESCE_WINDOW,
+    ) -> None:
+        self._notification = notification
+        self._sound = sound
+        self._window = window
+        self._queue: queue.Queue[_Item] = queue.Queue()
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self.dispatched = 0
+
+    # -- producer side (any thread) --
+
+    def notify(self, title: str, message: str) -> None:
+        self._put((title, message))
+
+    def play_alarm(self) -> None:
+        self._put(_SOUND)
+
+    def prewarm(self) -> None:
+        self._put(self._notification.prewarm)
+
+    def flush(self, timeout: Optional[float] = None) -> bool:
+        """Wait until everything queued so far has been dispatched."""
+        done = threading.Event()
+        self._put(done.set)
+        return done.wait(timeout)
+
+    def shutdown(self, timeout: float = 1.0) -> None:
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(_STOP)
+            thread.join(timeout)
+
+    def _put(self, item: _Item) -> None:
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run, name="notification-dispatcher", daemon=True
+                )
+                self._thread.start()
+        self._queue.put(item)
+
+    # -- worker --
+
+    def _run(self) -> None:
+        while True:
+            burst = [self._queue.get()]
+            deadline = time.monotonic() + self._window
+            while burst[-1] is not _STOP:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    burst.append(self._queue.get(timeout=remaining))
+                except queue.Empty:
+                    break
+            self._dispatch(burst)
+            if burst[-1] is _STOP:
+                return
+
+    def _dispatch(self, burst: list[_Item]) -> None:
+        notes = [item for item in burst if isinstance(item, tuple)]
+        for title, message in coalesce(notes):
+            try:
+                self._notification.notify(title, message)
+            except Exception:
+                logger.exception("notification %r failed", title)
+                continue
+            self.dispatched += 1
+        if any(item is _SOUND for item in burst):
+            try:
+                self._sound.play_alarm()
+            except Exception:
+                logger.exception("alarm sound failed")
+        for item in burst:
+            if callable(item):
+                try:
+                    item()
+                except Exception:
+                    logger.exception("queued notification task %r failed", item)
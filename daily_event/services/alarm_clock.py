@@ -0,0 +1,115 @@
+"""Wall vs. elapsed clock bookkeeping for alarms — drift detection and lateness classes.
+
+The wall clock (``datetime.now``) is what clock-time alarms are set against;
+it jumps on NTP corrections, manual changes and time-zone changes. The
+elapsed clock only moves forward at one second per second and also counts
+time spent suspended where the platform allows it: ``CLOCK_BOOTTIME`` on
+Linux, ``CLOCK_MONOTONIC`` on macOS (``time.monotonic`` there stops during
+sleep) and ``time.monotonic`` on Windows. Countdowns are measured on the
+elapsed clock; comparing the two tells a clock jump (wall moved, elapsed did
+not) from a sleep (both moved). Elsewhere ``ELAPSED_COUNTS_SUSPEND`` is false
+and a forward jump cannot be told from a sleep.
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Callable, Optional
+
+DRIFT_TOLERANCE = 2.0  # seconds of wall/elapsed disagreement treated as a clock jump
+GRACE = 60.0  # seconds an alarm may be late and still count as on time
+
+ON_TIME = "on_time"
+LATE = "late"
+STALE = "stale"
+
+CATCH_UP_POLICIES = ("fire", "summarize", "drop")
+DEFAULT_CATCH_UP = "summarize"
+DEFAULT_STALE_AFTER = timedelta(hours=1)
+
+DRIFT_CHECK_MIN_MS = 60_000  # shortest wait between unprompted clock re-checks
+DRIFT_CHECK_FRACTION = 4  # ...otherwise re-check after 1/N of the remaining wait
+
+
+if hasattr(time, "CLOCK_BOOTTIME"):
+    _ELAPSED_CLOCK: Optional[int] = time.CLOCK_BOOTTIME
+elif sys.platform == "darwin":
+    _ELAPSED_CLOCK = time.CLOCK_MONOTONIC  # mach_continuous_time: counts sleep
+else:
+    _ELAPSED_CLOCK = None
+
+# QueryPerformanceCounter / GetTickCount64 behind time.monotonic keep counting
+# through sleep and hibernation on Windows.
+ELAPSED_COUNTS_SUSPEND = _ELAPSED_CLOCK is not None or sys.platform == "win32"
+
+
+def elapsed_seconds() -> float:
+    """Seconds on a clock unaffected by wall-clock changes, including suspend when available."""
+    if _ELAPSED_CLOCK is not None:
+        return time.clock_gettime(_ELAPSED_CLOCK)
+    return time.monotonic()
+
+
+def drift_check_ms(ms_until_due: int) -> int:
+    """How long a timer may wait toward an alarm *ms_until_due* away.
+
+    A timer runs on the elapsed clock and cannot see a wall-clock jump that
+    no system notification reported, so it wakes early to let the service
+    re-check the clocks: after a quarter of the remaining wait, but no more
+    often than once a minute. An unreported jump is then noticed within a
+    quarter of the wait, while an alarm hours away costs a couple of dozen
+    wake-ups instead of one per minute.
+    """
+    return min(ms_until_due, max(DRIFT_CHECK_MIN_MS, ms_until_due // DRIFT_CHECK_FRACTION))
+
+
+def classify_lateness(lateness: float, stale_after: float, grace: float = GRACE) -> str:
+    """``ON_TIME`` within *grace* seconds, ``STALE`` from *stale_after* on, else ``LATE``."""
+    if lateness <= grace:
+        return ON_TIME
+    if lateness >= stale_after:
+        return STALE
+    return LATE
+
+
+class ClockWatch:
+    """Tracks the offset between the wall clock and the elapsed clock.
+
+    ``drift`` returns how far the wall clock moved relative to the elapsed
+    clock since the previous call: ~0 in normal operation and across a
+    suspend counted by the elapsed clock, ±N seconds after a clock jump.
+    *counts_suspend* says whether a suspend is counted; if not, a positive
+    drift may just be a sleep (defaults to ``ELAPSED_COUNTS_SUSPEND`` for
+    the platform clock, true for an injected one).
+    """
+
+    def __init__(
+        self,
+        wall: Callable[[], datetime] = datetime.now,
+        elapsed: Callable[[], float] = elapsed_seconds,
+        counts_suspend: Optional[bool] = None,
+    ) -> None:
+        self._wall = wall
+        self._elapsed = elapsed
+        if counts_suspend is None:
+            counts_suspend = ELAPSED_COUNTS_SUSPEND if elapsed is elapsed_seconds else True
+        self.counts_suspend = counts_suspend
+        self._offset = self._measure()
+
+    def read(self) -> tuple[datetime, float]:
+        return self._wall(), self._elapsed()
+
+    def to_elapsed(self, timestamp: float) -> float:
+        """A wall timestamp on the elapsed clock, as of the last ``drift`` reading."""
+        return timestamp - self._offset
+
+    def _measure(self) -> float:
+        wall, elapsed = self.read()
+        return wall.timestamp() - elapsed
+
+    def drift(self) -> float:
+        offset = self._measure()
+        drift, self._offset = offset - self._offset, offset
+        return drift
@@ -1,31 +1,266 @@
-"""Alarm business logic — countdown, scheduled, fire and notify."""
+"""Alarm business logic — countdown, scheduled, recurring, fire and notify."""
 
 from __future__ import annotations
 
-from datetime import datetime, timedelta
+import heapq
+import math
+import threading
+from datetime import date, datetime, time, timedelta
+from typing import Callable, Optional
 
-from sqlalchemy import select
+from sqlalchemy import select, update
 
 from daily_event.domain.enums import AlarmMode, AlarmStatus
 from daily_event.domain.models import Alarm
 from daily_event.infra.database import Database
 from daily_event.infra.notification import NotificationService
+from daily_event.infra.notification_dispatcher import coalesce
 from daily_event.infra.sound import SoundService
+from daily_event.services.alarm_clock import (
+    CATCH_UP_POLICIES,
+    DEFAULT_CATCH_UP,
+    DEFAULT_STALE_AFTER,
+    DRIFT_TOLERANCE,
+    STALE,
+    ClockWatch,
+    classify_lateness,
+    elapsed_seconds,
+)
+from daily_event.services.recurrence import compile_rule, describe_rule, is_valid_rule
+
+# Repeat presets offered by the alarm dialog; any recurrence.py day rule works too.
+ALARM_REPEAT_OPTIONS: list[tuple[str, str]] = [
+    ("daily", "每天"),
+    ("workday", "工作日"),
+    ("weekend", "周末"),
+    ("weekdays:", "自定义星期"),
+    ("hours:", "每 N 小时"),
+]
+
+
+def parse_every_hours(rule: str) -> Optional[int]:
+    """N for an ``hours:N`` rule, None for a day rule."""
+    kind, _, value = rule.partition(":")
+    if kind != "hours":
+        return None
+    hours = int(value)
+    if hours < 1:
+        raise ValueError(f"interval must be positive: {rule!r}")
+    return hours
+
+
+def is_valid_repeat(rule: str) -> bool:
+    try:
+        if parse_every_hours(rule) is not None:
+            return True
+    except ValueError:
+        return False
+    return is_valid_rule(rule)
+
+
+def describe_repeat(rule: str) -> str:
+    hours = parse_every_hours(rule)
+    if hours is not None:
+        return "每小时" if hours == 1 else f"每{hours}小时"
+    return describe_rule(rule)
+
+
+def format_remaining(target: datetime, now: datetime) -> str:
+    """Countdown text for a pending alarm: ``"4:05"``, ``"1:02:03"``, ``"2天3小时"``."""
+    seconds = max(0, math.ceil((target - now).total_seconds()))
+    if seconds >= 86400:
+        return f"{seconds // 86400}天{seconds % 86400 // 3600}小时"
+    hours, rest = divmod(seconds, 3600)
+    minutes, seconds = divmod(rest, 60)
+    if hours:
+        return f"{hours}:{minutes:02d}:{seconds:02d}"
+    return f"{minutes}:{seconds:02d}"
+
+
+def _late_suffix(lateness: float) -> str:
+    minutes = int(lateness // 60)
+    if minutes < 1:
+        return ""
+    if minutes < 120:
+        return f"（晚了 {minutes} 分钟）"
+    return f"（晚了 {minutes // 60} 小时）"
+
+
+def next_occurrence(
+    rule: str, previous: datetime, after: datetime, anchor: date
+) -> Optional[datetime]:
+    """First occurrence of *rule* strictly after *after*.
+
+    ``hours:N`` steps from *previous* in whole intervals of real time, on
+    POSIX timestamps, so a DST change neither stretches nor shrinks one
+    (missed ones are skipped, not replayed). Day rules (``recurrence.py``
+    grammar, anchored at *anchor*) keep *previous*'s time of day. None if
+    the rule never fires.
+    """
+    hours = parse_every_hours(rule)
+    if hours is not None:
+        step = hours * 3600
+        start = previous.timestamp()
+        return datetime.fromtimestamp(start + ((after.timestamp() - start) // step + 1) * step)
+    at = previous.time()
+    day = after.date()
+    if datetime.combine(day, at) <= after:
+        day += timedelta(days=1)
+    due = compile_rule(rule, anchor).next_due(day)
+    return datetime.combine(due, at) if due is not None else None
 
 
 class AlarmService:
+    """Alarm CRUD plus an in-memory schedule of the pending alarms.
+
+    Pending alarms live in a min-heap of ``(timestamp, id)``, loaded with
+    one query on first use and kept current by ``create_*`` / ``cancel``.
+    A scheduler only asks ``ms_until_next`` to arm a single timer and calls
+    ``fire_due`` when it expires, so nothing touches the database while no
+    alarm is due. Cancelled alarms are dropped lazily when they reach the top.
+    Keys are POSIX timestamps, so a DST change neither moves nor reorders
+    anything.
+
+    A recurring alarm is a single row: when it fires, its next occurrence
+    is computed from ``repeat_rule`` and written back to ``target_time``,
+    and the alarm goes back on the heap.
+
+    Countdowns also keep a deadline on the *elapsed* clock (monotonic, counting
+    suspend). Every ``ms_until_next`` / ``fire_due`` compares the wall clock
+    with it; when they drift apart (NTP correction, manual change) the
+    countdowns are re-anchored, while clock-time alarms stay on the wall
+    clock. Where the elapsed clock misses suspend, forward drift is left
+    alone, since it is indistinguishable from a sleep. Overdue alarms are classified by lateness and *catch_up* decides
+    what happens to stale ones: ``"fire"`` them, ``"summarize"`` them in one
+    quiet notification, or ``"drop"`` them (status ``missed``).
+    """
+
     def __init__(
         self,
         db: Database,
         notification: NotificationService,
         sound: SoundService,
+        clock: Callable[[], datetime] = datetime.now,
+        elapsed: Optional[Callable[[], float]] = None,
+        catch_up: str = DEFAULT_CATCH_UP,
+        stale_after: timedelta = DEFAULT_STALE_AFTER,
+        elapsed_counts_suspend: Optional[bool] = None,
     ) -> None:
         self._db = db
         self._notification = notification
         self._sound = sound
+        self._clock = clock
+        if elapsed is None:
+            # An injected wall clock without an elapsed clock never drifts.
+            elapsed = elapsed_seconds if clock is datetime.now else (lambda: clock().timestamp())
+        self._watch = ClockWatch(clock, elapsed, elapsed_counts_suspend)
+        self._catch_up = catch_up if catch_up in CATCH_UP_POLICIES else DEFAULT_CATCH_UP
+        self._stale_after = stale_after.total_seconds()
+        self._lock = threading.Lock()
+        self._heap: list[tuple[float, int]] = []
+        self._targets: Optional[dict[int, float]] = None  # pending id -> timestamp
+        self._deadlines: dict[int, float] = {}  # pending countdown id -> elapsed deadline
+        self.queries = 0
+        self.clock_jumps = 0
+
+    # -- schedule --
+
+    def _schedule(self) -> dict[int, float]:
+        """The pending alarms by id, loading them on first use (lock held)."""
+        if self._targets is None:
+            with self._db.session_scope() as session:
+                rows = session.execute(
+                    select(Alarm.id, Alarm.target_time, Alarm.mode).where(
+                        Alarm.status == AlarmStatus.PENDING.value
+                    )
+                ).all()
+            self.queries += 1
+            self._targets = {alarm_id: target.timestamp() for alarm_id, target, _ in rows}
+            self._heap = [(ts, alarm_id) for alarm_id, ts in self._targets.items()]
+            heapq.heapify(self._heap)
+            for alarm_id, _, mode in rows:
+                if mode == AlarmMode.COUNTDOWN.value:
+                    self._deadlines[alarm_id] = self._watch.to_elapsed(self._targets[alarm_id])
+        return self._targets
+
+    def _push(self, alarm_id: int, target: datetime, deadline: Optional[float] = None) -> None:
+        with self._lock:
+            ts = target.timestamp()
+            self._schedule()[alarm_id] = ts
+            heapq.heappush(self._heap, (ts, alarm_id))
+            if deadline is not None:
+                self._deadlines[alarm_id] = deadline
+
+    def _head(self) -> Optional[tuple[float, int]]:
+        """The earliest live heap entry, discarding cancelled ones (lock held)."""
+        targets = self._schedule()
+        while self._heap:
+            ts, alarm_id = self._heap[0]
+            if targets.get(alarm_id) == ts:
+                return ts, alarm_id
+            heapq.heappop(self._heap)
+        return None
+
+    def check_clock(self) -> float:
+        """Re-anchor countdowns if the wall clock jumped; returns the jump in seconds."""
+        with self._lock:
+            self._schedule()  # anchor loaded countdowns before the new reading
+        drift = self._watch.drift()
+        if abs(drift) < DRIFT_TOLERANCE:
+            return 0.0
+        if drift > 0 and not self._watch.counts_suspend:
+            # Maybe a sleep the elapsed clock missed: keep the wall targets
+            # rather than push countdowns back, and rebase their deadlines.
+            with self._lock:
+                for alarm_id, ts in self._schedule().items():
+                    if alarm_id in self._deadlines:
+                        self._deadlines[alarm_id] = self._watch.to_elapsed(ts)
+            return 0.0
+        self.clock_jumps += 1
+        now, elapsed = self._watch.read()
+        moved: list[tuple[int, datetime]] = []
+        with self._lock:
+            targets = self._schedule()
+            for alarm_id, deadline in list(self._deadlines.items()):
+                if alarm_id not in targets:
+                    del self._deadlines[alarm_id]
+                    continue
+                ts = now.timestamp() + deadline - elapsed
+                targets[alarm_id] = ts
+                heapq.heappush(self._heap, (ts, alarm_id))
+                moved.append((alarm_id, datetime.fromtimestamp(ts)))
+        if moved:
+            with self._db.session_scope() as session:
+                for alarm_id, target in moved:
+                    session.execute(
+                        update(Alarm).where(Alarm.id == alarm_id).values(target_time=target)
+                    )
+        return drift
+
+    @property
+    def pending_count(self) -> int:
+        with self._lock:
+            return len(self._schedule())
+
+    def next_fire_at(self) -> Optional[datetime]:
+        with self._lock:
+            head = self._head()
+        return datetime.fromtimestamp(head[0]) if head else None
+
+    def ms_until_next(self) -> Optional[int]:
+        """Milliseconds until the next alarm (rounded up, never early); None when idle."""
+        self.check_clock()
+        with self._lock:
+            head = self._head()
+        if head is None:
+            return None
+        return max(0, math.ceil((head[0] - self._clock().timestamp()) * 1000))
+
+    # -- CRUD --
 
     def create_countdown(self, label: str, minutes: int) -> int:
-        target = datetime.now() + timedelta(minutes=minutes)
+        now, elapsed = self._watch.read()
+        target = datetime.fromtimestamp(now.timestamp() + minutes * 60)
         auto_label = label or f"{minutes} 分钟倒计时"
         with self._db.session_scope() as session:
             alarm = Alarm(
@@ -33,13 +268,16 @@ class AlarmService:
                 mode=AlarmMode.COUNTDOWN.value,
                 target_time=target,
                 duration_seconds=minutes * 60,
+                created_at=now,
             )
             session.add(alarm)
             session.flush()
-            return alarm.id
+            alarm_id = alarm.id
+        self._push(alarm_id, target, deadline=elapsed + minutes * 60)
+        return alarm_id
 
     def create_scheduled(self, label: str, hour: int, minute: int) -> int:
-        now = datetime.now()
+        now = self._clock()
         target = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
         if target <= now:
             target += timedelta(days=1)
@@ -49,44 +287,130 @@ class AlarmService:
                 label=auto_label,
                 mode=AlarmMode.SCHEDULED.value,
                 target_time=target,
+                created_at=now,
+            )
+            session.add(alarm)
+            session.flush()
+            alarm_id = alarm.id
+        self._push(alarm_id, target)
+        return alarm_id
+
+    def create_recurring(self, label: str, rule: str, hour: int = 0, minute: int = 0) -> int:
+        """Alarm repeating by *rule*: a day rule at *hour*:*minute*, or ``hours:N`` from now."""
+        if not is_valid_repeat(rule):
+            raise ValueError(f"invalid repeat rule: {rule!r}")
+        now = self._clock()
+        if parse_every_hours(rule) is not None:
+            target = next_occurrence(rule, now, now, now.date())
+            auto_label = label or f"{describe_repeat(rule)}提醒"
+        else:
+            start = datetime.combine(now.date(), time(hour, minute))
+            target = next_occurrence(rule, start, now, now.date())
+            auto_label = label or f"{describe_repeat(rule)} {hour:02d}:{minute:02d} 提醒"
+        if target is None:
+            raise ValueError(f"repeat rule never fires: {rule!r}")
+        with self._db.session_scope() as session:
+            alarm = Alarm(
+                label=auto_label,
+                mode=AlarmMode.RECURRING.value,
+                target_time=target,
+                repeat_rule=rule,
+                created_at=now,
             )
             session.add(alarm)
             session.flush()
-            return alarm.id
+            alarm_id = alarm.id
+        self._push(alarm_id, target)
+        return alarm_id
 
     def cancel(self, alarm_id: int) -> None:
         with self._db.session_scope() as session:
             alarm = session.get(Alarm, alarm_id)
             if alarm and alarm.status == AlarmStatus.PENDING.value:
                 alarm.status = AlarmStatus.CANCELLED.value
+        with self._lock:
+            self._schedule().pop(alarm_id, None)
+            self._deadlines.pop(alarm_id, None)
 
     def get_all(self) -> list[Alarm]:
         with self._db.session_scope() as session:
             return list(
                 session.execute(
-                    select(Alarm).order_by(Alarm.created_at.desc())
+                    select(Alarm).order_by(Alarm.created_at.desc(), Alarm.id.desc())
                 )
                 .scalars()
                 .all()
             )
 
-    def check_and_fire(self) -> list[Alarm]:
-        """Check pending alarms; fire those past target_time. Returns newly fired."""
-        now = datetime.now()
+    def fire_due(self) -> list[Alarm]:
+        """Fire the alarms whose target time has passed. Returns newly fired.
+
+        Pops due entries off the heap and touches the database only when
+        there is something to fire. Each alarm is classified by lateness
+        (``classify_lateness``); on-time and late ones ring, stale ones
+        follow the catch-up policy. A recurring alarm that missed several
+        occurrences (app closed, machine asleep) is handled once and moves on
+        to its next future occurrence.
+        """
+        self.check_clock()
+        now = self._clock()
+        now_ts = now.timestamp()
+        due: dict[int, float] = {}
+        with self._lock:
+            targets = self._schedule()
+            head = self._head()
+            while head is not None and head[0] <= now_ts:
+                heapq.heappop(self._heap)
+                del targets[head[1]]
+                self._deadlines.pop(head[1], None)
+                due[head[1]] = now_ts - head[0]
+                head = self._head()
+        if not due:
+            return []
+        ring: list[tuple[Alarm, float]] = []
+        stale: list[Alarm] = []
         with self._db.session_scope() as session:
-            pending = list(
+            fired = list(
                 session.execute(
-                    select(Alarm).where(
-                        Alarm.status == AlarmStatus.PENDING.value,
-                        Alarm.target_time <= now,
-                    )
+                    select(Alarm)
+                    .where(Alarm.id.in_(list(due)), Alarm.status == AlarmStatus.PENDING.value)
+                    .order_by(Alarm.target_time)
                 )
                 .scalars()
                 .all()
             )
-            for alarm in pending:
-                alarm.status = AlarmStatus.FIRED.value
-                self._notification.notify("闹钟提醒", alarm.label)
-                if alarm.sound_enabled:
-                    self._sound.play_alarm()
-            return pending
+            again: list[tuple[int, datetime]] = []
+            for alarm in fired:
+                lateness = due[alarm.id]
+                kind = classify_lateness(lateness, self._stale_after)
+                if kind == STALE and self._catch_up != "fire":
+                    stale.append(alarm)
+                else:
+                    ring.append((alarm, lateness))
+                upcoming = None
+                if alarm.repeat_rule:
+                    upcoming = next_occurrence(
+                        alarm.repeat_rule, alarm.target_time, now, alarm.created_at.date()
+                    )
+                if upcoming is not None:
+                    again.append((alarm.id, upcoming))
+                    alarm.target_time = upcoming
+                elif kind == STALE and self._catch_up == "drop":
+                    alarm.status = AlarmStatus.MISSED.value
+                else:
+                    alarm.status = AlarmStatus.FIRED.value
+        for alarm_id, upcoming in again:
+            self._push(alarm_id, upcoming)
+        # Notify after the commit: the transaction never waits on a toast or a sound.
+        for alarm, lateness in ring:
+            self._notification.notify("闹钟提醒", alarm.label + _late_suffix(lateness))
+        if stale and self._catch_up == "summarize":
+            missed = [
+                ("错过的闹钟", f"{a.label}（{datetime.fromtimestamp(now_ts - due[a.id]):%m-%d %H:%M}）")
+                for a in stale
+            ]
+            for title, message in coalesce(missed):
+                self._notification.notify(title, message)
+        if any(alarm.sound_enabled for alarm, _ in ring):
+            self._sound.play_alarm()
+        return fired
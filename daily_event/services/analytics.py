@@ -0,0 +1,125 @@
+"""Rolling completion-rate analytics over day-indexed arrays.
+
+Every habit is described by two equally long 0/1 rows — *done* and *due* —
+indexed by day, oldest first, with the last column being today. Rates are
+completions on due days / due days inside a trailing window, computed from prefix sums so
+each window is two subtractions. NumPy evaluates all habits at once when it is
+installed; otherwise a pure-Python path with identical results is used
+(PyInstaller builds exclude NumPy, see daily_event.spec).
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass
+from itertools import accumulate
+from typing import Optional, Sequence
+
+try:  # optional acceleration
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised when NumPy is absent
+    np = None
+
+HAVE_NUMPY = np is not None
+
+RATE_WINDOWS = (7, 30, 90)
+SPARKLINE_DAYS = 90
+SPARKLINE_WINDOW = 7
+# Days of history needed to fill every window and the sparkline.
+SPAN_DAYS = max(max(RATE_WINDOWS), SPARKLINE_DAYS + SPARKLINE_WINDOW - 1)
+
+
+@dataclass
+class TrendRow:
+    rates: dict[int, Optional[float]]  # window -> rate, None if nothing was due
+    week_over_week: Optional[float]  # 7-day rate today minus 7-day rate a week ago
+    sparkline: list[Optional[float]]  # rolling 7-day rate for the last 90 days
+
+
+def _rate(done: float, due: float) -> Optional[float]:
+    if due <= 0:
+        return None
+    return done / due
+
+
+def _compute_python(done_rows, due_rows, span: int) -> list[TrendRow]:
+    result: list[TrendRow] = []
+    w = SPARKLINE_WINDOW
+    for done, due in zip(done_rows, due_rows):
+        cd = [0, *accumulate(d & u for d, u in zip(done, due))]
+        cu = [0, *accumulate(due)]
+        rates = {
+            win: _rate(cd[span] - cd[span - win], cu[span] - cu[span - win])
+            for win in RATE_WINDOWS
+        }
+        spark = [
+            _rate(cd[t] - cd[t - w], cu[t] - cu[t - w])
+            for t in range(span - SPARKLINE_DAYS + 1, span + 1)
+        ]
+        result.append(TrendRow(rates, _delta(spark), spark))
+    return result
+
+
+def _compute_numpy(done_rows, due_rows, span: int) -> list[TrendRow]:
+    n = len(done_rows)
+    cd = np.zeros((n, span + 1), dtype=np.int32)
+    cu = np.zeros((n, span + 1), dtype=np.int32)
+    due_arr = np.asarray(due_rows, dtype=np.int32)
+    np.cumsum(np.asarray(done_rows, dtype=np.int32) & due_arr, axis=1, out=cd[:, 1:])
+    np.cumsum(due_arr, axis=1, out=cu[:, 1:])
+
+    def rates(d, u):
+        with np.errstate(divide="ignore", invalid="ignore"):
+            return np.where(u > 0, d / u, np.nan)
+
+    def clean(values) -> list[Optional[float]]:
+        return [None if v != v else float(v) for v in values.tolist()]
+
+    window_rates = {
+        win: clean(rates(cd[:, span] - cd[:, span - win], cu[:, span] - cu[:, span - win]))
+        for win in RATE_WINDOWS
+    }
+    w = SPARKLINE_WINDOW
+    lo = span - SPARKLINE_DAYS + 1
+    spark = rates(cd[:, lo:] - cd[:, lo - w:span + 1 - w], cu[:, lo:] - cu[:, lo - w:span + 1 - w])
+
+    result: list[TrendRow] = []
+    for i, spark_row in enumerate(spark):
+        spark_list = clean(spark_row)
+        result.append(
+            TrendRow(
+                {win: window_rates[win][i] for win in RATE_WINDOWS},
+                _delta(spark_list),
+                spark_list,
+            )
+        )
+    return result
+
+
+def _delta(spark: list[Optional[float]]) -> Optional[float]:
+    now, before = spark[-1], spark[-1 - 7]
+    if now is None or before is None:
+        return None
+    return now - before
+
+
+def compute_trends(
+    done_rows: Sequence[Sequence[int]],
+    due_rows: Sequence[Sequence[int]],
+    use_numpy: Optional[bool] = None,
+) -> list[TrendRow]:
+    """Rates, week-over-week delta and sparkline for each (done, due) row pair.
+
+    Rows must all be ``SPAN_DAYS`` long. *use_numpy* forces a backend
+    (``None`` = NumPy when available).
+    """
+    if not done_rows:
+        return []
+    span = len(done_rows[0])
+    if span < SPAN_DAYS:
+        raise ValueError(f"rows must cover at least {SPAN_DAYS} days, got {span}")
+    if use_numpy is None:
+        use_numpy = HAVE_NUMPY
+    if use_numpy and not HAVE_NUMPY:
+        raise RuntimeError("NumPy is not installed")
+    impl = _compute_numpy if use_numpy else _compute_python
+    return impl(done_rows, due_rows, span)
@@ -2,12 +2,46 @@
 
 from __future__ import annotations
 
+import heapq
+from collections import OrderedDict, defaultdict
 from dataclasses import dataclass
 from datetime import date, timedelta
-from typing import TYPE_CHECKING
+from itertools import accumulate
+from typing import (
+    TYPE_CHECKING,
+    Callable,
+    Collection,
+    Iterable,
+    Iterator,
+    NamedTuple,
+    Optional,
+    Sequence,
+)
+
+try:  # optional acceleration for batch splitting / density
+    import numpy as np
+except ImportError:  # pragma: no cover - exercised when NumPy is absent
+    np = None
 
 if TYPE_CHECKING:
-    from daily_event.domain.models import WorkEvent
+    from daily_event.services.work_event_service import CalendarItem
+
+GRID_DAYS = 42
+# Below this many events the NumPy set-up cost outweighs the vector math.
+NUMPY_BATCH_MIN = 64
+
+
+class SegmentColumns(NamedTuple):
+    """Row segments as parallel columns — no per-segment object is allocated."""
+
+    rows: list[int]
+    start_cols: list[int]
+    end_cols: list[int]
+    event_ids: list[int]
+
+    def spans(self) -> Iterator[tuple[int, int, int, int]]:
+        """Iterate ``(row, start_col, end_col, event_id)`` tuples."""
+        return zip(self.rows, self.start_cols, self.end_cols, self.event_ids)
 
 
 @dataclass
@@ -22,7 +56,164 @@ class EventSegment:
     slot: int = 0
 
 
+@dataclass
+class Conflict:
+    """A run of consecutive overloaded days and the events open during it."""
+
+    start: date
+    end: date
+    peak: int
+    event_ids: list[int]
+
+
+@dataclass
+class Workload:
+    """Concurrent open events per grid day and the runs above *threshold*."""
+
+    first: date
+    counts: list[int]
+    threshold: int
+    conflicts: list[Conflict]
+
+    def count_on(self, d: date) -> int:
+        i = (d - self.first).days
+        return self.counts[i] if 0 <= i < len(self.counts) else 0
+
+
+def _overlaps(a: EventSegment, b: EventSegment) -> bool:
+    return a.start_col <= b.end_col and b.start_col <= a.end_col
+
+
+class MonthLayout:
+    """Segments and slots for one calendar grid, updated event by event.
+
+    ``update`` diffs the incoming events against the previous call by
+    (dates, color, title). Unchanged events keep their segments and slots;
+    added or edited events are re-split and slotted into the lowest free
+    slot of their rows around the existing bars, and removed events simply
+    leave their slot empty. Only a fresh layout packs from scratch.
+    """
+
+    def __init__(self, grid_start: date) -> None:
+        self.grid_start = grid_start
+        self.version: int | None = None
+        self._keys: dict[int, tuple] = {}
+        self._by_event: dict[int, list[EventSegment]] = {}
+        self._by_row: dict[int, list[EventSegment]] = defaultdict(list)
+        self._flat: list[EventSegment] = []
+        self._workload: Workload | None = None
+
+    @property
+    def segments(self) -> list[EventSegment]:
+        return self._flat
+
+    def workload(self, threshold: int) -> Workload:
+        """Per-day workload of the current events; cached until the next ``update``."""
+        cached = self._workload
+        if cached is None or cached.threshold != threshold:
+            ids = list(self._keys)
+            cached = self._workload = CalendarService.workload(
+                [self._keys[eid][0].toordinal() for eid in ids],
+                [self._keys[eid][1].toordinal() for eid in ids],
+                ids,
+                self.grid_start,
+                GRID_DAYS,
+                threshold,
+            )
+        return cached
+
+    def update(self, events: Iterable[CalendarItem], color_for: Callable[[int], str]) -> set[int]:
+        """Apply *events* (the complete current set); returns the rows that changed."""
+        incoming = {
+            ev.id: (ev.start_date, ev.end_date, color_for(ev.color_index), ev.title)
+            for ev in events
+        }
+        fresh = not self._keys
+        dirty_rows: set[int] = set()
+        self._workload = None
+
+        for event_id in [eid for eid in self._keys if incoming.get(eid) != self._keys[eid]]:
+            for seg in self._by_event.pop(event_id):
+                self._by_row[seg.row].remove(seg)
+                dirty_rows.add(seg.row)
+            del self._keys[event_id]
+
+        new_ids = [eid for eid in incoming if eid not in self._keys]
+        added: list[EventSegment] = []
+        for eid in new_ids:
+            self._keys[eid] = incoming[eid]
+            self._by_event[eid] = []
+        for row, start_col, end_col, eid in CalendarService.split_ranges_batch(
+            [incoming[eid][0].toordinal() for eid in new_ids],
+            [incoming[eid][1].toordinal() for eid in new_ids],
+            new_ids,
+            self.grid_start,
+        ).spans():
+            _, _, color, title = incoming[eid]
+            seg = EventSegment(row, start_col, end_col, color, eid, title)
+            self._by_event[eid].append(seg)
+            added.append(seg)
+
+        if fresh:
+            CalendarService.assign_slots(added)
+            for seg in added:
+                self._by_row[seg.row].append(seg)
+        else:
+            added.sort(key=lambda s: (s.row, s.start_col, s.event_id))
+            for seg in added:
+                row_segs = self._by_row[seg.row]
+                used = {other.slot for other in row_segs if _overlaps(seg, other)}
+                slot = 0
+                while slot in used:
+                    slot += 1
+                seg.slot = slot
+                row_segs.append(seg)
+        dirty_rows.update(seg.row for seg in added)
+
+        if dirty_rows or fresh:
+            self._flat = [seg for segs in self._by_event.values() for seg in segs]
+        return dirty_rows
+
+
 class CalendarService:
+    """Grid geometry helpers plus a small cache of per-grid layouts."""
+
+    def __init__(self, layout_capacity: int = 6) -> None:
+        self._layouts: OrderedDict[date, MonthLayout] = OrderedDict()
+        self._capacity = layout_capacity
+
+    def layout(
+        self,
+        grid_start: date,
+        events: Iterable[CalendarItem],
+        version: int,
+        color_for: Callable[[int], str],
+    ) -> list[EventSegment]:
+        """Slotted segments for *events* on the grid starting at *grid_start*.
+
+        Cached per ``(grid_start, version)``: an unchanged version returns the
+        previous segments untouched, a new version updates the cached layout
+        incrementally (see ``MonthLayout``).
+        """
+        layout = self._layouts.get(grid_start)
+        if layout is None:
+            layout = MonthLayout(grid_start)
+            self._layouts[grid_start] = layout
+            while len(self._layouts) > self._capacity:
+                self._layouts.popitem(last=False)
+        else:
+            self._layouts.move_to_end(grid_start)
+            if layout.version == version:
+                return layout.segments
+        layout.update(events, color_for)
+        layout.version = version
+        return layout.segments
+
+    def cached_workload(self, grid_start: date, threshold: int) -> Optional[Workload]:
+        """Workload for the layout last built by ``layout(grid_start, ...)``, if still cached."""
+        layout = self._layouts.get(grid_start)
+        return layout.workload(threshold) if layout is not None else None
+
     @staticmethod
     def split_range_to_segments(
         start_date: date,
@@ -69,24 +260,268 @@ class CalendarService:
 
         return segments
 
+    @staticmethod
+    def split_ranges_batch(
+        start_ordinals: Sequence[int],
+        end_ordinals: Sequence[int],
+        event_ids: Sequence[int],
+        grid_start: date,
+        use_numpy: Optional[bool] = None,
+    ) -> SegmentColumns:
+        """Batch form of ``split_range_to_segments`` on proleptic ordinals.
+
+        Returns the segments as columns, in the same order the per-event
+        function would produce them, computed with plain integer division
+        instead of per-week ``timedelta`` steps. NumPy handles large batches
+        when installed (*use_numpy* forces a backend).
+        """
+        if use_numpy is None:
+            use_numpy = np is not None and len(event_ids) >= NUMPY_BATCH_MIN
+        if use_numpy:
+            if np is None:
+                raise RuntimeError("NumPy is not installed")
+            return _split_numpy(start_ordinals, end_ordinals, event_ids, grid_start.toordinal())
+        return _split_python(start_ordinals, end_ordinals, event_ids, grid_start.toordinal())
+
+    @staticmethod
+    def day_density(
+        start_ordinals: Sequence[int],
+        end_ordinals: Sequence[int],
+        first: date,
+        days: int,
+        use_numpy: Optional[bool] = None,
+    ) -> list[int]:
+        """Number of ranges covering each of *days* days from *first*.
+
+        A difference array (+1 at the clipped start, -1 after the clipped
+        end) followed by one prefix sum, so the cost is O(ranges + days)
+        regardless of how long the ranges are.
+        """
+        if use_numpy is None:
+            use_numpy = np is not None and len(start_ordinals) >= NUMPY_BATCH_MIN
+        if use_numpy and np is None:
+            raise RuntimeError("NumPy is not installed")
+        f0 = first.toordinal()
+        if use_numpy:
+            s = np.asarray(start_ordinals, dtype=np.int64) - f0
+            e = np.asarray(end_ordinals, dtype=np.int64) - f0
+            np.maximum(s, 0, out=s)
+            np.minimum(e, days - 1, out=e)
+            keep = s <= e
+            diff = np.bincount(s[keep], minlength=days + 1)
+            diff -= np.bincount(e[keep] + 1, minlength=days + 1)
+            return np.cumsum(diff[:days]).tolist()
+        diff = [0] * (days + 1)
+        for start, end in zip(start_ordinals, end_ordinals):
+            s = max(start - f0, 0)
+            e = min(end - f0, days - 1)
+            if s <= e:
+                diff[s] += 1
+                diff[e + 1] -= 1
+        return list(accumulate(diff[:days]))
+
+    @staticmethod
+    def workload(
+        start_ordinals: Sequence[int],
+        end_ordinals: Sequence[int],
+        event_ids: Sequence[int],
+        first: date,
+        days: int,
+        threshold: int,
+        use_numpy: Optional[bool] = None,
+    ) -> Workload:
+        """Days with more than *threshold* concurrent ranges, as maximal runs.
+
+        Counts come from ``day_density`` (difference array + prefix sum). The
+        runs are found in one pass over the counts, and each range is mapped
+        to the runs it touches through a ``next_run`` table (first run ending
+        on or after each day), so the whole thing is O(ranges + days + output)
+        with no pairwise comparison. ``threshold <= 0`` disables detection.
+        """
+        counts = CalendarService.day_density(start_ordinals, end_ordinals, first, days, use_numpy)
+        if threshold <= 0:
+            return Workload(first, counts, threshold, [])
+
+        runs: list[tuple[int, int]] = []
+        run_start = -1
+        for i, count in enumerate(counts):
+            if count > threshold:
+                if run_start < 0:
+                    run_start = i
+            elif run_start >= 0:
+                runs.append((run_start, i - 1))
+                run_start = -1
+        if run_start >= 0:
+            runs.append((run_start, days - 1))
+        if not runs:
+            return Workload(first, counts, threshold, [])
+
+        # next_run[i]: index of the first run that ends on or after day i.
+        next_run = [len(runs)] * (days + 1)
+        k = len(runs)
+        for i in range(days - 1, -1, -1):
+            while k > 0 and runs[k - 1][1] >= i:
+                k -= 1
+            next_run[i] = k
+        members: list[list[int]] = [[] for _ in runs]
+        f0 = first.toordinal()
+        for start, end, eid in zip(start_ordinals, end_ordinals, event_ids):
+            s = max(start - f0, 0)
+            e = min(end - f0, days - 1)
+            if s > e:
+                continue
+            k = next_run[s]
+            while k < len(runs) and runs[k][0] <= e:
+                members[k].append(eid)
+                k += 1
+
+        conflicts = [
+            Conflict(
+                first + timedelta(days=a),
+                first + timedelta(days=b),
+                max(counts[a:b + 1]),
+                ids,
+            )
+            for (a, b), ids in zip(runs, members)
+        ]
+        return Workload(first, counts, threshold, conflicts)
+
     @staticmethod
     def assign_slots(segments: list[EventSegment]) -> None:
-        """Assign vertical slot indices so overlapping segments stack."""
-        from collections import defaultdict
+        """Assign vertical slot indices so overlapping segments stack.
 
+        Interval partitioning per row: segments are swept by start column
+        while a heap of (end_col, slot) tracks the bars still open and a
+        second heap holds released slots, so each segment takes the lowest
+        free slot in O(log n) instead of rescanning everything placed so far.
+        """
         by_row: dict[int, list[EventSegment]] = defaultdict(list)
         for seg in segments:
             by_row[seg.row].append(seg)
 
         for row_segs in by_row.values():
             row_segs.sort(key=lambda s: (s.start_col, s.event_id))
-            occupied: list[tuple[int, int]] = []  # (end_col, slot)
+            active: list[tuple[int, int]] = []  # (end_col, slot)
+            free: list[int] = []
+            next_slot = 0
             for seg in row_segs:
-                used_slots = {
-                    slot for end_col, slot in occupied if end_col >= seg.start_col
-                }
-                slot = 0
-                while slot in used_slots:
-                    slot += 1
+                while active and active[0][0] < seg.start_col:
+                    heapq.heappush(free, heapq.heappop(active)[1])
+                if free:
+                    slot = heapq.heappop(free)
+                else:
+                    slot = next_slot
+                    next_slot += 1
                 seg.slot = slot
-                occupied.append((seg.end_col, slot))
+                heapq.heappush(active, (seg.end_col, slot))
+
+    @staticmethod
+    def filter_segments(
+        segments: Iterable[EventSegment], event_ids: Collection[int]
+    ) -> list[EventSegment]:
+        """Copies of the segments belonging to *event_ids*, packed into fresh slots.
+
+        Used for tag filters: the cached layout stays untouched, and hidden
+        bars leave no empty slots behind.
+        """
+        kept = [
+            EventSegment(s.row, s.start_col, s.end_col, s.color_hex, s.event_id, s.title)
+            for s in segments
+            if s.event_id in event_ids
+        ]
+        CalendarService.assign_slots(kept)
+        return kept
+
+    @staticmethod
+    def overflow_counts(
+        segments: Iterable[EventSegment], max_slots: int
+    ) -> dict[tuple[int, int], int]:
+        """Per (row, col) cell, how many bars sit in slots >= *max_slots*."""
+        counts: dict[tuple[int, int], int] = defaultdict(int)
+        if max_slots <= 0:
+            return {}
+        for seg in segments:
+            if seg.slot >= max_slots:
+                for col in range(seg.start_col, seg.end_col + 1):
+                    counts[(seg.row, col)] += 1
+        return dict(counts)
+
+
+def _span_tables() -> tuple[list[bytes], list[bytes], list[bytes], list[int]]:
+    """Row segments of every clipped (start, end) grid offset pair, keyed ``s * GRID_DAYS + e``.
+
+    Rows and columns are < 256, so each entry is a ``bytes`` run and a whole
+    column is one ``b"".join``. Pairs with ``s > e`` stay empty.
+    """
+    size = GRID_DAYS * GRID_DAYS
+    rows, start_cols, end_cols = [b""] * size, [b""] * size, [b""] * size
+    counts = [0] * size
+    for s in range(GRID_DAYS):
+        for e in range(s, GRID_DAYS):
+            r0, c0 = divmod(s, 7)
+            r1, c1 = divmod(e, 7)
+            n = r1 - r0 + 1
+            key = s * GRID_DAYS + e
+            rows[key] = bytes(range(r0, r1 + 1))
+            start_cols[key] = bytes([c0] + [0] * (n - 1))
+            end_cols[key] = bytes([6] * (n - 1) + [c1])
+            counts[key] = n
+    return rows, start_cols, end_cols, counts
+
+
+_SPAN_ROWS, _SPAN_START_COLS, _SPAN_END_COLS, _SPAN_COUNTS = _span_tables()
+
+
+def _split_python(starts, ends, event_ids, g0: int) -> SegmentColumns:
+    # The loop only clips and computes a table key; the three small-int
+    # columns are then joined from the precomputed byte runs in C.
+    keys: list[int] = []
+    ids: list[int] = []
+    add_key, add_id, add_ids = keys.append, ids.append, ids.extend
+    counts = _SPAN_COUNTS
+    last = GRID_DAYS - 1
+    for start, end, eid in zip(starts, ends, event_ids):
+        s = start - g0
+        e = end - g0
+        if s < 0:
+            s = 0
+        if e > last:
+            e = last
+        if s > e:
+            continue
+        key = s * GRID_DAYS + e
+        add_key(key)
+        n = counts[key]
+        if n == 1:
+            add_id(eid)
+        else:
+            add_ids((eid,) * n)
+    join = b"".join
+    return SegmentColumns(
+        list(join(map(_SPAN_ROWS.__getitem__, keys))),
+        list(join(map(_SPAN_START_COLS.__getitem__, keys))),
+        list(join(map(_SPAN_END_COLS.__getitem__, keys))),
+        ids,
+    )
+
+
+def _split_numpy(starts, ends, event_ids, g0: int) -> SegmentColumns:
+    count = len(event_ids)
+    s = np.fromiter(starts, dtype=np.int64, count=count) - g0
+    e = np.fromiter(ends, dtype=np.int64, count=count) - g0
+    ids = np.fromiter(event_ids, dtype=np.int64, count=count)
+    np.maximum(s, 0, out=s)
+    np.minimum(e, GRID_DAYS - 1, out=e)
+    keep = s <= e
+    s, e, ids = s[keep], e[keep], ids[keep]
+    r0 = s // 7
+    r1 = e // 7
+    counts = r1 - r0 + 1
+    owner = np.repeat(np.arange(len(s)), counts)
+    first = np.cumsum(counts) - counts  # index of each event's first row span
+    rows = r0[owner] + (np.arange(len(owner)) - first[owner])
+    start_cols = np.where(rows == r0[owner], s[owner] % 7, 0)
+    end_cols = np.where(rows == r1[owner], e[owner] % 7, 6)
+    return SegmentColumns(
+        rows.tolist(), start_cols.tolist(), end_cols.tolist(), ids[owner].tolist()
+    )
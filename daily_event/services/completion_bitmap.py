@@ -0,0 +1,128 @@
+"""Compact bitset storage for Daily Event completions.
+
+Each ``(event_id, year)`` pair is persisted as one little-endian BLOB in
+which bit *i* marks day-of-year *i* (Jan 1 = bit 0). In memory all years of
+an event are stitched into a single Python int, so streak, total and range
+queries become a handful of bitwise operations instead of per-day loops.
+"""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+from typing import Iterable, Iterator, Mapping, Optional
+
+YEAR_BYTES = 46  # 366 bits rounded up to whole bytes
+
+
+def _year_base(year: int) -> int:
+    return date(year, 1, 1).toordinal()
+
+
+def _popcount(value: int) -> int:
+    return bin(value).count("1")
+
+
+def encode_dates(dates: Iterable[date]) -> dict[int, bytes]:
+    """Pack completion dates into ``{year: blob}``."""
+    words: dict[int, int] = {}
+    for d in dates:
+        words[d.year] = words.get(d.year, 0) | (1 << (d.toordinal() - _year_base(d.year)))
+    return {year: bits.to_bytes(YEAR_BYTES, "little") for year, bits in words.items()}
+
+
+def set_day(blob: Optional[bytes], d: date, done: bool = True) -> bytes:
+    """Return *blob* with the bit for *d* set (or cleared when *done* is False)."""
+    bits = int.from_bytes(blob, "little") if blob else 0
+    mask = 1 << (d.toordinal() - _year_base(d.year))
+    bits = bits | mask if done else bits & ~mask
+    return bits.to_bytes(YEAR_BYTES, "little")
+
+
+def merge_blobs(a: Optional[bytes], b: Optional[bytes]) -> bytes:
+    bits = int.from_bytes(a or b"", "little") | int.from_bytes(b or b"", "little")
+    return bits.to_bytes(YEAR_BYTES, "little")
+
+
+class CompletionBitmap:
+    """Read-only completion set backed by one arbitrary-precision int.
+
+    Behaves like ``set[date]`` for ``in`` / ``len`` / iteration, so it can be
+    passed anywhere a set of completion dates is expected.
+    """
+
+    __slots__ = ("_base", "_bits")
+
+    def __init__(self, base_ordinal: int = 0, bits: int = 0) -> None:
+        self._base = base_ordinal
+        self._bits = bits
+
+    @classmethod
+    def from_blobs(cls, blobs: Mapping[int, bytes]) -> CompletionBitmap:
+        if not blobs:
+            return cls()
+        base = _year_base(min(blobs))
+        bits = 0
+        for year, blob in blobs.items():
+            bits |= int.from_bytes(blob, "little") << (_year_base(year) - base)
+        return cls(base, bits)
+
+    @classmethod
+    def from_dates(cls, dates: Iterable[date]) -> CompletionBitmap:
+        return cls.from_blobs(encode_dates(dates))
+
+    def _offset(self, d: date) -> int:
+        return d.toordinal() - self._base
+
+    def __contains__(self, d: object) -> bool:
+        if not isinstance(d, date):
+            return False
+        k = self._offset(d)
+        return k >= 0 and bool((self._bits >> k) & 1)
+
+    def __len__(self) -> int:
+        return _popcount(self._bits)
+
+    def __bool__(self) -> bool:
+        return self._bits != 0
+
+    def __iter__(self) -> Iterator[date]:
+        bits = self._bits
+        while bits:
+            low = bits & -bits
+            yield date.fromordinal(self._base + low.bit_length() - 1)
+            bits ^= low
+
+    def to_set(self) -> set[date]:
+        return set(self)
+
+    def last(self) -> Optional[date]:
+        if not self._bits:
+            return None
+        return date.fromordinal(self._base + self._bits.bit_length() - 1)
+
+    def count_between(self, start: date, end: date) -> int:
+        """Number of completed days in ``[start, end]``."""
+        lo = max(self._offset(start), 0)
+        hi = self._offset(end)
+        if hi < lo:
+            return 0
+        window = (self._bits >> lo) & ((1 << (hi - lo + 1)) - 1)
+        return _popcount(window)
+
+    def run_ending_at(self, d: date) -> int:
+        """Length of the consecutive completed run ending on *d* (0 if *d* is not done)."""
+        k = self._offset(d)
+        if k < 0 or not (self._bits >> k) & 1:
+            return 0
+        mask = (1 << (k + 1)) - 1
+        gaps = ~self._bits & mask
+        if not gaps:
+            return k + 1
+        return k + 1 - gaps.bit_length()
+
+    def streak(self, today: date) -> int:
+        """Daily streak with the same grace rule as ``calc_streak``."""
+        return self.run_ending_at(today) or self.run_ending_at(today - timedelta(days=1))
+
+    def to_blobs(self) -> dict[int, bytes]:
+        return encode_dates(self)
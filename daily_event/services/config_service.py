@@ -12,6 +12,16 @@ DEFAULT_CONFIG: dict[str, Any] = {
     "sound_enabled": True,
     "db_path": "",
     "theme": "light",
+    "daily_storage": "rows",
+    "streak_grace_days": 0,
+    "work_cache_capacity": 12,
+    "calendar_max_slots": 3,
+    "workload_threshold": 3,
+    "deadline_reminder_days": [1, 0],
+    "deadline_reminder_time": "09:00",
+    "archive_after_days": 90,
+    "alarm_catch_up": "summarize",
+    "alarm_stale_minutes": 60,
 }
 
 
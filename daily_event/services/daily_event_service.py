@@ -2,15 +2,30 @@
 
 from __future__ import annotations
 
+import logging
+from collections import defaultdict
 from dataclasses import dataclass
 from datetime import date, datetime, timedelta
-from typing import Optional
+from typing import Any, Callable, Optional, TypeVar, Union
 
-from sqlalchemy import select
-from sqlalchemy.orm import joinedload
+from sqlalchemy import Integer, delete, func, select
+from sqlalchemy.orm import Session
 
-from daily_event.domain.models import DailyCompletion, DailyEvent
+from daily_event.domain.models import DailyCompletion, DailyCompletionBitmap, DailyEvent
 from daily_event.infra.database import Database
+from daily_event.services.analytics import SPAN_DAYS, compute_trends
+from daily_event.services.completion_bitmap import (
+    CompletionBitmap,
+    encode_dates,
+    merge_blobs,
+    set_day,
+)
+from daily_event.services.recurrence import CompiledRule, compile_rule, is_valid_rule
+
+logger = logging.getLogger(__name__)
+
+CompletionSet = Union[set[date], CompletionBitmap]
+_T = TypeVar("_T")
 
 
 @dataclass
@@ -31,6 +46,24 @@ class DailySetting:
     created_at: date
 
 
+@dataclass
+class DailyTrend:
+    event_id: int
+    rate_7: Optional[float]
+    rate_30: Optional[float]
+    rate_90: Optional[float]
+    week_over_week: Optional[float]
+    sparkline: list[Optional[float]]
+
+
+@dataclass
+class DailyHeatmap:
+    event_id: int
+    title: str
+    start: date
+    counts: list[int]  # counts[i] = completions on start + i days
+
+
 RECURRENCE_RULE_OPTIONS: list[tuple[str, str]] = [
     ("daily", "每天"),
     ("workday", "工作日"),
@@ -38,26 +71,23 @@ RECURRENCE_RULE_OPTIONS: list[tuple[str, str]] = [
     ("every_2_days", "两天一次"),
     ("every_3_days", "三天一次"),
     ("weekly", "一周一次"),
+    ("weekdays:0,2,4", "周一三五"),
+    ("every:2w", "两周一次"),
+    ("monthly:1", "每月1日"),
 ]
 
-VALID_RECURRENCE_RULES = {v for v, _ in RECURRENCE_RULE_OPTIONS}
+
+# "rows": one daily_completions row per day (default)
+# "bitmap": one daily_completion_bitmaps BLOB per (event, year)
+# "verify": write both, read both and log any disagreement
+STORAGE_MODES = ("rows", "bitmap", "verify")
 
 
 def is_due_today(rule: str, created_at: date, today: date) -> bool:
-    if rule == "workday":
-        return today.weekday() < 5
-    if rule == "weekend":
-        return today.weekday() >= 5
-    if rule == "every_2_days":
-        return (today - created_at).days % 2 == 0
-    if rule == "every_3_days":
-        return (today - created_at).days % 3 == 0
-    if rule == "weekly":
-        return (today - created_at).days % 7 == 0
-    return True
-
-
-def calc_streak(completed_dates: set[date], today: date) -> tuple[int, int]:
+    return compile_rule(rule, created_at).is_due(today)
+
+
+def calc_streak(completed_dates: CompletionSet, today: date) -> tuple[int, int]:
     """Pure function: (current_streak, total_done) from completion dates.
 
     If today is not completed, streak is counted from yesterday backwards.
@@ -66,6 +96,8 @@ def calc_streak(completed_dates: set[date], today: date) -> tuple[int, int]:
     total = len(completed_dates)
     if not completed_dates:
         return 0, 0
+    if isinstance(completed_dates, CompletionBitmap):
+        return completed_dates.streak(today), total
 
     streak = 0
     check = today
@@ -77,68 +109,300 @@ def calc_streak(completed_dates: set[date], today: date) -> tuple[int, int]:
     return streak, total
 
 
+def calc_recurring_streak(
+    completed_dates: CompletionSet,
+    rule: CompiledRule,
+    today: date,
+    grace_days: int = 0,
+) -> tuple[int, int]:
+    """(current_streak, total_done) counted in due occurrences of *rule*.
+
+    Walks backwards from the latest due date, jumping straight to the previous
+    due date each step, so the cost is O(streak) set lookups however long the
+    history is. A due date counts as done if it was completed on the day or up
+    to *grace_days* later (but before the next due date). The latest due date
+    does not break the streak while its window is still open.
+    """
+    total = len(completed_dates)
+    if not completed_dates:
+        return 0, 0
+    if rule.every_day:
+        # Each window is capped by the next day, so grace never applies.
+        return calc_streak(completed_dates, today)
+
+    def satisfied(due: date, next_due: Optional[date]) -> bool:
+        if grace_days == 0:
+            return due in completed_dates
+        last = due + timedelta(days=grace_days)
+        if next_due is not None and next_due <= last:
+            last = next_due - timedelta(days=1)
+        check = due
+        while check <= last:
+            if check in completed_dates:
+                return True
+            check += timedelta(days=1)
+        return False
+
+    one_day = timedelta(days=1)
+    due = rule.prev_due(today)
+    next_due = rule.next_due(today + one_day)
+    if due is not None and today <= due + timedelta(days=grace_days):
+        if not satisfied(due, next_due):
+            next_due = due
+            due = rule.prev_due(due - one_day)
+
+    streak = 0
+    while due is not None and satisfied(due, next_due):
+        streak += 1
+        next_due = due
+        due = rule.prev_due(due - one_day)
+    return streak, total
+
+
+def _last_done(completed_dates: CompletionSet) -> Optional[date]:
+    if isinstance(completed_dates, CompletionBitmap):
+        return completed_dates.last()
+    return max(completed_dates) if completed_dates else None
+
+
 class DailyEventService:
-    def __init__(self, db: Database) -> None:
+    def __init__(
+        self,
+        db: Database,
+        storage: str = "rows",
+        streak_grace_days: int = 0,
+    ) -> None:
         self._db = db
+        self._storage = storage if storage in STORAGE_MODES else "rows"
+        self._grace_days = max(0, streak_grace_days)
+        self.verify_mismatches = 0
+        self._version = 0
+        # Derived read results keyed by name -> ((today, data version), value).
+        self._cache: dict[object, tuple[tuple[date, int], Any]] = {}
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    @property
+    def storage(self) -> str:
+        return self._storage
+
+    @property
+    def data_version(self) -> int:
+        """Bumped by every write to daily events or completions."""
+        return self._version
+
+    def _memo(self, name: object, today: date, compute: Callable[[], _T]) -> _T:
+        """Return the cached *name* result for (today, data version), or compute it.
+
+        Every write bumps the data version, so a stale entry can never be
+        served; values are shared between callers and must not be mutated.
+        """
+        key = (today, self._version)
+        entry = self._cache.get(name)
+        if entry is not None and entry[0] == key:
+            self.cache_hits += 1
+            return entry[1]
+        self.cache_misses += 1
+        value = compute()
+        self._cache[name] = (key, value)
+        return value
+
+    @property
+    def _use_rows(self) -> bool:
+        return self._storage in ("rows", "verify")
+
+    @property
+    def _use_bitmap(self) -> bool:
+        return self._storage in ("bitmap", "verify")
 
     def create(self, title: str, recurrence_rule: str = "daily") -> int:
-        if recurrence_rule not in VALID_RECURRENCE_RULES:
+        if not is_valid_rule(recurrence_rule):
             recurrence_rule = "daily"
         with self._db.session_scope() as session:
             event = DailyEvent(title=title, recurrence_rule=recurrence_rule)
             session.add(event)
             session.flush()
-            return event.id
+            event_id = event.id
+        self._version += 1
+        return event_id
 
     def delete(self, event_id: int) -> None:
         with self._db.session_scope() as session:
             event = session.get(DailyEvent, event_id)
             if event:
                 session.delete(event)
+        self._version += 1
 
     def complete_today(self, event_id: int, today: date | None = None) -> None:
         if today is None:
             today = date.today()
         with self._db.session_scope() as session:
-            exists = session.execute(
-                select(DailyCompletion).where(
-                    DailyCompletion.event_id == event_id,
-                    DailyCompletion.completed_date == today,
-                )
-            ).scalar_one_or_none()
-            if not exists:
-                session.add(
-                    DailyCompletion(event_id=event_id, completed_date=today)
-                )
+            if self._use_rows:
+                exists = session.execute(
+                    select(DailyCompletion).where(
+                        DailyCompletion.event_id == event_id,
+                        DailyCompletion.completed_date == today,
+                    )
+                ).scalar_one_or_none()
+                if not exists:
+                    session.add(
+                        DailyCompletion(event_id=event_id, completed_date=today)
+                    )
+            if self._use_bitmap:
+                self._set_bit(session, event_id, today, True)
+        self._version += 1
 
     def uncomplete_today(self, event_id: int, today: date | None = None) -> None:
         if today is None:
             today = date.today()
         with self._db.session_scope() as session:
-            comp = session.execute(
-                select(DailyCompletion).where(
-                    DailyCompletion.event_id == event_id,
-                    DailyCompletion.completed_date == today,
+            if self._use_rows:
+                comp = session.execute(
+                    select(DailyCompletion).where(
+                        DailyCompletion.event_id == event_id,
+                        DailyCompletion.completed_date == today,
+                    )
+                ).scalar_one_or_none()
+                if comp:
+                    session.delete(comp)
+            if self._use_bitmap:
+                self._set_bit(session, event_id, today, False)
+        self._version += 1
+
+    # -- completion storage --
+
+    def _set_bit(self, session: Session, event_id: int, d: date, done: bool) -> None:
+        row = session.execute(
+            select(DailyCompletionBitmap).where(
+                DailyCompletionBitmap.event_id == event_id,
+                DailyCompletionBitmap.year == d.year,
+            )
+        ).scalar_one_or_none()
+        if row is None:
+            if done:
+                session.add(
+                    DailyCompletionBitmap(
+                        event_id=event_id, year=d.year, bits=set_day(None, d)
+                    )
                 )
-            ).scalar_one_or_none()
-            if comp:
-                session.delete(comp)
+            return
+        row.bits = set_day(row.bits, d, done)
+
+    def _load_rows(self, session: Session) -> dict[int, set[date]]:
+        result: dict[int, set[date]] = defaultdict(set)
+        for event_id, completed in session.execute(
+            select(DailyCompletion.event_id, DailyCompletion.completed_date)
+        ):
+            result[event_id].add(completed)
+        return result
+
+    def _load_bitmaps(self, session: Session) -> dict[int, CompletionBitmap]:
+        blobs: dict[int, dict[int, bytes]] = defaultdict(dict)
+        for event_id, year, bits in session.execute(
+            select(
+                DailyCompletionBitmap.event_id,
+                DailyCompletionBitmap.year,
+                DailyCompletionBitmap.bits,
+            )
+        ):
+            blobs[event_id][year] = bits
+        return {eid: CompletionBitmap.from_blobs(years) for eid, years in blobs.items()}
+
+    def _load_completions(self, session: Session) -> dict[int, CompletionSet]:
+        """Completion sets keyed by event id, read from the configured storage."""
+        if self._storage == "rows":
+            return dict(self._load_rows(session))
+        if self._storage == "bitmap":
+            return dict(self._load_bitmaps(session))
+
+        rows = self._load_rows(session)
+        bitmaps = self._load_bitmaps(session)
+        for event_id in set(rows) | set(bitmaps):
+            from_rows = rows.get(event_id, set())
+            bitmap = bitmaps.get(event_id)
+            from_bits = bitmap.to_set() if bitmap is not None else set()
+            if from_rows != from_bits:
+                self.verify_mismatches += 1
+                logger.warning(
+                    "daily completion mismatch for event %s: rows-only=%s bitmap-only=%s",
+                    event_id,
+                    sorted(from_rows - from_bits),
+                    sorted(from_bits - from_rows),
+                )
+        return dict(rows)
+
+    def sync_storage(self) -> int:
+        """Bring the tables in line with the storage mode. Returns days copied.
+
+        ``bitmap`` folds any remaining daily_completions rows into bitsets and
+        drops the rows; ``rows`` does the reverse, so switching modes back and
+        forth never loses data. ``verify`` keeps both tables and fills each
+        from the other.
+        """
+        with self._db.session_scope() as session:
+            row_count = session.execute(
+                select(func.count()).select_from(DailyCompletion)
+            ).scalar_one()
+            bitmap_count = session.execute(
+                select(func.count()).select_from(DailyCompletionBitmap)
+            ).scalar_one()
+            copied = 0
+            if self._use_bitmap and row_count:
+                copied += self._rows_to_bitmaps(session)
+                if not self._use_rows:
+                    session.execute(delete(DailyCompletion))
+            if self._use_rows and bitmap_count:
+                copied += self._bitmaps_to_rows(session)
+                if not self._use_bitmap:
+                    session.execute(delete(DailyCompletionBitmap))
+        if copied:
+            self._version += 1
+        return copied
+
+    def _rows_to_bitmaps(self, session: Session) -> int:
+        rows = self._load_rows(session)
+        existing = {
+            (bm.event_id, bm.year): bm
+            for bm in session.execute(select(DailyCompletionBitmap)).scalars()
+        }
+        copied = 0
+        for event_id, dates in rows.items():
+            for year, blob in encode_dates(dates).items():
+                bm = existing.get((event_id, year))
+                if bm is None:
+                    session.add(DailyCompletionBitmap(event_id=event_id, year=year, bits=blob))
+                else:
+                    bm.bits = merge_blobs(bm.bits, blob)
+            copied += len(dates)
+        return copied
+
+    def _bitmaps_to_rows(self, session: Session) -> int:
+        rows = self._load_rows(session)
+        copied = 0
+        for event_id, bitmap in self._load_bitmaps(session).items():
+            have = rows.get(event_id, set())
+            for d in bitmap:
+                if d not in have:
+                    session.add(DailyCompletion(event_id=event_id, completed_date=d))
+                    copied += 1
+        return copied
 
     def get_visible(self, today: date | None = None) -> list[tuple[int, str, int]]:
         """Return (event_id, title, current_streak) for dailies not completed on *today*."""
         if today is None:
             today = date.today()
+        return self._memo("visible", today, lambda: self._compute_visible(today))
+
+    def _compute_visible(self, today: date) -> list[tuple[int, str, int]]:
         with self._db.session_scope() as session:
             events = (
                 session.execute(
-                    select(DailyEvent)
-                    .where(DailyEvent.is_archived == False)  # noqa: E712
-                    .options(joinedload(DailyEvent.completions))
+                    select(DailyEvent).where(DailyEvent.is_archived == False)  # noqa: E712
                 )
-                .unique()
                 .scalars()
                 .all()
             )
+            completions = self._load_completions(session)
             result: list[tuple[int, str, int]] = []
             for ev in events:
                 created = (
@@ -146,15 +410,159 @@ class DailyEventService:
                     if isinstance(ev.created_at, datetime)
                     else ev.created_at
                 )
-                if not is_due_today(ev.recurrence_rule, created, today):
+                rule = compile_rule(ev.recurrence_rule, created)
+                if not rule.is_due(today):
                     continue
-                dates_set = {c.completed_date for c in ev.completions}
+                dates_set = completions.get(ev.id, set())
                 if today in dates_set:
                     continue
-                streak, _ = calc_streak(dates_set, today)
+                streak, _ = calc_recurring_streak(dates_set, rule, today, self._grace_days)
                 result.append((ev.id, ev.title, streak))
             return result
 
+    def _completion_offsets(self, session: Session, start: date, end: date) -> dict[int, list[int]]:
+        """Day offsets from *start* of every completion in ``[start, end]``, per event.
+
+        Row storage is read with one ``GROUP BY event_id`` aggregate whose day
+        offsets are computed and concatenated in SQL, so Python handles one
+        row per event and never parses a date string. Bitmap storage slices
+        the yearly BLOBs covering the window.
+        """
+        result: dict[int, list[int]] = {}
+        if self._storage == "bitmap":
+            bitmaps: dict[int, dict[int, bytes]] = defaultdict(dict)
+            for event_id, year, bits in session.execute(
+                select(
+                    DailyCompletionBitmap.event_id,
+                    DailyCompletionBitmap.year,
+                    DailyCompletionBitmap.bits,
+                ).where(DailyCompletionBitmap.year.between(start.year, end.year))
+            ):
+                bitmaps[event_id][year] = bits
+            for event_id, blobs in bitmaps.items():
+                result[event_id] = [
+                    (d - start).days
+                    for d in CompletionBitmap.from_blobs(blobs)
+                    if start <= d <= end
+                ]
+            return result
+
+        day = func.cast(
+            func.julianday(DailyCompletion.completed_date) - func.julianday(start),
+            Integer,
+        )
+        for event_id, offsets in session.execute(
+            select(DailyCompletion.event_id, func.group_concat(day))
+            .where(DailyCompletion.completed_date.between(start, end))
+            .group_by(DailyCompletion.event_id)
+        ):
+            if offsets:
+                result[event_id] = [int(x) for x in offsets.split(",")]
+        return result
+
+    def _active_events(self, session: Session) -> list[tuple[int, str, str, date]]:
+        """(id, title, recurrence_rule, created date) of non-archived events."""
+        rows = session.execute(
+            select(
+                DailyEvent.id,
+                DailyEvent.title,
+                DailyEvent.recurrence_rule,
+                DailyEvent.created_at,
+            )
+            .where(DailyEvent.is_archived == False)  # noqa: E712
+            .order_by(DailyEvent.created_at)
+        ).all()
+        return [
+            (eid, title, rule, created.date() if isinstance(created, datetime) else created)
+            for eid, title, rule, created in rows
+        ]
+
+    def get_heatmaps(self, today: date | None = None, days: int = 365) -> list[DailyHeatmap]:
+        """Per-event completion counts for the *days* ending on *today*."""
+        if today is None:
+            today = date.today()
+        start = today - timedelta(days=days - 1)
+        with self._db.session_scope() as session:
+            events = self._active_events(session)
+            offsets = self._completion_offsets(session, start, today)
+        result: list[DailyHeatmap] = []
+        for eid, title, _, _ in events:
+            counts = [0] * days
+            for k in offsets.get(eid, ()):
+                counts[k] += 1
+            result.append(DailyHeatmap(event_id=eid, title=title, start=start, counts=counts))
+        return result
+
+    def get_completion_totals(self, start: date, end: date) -> list[int]:
+        """Completions per day across all events, for each day in ``[start, end]``."""
+        totals = [0] * ((end - start).days + 1)
+        with self._db.session_scope() as session:
+            offsets = self._completion_offsets(session, start, end)
+        for event_offsets in offsets.values():
+            for k in event_offsets:
+                totals[k] += 1
+        return totals
+
+    def get_trends(self, today: date | None = None) -> dict[int, DailyTrend]:
+        """7/30/90-day completion rates, week-over-week delta and sparkline per event.
+
+        Built from one bulk completion query and the compiled recurrence rules,
+        then evaluated for all events at once by ``compute_trends``. Results are
+        cached until the data version or the date changes.
+        """
+        if today is None:
+            today = date.today()
+        return self._memo("trends", today, lambda: self._compute_trends(today))
+
+    def _compute_trends(self, today: date) -> dict[int, DailyTrend]:
+        span = SPAN_DAYS
+        start = today - timedelta(days=span - 1)
+        base = start.toordinal()
+        with self._db.session_scope() as session:
+            events = self._active_events(session)
+            offsets = self._completion_offsets(session, start, today)
+        done_rows: list[list[int]] = []
+        due_rows: list[list[int]] = []
+        for eid, _, rule, created in events:
+            first = max((created - start).days, 0)
+            done = [0] * span
+            for k in offsets.get(eid, ()):
+                if k >= first:
+                    done[k] = 1
+            due = [0] * span
+            for o in compile_rule(rule, created).due_ordinals(max(start, created), today):
+                due[o - base] = 1
+            done_rows.append(done)
+            due_rows.append(due)
+
+        trends = {
+            eid: DailyTrend(
+                event_id=eid,
+                rate_7=row.rates[7],
+                rate_30=row.rates[30],
+                rate_90=row.rates[90],
+                week_over_week=row.week_over_week,
+                sparkline=row.sparkline,
+            )
+            for (eid, _, _, _), row in zip(events, compute_trends(done_rows, due_rows))
+        }
+        return trends
+
+    def get_due_counts(self, start: date, end: date) -> dict[date, int]:
+        """Number of dailies due on each day of ``[start, end]`` (zero days omitted)."""
+        counts: dict[int, int] = defaultdict(int)
+        with self._db.session_scope() as session:
+            rows = session.execute(
+                select(DailyEvent.recurrence_rule, DailyEvent.created_at).where(
+                    DailyEvent.is_archived == False  # noqa: E712
+                )
+            ).all()
+        for rule, created_at in rows:
+            created = created_at.date() if isinstance(created_at, datetime) else created_at
+            for o in compile_rule(rule, created).due_ordinals(max(start, created), end):
+                counts[o] += 1
+        return {date.fromordinal(o): n for o, n in counts.items()}
+
     def get_all_settings(self) -> list[DailySetting]:
         with self._db.session_scope() as session:
             events = (
@@ -184,36 +592,40 @@ class DailyEventService:
             return result
 
     def set_recurrence_rule(self, event_id: int, recurrence_rule: str) -> None:
-        if recurrence_rule not in VALID_RECURRENCE_RULES:
+        if not is_valid_rule(recurrence_rule):
             return
         with self._db.session_scope() as session:
             event = session.get(DailyEvent, event_id)
             if event:
                 event.recurrence_rule = recurrence_rule
+        self._version += 1
 
-    def get_all_stats(self) -> list[DailyStats]:
-        today = date.today()
+    def get_all_stats(self, today: date | None = None) -> list[DailyStats]:
+        if today is None:
+            today = date.today()
+        return self._memo("stats", today, lambda: self._compute_stats(today))
+
+    def _compute_stats(self, today: date) -> list[DailyStats]:
         with self._db.session_scope() as session:
             events = (
                 session.execute(
-                    select(DailyEvent)
-                    .where(DailyEvent.is_archived == False)  # noqa: E712
-                    .options(joinedload(DailyEvent.completions))
+                    select(DailyEvent).where(DailyEvent.is_archived == False)  # noqa: E712
                 )
-                .unique()
                 .scalars()
                 .all()
             )
+            completions = self._load_completions(session)
             stats: list[DailyStats] = []
             for ev in events:
-                dates_set = {c.completed_date for c in ev.completions}
-                streak, total = calc_streak(dates_set, today)
-                last_done = max(dates_set) if dates_set else None
                 created = (
                     ev.created_at.date()
                     if isinstance(ev.created_at, datetime)
                     else ev.created_at
                 )
+                dates_set = completions.get(ev.id, set())
+                rule = compile_rule(ev.recurrence_rule, created)
+                streak, total = calc_recurring_streak(dates_set, rule, today, self._grace_days)
+                last_done = _last_done(dates_set)
                 stats.append(
                     DailyStats(
                         event_id=ev.id,
@@ -0,0 +1,47 @@
+"""Local-midnight arithmetic for the day-rollover scheduler (Qt-free)."""
+
+from __future__ import annotations
+
+from datetime import date, datetime, time, timedelta
+from typing import Callable, Optional
+
+# Fire slightly after midnight so date.today() has definitely advanced.
+ROLLOVER_SLACK_MS = 500
+
+
+def ms_until_next_midnight(now: Optional[datetime] = None) -> int:
+    """Milliseconds from *now* (naive local time) to the next local midnight.
+
+    Goes through POSIX timestamps rather than subtracting wall-clock times, so
+    a DST transition during the night yields the real elapsed duration (23 or
+    25 hours for that day) instead of the nominal 24.
+    """
+    if now is None:
+        now = datetime.now()
+    midnight = datetime.combine(now.date() + timedelta(days=1), time.min)
+    return max(0, int((midnight.timestamp() - now.timestamp()) * 1000)) + ROLLOVER_SLACK_MS
+
+
+class DayTracker:
+    """Remembers the last observed local date and reports when it changes.
+
+    ``check`` is cheap and idempotent, so it can be called from any wake-up
+    source (timer, clock-change or resume notification, window activation)
+    without risking duplicate rollovers.
+    """
+
+    def __init__(self, today: Callable[[], date] = date.today) -> None:
+        self._today_fn = today
+        self._current = today()
+
+    @property
+    def current(self) -> date:
+        return self._current
+
+    def check(self) -> Optional[date]:
+        """Return the new date if the day changed since the last call, else None."""
+        today = self._today_fn()
+        if today == self._current:
+            return None
+        self._current = today
+        return today
@@ -0,0 +1,172 @@
+"""Deadline reminders for Work Events (Qt-free; the timer lives in ui/)."""
+
+from __future__ import annotations
+
+import math
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from typing import Callable, Iterable, Optional
+
+from sqlalchemy import delete, select
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+
+from daily_event.domain.models import DeadlineReminderSent, WorkEvent
+from daily_event.infra.database import Database
+from daily_event.infra.notification import NotificationService
+
+DEFAULT_DAYS_BEFORE = (1, 0)  # the day before, and the morning of the deadline
+DEFAULT_REMIND_AT = time(9, 0)
+
+
+@dataclass(frozen=True)
+class Reminder:
+    fire_at: datetime
+    event_id: int
+    title: str
+    end_date: date
+    days_left: int
+
+    @property
+    def key(self) -> tuple[int, date, int]:
+        return self.event_id, self.end_date, self.days_left
+
+    @property
+    def message(self) -> str:
+        if self.days_left == 0:
+            return f"「{self.title}」今天截止"
+        if self.days_left == 1:
+            return f"「{self.title}」明天截止"
+        return f"「{self.title}」{self.days_left} 天后截止（{self.end_date.month}/{self.end_date.day}）"
+
+
+def parse_remind_at(text: str) -> time:
+    """``"HH:MM"`` → time; falls back to the default on malformed input."""
+    try:
+        hour, minute = (int(part) for part in text.split(":"))
+        return time(hour, minute)
+    except (ValueError, AttributeError):
+        return DEFAULT_REMIND_AT
+
+
+class DeadlineReminders:
+    """Plans and fires the day's deadline reminders.
+
+    ``plan`` runs one indexed query (``ix_work_events_deadline``) for the open
+    events whose ``end_date`` is today + each configured offset, and turns
+    them into reminders at *remind_at* today. A scheduler then only needs
+    ``next_fire_at`` to arm a single exact timer and ``fire_due`` when it
+    expires; nothing is polled. Reminders whose time has already passed when
+    the plan is made (app started late, machine woke up) fire on the next
+    ``fire_due``. Sent reminders are stored by (event, deadline, offset) in
+    ``deadline_reminders_sent``, so neither re-planning after an edit nor a
+    restart repeats one.
+    """
+
+    def __init__(
+        self,
+        db: Database,
+        notification: NotificationService,
+        days_before: Iterable[int] = DEFAULT_DAYS_BEFORE,
+        remind_at: time = DEFAULT_REMIND_AT,
+        clock: Callable[[], datetime] = datetime.now,
+    ) -> None:
+        self._db = db
+        self._notification = notification
+        self._offsets = sorted({max(0, int(n)) for n in days_before})
+        self._remind_at = remind_at
+        self._clock = clock
+        self._day: Optional[date] = None
+        self._version: Optional[int] = None
+        self._pending: list[Reminder] = []
+        self.queries = 0
+
+    @property
+    def planned_day(self) -> Optional[date]:
+        return self._day
+
+    @property
+    def pending(self) -> list[Reminder]:
+        return list(self._pending)
+
+    def plan(self) -> list[Reminder]:
+        """Re-read today's reminders (call on day change and after Work Event writes)."""
+        today = self._clock().date()
+        new_day, self._day = today != self._day, today
+        self._pending = []
+        if not self._offsets:
+            return []
+        deadlines = {today + timedelta(days=n): n for n in self._offsets}
+        fire_at = datetime.combine(today, self._remind_at)
+        with self._db.session_scope() as session:
+            self.queries += 1
+            if new_day:
+                session.execute(
+                    delete(DeadlineReminderSent).where(DeadlineReminderSent.end_date < today)
+                )
+            sent_rows = session.execute(
+                select(
+                    DeadlineReminderSent.event_id,
+                    DeadlineReminderSent.end_date,
+                    DeadlineReminderSent.days_left,
+                ).where(DeadlineReminderSent.end_date.in_(list(deadlines)))
+            )
+            sent = {tuple(row) for row in sent_rows}
+            rows = session.execute(
+                select(WorkEvent.id, WorkEvent.title, WorkEvent.end_date)
+                .where(
+                    WorkEvent.is_completed == False,  # noqa: E712
+                    WorkEvent.end_date.in_(list(deadlines)),
+                )
+                .order_by(WorkEvent.end_date, WorkEvent.id)
+            ).all()
+        for event_id, title, end_date in rows:
+            reminder = Reminder(fire_at, event_id, title, end_date, deadlines[end_date])
+            if reminder.key not in sent:
+                self._pending.append(reminder)
+        return self.pending
+
+    def sync(self, version: int) -> bool:
+        """Re-plan only if the date or the Work Event *version* moved; returns whether it did."""
+        if version == self._version and self._clock().date() == self._day:
+            return False
+        self._version = version
+        self.plan()
+        return True
+
+    def next_fire_at(self) -> Optional[datetime]:
+        return min((r.fire_at for r in self._pending), default=None)
+
+    def ms_until_next(self) -> Optional[int]:
+        """Milliseconds until the next reminder (rounded up, never early; 0 if overdue), or None."""
+        at = self.next_fire_at()
+        if at is None:
+            return None
+        return max(0, math.ceil((at.timestamp() - self._clock().timestamp()) * 1000))
+
+    def fire_due(self) -> list[Reminder]:
+        """Notify every pending reminder whose time has come; returns them."""
+        now = self._clock()
+        due = [r for r in self._pending if r.fire_at <= now]
+        if not due:
+            return []
+        self._pending = [r for r in self._pending if r.fire_at > now]
+        with self._db.session_scope() as session:
+            session.execute(
+                sqlite_insert(DeadlineReminderSent).on_conflict_do_nothing(),
+                [
+                    {
+                        "event_id": r.event_id,
+                        "end_date": r.end_date,
+                        "days_left": r.days_left,
+                        "sent_at": now,
+                    }
+                    for r in due
+                ],
+            )
+        if len(due) == 1:
+            self._notification.notify("截止提醒", due[0].message)
+        else:
+            self._notification.notify(
+                f"截止提醒（{len(due)} 项）", "\n".join(r.message for r in due)
+            )
+        return due
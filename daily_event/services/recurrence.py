@@ -0,0 +1,379 @@
+"""Recurrence rules — parsing, compilation and bulk due-date expansion.
+
+A rule is stored as a short string on ``DailyEvent.recurrence_rule``. Besides
+the legacy presets (``daily``, ``workday``, ``weekend``, ``every_2_days``,
+``every_3_days``, ``weekly``) the grammar supports::
+
+    weekdays:0,2,4          every Monday, Wednesday and Friday (Monday = 0)
+    every:3d                every 3 days, counted from the anchor date
+    every:2w                every 2 weeks on the anchor's weekday
+    every:2w:0,3            Monday and Thursday of every 2nd week
+    monthly:15              15th of each month (clamped to the month end)
+    monthly:2:0             2nd Monday of each month
+    monthly:-1:4            last Friday of each month
+
+and an optional ``;except=2026-03-02,2026-03-09`` suffix listing skipped dates.
+
+``compile_rule`` turns a rule plus its anchor (the event's creation date)
+into a ``CompiledRule`` answering ``is_due``, ``next_due``, ``prev_due`` and
+``due_dates`` with modular arithmetic, never by stepping one day at a time.
+Weekly and interval rules compile to a periodic pattern of due offsets;
+monthly rules are resolved once per month.
+"""
+
+from __future__ import annotations
+
+import calendar as cal_mod
+from abc import ABC, abstractmethod
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass
+from datetime import date
+from functools import lru_cache
+from typing import Hashable, Optional
+
+WEEKDAY_NAMES = ["一", "二", "三", "四", "五", "六", "日"]
+
+# date.min (0001-01-01, ordinal 1) is a Monday.
+_MONDAY_ORDINAL = 1
+
+
+@dataclass(frozen=True)
+class RuleSpec:
+    """Parsed form of a recurrence rule string."""
+
+    kind: str  # "weekdays" | "days" | "weeks" | "monthly_day" | "monthly_nth"
+    weekdays: tuple[int, ...] = ()
+    interval: int = 1
+    month_day: int = 1
+    nth: int = 1
+    exclusions: tuple[date, ...] = ()
+
+
+LEGACY_RULES: dict[str, RuleSpec] = {
+    "daily": RuleSpec("weekdays", weekdays=(0, 1, 2, 3, 4, 5, 6)),
+    "workday": RuleSpec("weekdays", weekdays=(0, 1, 2, 3, 4)),
+    "weekend": RuleSpec("weekdays", weekdays=(5, 6)),
+    "every_2_days": RuleSpec("days", interval=2),
+    "every_3_days": RuleSpec("days", interval=3),
+    "weekly": RuleSpec("weeks", interval=1),
+}
+
+
+def _parse_weekdays(text: str) -> tuple[int, ...]:
+    days = tuple(sorted({int(x) for x in text.split(",") if x.strip()}))
+    if not days or any(d < 0 or d > 6 for d in days):
+        raise ValueError(f"invalid weekday list: {text!r}")
+    return days
+
+
+def parse_rule(rule: str) -> RuleSpec:
+    """Parse *rule* into a ``RuleSpec``. Raises ``ValueError`` if malformed."""
+    body, _, tail = rule.strip().partition(";")
+    exclusions: tuple[date, ...] = ()
+    if tail:
+        key, _, value = tail.partition("=")
+        if key != "except":
+            raise ValueError(f"unknown rule option: {tail!r}")
+        exclusions = tuple(sorted({date.fromisoformat(x) for x in value.split(",") if x}))
+
+    if body in LEGACY_RULES:
+        spec = LEGACY_RULES[body]
+    else:
+        kind, _, args = body.partition(":")
+        parts = args.split(":") if args else []
+        if kind == "weekdays" and len(parts) == 1:
+            spec = RuleSpec("weekdays", weekdays=_parse_weekdays(parts[0]))
+        elif kind == "every" and 1 <= len(parts) <= 2 and parts[0][-1:] in ("d", "w"):
+            interval = int(parts[0][:-1])
+            if interval < 1:
+                raise ValueError(f"interval must be positive: {rule!r}")
+            if parts[0].endswith("d"):
+                if len(parts) != 1:
+                    raise ValueError(f"weekday list only applies to weeks: {rule!r}")
+                spec = RuleSpec("days", interval=interval)
+            else:
+                weekdays = _parse_weekdays(parts[1]) if len(parts) == 2 else ()
+                spec = RuleSpec("weeks", interval=interval, weekdays=weekdays)
+        elif kind == "monthly" and len(parts) == 1:
+            day = int(parts[0])
+            if not 1 <= day <= 31:
+                raise ValueError(f"invalid day of month: {rule!r}")
+            spec = RuleSpec("monthly_day", month_day=day)
+        elif kind == "monthly" and len(parts) == 2:
+            nth, weekday = int(parts[0]), int(parts[1])
+            if nth not in (1, 2, 3, 4, -1) or not 0 <= weekday <= 6:
+                raise ValueError(f"invalid nth weekday: {rule!r}")
+            spec = RuleSpec("monthly_nth", nth=nth, weekdays=(weekday,))
+        else:
+            raise ValueError(f"unknown recurrence rule: {rule!r}")
+
+    if exclusions:
+        spec = RuleSpec(
+            spec.kind, spec.weekdays, spec.interval, spec.month_day, spec.nth, exclusions
+        )
+    return spec
+
+
+def format_rule(spec: RuleSpec) -> str:
+    """Inverse of ``parse_rule`` (legacy presets come back in the new grammar)."""
+    if spec.kind == "weekdays":
+        body = "weekdays:" + ",".join(str(d) for d in spec.weekdays)
+    elif spec.kind == "days":
+        body = f"every:{spec.interval}d"
+    elif spec.kind == "weeks":
+        body = f"every:{spec.interval}w"
+        if spec.weekdays:
+            body += ":" + ",".join(str(d) for d in spec.weekdays)
+    elif spec.kind == "monthly_day":
+        body = f"monthly:{spec.month_day}"
+    elif spec.kind == "monthly_nth":
+        body = f"monthly:{spec.nth}:{spec.weekdays[0]}"
+    else:
+        raise ValueError(f"unknown rule kind: {spec.kind!r}")
+    if spec.exclusions:
+        body += ";except=" + ",".join(d.isoformat() for d in spec.exclusions)
+    return body
+
+
+def is_valid_rule(rule: str) -> bool:
+    try:
+        parse_rule(rule)
+    except ValueError:
+        return False
+    return True
+
+
+def describe_rule(rule: str) -> str:
+    """Human-readable (Chinese) label for a rule string."""
+    try:
+        spec = parse_rule(rule)
+    except ValueError:
+        return rule
+    days = "、".join("周" + WEEKDAY_NAMES[d] for d in spec.weekdays)
+    if spec.kind == "weekdays":
+        if len(spec.weekdays) == 7:
+            text = "每天"
+        elif spec.weekdays == (0, 1, 2, 3, 4):
+            text = "工作日"
+        elif spec.weekdays == (5, 6):
+            text = "周末"
+        else:
+            text = f"每{days}"
+    elif spec.kind == "days":
+        text = "每天" if spec.interval == 1 else f"每{spec.interval}天"
+    elif spec.kind == "weeks":
+        text = "每周" if spec.interval == 1 else f"每{spec.interval}周"
+        if days:
+            text += f"（{days}）"
+    elif spec.kind == "monthly_day":
+        text = f"每月{spec.month_day}日"
+    else:
+        which = "最后一个" if spec.nth == -1 else f"第{spec.nth}个"
+        text = f"每月{which}{days}"
+    if spec.exclusions:
+        text += f"（排除{len(spec.exclusions)}天）"
+    return text
+
+
+class CompiledRule(ABC):
+    """A rule bound to its anchor date, answering due-date queries.
+
+    ``pattern`` is a hashable key shared by all rules that are due on exactly
+    the same days (e.g. every ``every:3d`` rule whose anchors differ by a
+    multiple of 3), so callers can expand a window once per pattern.
+    """
+
+    pattern: Hashable
+
+    def __init__(self, exclusions: tuple[date, ...] = ()) -> None:
+        self._excluded = frozenset(d.toordinal() for d in exclusions)
+
+    @property
+    def every_day(self) -> bool:
+        """True when every calendar day is due (lets callers take daily fast paths)."""
+        return False
+
+    # -- subclasses implement ordinal versions without exclusions --
+
+    @abstractmethod
+    def _next(self, o: int) -> Optional[int]:
+        ...
+
+    @abstractmethod
+    def _prev(self, o: int) -> Optional[int]:
+        ...
+
+    @abstractmethod
+    def _expand(self, lo: int, hi: int) -> list[int]:
+        ...
+
+    @abstractmethod
+    def _matches(self, o: int) -> bool:
+        ...
+
+    # -- public API --
+
+    def is_due(self, d: date) -> bool:
+        o = d.toordinal()
+        return o not in self._excluded and self._matches(o)
+
+    def next_due(self, d: date) -> Optional[date]:
+        """First due date on or after *d*, or None if the rule never fires."""
+        o = self._next(d.toordinal())
+        while o is not None and o in self._excluded:
+            o = self._next(o + 1)
+        return date.fromordinal(o) if o is not None else None
+
+    def prev_due(self, d: date) -> Optional[date]:
+        """Last due date on or before *d*, or None if there is none."""
+        o = self._prev(d.toordinal())
+        while o is not None and o in self._excluded:
+            o = self._prev(o - 1) if o > 1 else None
+        return date.fromordinal(o) if o is not None else None
+
+    def due_ordinals(self, start: date, end: date) -> list[int]:
+        return self.ordinals_between(start.toordinal(), end.toordinal())
+
+    def ordinals_between(self, lo: int, hi: int) -> list[int]:
+        """Due ordinals in ``[lo, hi]``, ascending (the ordinal form of ``due_dates``)."""
+        if hi < lo:
+            return []
+        found = self._expand(lo, hi)
+        if self._excluded:
+            found = [o for o in found if o not in self._excluded]
+        return found
+
+    def due_dates(self, start: date, end: date) -> list[date]:
+        """All due dates in ``[start, end]``, ascending."""
+        return [date.fromordinal(o) for o in self.due_ordinals(start, end)]
+
+
+class _PeriodicRule(CompiledRule):
+    """Due on fixed offsets inside a repeating window of *period* days."""
+
+    def __init__(
+        self,
+        anchor: int,
+        period: int,
+        offsets: tuple[int, ...],
+        exclusions: tuple[date, ...] = (),
+    ) -> None:
+        super().__init__(exclusions)
+        self._anchor = anchor
+        self._period = period
+        self._offsets = offsets
+        self._offset_set = frozenset(offsets)
+        self.pattern = ("periodic", period, offsets, anchor % period, exclusions)
+
+    @property
+    def every_day(self) -> bool:
+        return not self._excluded and len(self._offsets) == self._period
+
+    def _matches(self, o: int) -> bool:
+        return (o - self._anchor) % self._period in self._offset_set
+
+    def _next(self, o: int) -> Optional[int]:
+        if not self._offsets:
+            return None
+        r = (o - self._anchor) % self._period
+        i = bisect_left(self._offsets, r)
+        if i < len(self._offsets):
+            return o + self._offsets[i] - r
+        return o + self._period - r + self._offsets[0]
+
+    def _prev(self, o: int) -> Optional[int]:
+        if not self._offsets:
+            return None
+        r = (o - self._anchor) % self._period
+        i = bisect_right(self._offsets, r)
+        if i > 0:
+            result = o - (r - self._offsets[i - 1])
+        else:
+            result = o - r - self._period + self._offsets[-1]
+        return result if result >= 1 else None
+
+    def _expand(self, lo: int, hi: int) -> list[int]:
+        if not self._offsets:
+            return []
+        base = lo - (lo - self._anchor) % self._period
+        found = [
+            b + off
+            for b in range(base, hi + 1, self._period)
+            for off in self._offsets
+        ]
+        # Only the first and last window can spill outside [lo, hi].
+        head = bisect_left(found, lo)
+        tail = bisect_right(found, hi)
+        return found[head:tail]
+
+
+class _MonthlyRule(CompiledRule):
+    """Due once per month — fixed day (clamped) or nth weekday."""
+
+    def __init__(self, spec: RuleSpec) -> None:
+        super().__init__(spec.exclusions)
+        self._spec = spec
+        self.pattern = ("monthly", spec)
+
+    def _in_month(self, year: int, month: int) -> int:
+        days_in_month = cal_mod.monthrange(year, month)[1]
+        spec = self._spec
+        if spec.kind == "monthly_day":
+            return date(year, month, min(spec.month_day, days_in_month)).toordinal()
+        weekday = spec.weekdays[0]
+        if spec.nth == -1:
+            last = date(year, month, days_in_month)
+            return last.toordinal() - (last.weekday() - weekday) % 7
+        first = date(year, month, 1)
+        return first.toordinal() + (weekday - first.weekday()) % 7 + 7 * (spec.nth - 1)
+
+    def _matches(self, o: int) -> bool:
+        d = date.fromordinal(o)
+        return self._in_month(d.year, d.month) == o
+
+    def _next(self, o: int) -> Optional[int]:
+        d = date.fromordinal(o)
+        hit = self._in_month(d.year, d.month)
+        if hit >= o:
+            return hit
+        year, month = (d.year + 1, 1) if d.month == 12 else (d.year, d.month + 1)
+        return self._in_month(year, month) if year <= 9999 else None
+
+    def _prev(self, o: int) -> Optional[int]:
+        d = date.fromordinal(o)
+        hit = self._in_month(d.year, d.month)
+        if hit <= o:
+            return hit
+        year, month = (d.year - 1, 12) if d.month == 1 else (d.year, d.month - 1)
+        return self._in_month(year, month) if year >= 1 else None
+
+    def _expand(self, lo: int, hi: int) -> list[int]:
+        start, end = date.fromordinal(lo), date.fromordinal(hi)
+        found: list[int] = []
+        for index in range(start.year * 12 + start.month - 1, end.year * 12 + end.month):
+            o = self._in_month(index // 12, index % 12 + 1)
+            if lo <= o <= hi:
+                found.append(o)
+        return found
+
+
+def _compile_spec(spec: RuleSpec, anchor: date) -> CompiledRule:
+    if spec.kind == "weekdays":
+        return _PeriodicRule(_MONDAY_ORDINAL, 7, spec.weekdays, spec.exclusions)
+    if spec.kind == "days":
+        return _PeriodicRule(anchor.toordinal(), spec.interval, (0,), spec.exclusions)
+    if spec.kind == "weeks":
+        week_start = anchor.toordinal() - anchor.weekday()
+        offsets = spec.weekdays or (anchor.weekday(),)
+        return _PeriodicRule(week_start, 7 * spec.interval, offsets, spec.exclusions)
+    return _MonthlyRule(spec)
+
+
+@lru_cache(maxsize=1024)
+def compile_rule(rule: str, anchor: date) -> CompiledRule:
+    """Compile *rule* anchored at *anchor*; unparseable rules behave as daily."""
+    try:
+        spec = parse_rule(rule)
+    except ValueError:
+        spec = LEGACY_RULES["daily"]
+    return _compile_spec(spec, anchor)
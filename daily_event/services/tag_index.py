@@ -0,0 +1,108 @@
+"""Tag filtering for Work Events over an in-memory bitmap index."""
+
+from __future__ import annotations
+
+import re
+from collections import defaultdict
+from typing import Generic, Iterable, Mapping, Sequence, TypeVar
+
+MAX_TAG_LENGTH = 50
+
+_SEPARATORS = re.compile(r"[,，、;；\s]+")
+
+T = TypeVar("T")
+
+
+def normalize_tags(names: Iterable[str]) -> list[str]:
+    """Trimmed, ``#``-less, non-empty tag names in first-seen order, without duplicates."""
+    seen: dict[str, None] = {}
+    for name in names:
+        name = name.strip().lstrip("#").strip()[:MAX_TAG_LENGTH]
+        if name:
+            seen.setdefault(name)
+    return list(seen)
+
+
+def parse_tags(text: str) -> list[str]:
+    """Split user input such as ``"客户A, 紧急 #内部"`` into tag names."""
+    return normalize_tags(_SEPARATORS.split(text))
+
+
+def _bitmap(positions: list[int], size: int) -> int:
+    buf = bytearray((size + 7) // 8)
+    for i in positions:
+        buf[i >> 3] |= 1 << (i & 7)
+    return int.from_bytes(buf, "little")
+
+
+class TagIndex(Generic[T]):
+    """Tag → bitmap over the items of one loaded window (e.g. a calendar month).
+
+    Bit *i* of a tag's bitmap is set when ``items[i]`` carries the tag, so a
+    tag combination is a few big-integer ANDs / ORs and picking the matching
+    items is one pass over the set bits of the result. Built once per window
+    and data version; changing the filter never touches the database.
+    """
+
+    def __init__(self, items: Sequence[T], tags_by_id: Mapping[int, Iterable[str]]) -> None:
+        self._items = list(items)
+        self._full = (1 << len(self._items)) - 1
+        positions: dict[str, list[int]] = defaultdict(list)
+        self._tags_by_id: dict[int, tuple[str, ...]] = {}
+        for i, item in enumerate(self._items):
+            names = tuple(tags_by_id.get(item.id, ()))
+            if names:
+                self._tags_by_id[item.id] = names
+                for name in names:
+                    positions[name].append(i)
+        self._bits = {name: _bitmap(pos, len(self._items)) for name, pos in positions.items()}
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    @property
+    def tags(self) -> list[str]:
+        """Tags present in the window, by name."""
+        return sorted(self._bits)
+
+    def count(self, tag: str) -> int:
+        return bin(self._bits.get(tag, 0)).count("1")
+
+    def tags_of(self, event_id: int) -> tuple[str, ...]:
+        return self._tags_by_id.get(event_id, ())
+
+    def mask(self, tags: Iterable[str], match_all: bool = True) -> int:
+        """Bitmap of the items carrying all (or, with ``match_all=False``, any) of *tags*.
+
+        No tags selected means no filter: every item matches.
+        """
+        selected = list(tags)
+        if not selected:
+            return self._full
+        if match_all:
+            result = self._full
+            for tag in selected:
+                result &= self._bits.get(tag, 0)
+                if not result:
+                    break
+            return result
+        result = 0
+        for tag in selected:
+            result |= self._bits.get(tag, 0)
+        return result
+
+    def select(self, mask: int) -> list[T]:
+        """The items whose bits are set in *mask*, in window order."""
+        if mask == self._full:
+            return list(self._items)
+        bits = format(mask, "b")[::-1]
+        items = self._items
+        out = []
+        i = bits.find("1")
+        while i >= 0:
+            out.append(items[i])
+            i = bits.find("1", i + 1)
+        return out
+
+    def filter(self, tags: Iterable[str], match_all: bool = True) -> list[T]:
+        return self.select(self.mask(tags, match_all))
@@ -0,0 +1,108 @@
+"""Hot/cold split for Work Events: old completed events move to an archive table."""
+
+from __future__ import annotations
+
+from datetime import datetime, timedelta
+from typing import Callable
+
+from sqlalchemy import delete, func, insert, literal, select
+
+from daily_event.domain.models import WorkEvent, WorkEventArchive
+from daily_event.infra.database import Database
+
+ARCHIVE_BATCH = 200
+_COLUMNS = (
+    "id",
+    "title",
+    "start_date",
+    "end_date",
+    "note",
+    "color_index",
+    "is_completed",
+    "completed_at",
+    "created_at",
+)
+
+
+class WorkArchiver:
+    """Moves events completed more than *older_than_days* ago into ``work_events_archive``.
+
+    Each ``archive_batch`` call is one short transaction over at most
+    *batch_size* rows, oldest completion first, found through the history
+    index; callers spread the calls over idle time (see
+    ``ui/archive_scheduler``). Ids, tags and subtasks are kept, and
+    ``WorkEventService`` reads history from both tables, so archiving
+    changes nothing visible. Events without a completion time stay put.
+    """
+
+    def __init__(
+        self,
+        db: Database,
+        older_than_days: int = 90,
+        batch_size: int = ARCHIVE_BATCH,
+        clock: Callable[[], datetime] = datetime.now,
+    ) -> None:
+        self._db = db
+        self._days = older_than_days
+        self._batch = max(1, batch_size)
+        self._clock = clock
+
+    @property
+    def enabled(self) -> bool:
+        return self._days > 0
+
+    @property
+    def batch_size(self) -> int:
+        return self._batch
+
+    def cutoff(self) -> datetime:
+        return self._clock() - timedelta(days=self._days)
+
+    def _eligible(self, cutoff: datetime):
+        return (
+            WorkEvent.is_completed == True,  # noqa: E712
+            WorkEvent.completed_at < cutoff,
+        )
+
+    def pending(self) -> int:
+        """How many hot events are old enough to archive."""
+        if not self.enabled:
+            return 0
+        with self._db.session_scope() as session:
+            return session.execute(
+                select(func.count()).select_from(WorkEvent).where(*self._eligible(self.cutoff()))
+            ).scalar_one()
+
+    def archive_batch(self) -> int:
+        """Archive up to ``batch_size`` events; returns how many moved (0 = done)."""
+        if not self.enabled:
+            return 0
+        now = self._clock()
+        with self._db.session_scope() as session:
+            ids = session.execute(
+                select(WorkEvent.id)
+                .where(*self._eligible(now - timedelta(days=self._days)))
+                .order_by(WorkEvent.completed_at, WorkEvent.id)
+                .limit(self._batch)
+            ).scalars().all()
+            if not ids:
+                return 0
+            session.execute(
+                insert(WorkEventArchive).from_select(
+                    [*_COLUMNS, "archived_at"],
+                    select(*(getattr(WorkEvent, c) for c in _COLUMNS), literal(now)).where(
+                        WorkEvent.id.in_(ids)
+                    ),
+                )
+            )
+            session.execute(delete(WorkEvent).where(WorkEvent.id.in_(ids)))
+        return len(ids)
+
+    def archive_all(self) -> int:
+        """Run batches until nothing is left (tests, benchmarks, maintenance)."""
+        total = 0
+        while True:
+            moved = self.archive_batch()
+            total += moved
+            if moved < self._batch:
+                return total
@@ -3,20 +3,322 @@
 from __future__ import annotations
 
 import calendar as cal_mod
-from datetime import date, datetime
-from typing import Any, Optional
+import heapq
+import threading
+from collections import OrderedDict, defaultdict
+from concurrent.futures import Future, ThreadPoolExecutor, wait
+from dataclasses import dataclass
+from datetime import date, datetime, time, timedelta
+from itertools import islice
+from typing import Any, Callable, Iterable, NamedTuple, Optional, TypeVar, Union
 
-from sqlalchemy import select
+from sqlalchemy import case, delete, func, insert, or_, select, tuple_, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.orm import Session
 
-from daily_event.domain.models import WorkEvent
+from daily_event.domain.models import (
+    Tag,
+    WorkEvent,
+    WorkEventArchive,
+    WorkEventTag,
+    WorkOccurrenceCompletion,
+    WorkSeries,
+    WorkSeriesException,
+    WorkSubtask,
+)
 from daily_event.infra.color_allocator import ColorAllocator
 from daily_event.infra.database import Database
+from daily_event.services.recurrence import is_valid_rule
+from daily_event.services.tag_index import TagIndex, normalize_tags
+from daily_event.services.work_series import (
+    OccurrenceSpan,
+    SeriesEntry,
+    SeriesIndex,
+    WorkOccurrence,
+    is_occurrence_id,
+    split_occurrence_id,
+)
+
+
+Month = tuple[int, int]
+CalendarItem = Union[WorkEvent, OccurrenceSpan]
+# (completed_at, id) of the last row on the previous page; completed_at is
+# None for events completed before completion times were recorded.
+HistoryCursor = tuple[Optional[datetime], int]
+
+# Subtask edits as ``(title, is_done)`` in display order.
+SubtaskSpec = tuple[str, bool]
+T = TypeVar("T")
+
+HISTORY_PAGE_SIZE = 50
+# Ids per ``IN (...)`` list; stays under SQLite's bound-parameter limit.
+BULK_CHUNK = 500
+
+
+HistoryItem = Union[WorkEvent, WorkEventArchive]
+
+
+@dataclass
+class HistoryBatch:
+    events: list[HistoryItem]
+    next_cursor: Optional[HistoryCursor]  # None when this is the last page
+
+
+class SubtaskProgress(NamedTuple):
+    done: int
+    total: int
+
+    @property
+    def fraction(self) -> float:
+        return self.done / self.total if self.total else 0.0
+
+
+def _month_bounds(month: Month) -> tuple[date, date]:
+    year, mon = month
+    return date(year, mon, 1), date(year, mon, cal_mod.monthrange(year, mon)[1])
+
+
+def _months_between(start: date, end: date) -> list[Month]:
+    """Every (year, month) touched by ``[start, end]``."""
+    first = start.year * 12 + start.month - 1
+    last = end.year * 12 + end.month - 1
+    return [(k // 12, k % 12 + 1) for k in range(first, last + 1)]
+
+
+def _like_pattern(text: str) -> str:
+    """Substring LIKE pattern for *text*, with ``\\`` as the escape character."""
+    escaped = text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+def _history_filters(
+    model: type,
+    text: str = "",
+    since: Optional[date] = None,
+    until: Optional[date] = None,
+) -> list[Any]:
+    """WHERE terms for completed events of *model* (hot or archive table)."""
+    filters: list[Any] = []
+    if model is WorkEvent:
+        filters.append(WorkEvent.is_completed == True)  # noqa: E712
+    if text.strip():
+        pattern = _like_pattern(text.strip())
+        filters.append(
+            or_(model.title.like(pattern, escape="\\"), model.note.like(pattern, escape="\\"))
+        )
+    if since is not None:
+        filters.append(model.completed_at >= datetime.combine(since, time.min))
+    if until is not None:
+        filters.append(model.completed_at < datetime.combine(until + timedelta(days=1), time.min))
+    return filters
+
+
+def _chunks(ids: list[int]) -> Iterable[list[int]]:
+    for i in range(0, len(ids), BULK_CHUNK):
+        yield ids[i:i + BULK_CHUNK]
+
+
+def _split_ids(event_ids: Iterable[int]) -> tuple[list[int], list[tuple[int, date]]]:
+    """Row ids and ``(series_id, occurrence_date)`` pairs, de-duplicated."""
+    ids = set(event_ids)
+    rows = sorted(i for i in ids if not is_occurrence_id(i))
+    occurrences = sorted(split_occurrence_id(i) for i in ids if is_occurrence_id(i))
+    return rows, occurrences
+
+
+def _shift_month(month: Month, delta: int) -> Month:
+    k = month[0] * 12 + month[1] - 1 + delta
+    return k // 12, k % 12 + 1
 
 
 class WorkEventService:
-    def __init__(self, db: Database, color_allocator: ColorAllocator) -> None:
+    """Work Event CRUD with an LRU cache of open events per calendar month.
+
+    ``get_for_month`` / ``get_for_date`` / ``get_by_id`` are answered from the
+    cache when the month is loaded; writes drop exactly the months the old
+    and new date ranges touch. ``prefetch_adjacent`` loads the neighbouring
+    months on a single background thread so month flips never wait on SQLite.
+    Cached ``WorkEvent`` instances are detached and shared; treat them as
+    read-only.
+
+    Recurring series are expanded into compact ``OccurrenceSpan`` items per
+    month as the month is loaded (see ``work_series``); ``get_by_id`` builds
+    the full ``WorkOccurrence``. Occurrences carry negative ids,
+    and ``update`` / ``delete`` / ``set_completed`` / ``get_by_id`` accept
+    them: deleting skips that one occurrence, editing detaches it into an
+    ordinary Work Event.
+
+    Tags and subtasks belong to ordinary Work Events. ``get_tag_index`` and
+    ``get_month_progress`` derive per-month views once per data version;
+    progress comes from one grouped count query, never from loading each
+    event's subtasks.
+    """
+
+    def __init__(
+        self,
+        db: Database,
+        color_allocator: ColorAllocator,
+        cache_capacity: int = 12,
+    ) -> None:
         self._db = db
         self._colors = color_allocator
+        self._capacity = max(1, cache_capacity)
+        self._months: OrderedDict[Month, list[CalendarItem]] = OrderedDict()
+        self._series: Optional[SeriesIndex] = None
+        self._lock = threading.Lock()
+        self._version = 0
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._pending: dict[Month, Future] = {}
+        self._month_views: dict[str, tuple[Month, int, Any]] = {}
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    @property
+    def data_version(self) -> int:
+        """Bumped by every write to work events."""
+        return self._version
+
+    # -- month cache --
+
+    def _query_month(self, month: Month) -> list[WorkEvent]:
+        first, last = _month_bounds(month)
+        with self._db.session_scope() as session:
+            return list(
+                session.execute(
+                    select(WorkEvent)
+                    .where(
+                        WorkEvent.start_date <= last,
+                        WorkEvent.end_date >= first,
+                        WorkEvent.is_completed == False,  # noqa: E712
+                    )
+                    .order_by(WorkEvent.start_date)
+                )
+                .scalars()
+                .all()
+            )
+
+    def _load_series(self, version: int) -> SeriesIndex:
+        skipped: dict[int, list[date]] = defaultdict(list)
+        completed: dict[int, dict[date, datetime]] = defaultdict(dict)
+        with self._db.session_scope() as session:
+            for sid, d in session.execute(
+                select(WorkSeriesException.series_id, WorkSeriesException.occurrence_date)
+            ):
+                skipped[sid].append(d)
+            for sid, d, at in session.execute(
+                select(
+                    WorkOccurrenceCompletion.series_id,
+                    WorkOccurrenceCompletion.occurrence_date,
+                    WorkOccurrenceCompletion.completed_at,
+                )
+            ):
+                completed[sid][d] = at
+            index = SeriesIndex(
+                SeriesEntry(
+                    s.id,
+                    s.title,
+                    s.note,
+                    s.recurrence_rule,
+                    s.anchor_date,
+                    s.duration_days,
+                    s.until_date,
+                    s.color_index,
+                    skipped[s.id],
+                    completed[s.id],
+                )
+                for s in session.execute(select(WorkSeries)).scalars()
+            )
+        with self._lock:
+            if version == self._version:
+                self._series = index
+        return index
+
+    def _series_index(self, version: int) -> SeriesIndex:
+        index = self._series
+        return index if index is not None else self._load_series(version)
+
+    def _load_month(self, month: Month, version: int) -> list[CalendarItem]:
+        """Open events plus expanded series occurrences for *month*, by start date."""
+        first, last = _month_bounds(month)
+        occurrences = self._series_index(version).expand(first, last)
+        events = self._query_month(month)
+        if not occurrences:
+            return events
+        return list(heapq.merge(events, occurrences.spans(), key=lambda item: item.start_date))
+
+    def _store(self, month: Month, events: list[CalendarItem], version: int) -> None:
+        """Cache *events* unless a write happened since they were read."""
+        with self._lock:
+            if version != self._version:
+                return
+            self._months[month] = events
+            self._months.move_to_end(month)
+            while len(self._months) > self._capacity:
+                self._months.popitem(last=False)
+
+    def _month(self, month: Month) -> list[CalendarItem]:
+        with self._lock:
+            pending = self._pending.pop(month, None)
+        if pending is not None:
+            wait([pending])  # a prefetch of this month is in flight; reuse it
+        with self._lock:
+            events = self._months.get(month)
+            if events is not None:
+                self._months.move_to_end(month)
+                self.cache_hits += 1
+                return events
+            self.cache_misses += 1
+            version = self._version
+        events = self._load_month(month, version)
+        self._store(month, events, version)
+        return events
+
+    def _invalidate(self, *ranges: tuple[date, date], series: bool = False) -> None:
+        """Drop the cached months touched by *ranges*; *series* also reloads the series index."""
+        with self._lock:
+            self._version += 1
+            if series:
+                self._series = None
+            for start, end in ranges:
+                for month in _months_between(min(start, end), max(start, end)):
+                    self._months.pop(month, None)
+
+    def is_cached(self, year: int, month: int) -> bool:
+        with self._lock:
+            return (year, month) in self._months
+
+    def prefetch_adjacent(self, year: int, month: int) -> list[Future]:
+        """Load the months before and after *year*/*month* in the background."""
+        futures: list[Future] = []
+        for delta in (-1, 1):
+            target = _shift_month((year, month), delta)
+            with self._lock:
+                if target in self._months:
+                    continue
+                pending = self._pending.get(target)
+                if pending is not None and not pending.done():
+                    futures.append(pending)
+                    continue
+                version = self._version
+                if self._executor is None:
+                    self._executor = ThreadPoolExecutor(
+                        max_workers=1, thread_name_prefix="work-prefetch"
+                    )
+                future = self._executor.submit(self._prefetch, target, version)
+                self._pending[target] = future
+            futures.append(future)
+        return futures
+
+    def _prefetch(self, month: Month, version: int) -> None:
+        self._store(month, self._load_month(month, version), version)
+
+    def shutdown(self) -> None:
+        """Stop the prefetch thread (pending loads are abandoned)."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+
+    # -- writes --
 
     def create(
         self,
@@ -24,33 +326,77 @@ class WorkEventService:
         start_date: date,
         end_date: date,
         note: str = "",
+        tags: Iterable[str] = (),
+        subtasks: Iterable[SubtaskSpec] = (),
     ) -> int:
         with self._db.session_scope() as session:
-            event = WorkEvent(
-                title=title,
-                start_date=start_date,
-                end_date=end_date,
-                note=note,
-            )
-            session.add(event)
-            session.flush()
-            event.color_index = event.id % self._colors.palette_size
-            return event.id
+            event_id = self._add_event(session, title, start_date, end_date, note, tags, subtasks)
+        self._invalidate((start_date, end_date))
+        return event_id
+
+    def _add_event(
+        self,
+        session: Session,
+        title: str,
+        start_date: date,
+        end_date: date,
+        note: str,
+        tags: Iterable[str],
+        subtasks: Iterable[SubtaskSpec],
+    ) -> int:
+        event = WorkEvent(
+            title=title,
+            start_date=start_date,
+            end_date=end_date,
+            note=note,
+        )
+        session.add(event)
+        session.flush()
+        event.color_index = event.id % self._colors.palette_size
+        self._write_tags(session, event.id, tags)
+        self._write_subtasks(session, event.id, subtasks)
+        return event.id
 
     def update(self, event_id: int, **kwargs: Any) -> None:
+        """Change the given fields; ``tags`` / ``subtasks`` lists replace the existing ones."""
+        if is_occurrence_id(event_id):
+            self._detach_occurrence(event_id, kwargs)
+            return
+        tags = kwargs.pop("tags", None)
+        subtasks = kwargs.pop("subtasks", None)
         with self._db.session_scope() as session:
             event = session.get(WorkEvent, event_id)
             if not event:
                 return
+            old = (event.start_date, event.end_date)
             for key, val in kwargs.items():
-                if hasattr(event, key) and key not in ("id", "created_at", "color_index"):
+                if hasattr(event, key) and key not in ("id", "created_at", "color_index", "tag_links"):
                     setattr(event, key, val)
+            new = (event.start_date, event.end_date)
+            if tags is not None:
+                self._write_tags(session, event_id, tags)
+            if subtasks is not None:
+                self._write_subtasks(session, event_id, subtasks)
+        self._invalidate(old, new)
 
     def delete(self, event_id: int) -> None:
+        if is_occurrence_id(event_id):
+            self.skip_occurrence(event_id)
+            return
         with self._db.session_scope() as session:
             event = session.get(WorkEvent, event_id)
-            if event:
-                session.delete(event)
+            if not event:
+                # Deleting from the history may hit an archived event.
+                archived = session.get(WorkEventArchive, event_id)
+                if archived:
+                    session.execute(delete(WorkEventTag).where(WorkEventTag.event_id == event_id))
+                    session.execute(delete(WorkSubtask).where(WorkSubtask.event_id == event_id))
+                    session.delete(archived)
+                return
+            span = (event.start_date, event.end_date)
+            session.execute(delete(WorkSubtask).where(WorkSubtask.event_id == event_id))
+            session.delete(event)
+        self._invalidate(span)
 
     def get_all(self) -> list[WorkEvent]:
         with self._db.session_scope() as session:
@@ -65,31 +411,90 @@ class WorkEventService:
                 .all()
             )
 
-    def get_history(self) -> list[WorkEvent]:
+    def get_history(self) -> list[HistoryItem]:
+        """Every completed event, hot and archived, newest completion first."""
         with self._db.session_scope() as session:
-            return list(
+            events: list[HistoryItem] = list(
                 session.execute(
-                    select(WorkEvent)
-                    .where(WorkEvent.is_completed == True)  # noqa: E712
-                    .order_by(
-                        WorkEvent.completed_at.desc(),
-                        WorkEvent.start_date,
+                    select(WorkEvent).where(WorkEvent.is_completed == True)  # noqa: E712
+                ).scalars()
+            )
+            events.extend(session.execute(select(WorkEventArchive)).scalars())
+        events.sort(key=lambda ev: ev.start_date)
+        events.sort(key=lambda ev: ev.completed_at or datetime.min, reverse=True)
+        return events
+
+    def get_history_page(
+        self,
+        limit: int = HISTORY_PAGE_SIZE,
+        cursor: Optional[HistoryCursor] = None,
+        since: Optional[date] = None,
+        until: Optional[date] = None,
+        text: str = "",
+    ) -> HistoryBatch:
+        """One page of completed events, newest completion first.
+
+        Keyset pagination on ``(completed_at, id)``: each page is an index
+        range scan that starts where *cursor* left off, so the cost does not
+        grow with the page number. *since* / *until* bound the completion
+        date (inclusive); *text* matches title or note. Events without a
+        completion time sort last and are skipped when a date range is set.
+
+        The hot table and ``work_events_archive`` are scanned side by side
+        and merged (ids are unique across both), so archived events page in
+        exactly where they would have been.
+        """
+        events: list[HistoryItem] = []
+        with self._db.session_scope() as session:
+            if cursor is None or cursor[0] is not None:
+                parts = []
+                for model in (WorkEvent, WorkEventArchive):
+                    query = select(model).where(
+                        *_history_filters(model, text, since, until),
+                        model.completed_at.is_not(None),
                     )
+                    if cursor is not None:
+                        query = query.where(
+                            tuple_(model.completed_at, model.id) < tuple_(cursor[0], cursor[1])
+                        )
+                    query = query.order_by(model.completed_at.desc(), model.id.desc())
+                    parts.append(list(session.execute(query.limit(limit + 1)).scalars()))
+                merged = heapq.merge(*parts, key=lambda ev: (ev.completed_at, ev.id), reverse=True)
+                events = list(islice(merged, limit + 1))
+            if len(events) <= limit and since is None and until is None:
+                # Only hot rows can lack a completion time (completed before v3).
+                query = select(WorkEvent).where(
+                    *_history_filters(WorkEvent, text), WorkEvent.completed_at.is_(None)
                 )
-                .scalars()
-                .all()
-            )
+                if cursor is not None and cursor[0] is None:
+                    query = query.where(WorkEvent.id < cursor[1])
+                query = query.order_by(WorkEvent.id.desc()).limit(limit + 1 - len(events))
+                events.extend(session.execute(query).scalars())
+        if len(events) <= limit:
+            return HistoryBatch(events, None)
+        events = events[:limit]
+        last = events[-1]
+        return HistoryBatch(events, (last.completed_at, last.id))
+
+    def get_for_month(self, year: int, month: int) -> list[CalendarItem]:
+        return list(self._month((year, month)))
+
+    def get_for_range(self, start: date, end: date) -> list[CalendarItem]:
+        """Open events and series occurrences overlapping ``[start, end]``, by start date.
 
-    def get_for_month(self, year: int, month: int) -> list[WorkEvent]:
-        first = date(year, month, 1)
-        last = date(year, month, cal_mod.monthrange(year, month)[1])
+        One query for the stored events (bypasses the month cache) merged
+        with the series index expanded over the same window, as for a month.
+        """
+        with self._lock:
+            version = self._version
+        occurrences = self._series_index(version).expand(start, end)
         with self._db.session_scope() as session:
-            return list(
+            events = list(
                 session.execute(
                     select(WorkEvent)
                     .where(
-                        WorkEvent.start_date <= last,
-                        WorkEvent.end_date >= first,
+                        WorkEvent.start_date <= end,
+                        WorkEvent.end_date >= start,
                         WorkEvent.is_completed == False,  # noqa: E712
                     )
                     .order_by(WorkEvent.start_date)
@@ -97,30 +502,434 @@ class WorkEventService:
                 .scalars()
                 .all()
             )
+        if not occurrences:
+            return events
+        return list(heapq.merge(events, occurrences.spans(), key=lambda item: item.start_date))
+
+    def get_for_date(self, d: date) -> list[CalendarItem]:
+        return [
+            ev for ev in self._month((d.year, d.month)) if ev.start_date <= d <= ev.end_date
+        ]
+
+    def get_by_id(self, event_id: int) -> Optional[Union[WorkEvent, WorkOccurrence]]:
+        if is_occurrence_id(event_id):
+            # Month lists hold compact spans; build the full occurrence on demand.
+            series_id, d = split_occurrence_id(event_id)
+            with self._lock:
+                version = self._version
+            return self._series_index(version).occurrence(series_id, d)
+        with self._lock:
+            for events in self._months.values():
+                for ev in events:
+                    if ev.id == event_id:
+                        self.cache_hits += 1
+                        return ev
+        with self._db.session_scope() as session:
+            return session.get(WorkEvent, event_id)
+
+    def set_completed(self, event_id: int, completed: bool) -> None:
+        if is_occurrence_id(event_id):
+            self._set_occurrence_completed(event_id, completed)
+            return
+        with self._db.session_scope() as session:
+            event = session.get(WorkEvent, event_id)
+            if not event:
+                return
+            event.is_completed = completed
+            event.completed_at = datetime.now() if completed else None
+            span = (event.start_date, event.end_date)
+        self._invalidate(span)
+
+    # -- tags --
+
+    def set_tags(self, event_id: int, tags: Iterable[str]) -> None:
+        """Replace the tags of an ordinary Work Event (occurrences carry none)."""
+        if is_occurrence_id(event_id):
+            return
+        with self._db.session_scope() as session:
+            event = session.get(WorkEvent, event_id)
+            if not event:
+                return
+            span = (event.start_date, event.end_date)
+            self._write_tags(session, event_id, tags)
+        self._invalidate(span)
+
+    def get_tags(self, event_id: int) -> list[str]:
+        if is_occurrence_id(event_id):
+            return []
+        with self._db.session_scope() as session:
+            return list(
+                session.execute(
+                    select(Tag.name)
+                    .join(WorkEventTag, WorkEventTag.tag_id == Tag.id)
+                    .where(WorkEventTag.event_id == event_id)
+                    .order_by(Tag.name)
+                ).scalars()
+            )
 
-    def get_for_date(self, d: date) -> list[WorkEvent]:
+    def get_all_tags(self) -> list[str]:
+        """Names of the tags attached to at least one Work Event."""
         with self._db.session_scope() as session:
             return list(
                 session.execute(
-                    select(WorkEvent)
-                    .where(
-                        WorkEvent.start_date <= d,
-                        WorkEvent.end_date >= d,
-                        WorkEvent.is_completed == False,  # noqa: E712
+                    select(Tag.name)
+                    .where(select(WorkEventTag.tag_id).where(WorkEventTag.tag_id == Tag.id).exists())
+                    .order_by(Tag.name)
+                ).scalars()
+            )
+
+    def get_tag_index(self, year: int, month: int) -> TagIndex:
+        """Bitmap tag index over ``get_for_month(year, month)``, cached per data version."""
+        return self._month_view("tags", (year, month), self._build_tag_index)
+
+    def _build_tag_index(self, items: list[CalendarItem]) -> TagIndex:
+        ids = [item.id for item in items if not is_occurrence_id(item.id)]
+        tags_by_id: dict[int, list[str]] = defaultdict(list)
+        with self._db.session_scope() as session:
+            for chunk in _chunks(ids):
+                for event_id, name in session.execute(
+                    select(WorkEventTag.event_id, Tag.name)
+                    .join(Tag, Tag.id == WorkEventTag.tag_id)
+                    .where(WorkEventTag.event_id.in_(chunk))
+                    .order_by(Tag.name)
+                ):
+                    tags_by_id[event_id].append(name)
+        return TagIndex(items, tags_by_id)
+
+    def _month_view(self, name: str, month: Month, build: Callable[[list[CalendarItem]], T]) -> T:
+        """``build(month items)``, remembered for the latest month and data version."""
+        with self._lock:
+            cached = self._month_views.get(name)
+            version = self._version
+        if cached is not None and cached[0] == month and cached[1] == version:
+            return cached[2]
+        view = build(self._month(month))
+        with self._lock:
+            if version == self._version:
+                self._month_views[name] = (month, version, view)
+        return view
+
+    def _write_tags(self, session: Session, event_id: int, tags: Iterable[str]) -> None:
+        names = normalize_tags(tags)
+        session.execute(delete(WorkEventTag).where(WorkEventTag.event_id == event_id))
+        if not names:
+            return
+        now = datetime.now()
+        session.execute(
+            sqlite_insert(Tag).on_conflict_do_nothing(),
+            [{"name": name, "created_at": now} for name in names],
+        )
+        tag_ids = session.execute(select(Tag.id).where(Tag.name.in_(names))).scalars().all()
+        session.execute(
+            insert(WorkEventTag), [{"event_id": event_id, "tag_id": tid} for tid in tag_ids]
+        )
+
+    # -- subtasks --
+
+    def get_subtasks(self, event_id: int) -> list[WorkSubtask]:
+        """The checklist of one event, in order (for the edit dialog)."""
+        if is_occurrence_id(event_id):
+            return []
+        with self._db.session_scope() as session:
+            return list(
+                session.execute(
+                    select(WorkSubtask)
+                    .where(WorkSubtask.event_id == event_id)
+                    .order_by(WorkSubtask.position, WorkSubtask.id)
+                ).scalars()
+            )
+
+    def set_subtasks(self, event_id: int, subtasks: Iterable[SubtaskSpec]) -> None:
+        """Replace the checklist of an ordinary Work Event."""
+        if is_occurrence_id(event_id):
+            return
+        with self._db.session_scope() as session:
+            event = session.get(WorkEvent, event_id)
+            if not event:
+                return
+            span = (event.start_date, event.end_date)
+            self._write_subtasks(session, event_id, subtasks)
+        self._invalidate(span)
+
+    def get_progress(self, event_ids: Iterable[int]) -> dict[int, SubtaskProgress]:
+        """Done / total subtasks per event, from one grouped query per id chunk.
+
+        Events without subtasks are absent from the result.
+        """
+        ids = sorted({i for i in event_ids if not is_occurrence_id(i)})
+        done = func.sum(case((WorkSubtask.is_done == True, 1), else_=0))  # noqa: E712
+        progress: dict[int, SubtaskProgress] = {}
+        with self._db.session_scope() as session:
+            for chunk in _chunks(ids):
+                for event_id, n_done, total in session.execute(
+                    select(WorkSubtask.event_id, done, func.count())
+                    .where(WorkSubtask.event_id.in_(chunk))
+                    .group_by(WorkSubtask.event_id)
+                ):
+                    progress[event_id] = SubtaskProgress(int(n_done or 0), total)
+        return progress
+
+    def get_month_progress(self, year: int, month: int) -> dict[int, SubtaskProgress]:
+        """``get_progress`` for the events of a month, cached per data version."""
+        return self._month_view(
+            "progress", (year, month), lambda items: self.get_progress(item.id for item in items)
+        )
+
+    def _write_subtasks(self, session: Session, event_id: int, subtasks: Iterable[SubtaskSpec]) -> None:
+        session.execute(delete(WorkSubtask).where(WorkSubtask.event_id == event_id))
+        now = datetime.now()
+        rows = [
+            {
+                "event_id": event_id,
+                "title": title.strip(),
+                "is_done": bool(is_done),
+                "position": i,
+                "created_at": now,
+            }
+            for i, (title, is_done) in enumerate(item for item in subtasks if item[0].strip())
+        ]
+        if rows:
+            session.execute(insert(WorkSubtask), rows)
+
+    # -- bulk operations --
+    #
+    # Each call is one transaction of set-based statements (``UPDATE ... WHERE
+    # id IN (...)``) followed by a single cache invalidation, so acting on a
+    # selection costs the same number of round trips as acting on one event.
+    # Occurrence ids are accepted and handled as in the single-event methods.
+
+    def bulk_set_completed(self, event_ids: Iterable[int], completed: bool) -> int:
+        """Complete or reopen every event in *event_ids*; returns how many changed."""
+        rows, occurrences = _split_ids(event_ids)
+        now = datetime.now()
+        changed = 0
+        with self._db.session_scope() as session:
+            spans = self._row_spans(session, rows)
+            for chunk in _chunks(rows):
+                changed += session.execute(
+                    update(WorkEvent)
+                    .where(WorkEvent.id.in_(chunk), WorkEvent.is_completed != completed)
+                    .values(is_completed=completed, completed_at=now if completed else None)
+                ).rowcount
+            occurrences = self._live_occurrences(session, occurrences)
+            if occurrences:
+                session.execute(
+                    delete(WorkOccurrenceCompletion).where(
+                        tuple_(WorkOccurrenceCompletion.series_id, WorkOccurrenceCompletion.occurrence_date)
+                        .in_(occurrences)
                     )
-                    .order_by(WorkEvent.start_date)
                 )
-                .scalars()
-                .all()
+                if completed:
+                    session.execute(
+                        insert(WorkOccurrenceCompletion),
+                        [{"series_id": sid, "occurrence_date": d, "completed_at": now} for sid, d in occurrences],
+                    )
+                changed += len(occurrences)
+        self._invalidate(*spans, *self._occurrence_spans(occurrences), series=bool(occurrences))
+        return changed
+
+    def bulk_delete(self, event_ids: Iterable[int]) -> int:
+        """Delete every event in *event_ids* (occurrences are skipped); returns the count."""
+        rows, occurrences = _split_ids(event_ids)
+        changed = 0
+        with self._db.session_scope() as session:
+            spans = self._row_spans(session, rows)
+            for chunk in _chunks(rows):
+                session.execute(delete(WorkEventTag).where(WorkEventTag.event_id.in_(chunk)))
+                session.execute(delete(WorkSubtask).where(WorkSubtask.event_id.in_(chunk)))
+                changed += session.execute(delete(WorkEvent).where(WorkEvent.id.in_(chunk))).rowcount
+            occurrences = self._live_occurrences(session, occurrences)
+            self._skip_occurrences(session, occurrences)
+            changed += len(occurrences)
+        self._invalidate(*spans, *self._occurrence_spans(occurrences), series=bool(occurrences))
+        return changed
+
+    def bulk_shift(self, event_ids: Iterable[int], days: int) -> int:
+        """Move every event in *event_ids* by *days* (negative = earlier); returns the count.
+
+        Shifted occurrences are detached from their series, as with ``update``.
+        """
+        rows, occurrences = _split_ids(event_ids)
+        if days == 0:
+            return 0
+        delta = timedelta(days=days)
+        modifier = f"{days:+d} days"
+        changed = 0
+        with self._db.session_scope() as session:
+            spans = self._row_spans(session, rows)
+            for chunk in _chunks(rows):
+                changed += session.execute(
+                    update(WorkEvent)
+                    .where(WorkEvent.id.in_(chunk))
+                    .values(
+                        start_date=func.date(WorkEvent.start_date, modifier),
+                        end_date=func.date(WorkEvent.end_date, modifier),
+                    )
+                ).rowcount
+            spans += [(start + delta, end + delta) for start, end in spans]
+
+            occurrences = self._live_occurrences(session, occurrences)
+            index = self._series_index(self._version)
+            detached = [index.occurrence(sid, d) for sid, d in occurrences]
+            detached = [occ for occ in detached if occ is not None]
+            self._skip_occurrences(session, [(occ.series_id, occ.occurrence_date) for occ in detached])
+            moved = [
+                WorkEvent(
+                    title=occ.title,
+                    start_date=occ.start_date + delta,
+                    end_date=occ.end_date + delta,
+                    note=occ.note,
+                )
+                for occ in detached
+            ]
+            session.add_all(moved)
+            session.flush()
+            for event in moved:
+                event.color_index = event.id % self._colors.palette_size
+                spans.append((event.start_date, event.end_date))
+            changed += len(moved)
+        self._invalidate(*spans, *self._occurrence_spans(occurrences), series=bool(occurrences))
+        return changed
+
+    def _row_spans(self, session: Session, rows: list[int]) -> list[tuple[date, date]]:
+        spans: list[tuple[date, date]] = []
+        for chunk in _chunks(rows):
+            spans.extend(
+                (start, end)
+                for start, end in session.execute(
+                    select(WorkEvent.start_date, WorkEvent.end_date).where(WorkEvent.id.in_(chunk))
+                )
+            )
+        return spans
+
+    def _live_occurrences(
+        self, session: Session, occurrences: list[tuple[int, date]]
+    ) -> list[tuple[int, date]]:
+        """Drop occurrences whose series no longer exists."""
+        if not occurrences:
+            return []
+        live = set(
+            session.execute(
+                select(WorkSeries.id).where(WorkSeries.id.in_({sid for sid, _ in occurrences}))
+            ).scalars()
+        )
+        return [o for o in occurrences if o[0] in live]
+
+    def _skip_occurrences(self, session: Session, occurrences: list[tuple[int, date]]) -> None:
+        if occurrences:
+            session.execute(
+                sqlite_insert(WorkSeriesException).on_conflict_do_nothing(),
+                [{"series_id": sid, "occurrence_date": d} for sid, d in occurrences],
             )
 
-    def get_by_id(self, event_id: int) -> Optional[WorkEvent]:
+    def _occurrence_spans(self, occurrences: list[tuple[int, date]]) -> list[tuple[date, date]]:
+        return [self._occurrence_span(sid, d) for sid, d in occurrences]
+
+    # -- recurring series --
+
+    def create_series(
+        self,
+        title: str,
+        recurrence_rule: str,
+        anchor_date: date,
+        duration_days: int = 0,
+        until_date: Optional[date] = None,
+        note: str = "",
+    ) -> int:
+        """Create a recurring Work Event; each occurrence spans *duration_days* + 1 days."""
+        if not is_valid_rule(recurrence_rule):
+            raise ValueError(f"invalid recurrence rule: {recurrence_rule!r}")
         with self._db.session_scope() as session:
-            return session.get(WorkEvent, event_id)
+            series = WorkSeries(
+                title=title,
+                note=note,
+                recurrence_rule=recurrence_rule,
+                anchor_date=anchor_date,
+                duration_days=max(0, duration_days),
+                until_date=until_date,
+            )
+            session.add(series)
+            session.flush()
+            series.color_index = series.id % self._colors.palette_size
+            series_id = series.id
+        self._invalidate_all()
+        return series_id
 
-    def set_completed(self, event_id: int, completed: bool) -> None:
+    def get_series(self, series_id: int) -> Optional[WorkSeries]:
         with self._db.session_scope() as session:
-            event = session.get(WorkEvent, event_id)
-            if event:
-                event.is_completed = completed
-                event.completed_at = datetime.now() if completed else None
+            return session.get(WorkSeries, series_id)
+
+    def delete_series(self, series_id: int) -> None:
+        with self._db.session_scope() as session:
+            series = session.get(WorkSeries, series_id)
+            if not series:
+                return
+            session.delete(series)
+        self._invalidate_all()
+
+    def skip_occurrence(self, occurrence_id: int) -> None:
+        """Remove one occurrence from its series."""
+        series_id, d = split_occurrence_id(occurrence_id)
+        with self._db.session_scope() as session:
+            if session.get(WorkSeries, series_id) is None:
+                return
+            exists = session.execute(
+                select(WorkSeriesException.id).where(
+                    WorkSeriesException.series_id == series_id,
+                    WorkSeriesException.occurrence_date == d,
+                )
+            ).first()
+            if not exists:
+                session.add(WorkSeriesException(series_id=series_id, occurrence_date=d))
+        self._invalidate(self._occurrence_span(series_id, d), series=True)
+
+    def _set_occurrence_completed(self, occurrence_id: int, completed: bool) -> None:
+        series_id, d = split_occurrence_id(occurrence_id)
+        with self._db.session_scope() as session:
+            if session.get(WorkSeries, series_id) is None:
+                return
+            session.execute(
+                delete(WorkOccurrenceCompletion).where(
+                    WorkOccurrenceCompletion.series_id == series_id,
+                    WorkOccurrenceCompletion.occurrence_date == d,
+                )
+            )
+            if completed:
+                session.add(WorkOccurrenceCompletion(series_id=series_id, occurrence_date=d))
+        self._invalidate(self._occurrence_span(series_id, d), series=True)
+
+    def _detach_occurrence(self, occurrence_id: int, changes: dict[str, Any]) -> None:
+        """Edit one occurrence: skip it in the series and store it as a plain Work Event.
+
+        Both rows are written in one transaction, so a failure leaves the
+        occurrence untouched instead of hidden with no replacement.
+        """
+        occ = self.get_by_id(occurrence_id)
+        if occ is None:
+            return
+        start = changes.get("start_date", occ.start_date)
+        end = changes.get("end_date", occ.end_date)
+        with self._db.session_scope() as session:
+            self._skip_occurrences(session, [(occ.series_id, occ.start_date)])
+            self._add_event(
+                session,
+                changes.get("title", occ.title),
+                start,
+                end,
+                changes.get("note", occ.note),
+                changes.get("tags", ()),
+                changes.get("subtasks", ()),
+            )
+        self._invalidate((occ.start_date, occ.end_date), (start, end), series=True)
+
+    def _occurrence_span(self, series_id: int, d: date) -> tuple[date, date]:
+        # Load the index if needed: a multi-day occurrence may end in the next month.
+        with self._lock:
+            version = self._version
+        return d, d + timedelta(days=self._series_index(version).duration(series_id))
+
+    def _invalidate_all(self) -> None:
+        with self._lock:
+            self._version += 1
+            self._series = None
+            self._months.clear()
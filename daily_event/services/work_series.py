@@ -0,0 +1,289 @@
+"""Lazy occurrence expansion for recurring Work Events.
+
+A ``WorkSeries`` stores one rule (the recurrence grammar shared with Daily
+Events), an anchor date and an occurrence length. Occurrences are never
+written to the database: ``SeriesIndex`` keeps the series, their skipped
+dates and their completed dates in memory and expands only the window that
+is asked for, as an ``OccurrenceBatch`` of packed ints; month lists turn
+it into lightweight ``OccurrenceSpan`` tuples and the full
+``WorkOccurrence`` is built only for the one being opened. Each occurrence
+gets a stable negative id so it can travel through the same UI paths as an
+ordinary ``WorkEvent`` id.
+"""
+
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from datetime import date, datetime
+from functools import partial
+from itertools import repeat
+from operator import add, and_, attrgetter, or_, rshift
+from typing import Hashable, Iterable, NamedTuple, Optional
+
+from daily_event.services.recurrence import CompiledRule, compile_rule
+
+OCCURRENCE_ORDINAL_BITS = 22  # date.max.toordinal() < 2**22
+_ORDINAL_MASK = (1 << OCCURRENCE_ORDINAL_BITS) - 1
+
+
+def occurrence_id(series_id: int, occurrence_date: date) -> int:
+    """Synthetic id ``-((series_id << 22) | ordinal)``; never collides with row ids."""
+    return -((series_id << OCCURRENCE_ORDINAL_BITS) | occurrence_date.toordinal())
+
+
+def is_occurrence_id(event_id: int) -> bool:
+    return event_id < 0
+
+
+def split_occurrence_id(event_id: int) -> tuple[int, date]:
+    n = -event_id
+    return n >> OCCURRENCE_ORDINAL_BITS, date.fromordinal(n & _ORDINAL_MASK)
+
+
+class WorkOccurrence:
+    """One expanded occurrence; duck-types the ``WorkEvent`` fields the UI reads."""
+
+    __slots__ = (
+        "id",
+        "series_id",
+        "occurrence_date",
+        "title",
+        "start_date",
+        "end_date",
+        "note",
+        "color_index",
+        "is_completed",
+        "completed_at",
+    )
+
+    def __init__(
+        self,
+        event_id: int,
+        series_id: int,
+        start_date: date,
+        end_date: date,
+        title: str,
+        note: str,
+        color_index: int,
+        completed_at: Optional[datetime] = None,
+    ) -> None:
+        self.id = event_id
+        self.series_id = series_id
+        self.occurrence_date = start_date
+        self.title = title
+        self.start_date = start_date
+        self.end_date = end_date
+        self.note = note
+        self.color_index = color_index
+        self.is_completed = completed_at is not None
+        self.completed_at = completed_at
+
+    def __repr__(self) -> str:
+        return f"WorkOccurrence(series={self.series_id}, date={self.occurrence_date})"
+
+
+class OccurrenceSpan(NamedTuple):
+    """What a month view needs of an occurrence; a plain tuple, cheap to build in bulk."""
+
+    id: int
+    series_id: int
+    start_date: date
+    end_date: date
+    title: str
+    color_index: int
+    is_completed: bool
+
+
+_new_span = partial(tuple.__new__, OccurrenceSpan)
+
+
+class OccurrenceBatch:
+    """The occurrences of one window as sorted ints ``day << shift | position``.
+
+    *day* counts from the window's first day and *position* is the series'
+    place in the index, so the keys sort by start date, then series order,
+    and normally fit CPython's fast single-digit int comparison. Expansion
+    stops at this one int per occurrence: ``spans`` turns the batch into
+    ``OccurrenceSpan`` tuples for a month list, and the full
+    ``WorkOccurrence`` is only built by ``SeriesIndex.occurrence``.
+    """
+
+    __slots__ = ("keys", "_first", "_shift", "_entries")
+
+    def __init__(self, keys: list[int], first: int, shift: int, entries: list[SeriesEntry]) -> None:
+        self.keys = keys
+        self._first = first
+        self._shift = shift
+        self._entries = entries
+
+    def __len__(self) -> int:
+        return len(self.keys)
+
+    def _days(self) -> list[int]:
+        return list(map(rshift, self.keys, repeat(self._shift)))
+
+    def _series(self) -> list[SeriesEntry]:
+        mask = (1 << self._shift) - 1
+        return list(map(self._entries.__getitem__, map(and_, self.keys, repeat(mask))))
+
+    def start_ordinals(self) -> list[int]:
+        return list(map(add, self._days(), repeat(self._first)))
+
+    def ids(self) -> list[int]:
+        return [
+            -((entry.series_id << OCCURRENCE_ORDINAL_BITS) | o)
+            for o, entry in zip(self.start_ordinals(), self._series())
+        ]
+
+    def spans(self) -> list[OccurrenceSpan]:
+        if not self.keys:
+            return []
+        offsets = self._days()
+        entries = self._series()
+        ends = list(map(add, offsets, map(attrgetter("duration"), entries)))
+        days = [date.fromordinal(self._first + i) for i in range(max(ends) + 1)]
+        day_at = days.__getitem__
+        starts = list(map(add, offsets, repeat(self._first)))
+        return list(
+            map(
+                _new_span,
+                zip(
+                    self.ids(),
+                    map(attrgetter("series_id"), entries),
+                    map(day_at, offsets),
+                    map(day_at, ends),
+                    map(attrgetter("title"), entries),
+                    map(attrgetter("color_index"), entries),
+                    [o in e.completed for o, e in zip(starts, entries)],
+                ),
+            )
+        )
+
+
+class SeriesEntry:
+    __slots__ = (
+        "series_id",
+        "title",
+        "note",
+        "rule",
+        "anchor",
+        "duration",
+        "until",
+        "color_index",
+        "skipped",
+        "completed",
+        "skip_ordinals",
+        "hidden_ordinals",
+    )
+
+    def __init__(
+        self,
+        series_id: int,
+        title: str,
+        note: str,
+        recurrence_rule: str,
+        anchor: date,
+        duration_days: int,
+        until: Optional[date],
+        color_index: int,
+        skipped: Iterable[date] = (),
+        completed: Optional[dict[date, datetime]] = None,
+    ) -> None:
+        self.series_id = series_id
+        self.title = title
+        self.note = note or ""
+        self.rule: CompiledRule = compile_rule(recurrence_rule, anchor)
+        self.anchor = anchor.toordinal()
+        self.duration = max(0, duration_days)
+        self.until = until.toordinal() if until else None
+        self.color_index = color_index
+        self.skipped = frozenset(d.toordinal() for d in skipped)
+        self.completed = {d.toordinal(): at for d, at in (completed or {}).items()}
+        # Sorted ordinals expand() leaves out, without and with completed ones.
+        self.skip_ordinals = sorted(self.skipped)
+        self.hidden_ordinals = sorted(self.skipped.union(self.completed))
+
+    def make(self, o: int) -> WorkOccurrence:
+        return WorkOccurrence(
+            occurrence_id(self.series_id, date.fromordinal(o)),
+            self.series_id,
+            date.fromordinal(o),
+            date.fromordinal(o + self.duration),
+            self.title,
+            self.note,
+            self.color_index,
+            self.completed.get(o),
+        )
+
+
+class SeriesIndex:
+    """All series in memory; expands occurrences for a date window on request."""
+
+    def __init__(self, entries: Iterable[SeriesEntry]) -> None:
+        self._entries = {e.series_id: e for e in entries}
+        self._order = list(self._entries.values())
+        # Series sharing a rule pattern, with their positions in _order.
+        groups: dict[Hashable, tuple[CompiledRule, list[tuple[int, SeriesEntry]]]] = {}
+        for position, entry in enumerate(self._order):
+            groups.setdefault(entry.rule.pattern, (entry.rule, []))[1].append((position, entry))
+        self._groups = list(groups.values())
+        self._max_duration = max((e.duration for e in self._entries.values()), default=0)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def expand(self, start: date, end: date, include_completed: bool = False) -> OccurrenceBatch:
+        """Occurrences overlapping ``[start, end]``, ordered by start date.
+
+        Each distinct rule pattern (see ``CompiledRule.pattern``) is expanded
+        once over the window for all series sharing it; every series takes its slice with two bisects
+        and contributes one packed int per occurrence, so no object is built
+        per occurrence and the final sort compares small ints.
+        """
+        lo, hi = start.toordinal(), end.toordinal()
+        first = lo - self._max_duration
+        shift = max(1, (len(self._order) - 1).bit_length())
+        keys: list[int] = []
+        if hi < lo:
+            return OccurrenceBatch(keys, first, shift, self._order)
+        for rule, members in self._groups:
+            found = [(o - first) << shift for o in rule.ordinals_between(first, hi)]
+            if not found:
+                continue
+            for position, entry in members:
+                bottom = max(lo - entry.duration, entry.anchor)
+                top = hi if entry.until is None else min(hi, entry.until)
+                a = bisect_left(found, (bottom - first) << shift)
+                b = bisect_left(found, (top + 1 - first) << shift, a)
+                if a >= b:
+                    continue
+                run = found[a:b]
+                hidden = entry.skip_ordinals if include_completed else entry.hidden_ordinals
+                if hidden:
+                    i = bisect_left(hidden, bottom)
+                    j = bisect_right(hidden, top, i)
+                    if i < j:
+                        drop = {(o - first) << shift for o in hidden[i:j]}
+                        run = [k for k in run if k not in drop]
+                keys.extend(map(or_, run, repeat(position)))
+        keys.sort()
+        return OccurrenceBatch(keys, first, shift, self._order)
+
+    def occurrence(self, series_id: int, occurrence_date: date) -> Optional[WorkOccurrence]:
+        """The occurrence starting on *occurrence_date*, if the series produces one."""
+        entry = self._entries.get(series_id)
+        if entry is None:
+            return None
+        o = occurrence_date.toordinal()
+        if (
+            o < entry.anchor
+            or (entry.until is not None and o > entry.until)
+            or o in entry.skipped
+            or not entry.rule.is_due(occurrence_date)
+        ):
+            return None
+        return entry.make(o)
+
+    def duration(self, series_id: int) -> int:
+        entry = self._entries.get(series_id)
+        return entry.duration if entry else 0
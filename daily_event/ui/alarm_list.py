@@ -0,0 +1,225 @@
+"""Alarm list model and delegate — countdowns tick in memory, rows repaint individually."""
+
+from __future__ import annotations
+
+from datetime import datetime
+from typing import Any, Callable, Sequence
+
+from PySide6.QtCore import (
+    QAbstractListModel,
+    QEvent,
+    QModelIndex,
+    QRect,
+    QSize,
+    Qt,
+    Signal,
+)
+from PySide6.QtGui import QColor, QFont, QPainter, QPen
+from PySide6.QtWidgets import QStyle, QStyledItemDelegate, QStyleOptionViewItem
+
+from daily_event.domain.enums import AlarmStatus
+from daily_event.domain.models import Alarm
+from daily_event.services.alarm_service import describe_repeat, format_remaining
+
+STATUS_LABELS = {
+    "pending": ("等待中", "#0067c0"),
+    "fired": ("已触发", "#888"),
+    "cancelled": ("已取消", "#bbb"),
+    "missed": ("已错过", "#c42b1c"),
+}
+
+ROW_HEIGHT = 40
+ROW_GAP = 8
+
+AlarmRole = Qt.ItemDataRole.UserRole + 1
+RemainingRole = Qt.ItemDataRole.UserRole + 2
+
+
+def _fingerprint(alarm: Alarm) -> tuple:
+    return alarm.label, alarm.status, alarm.target_time, alarm.repeat_rule
+
+
+class AlarmListModel(QAbstractListModel):
+    """Alarms plus a cached countdown text per row.
+
+    ``set_alarms`` is called only when alarms actually change; it updates
+    rows in place when the id list is unchanged. ``tick`` recomputes the
+    countdowns of a row range from the clock and emits ``dataChanged`` only
+    for the rows whose text moved, so one second of an open dialog costs a
+    few string formats and a repaint of the visible pending rows.
+    """
+
+    def __init__(self, clock: Callable[[], datetime] = datetime.now, parent=None) -> None:
+        super().__init__(parent)
+        self._clock = clock
+        self._alarms: list[Alarm] = []
+        self._remaining: list[str] = []
+
+    # -- Qt model API --
+
+    def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:  # noqa: N802
+        return 0 if parent.isValid() else len(self._alarms)
+
+    def data(self, index: QModelIndex, role: int = Qt.ItemDataRole.DisplayRole) -> Any:
+        if not index.isValid():
+            return None
+        row = index.row()
+        if role == AlarmRole:
+            return self._alarms[row]
+        if role == RemainingRole:
+            return self._remaining[row]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._alarms[row].label
+        return None
+
+    # -- updates --
+
+    @property
+    def has_pending(self) -> bool:
+        return any(a.status == AlarmStatus.PENDING.value for a in self._alarms)
+
+    def _countdown(self, alarm: Alarm, now: datetime) -> str:
+        if alarm.status != AlarmStatus.PENDING.value:
+            return ""
+        return format_remaining(alarm.target_time, now)
+
+    def set_alarms(self, alarms: Sequence[Alarm]) -> None:
+        now = self._clock()
+        alarms = list(alarms)
+        if [a.id for a in alarms] != [a.id for a in self._alarms]:
+            self.beginResetModel()
+            self._alarms = alarms
+            self._remaining = [self._countdown(a, now) for a in alarms]
+            self.endResetModel()
+            return
+        changed = [
+            row
+            for row, (old, new) in enumerate(zip(self._alarms, alarms))
+            if _fingerprint(old) != _fingerprint(new)
+        ]
+        self._alarms = alarms
+        for row in changed:
+            self._remaining[row] = self._countdown(alarms[row], now)
+        self._emit_rows(changed)
+
+    def tick(self, first: int = 0, last: int = -1) -> int:
+        """Refresh countdowns of rows *first*..*last* (inclusive; -1 = end); returns rows changed."""
+        if not self._alarms:
+            return 0
+        last = len(self._alarms) - 1 if last < 0 else min(last, len(self._alarms) - 1)
+        now = self._clock()
+        changed = []
+        for row in range(max(0, first), last + 1):
+            text = self._countdown(self._alarms[row], now)
+            if text != self._remaining[row]:
+                self._remaining[row] = text
+                changed.append(row)
+        self._emit_rows(changed, [RemainingRole])
+        return len(changed)
+
+    def _emit_rows(self, rows: list[int], roles: list[int] | None = None) -> None:
+        """One ``dataChanged`` per run of consecutive rows."""
+        start = prev = None
+        for row in rows + [None]:
+            if row is not None and prev is not None and row == prev + 1:
+                prev = row
+                continue
+            if start is not None:
+                self.dataChanged.emit(self.index(start), self.index(prev), roles or [])
+            start = prev = row
+
+
+class AlarmItemDelegate(QStyledItemDelegate):
+    """Paints an alarm row (label, time, countdown, repeat, status, cancel)."""
+
+    cancel_requested = Signal(int)
+
+    def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:  # noqa: N802
+        return QSize(option.rect.width(), ROW_HEIGHT + ROW_GAP)
+
+    @staticmethod
+    def _card(option: QStyleOptionViewItem) -> QRect:
+        return option.rect.adjusted(0, 0, 0, -ROW_GAP)
+
+    @staticmethod
+    def _cancel_rect(card: QRect) -> QRect:
+        return QRect(card.right() - 12 - 40, card.center().y() - 12, 40, 24)
+
+    def paint(self, p: QPainter, option: QStyleOptionViewItem, index: QModelIndex) -> None:
+        alarm: Alarm = index.data(AlarmRole)
+        remaining: str = index.data(RemainingRole)
+        card = self._card(option)
+        hovered = bool(option.state & QStyle.StateFlag.State_MouseOver)
+        pending = alarm.status == AlarmStatus.PENDING.value
+
+        p.save()
+        p.setRenderHint(QPainter.RenderHint.Antialiasing)
+        p.setPen(Qt.PenStyle.NoPen)
+        p.setBrush(QColor("#ececec" if hovered else "#f5f5f5"))
+        p.drawRoundedRect(card, 8, 8)
+
+        font = QFont(option.font)
+        right = card.right() - 12
+        if pending:
+            cancel = self._cancel_rect(card)
+            p.setPen(QPen(QColor("#e0b4b0"), 1))
+            p.setBrush(QColor("#fce8e6") if hovered else Qt.BrushStyle.NoBrush)
+            p.drawRoundedRect(cancel, 4, 4)
+            font.setPixelSize(11)
+            p.setFont(font)
+            p.setPen(QColor("#c42b1c"))
+            p.drawText(cancel, Qt.AlignmentFlag.AlignCenter, "取消")
+            right = cancel.left() - 10
+
+        # Right-to-left: status badge, repeat rule, countdown, target time.
+        status_text, status_color = STATUS_LABELS.get(alarm.status, ("未知", "#888"))
+        font.setPixelSize(10)
+        font.setWeight(QFont.Weight.DemiBold)
+        p.setFont(font)
+        badge_w = p.fontMetrics().horizontalAdvance(status_text) + 12
+        badge = QRect(right - badge_w, card.center().y() - 9, badge_w, 18)
+        p.setPen(Qt.PenStyle.NoPen)
+        p.setBrush(QColor(0, 0, 0, 13))
+        p.drawRoundedRect(badge, 4, 4)
+        p.setPen(QColor(status_color))
+        p.drawText(badge, Qt.AlignmentFlag.AlignCenter, status_text)
+        right = badge.left() - 10
+
+        font.setWeight(QFont.Weight.Normal)
+        font.setPixelSize(11)
+        p.setFont(font)
+        fm = p.fontMetrics()
+        parts = []
+        if alarm.repeat_rule:
+            parts.append((describe_repeat(alarm.repeat_rule), "#0067c0"))
+        if remaining:
+            parts.append((remaining, "#1a1a1a"))
+        if alarm.target_time:
+            parts.append((alarm.target_time.strftime("%m-%d %H:%M"), "#666"))
+        for text, color in parts:
+            w = fm.horizontalAdvance(text)
+            p.setPen(QColor(color))
+            p.drawText(QRect(right - w, card.top(), w, card.height()), Qt.AlignmentFlag.AlignVCenter, text)
+            right -= w + 10
+
+        font.setPixelSize(13)
+        font.setWeight(QFont.Weight.Medium)
+        p.setFont(font)
+        label_rect = QRect(card.left() + 12, card.top(), max(0, right - card.left() - 12), card.height())
+        p.setPen(QColor("#1a1a1a"))
+        p.drawText(
+            label_rect,
+            Qt.AlignmentFlag.AlignVCenter,
+            p.fontMetrics().elidedText(alarm.label, Qt.TextElideMode.ElideRight, label_rect.width()),
+        )
+        p.restore()
+
+    def editorEvent(self, event: QEvent, model, option: QStyleOptionViewItem, index: QModelIndex) -> bool:  # noqa: N802
+        if event.type() == QEvent.Type.MouseButtonRelease:
+            alarm: Alarm = index.data(AlarmRole)
+            if alarm.status == AlarmStatus.PENDING.value and self._cancel_rect(self._card(option)).contains(
+                event.position().toPoint()
+            ):
+                self.cancel_requested.emit(alarm.id)
+                return True
+        return super().editorEvent(event, model, option, index)
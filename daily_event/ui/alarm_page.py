@@ -4,19 +4,26 @@ from __future__ import annotations
 
 from typing import TYPE_CHECKING
 
-from PySide6.QtCore import QTime, Qt, QTimer
+from PySide6.QtCore import Qt, QTimer, Signal
 from PySide6.QtWidgets import (
+    QAbstractItemView,
+    QCheckBox,
+    QComboBox,
     QDialog,
     QHBoxLayout,
     QLabel,
     QLineEdit,
+    QListView,
     QPushButton,
-    QScrollArea,
+    QSpinBox,
     QStackedWidget,
     QVBoxLayout,
     QWidget,
 )
 
+from daily_event.services.alarm_service import ALARM_REPEAT_OPTIONS
+from daily_event.services.recurrence import WEEKDAY_NAMES
+from daily_event.ui.alarm_list import AlarmItemDelegate, AlarmListModel
 from daily_event.ui.wheel_picker import WheelPicker
 
 if TYPE_CHECKING:
@@ -31,14 +38,37 @@ _INACTIVE_TAB = (
     "border-radius:16px; padding:6px 16px;"
 )
 
-_STATUS_LABELS = {
-    "pending": ("等待中", "#0067c0"),
-    "fired": ("已触发", "#888"),
-    "cancelled": ("已取消", "#bbb"),
-}
+_INPUT_STYLE = """
+    QLineEdit {
+        border: 1px solid #ddd;
+        border-radius: 8px;
+        padding: 8px 12px;
+        background: #f9f9f9;
+    }
+    QLineEdit:focus {
+        border: 1px solid #0067c0;
+        background: #fff;
+    }
+"""
+_PRIMARY_BUTTON_STYLE = """
+    QPushButton {
+        background: #0067c0;
+        color: white;
+        border: none;
+        border-radius: 8px;
+        padding: 8px 24px;
+        font-weight: 600;
+        font-size: 14px;
+    }
+    QPushButton:hover {
+        background: #0056a0;
+    }
+"""
 
 
 class AlarmPage(QDialog):
+    alarms_changed = Signal()
+
     def __init__(self, alarm_service: AlarmService | None = None, parent: QWidget | None = None) -> None:
         super().__init__(parent)
         self._service = alarm_service
@@ -52,11 +82,12 @@ class AlarmPage(QDialog):
 
         self._mode = 0
         self._setup_ui()
-        self._refresh_list()
 
+        # Countdowns tick in memory; the database is read only in reload().
         self._tick = QTimer(self)
-        self._tick.timeout.connect(self._refresh_list)
-        self._tick.start(2000)
+        self._tick.setInterval(1000)
+        self._tick.timeout.connect(self._on_tick)
+        self.reload()
 
     def _setup_ui(self) -> None:
         root = QVBoxLayout(self)
@@ -83,6 +114,11 @@ class AlarmPage(QDialog):
         self._tab_scheduled.setCursor(Qt.CursorShape.PointingHandCursor)
         self._tab_scheduled.clicked.connect(lambda: self._set_mode(1))
         tabs.addWidget(self._tab_scheduled)
+
+        self._tab_recurring = QPushButton("重复")
+        self._tab_recurring.setCursor(Qt.CursorShape.PointingHandCursor)
+        self._tab_recurring.clicked.connect(lambda: self._set_mode(2))
+        tabs.addWidget(self._tab_recurring)
         tabs.addStretch()
         root.addLayout(tabs)
 
@@ -109,36 +145,12 @@ class AlarmPage(QDialog):
         input_row = QHBoxLayout()
         self._cd_label = QLineEdit()
         self._cd_label.setPlaceholderText("标签（可选）")
-        self._cd_label.setStyleSheet("""
-            QLineEdit {
-                border: 1px solid #ddd;
-                border-radius: 8px;
-                padding: 8px 12px;
-                background: #f9f9f9;
-            }
-            QLineEdit:focus {
-                border: 1px solid #0067c0;
-                background: #fff;
-            }
-        """)
+        self._cd_label.setStyleSheet(_INPUT_STYLE)
         input_row.addWidget(self._cd_label)
         
         start_btn = QPushButton("开始")
         start_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        start_btn.setStyleSheet("""
-            QPushButton {
-                background: #0067c0; 
-                color: white; 
-                border: none;
-                border-radius: 8px; 
-                padding: 8px 24px;
-                font-weight: 600;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background: #0056a0;
-            }
-        """)
+        start_btn.setStyleSheet(_PRIMARY_BUTTON_STYLE)
         start_btn.clicked.connect(self._start_countdown)
         input_row.addWidget(start_btn)
         cd_layout.addLayout(input_row)
@@ -172,42 +184,21 @@ class AlarmPage(QDialog):
         sc_input_row = QHBoxLayout()
         self._sc_label = QLineEdit()
         self._sc_label.setPlaceholderText("标签（可选）")
-        self._sc_label.setStyleSheet("""
-            QLineEdit {
-                border: 1px solid #ddd;
-                border-radius: 8px;
-                padding: 8px 12px;
-                background: #f9f9f9;
-            }
-            QLineEdit:focus {
-                border: 1px solid #0067c0;
-                background: #fff;
-            }
-        """)
+        self._sc_label.setStyleSheet(_INPUT_STYLE)
         sc_input_row.addWidget(self._sc_label)
         
         set_btn = QPushButton("设置")
         set_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        set_btn.setStyleSheet("""
-            QPushButton {
-                background: #0067c0; 
-                color: white; 
-                border: none;
-                border-radius: 8px; 
-                padding: 8px 24px;
-                font-weight: 600;
-                font-size: 14px;
-            }
-            QPushButton:hover {
-                background: #0056a0;
-            }
-        """)
+        set_btn.setStyleSheet(_PRIMARY_BUTTON_STYLE)
         set_btn.clicked.connect(self._set_scheduled)
         sc_input_row.addWidget(set_btn)
         sc_layout.addLayout(sc_input_row)
 
         self._stack.addWidget(sc_page)
 
+        # -- Recurring Page --
+        self._stack.addWidget(self._build_recurring_page())
+
         root.addWidget(self._stack)
 
         # -- List --
@@ -215,23 +206,105 @@ class AlarmPage(QDialog):
         list_header.setStyleSheet("font-size:14px; font-weight:600; color:#444; margin-top:10px;")
         root.addWidget(list_header)
 
-        scroll = QScrollArea()
-        scroll.setWidgetResizable(True)
-        scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-        scroll.setStyleSheet("QScrollArea { border: none; background: transparent; }")
-        
-        self._list_w = QWidget()
-        self._list_w.setObjectName("scrollInner")
-        self._list_w.setStyleSheet("#scrollInner { background: transparent; }")
-        self._list_lo = QVBoxLayout(self._list_w)
-        self._list_lo.setContentsMargins(0, 0, 0, 0)
-        self._list_lo.setSpacing(8)
-        self._list_lo.addStretch()
-        scroll.setWidget(self._list_w)
-        root.addWidget(scroll, stretch=1)
+        self._model = AlarmListModel(parent=self)
+        self._delegate = AlarmItemDelegate(self)
+        self._delegate.cancel_requested.connect(self._cancel)
+        self._list = QListView()
+        self._list.setModel(self._model)
+        self._list.setItemDelegate(self._delegate)
+        self._list.setMouseTracking(True)
+        self._list.setUniformItemSizes(True)
+        self._list.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self._list.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        self._list.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self._list.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self._list.setStyleSheet("QListView { border: none; background: transparent; }")
+        root.addWidget(self._list, stretch=1)
+
+        self._empty_hint = QLabel("暂无闹钟")
+        self._empty_hint.setObjectName("emptyHint")
+        self._empty_hint.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self._empty_hint.setStyleSheet("color: #aaa; font-style: italic; margin-top: 20px;")
+        root.addWidget(self._empty_hint, stretch=1)
 
         self._update_tab_styles()
 
+    def _build_recurring_page(self) -> QWidget:
+        page = QWidget()
+        lo = QVBoxLayout(page)
+        lo.setContentsMargins(0, 10, 0, 10)
+        lo.setSpacing(12)
+
+        repeat_row = QHBoxLayout()
+        self._repeat_kind = QComboBox()
+        for value, label in ALARM_REPEAT_OPTIONS:
+            self._repeat_kind.addItem(label, userData=value)
+        self._repeat_kind.currentIndexChanged.connect(self._update_repeat_fields)
+        repeat_row.addWidget(self._repeat_kind)
+        self._every_hours = QSpinBox()
+        self._every_hours.setRange(1, 24)
+        self._every_hours.setValue(2)
+        self._every_hours.setPrefix("每 ")
+        self._every_hours.setSuffix(" 小时")
+        repeat_row.addWidget(self._every_hours)
+        repeat_row.addStretch()
+        lo.addLayout(repeat_row)
+
+        self._weekday_row = QWidget()
+        wrl = QHBoxLayout(self._weekday_row)
+        wrl.setContentsMargins(0, 0, 0, 0)
+        self._weekday_boxes: list[QCheckBox] = []
+        for i, name in enumerate(WEEKDAY_NAMES):
+            cb = QCheckBox(name)
+            cb.setChecked(i < 5)
+            wrl.addWidget(cb)
+            self._weekday_boxes.append(cb)
+        lo.addWidget(self._weekday_row)
+
+        self._repeat_time = QWidget()
+        tl = QHBoxLayout(self._repeat_time)
+        tl.setContentsMargins(0, 0, 0, 0)
+        tl.addStretch()
+        self._rp_hour_picker = WheelPicker(0, 23, 8, "{:02d}")
+        tl.addWidget(self._rp_hour_picker)
+        colon = QLabel(":")
+        colon.setStyleSheet("font-size: 32px; font-weight: bold; color: #0067c0; margin-bottom: 8px;")
+        tl.addWidget(colon)
+        self._rp_minute_picker = WheelPicker(0, 59, 0, "{:02d}")
+        tl.addWidget(self._rp_minute_picker)
+        tl.addStretch()
+        lo.addWidget(self._repeat_time)
+
+        input_row = QHBoxLayout()
+        self._rp_label = QLineEdit()
+        self._rp_label.setPlaceholderText("标签（可选）")
+        self._rp_label.setStyleSheet(_INPUT_STYLE)
+        input_row.addWidget(self._rp_label)
+        add_btn = QPushButton("设置")
+        add_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        add_btn.setStyleSheet(_PRIMARY_BUTTON_STYLE)
+        add_btn.clicked.connect(self._set_recurring)
+        input_row.addWidget(add_btn)
+        lo.addLayout(input_row)
+
+        self._update_repeat_fields()
+        return page
+
+    def _repeat_rule(self) -> str:
+        kind = self._repeat_kind.currentData()
+        if kind == "hours:":
+            return f"hours:{self._every_hours.value()}"
+        if kind == "weekdays:":
+            days = [str(i) for i, cb in enumerate(self._weekday_boxes) if cb.isChecked()]
+            return "weekdays:" + ",".join(days) if days else ""
+        return kind
+
+    def _update_repeat_fields(self) -> None:
+        kind = self._repeat_kind.currentData()
+        self._every_hours.setVisible(kind == "hours:")
+        self._weekday_row.setVisible(kind == "weekdays:")
+        self._repeat_time.setVisible(kind != "hours:")
+
     # -- mode switching --
 
     def _set_mode(self, idx: int) -> None:
@@ -240,8 +313,8 @@ class AlarmPage(QDialog):
         self._update_tab_styles()
 
     def _update_tab_styles(self) -> None:
-        self._tab_countdown.setStyleSheet(_ACTIVE_TAB if self._mode == 0 else _INACTIVE_TAB)
-        self._tab_scheduled.setStyleSheet(_INACTIVE_TAB if self._mode == 0 else _ACTIVE_TAB)
+        for i, tab in enumerate((self._tab_countdown, self._tab_scheduled, self._tab_recurring)):
+            tab.setStyleSheet(_ACTIVE_TAB if self._mode == i else _INACTIVE_TAB)
 
     # -- create alarms --
 
@@ -252,7 +325,8 @@ class AlarmPage(QDialog):
         label = self._cd_label.text().strip()
         self._service.create_countdown(label, minutes)
         self._cd_label.clear()
-        self._refresh_list()
+        self.alarms_changed.emit()
+        self.reload()
 
     def _set_scheduled(self) -> None:
         if not self._service:
@@ -262,82 +336,59 @@ class AlarmPage(QDialog):
         label = self._sc_label.text().strip()
         self._service.create_scheduled(label, hour, minute)
         self._sc_label.clear()
-        self._refresh_list()
+        self.alarms_changed.emit()
+        self.reload()
 
-    # -- list --
+    def _set_recurring(self) -> None:
+        if not self._service:
+            return
+        rule = self._repeat_rule()
+        if not rule:
+            return
+        label = self._rp_label.text().strip()
+        self._service.create_recurring(
+            label, rule, self._rp_hour_picker.value, self._rp_minute_picker.value
+        )
+        self._rp_label.clear()
+        self.alarms_changed.emit()
+        self.reload()
 
-    def _refresh_list(self) -> None:
-        while self._list_lo.count() > 0:
-            item = self._list_lo.takeAt(0)
-            w = item.widget()
-            if w:
-                w.deleteLater()
+    # -- list --
 
+    def reload(self) -> None:
+        """Re-read the alarms after they changed (created, cancelled, fired)."""
         if not self._service:
             return
-        alarms = self._service.get_all()
-        if not alarms:
-            h = QLabel("暂无闹钟")
-            h.setObjectName("emptyHint")
-            h.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            h.setStyleSheet("color: #aaa; font-style: italic; margin-top: 20px;")
-            self._list_lo.addWidget(h)
+        self._model.set_alarms(self._service.get_all())
+        empty = self._model.rowCount() == 0
+        self._list.setVisible(not empty)
+        self._empty_hint.setVisible(empty)
+        self._update_tick()
+
+    def _update_tick(self) -> None:
+        if self.isVisible() and self._model.has_pending:
+            if not self._tick.isActive():
+                self._tick.start()
         else:
-            for a in alarms:
-                self._list_lo.addWidget(self._build_item(a))
-        self._list_lo.addStretch()
-
-    def _build_item(self, alarm) -> QWidget:
-        row = QWidget()
-        row.setStyleSheet("""
-            QWidget {
-                background: #f5f5f5;
-                border-radius: 8px;
-            }
-        """)
-        lo = QHBoxLayout(row)
-        lo.setContentsMargins(12, 8, 12, 8)
-        lo.setSpacing(10)
-
-        lbl = QLabel(alarm.label)
-        lbl.setStyleSheet("font-size:13px; color:#1a1a1a; font-weight: 500;")
-        lo.addWidget(lbl, stretch=1)
-
-        time_str = alarm.target_time.strftime("%m-%d %H:%M") if alarm.target_time else ""
-        time_lbl = QLabel(time_str)
-        time_lbl.setStyleSheet("font-size:11px; color:#666;")
-        lo.addWidget(time_lbl)
-
-        status_text, status_color = _STATUS_LABELS.get(alarm.status, ("未知", "#888"))
-        badge = QLabel(status_text)
-        badge.setStyleSheet(
-            f"font-size:10px; color:{status_color}; background:rgba(0,0,0,0.05);"
-            "border-radius:4px; padding:2px 6px; font-weight: 600;"
-        )
-        lo.addWidget(badge)
-
-        if alarm.status == "pending":
-            cancel = QPushButton("取消")
-            cancel.setCursor(Qt.CursorShape.PointingHandCursor)
-            cancel.setFixedSize(40, 24)
-            cancel.setStyleSheet("""
-                QPushButton {
-                    font-size:11px; 
-                    color:#c42b1c; 
-                    border:1px solid #e0b4b0; 
-                    border-radius:4px; 
-                    background: transparent;
-                }
-                QPushButton:hover {
-                    background: #fce8e6;
-                }
-            """)
-            cancel.clicked.connect(lambda checked=False, aid=alarm.id: self._cancel(aid))
-            lo.addWidget(cancel)
-
-        return row
+            self._tick.stop()
+
+    def _on_tick(self) -> None:
+        viewport = self._list.viewport()
+        first = self._list.indexAt(viewport.rect().topLeft()).row()
+        last = self._list.indexAt(viewport.rect().bottomLeft()).row()
+        self._model.tick(max(first, 0), last)
+
+    def showEvent(self, event) -> None:  # noqa: N802
+        super().showEvent(event)
+        self._model.tick()
+        self._update_tick()
+
+    def hideEvent(self, event) -> None:  # noqa: N802
+        super().hideEvent(event)
+        self._tick.stop()
 
     def _cancel(self, alarm_id: int) -> None:
         if self._service:
             self._service.cancel(alarm_id)
-        self._refresh_list()
+            self.alarms_changed.emit()
+            self.reload()
@@ -0,0 +1,50 @@
+"""Single-shot timer that fires alarms at their target time."""
+
+from __future__ import annotations
+
+from PySide6.QtCore import QObject, Qt, QTimer, Signal
+
+from daily_event.services.alarm_clock import drift_check_ms
+from daily_event.services.alarm_service import AlarmService
+
+
+class AlarmScheduler(QObject):
+    """Arms one precise timer for the earliest pending alarm.
+
+    The schedule is ``AlarmService``'s in-memory heap, so arming costs no
+    query and nothing wakes up while no alarm is pending. Call ``reschedule``
+    after creating or cancelling an alarm, and on
+    ``DayBoundaryScheduler.day_changed`` / ``clock_changed`` (clock changes,
+    wake from sleep). QTimer cannot see a wall-clock jump that no such
+    notification reported, so the wait is cut to ``drift_check_ms`` of it
+    (a quarter of the remaining time, at least a minute) and each wake-up
+    lets the service re-check the clocks.
+    ``fired`` is emitted after alarms went off, so open views can reload.
+    """
+
+    fired = Signal()
+
+    def __init__(self, service: AlarmService, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._service = service
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.timeout.connect(self._on_timeout)
+
+    @property
+    def is_armed(self) -> bool:
+        return self._timer.isActive()
+
+    def reschedule(self) -> None:
+        ms = self._service.ms_until_next()
+        if ms is None:
+            self._timer.stop()
+        else:
+            self._timer.start(drift_check_ms(ms))
+
+    def _on_timeout(self) -> None:
+        fired = self._service.fire_due()
+        self.reschedule()
+        if fired:
+            self.fired.emit()
@@ -0,0 +1,68 @@
+"""Idle-time driver for the Work Event archiver."""
+
+from __future__ import annotations
+
+import time
+
+from PySide6.QtCore import QCoreApplication, QEvent, QObject, QTimer
+
+from daily_event.services.work_archive import WorkArchiver
+
+START_DELAY_MS = 60_000
+IDLE_MS = 5_000
+BATCH_PAUSE_MS = 200
+RECHECK_MS = 6 * 60 * 60 * 1000
+
+_INPUT_EVENTS = frozenset(
+    {
+        QEvent.Type.MouseButtonPress,
+        QEvent.Type.MouseMove,
+        QEvent.Type.KeyPress,
+        QEvent.Type.Wheel,
+    }
+)
+
+
+class ArchiveScheduler(QObject):
+    """Runs ``WorkArchiver.archive_batch`` only while the user is idle.
+
+    An application-wide event filter records the last mouse / keyboard
+    input. One single-shot timer drives everything: a batch runs once input
+    has been quiet for ``IDLE_MS``, full batches are chained with a short
+    pause until the backlog is gone, then the timer sleeps for hours.
+    """
+
+    def __init__(self, archiver: WorkArchiver, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._archiver = archiver
+        self._last_input = time.monotonic()
+        self.archived = 0
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.timeout.connect(self._on_timeout)
+
+    def start(self, delay_ms: int = START_DELAY_MS) -> None:
+        if not self._archiver.enabled:
+            return
+        app = QCoreApplication.instance()
+        if app is not None:
+            app.installEventFilter(self)
+        self._timer.start(delay_ms)
+
+    @property
+    def is_armed(self) -> bool:
+        return self._timer.isActive()
+
+    def eventFilter(self, watched: QObject, event: QEvent) -> bool:  # noqa: N802
+        if event.type() in _INPUT_EVENTS:
+            self._last_input = time.monotonic()
+        return False
+
+    def _on_timeout(self) -> None:
+        quiet_ms = int((time.monotonic() - self._last_input) * 1000)
+        if quiet_ms < IDLE_MS:
+            self._timer.start(IDLE_MS - quiet_ms)
+            return
+        moved = self._archiver.archive_batch()
+        self.archived += moved
+        self._timer.start(BATCH_PAUSE_MS if moved == self._archiver.batch_size else RECHECK_MS)
@@ -5,10 +5,12 @@ from __future__ import annotations
 from datetime import date, timedelta
 from typing import TYPE_CHECKING
 
-from PySide6.QtCore import Qt, Signal, QRectF
+from PySide6.QtCore import Qt, Signal, QPointF, QRectF
 from PySide6.QtGui import QPainter, QColor, QFont
 from PySide6.QtWidgets import QWidget
 
+from daily_event.services.calendar_service import CalendarService
+
 if TYPE_CHECKING:
     from daily_event.services.calendar_service import EventSegment
 
@@ -19,9 +21,13 @@ class CalendarWidget(QWidget):
     date_clicked = Signal(object)
     month_changed = Signal(int, int)
     event_clicked = Signal(int)
+    event_toggled = Signal(int)  # Ctrl+click on a bar: add to / remove from the selection
 
     WEEKDAY_HEADERS = ["日", "一", "二", "三", "四", "五", "六"]
     HEADER_HEIGHT = 28
+    BAR_HEIGHT = 4.0
+    BAR_GAP = 2.0
+    BAR_TOP = 0.55  # fraction of the cell height where slot 0 starts
 
     def __init__(self, parent: QWidget | None = None) -> None:
         super().__init__(parent)
@@ -33,6 +39,15 @@ class CalendarWidget(QWidget):
         self._hovered: date | None = None
         self._grid: list[list[date]] = []
         self._work_segments: list[EventSegment] = []
+        self._daily_due: dict[date, int] = {}
+        self._max_slots = 0  # 0 = unlimited
+        self._overflow: dict[tuple[int, int], int] = {}
+        self._expanded_row: int | None = None
+        self._selected_events: set[int] = set()
+        self._workload: list[int] = []  # open events per grid cell, row-major
+        self._workload_threshold = 0
+        self._progress: dict[int, float] = {}  # event id -> done fraction
+        self._bar_fill: dict[tuple[int, int], float] = {}  # (event id, row) -> filled part
 
         self._rebuild_grid()
         self.setMinimumSize(280, 220)
@@ -52,6 +67,11 @@ class CalendarWidget(QWidget):
     def selected_date(self) -> date | None:
         return self._selected
 
+    def select_date(self, d: date) -> None:
+        """Highlight *d* as the selected cell without emitting ``date_clicked``."""
+        self._selected = d
+        self.update()
+
     @property
     def grid_start(self) -> date:
         return self._grid[0][0] if self._grid else date.today()
@@ -76,6 +96,14 @@ class CalendarWidget(QWidget):
         self.month_changed.emit(self._year, self._month)
         self.update()
 
+    def show_month(self, year: int, month: int) -> None:
+        if (year, month) == (self._year, self._month):
+            return
+        self._year, self._month = year, month
+        self._rebuild_grid()
+        self.month_changed.emit(self._year, self._month)
+        self.update()
+
     def go_to_today(self) -> None:
         self._today = date.today()
         self._year = self._today.year
@@ -85,13 +113,98 @@ class CalendarWidget(QWidget):
         self.month_changed.emit(self._year, self._month)
         self.update()
 
+    def set_today(self, today: date) -> None:
+        """Move the today marker after a day rollover.
+
+        A selection that was sitting on the old today follows it; if that also
+        crosses into another month the view follows too.
+        """
+        old = self._today
+        if today == old:
+            return
+        self._today = today
+        if self._selected == old:
+            self._selected = today
+            if (today.year, today.month) != (self._year, self._month) and (
+                old.year,
+                old.month,
+            ) == (self._year, self._month):
+                self._year, self._month = today.year, today.month
+                self._rebuild_grid()
+                self.month_changed.emit(self._year, self._month)
+        self.update()
+
     def set_work_segments(self, segments: list[EventSegment]) -> None:
         self._work_segments = segments
+        self._update_overflow()
+        self._update_bar_fill()
+        self.update()
+
+    def set_work_progress(self, progress: dict[int, float]) -> None:
+        """Fill each event's bars left to right by its subtask completion fraction."""
+        if progress != self._progress:
+            self._progress = dict(progress)
+            self._update_bar_fill()
+            self.update()
+
+    def _update_bar_fill(self) -> None:
+        """Spread each event's fraction over its segments in reading order."""
+        self._bar_fill = {}
+        if not self._progress:
+            return
+        by_event: dict[int, list[EventSegment]] = {}
+        for seg in self._work_segments:
+            if seg.event_id in self._progress:
+                by_event.setdefault(seg.event_id, []).append(seg)
+        for eid, segs in by_event.items():
+            segs.sort(key=lambda s: s.row)
+            widths = [s.end_col - s.start_col + 1 for s in segs]
+            filled = self._progress[eid] * sum(widths)
+            for seg, width in zip(segs, widths):
+                self._bar_fill[(eid, seg.row)] = min(max(filled, 0.0), width) / width
+                filled -= width
+
+    def set_selected_events(self, event_ids: set[int]) -> None:
+        """Outline the bars of *event_ids* (the shared multi-selection)."""
+        if event_ids != self._selected_events:
+            self._selected_events = set(event_ids)
+            self.update()
+
+    def set_workload(self, counts: list[int], threshold: int) -> None:
+        """Shade cells with more than *threshold* concurrent events (0 = off)."""
+        self._workload = counts
+        self._workload_threshold = threshold
+        self.update()
+
+    def _overload(self, row: int, col: int) -> int:
+        """How far the cell's workload exceeds the threshold (0 when it doesn't)."""
+        i = row * 7 + col
+        if self._workload_threshold <= 0 or i >= len(self._workload):
+            return 0
+        return max(0, self._workload[i] - self._workload_threshold)
+
+    def set_max_slots(self, max_slots: int) -> None:
+        """Show at most *max_slots* stacked bars per cell; the rest become "+N"."""
+        self._max_slots = max(0, max_slots)
+        self._update_overflow()
+        self.update()
+
+    def _update_overflow(self) -> None:
+        self._overflow = CalendarService.overflow_counts(self._work_segments, self._max_slots)
+        if self._expanded_row is not None and not any(
+            row == self._expanded_row for row, _ in self._overflow
+        ):
+            self._expanded_row = None
+
+    def set_daily_due_counts(self, counts: dict[date, int]) -> None:
+        """Per-day number of due dailies, drawn as a small marker in each cell."""
+        self._daily_due = counts
         self.update()
 
     # -- grid computation --
 
     def _rebuild_grid(self) -> None:
+        self._expanded_row = None
         first_of_month = date(self._year, self._month, 1)
         start_offset = (first_of_month.weekday() + 1) % 7
         grid_start = first_of_month - timedelta(days=start_offset)
@@ -147,6 +260,12 @@ class CalendarWidget(QWidget):
                 is_sel = d == self._selected and not is_today
                 is_hover = d == self._hovered and not is_today and not is_sel
 
+                excess = self._overload(row_idx, col_idx)
+                if excess:
+                    p.setPen(Qt.PenStyle.NoPen)
+                    p.setBrush(QColor(196, 43, 28, min(70, 12 + 10 * excess) if is_cur else 14))
+                    p.drawRoundedRect(rect.adjusted(2, 2, -2, -2), 6, 6)
+
                 # Slightly smaller circle for today
                 size = min(rect.width(), rect.height()) * 0.58
 
@@ -176,25 +295,79 @@ class CalendarWidget(QWidget):
                 text_rect = QRectF(rect.x(), rect.y() + 4, rect.width(), rect.height() * 0.45)
                 p.drawText(text_rect, Qt.AlignmentFlag.AlignCenter, str(d.day))
 
+                if self._daily_due.get(d):
+                    pen = p.pen()
+                    p.setPen(Qt.PenStyle.NoPen)
+                    p.setBrush(QColor(0, 103, 192, 150 if is_cur else 60))
+                    p.drawEllipse(QPointF(rect.right() - 7, rect.top() + 7), 2.5, 2.5)
+                    p.setPen(pen)
+
+    def _is_visible(self, seg: EventSegment) -> bool:
+        return self._max_slots <= 0 or seg.slot < self._max_slots or seg.row == self._expanded_row
+
+    def _bar_rect(self, seg: EventSegment) -> QRectF:
+        s_rect = self._cell_rect(seg.row, seg.start_col)
+        e_rect = self._cell_rect(seg.row, seg.end_col)
+        y = s_rect.top() + s_rect.height() * self.BAR_TOP + seg.slot * (self.BAR_HEIGHT + self.BAR_GAP)
+        return QRectF(s_rect.left() + 6, y, e_rect.right() - s_rect.left() - 12, self.BAR_HEIGHT)
+
+    def _overflow_rect(self, row: int, col: int) -> QRectF:
+        rect = self._cell_rect(row, col)
+        return QRectF(rect.right() - 26, rect.bottom() - 13, 24, 12)
+
     def _paint_work_segments(self, p: QPainter) -> None:
         if not self._work_segments:
             return
-        line_h = 4.0
-        gap = 2.0
-        base_y_fraction = 0.55
-
+        p.setPen(Qt.PenStyle.NoPen)
         for seg in self._work_segments:
-            s_rect = self._cell_rect(seg.row, seg.start_col)
-            e_rect = self._cell_rect(seg.row, seg.end_col)
-
-            x1 = s_rect.left() + 6
-            x2 = e_rect.right() - 6
-            base_y = s_rect.top() + s_rect.height() * base_y_fraction
-            y = base_y + seg.slot * (line_h + gap)
-
+            if seg.row != self._expanded_row and self._is_visible(seg):
+                self._paint_bar(p, seg)
+
+        if self._overflow:
+            font = QFont(p.font())
+            font.setPointSize(8)
+            p.setFont(font)
+            p.setPen(QColor(0, 103, 192))
+            for (row, col), hidden in self._overflow.items():
+                if row != self._expanded_row:
+                    p.drawText(
+                        self._overflow_rect(row, col),
+                        Qt.AlignmentFlag.AlignRight | Qt.AlignmentFlag.AlignVCenter,
+                        f"+{hidden}",
+                    )
+
+        if self._expanded_row is not None:
+            row_segs = [s for s in self._work_segments if s.row == self._expanded_row]
+            if not row_segs:
+                return
+            step = self.BAR_HEIGHT + self.BAR_GAP
+            first = self._cell_rect(self._expanded_row, 0)
+            top = first.top() + first.height() * self.BAR_TOP
+            depth = (max(s.slot for s in row_segs) + 1) * step
+            p.setPen(QColor(0, 0, 0, 30))
+            p.setBrush(QColor(255, 255, 255, 240))
+            p.drawRoundedRect(QRectF(2, top - 4, self.width() - 4, depth + 6), 4, 4)
             p.setPen(Qt.PenStyle.NoPen)
+            for seg in row_segs:
+                self._paint_bar(p, seg)
+
+    def _paint_bar(self, p: QPainter, seg: EventSegment) -> None:
+        rect = self._bar_rect(seg)
+        if seg.event_id in self._selected_events:
+            p.setBrush(QColor(26, 26, 26))
+            p.drawRoundedRect(rect.adjusted(-1.5, -1.5, 1.5, 1.5), 3.0, 3.0)
+        fill = self._bar_fill.get((seg.event_id, seg.row))
+        if fill is None:
+            p.setBrush(QColor(seg.color_hex))
+            p.drawRoundedRect(rect, 2.0, 2.0)
+            return
+        pale = QColor(seg.color_hex)
+        pale.setAlpha(90)
+        p.setBrush(pale)
+        p.drawRoundedRect(rect, 2.0, 2.0)
+        if fill > 0:
             p.setBrush(QColor(seg.color_hex))
-            p.drawRoundedRect(QRectF(x1, y, x2 - x1, line_h), 2.0, 2.0)
+            p.drawRoundedRect(QRectF(rect.left(), rect.top(), rect.width() * fill, rect.height()), 2.0, 2.0)
 
     # -- mouse interaction --
 
@@ -205,16 +378,32 @@ class CalendarWidget(QWidget):
 
         pos = event.position()
 
-        for seg in self._work_segments:
-            sr = self._cell_rect(seg.row, seg.start_col)
-            er = self._cell_rect(seg.row, seg.end_col)
-            base_y = sr.top() + sr.height() * 0.55 + seg.slot * 6.0
-            hit = QRectF(sr.left(), base_y - 2, er.right() - sr.left(), 8)
+        # The expanded row is drawn on top, so it wins hit-testing.
+        ordered = sorted(self._work_segments, key=lambda s: s.row != self._expanded_row)
+        for seg in ordered:
+            if not self._is_visible(seg):
+                continue
+            bar = self._bar_rect(seg)
+            hit = QRectF(bar.left() - 6, bar.top() - 2, bar.width() + 12, 8)
             if hit.contains(pos):
-                self.event_clicked.emit(seg.event_id)
+                if event.modifiers() & Qt.KeyboardModifier.ControlModifier:
+                    self.event_toggled.emit(seg.event_id)
+                else:
+                    self.event_clicked.emit(seg.event_id)
                 event.accept()
                 return
 
+        for row, col in self._overflow:
+            if row != self._expanded_row and self._overflow_rect(row, col).contains(pos):
+                self._expanded_row = row
+                self.update()
+                event.accept()
+                return
+
+        if self._expanded_row is not None:
+            self._expanded_row = None
+            self.update()
+
         for row_idx, row in enumerate(self._grid):
             for col_idx, d in enumerate(row):
                 if self._cell_rect(row_idx, col_idx).contains(pos):
@@ -230,14 +419,19 @@ class CalendarWidget(QWidget):
         pos = event.position()
         old = self._hovered
         self._hovered = None
+        tip = ""
         for row_idx, row in enumerate(self._grid):
             for col_idx, d in enumerate(row):
                 if self._cell_rect(row_idx, col_idx).contains(pos):
                     self._hovered = d
+                    if self._overload(row_idx, col_idx):
+                        count = self._workload[row_idx * 7 + col_idx]
+                        tip = f"{count} 项工作并行（上限 {self._workload_threshold}）"
                     break
             if self._hovered:
                 break
         if self._hovered != old:
+            self.setToolTip(tip)
             self.update()
 
     def leaveEvent(self, event) -> None:  # noqa: N802
@@ -0,0 +1,115 @@
+"""Work Event conflicts — runs of days with more concurrent events than the limit."""
+
+from __future__ import annotations
+
+from datetime import date
+from typing import TYPE_CHECKING
+
+from PySide6.QtCore import Qt, Signal
+from PySide6.QtWidgets import (
+    QDialog,
+    QLabel,
+    QScrollArea,
+    QVBoxLayout,
+    QWidget,
+)
+
+if TYPE_CHECKING:
+    from daily_event.services.calendar_service import Conflict
+
+# Titles listed per conflict before collapsing the rest into "等 N 项".
+MAX_TITLES = 6
+
+
+class _ConflictCard(QWidget):
+    clicked = Signal(object)  # date
+
+    def __init__(self, conflict: Conflict, titles: list[str], parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self._start = conflict.start
+        self.setObjectName("itemCard")
+        self.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
+        self.setCursor(Qt.CursorShape.PointingHandCursor)
+
+        lo = QVBoxLayout(self)
+        lo.setContentsMargins(12, 8, 12, 8)
+        lo.setSpacing(4)
+
+        span = _span_text(conflict.start, conflict.end)
+        head = QLabel(f"{span} · 最多 {conflict.peak} 项并行")
+        head.setStyleSheet("font-size: 13px; font-weight: 600; color: #c42b1c;")
+        lo.addWidget(head)
+
+        shown = "、".join(titles[:MAX_TITLES])
+        if len(titles) > MAX_TITLES:
+            shown += f" 等 {len(titles)} 项"
+        body = QLabel(shown)
+        body.setWordWrap(True)
+        body.setStyleSheet("font-size: 12px; color: #555;")
+        lo.addWidget(body)
+
+    def mousePressEvent(self, event) -> None:  # noqa: N802
+        if event.button() == Qt.MouseButton.LeftButton:
+            self.clicked.emit(self._start)
+            event.accept()
+        else:
+            super().mousePressEvent(event)
+
+
+class ConflictPage(QDialog):
+    """Lists overloaded runs; clicking one jumps the calendar to its first day."""
+
+    date_selected = Signal(object)
+
+    def __init__(self, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self.setWindowTitle("工作量冲突")
+        self.setMinimumSize(420, 320)
+        self.setWindowFlags(
+            Qt.WindowType.Tool
+            | Qt.WindowType.WindowTitleHint
+            | Qt.WindowType.WindowCloseButtonHint
+        )
+
+        root = QVBoxLayout(self)
+        root.setContentsMargins(16, 16, 16, 16)
+        root.setSpacing(8)
+
+        self._heading = QLabel()
+        self._heading.setStyleSheet("font-size: 16px; font-weight: 600; color: #1a1a1a;")
+        root.addWidget(self._heading)
+
+        scroll = QScrollArea()
+        scroll.setWidgetResizable(True)
+        scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        inner = QWidget()
+        self._list = QVBoxLayout(inner)
+        self._list.setContentsMargins(0, 0, 0, 0)
+        self._list.setSpacing(8)
+        scroll.setWidget(inner)
+        root.addWidget(scroll, stretch=1)
+
+    def set_conflicts(self, conflicts: list[Conflict], titles: dict[int, str], threshold: int) -> None:
+        self._heading.setText(f"并行超过 {threshold} 项的日期")
+        while self._list.count() > 0:
+            item = self._list.takeAt(0)
+            w = item.widget()
+            if w:
+                w.deleteLater()
+
+        if not conflicts:
+            hint = QLabel("本月没有超出上限的日期")
+            hint.setObjectName("emptyHint")
+            hint.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            self._list.addWidget(hint)
+        for conflict in conflicts:
+            card = _ConflictCard(conflict, [titles.get(eid, "") for eid in conflict.event_ids])
+            card.clicked.connect(self.date_selected.emit)
+            self._list.addWidget(card)
+        self._list.addStretch()
+
+
+def _span_text(start: date, end: date) -> str:
+    if start == end:
+        return f"{start.month}/{start.day}"
+    return f"{start.month}/{start.day} – {end.month}/{end.day}"
@@ -64,6 +64,7 @@ class DailyPanel(QWidget):
         super().__init__(parent)
         self._service = service
         self._input_visible = False
+        self._shown: list | None = None
         self._setup_ui()
 
     def _setup_ui(self) -> None:
@@ -140,10 +141,14 @@ class DailyPanel(QWidget):
     # -- data ---
 
     def refresh(self) -> None:
-        self._clear_list()
         if not self._service:
+            self._clear_list()
             return
         items = self._service.get_visible()
+        if items == self._shown:
+            return  # unchanged (typically a cache hit) — keep the widgets
+        self._clear_list()
+        self._shown = items
         if not items:
             hint = QLabel("暂无每日事项")
             hint.setObjectName("emptyHint")
@@ -158,6 +163,7 @@ class DailyPanel(QWidget):
 
     def set_items(self, items: list) -> None:
         self._clear_list()
+        self._shown = items
         if not items:
             hint = QLabel("暂无每日事项")
             hint.setObjectName("emptyHint")
@@ -18,6 +18,9 @@ from PySide6.QtWidgets import (
 )
 
 from daily_event.services.daily_event_service import RECURRENCE_RULE_OPTIONS
+from daily_event.services.recurrence import describe_rule
+
+_CUSTOM_RULE = "__custom__"
 
 if TYPE_CHECKING:
     from daily_event.services.daily_event_service import DailySetting
@@ -112,12 +115,12 @@ class DailySettingsPage(QDialog):
         combo.setCursor(Qt.CursorShape.PointingHandCursor)
         for value, label in RECURRENCE_RULE_OPTIONS:
             combo.addItem(label, userData=value)
-        idx = combo.findData(item.recurrence_rule)
-        combo.setCurrentIndex(0 if idx < 0 else idx)
+        if combo.findData(item.recurrence_rule) < 0:
+            combo.addItem(describe_rule(item.recurrence_rule), userData=item.recurrence_rule)
+        combo.addItem("自定义…", userData=_CUSTOM_RULE)
+        combo.setCurrentIndex(combo.findData(item.recurrence_rule))
         combo.currentIndexChanged.connect(
-            lambda _=0, eid=item.event_id, cb=combo: self.recurrence_changed.emit(
-                eid, str(cb.currentData())
-            )
+            lambda _=0, it=item, cb=combo: self._on_rule_selected(it, cb)
         )
         row.addWidget(combo)
 
@@ -136,6 +139,20 @@ class DailySettingsPage(QDialog):
         lo.addLayout(row)
         return card
 
+    def _on_rule_selected(self, item: DailySetting, combo: QComboBox) -> None:
+        rule = str(combo.currentData())
+        if rule == _CUSTOM_RULE:
+            from daily_event.ui.dialogs import RecurrenceDialog
+
+            dlg = RecurrenceDialog(item.recurrence_rule, item.created_at, self)
+            if dlg.exec() != QDialog.DialogCode.Accepted or not dlg.result:
+                combo.blockSignals(True)
+                combo.setCurrentIndex(combo.findData(item.recurrence_rule))
+                combo.blockSignals(False)
+                return
+            rule = dlg.result
+        self.recurrence_changed.emit(item.event_id, rule)
+
     def _confirm_delete(self, event_id: int, title: str) -> None:
         reply = QMessageBox.question(
             self,
@@ -0,0 +1,77 @@
+"""Single-shot timer that announces local day changes."""
+
+from __future__ import annotations
+
+import sys
+from datetime import date
+
+from PySide6.QtCore import QObject, Qt, QTimer, Signal
+from PySide6.QtWidgets import QApplication
+
+from daily_event.services.day_boundary import DayTracker, ms_until_next_midnight
+
+# Windows broadcast messages that invalidate an armed midnight timer.
+WM_TIMECHANGE = 0x001E
+WM_POWERBROADCAST = 0x0218
+PBT_APMRESUMEAUTOMATIC = 0x0012
+PBT_APMRESUMESUSPEND = 0x0007
+
+
+class DayBoundaryScheduler(QObject):
+    """Emits ``day_changed`` once per local date change, without polling.
+
+    One precise single-shot timer is armed for the next local midnight. QTimer
+    runs on a monotonic clock, so a wall-clock change or a suspend/resume can
+    leave it pointing at the wrong instant; ``recheck`` compares dates and
+    re-arms, and is called for clock-change/resume notifications (see
+    ``handle_native_message``) and whenever the application becomes active.
+    Those same events emit ``clock_changed`` so other timers can re-arm.
+    """
+
+    day_changed = Signal(object)  # date
+    clock_changed = Signal()
+
+    def __init__(self, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._tracker = DayTracker()
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.timeout.connect(self.recheck)
+        app = QApplication.instance()
+        if app is not None:
+            app.applicationStateChanged.connect(self._on_app_state_changed)
+        self._arm()
+
+    @property
+    def today(self) -> date:
+        return self._tracker.current
+
+    def recheck(self) -> None:
+        """Emit ``day_changed`` if the date moved on, then re-arm the timer."""
+        new_day = self._tracker.check()
+        self._arm()
+        if new_day is not None:
+            self.day_changed.emit(new_day)
+
+    def handle_native_message(self, event_type, message) -> None:
+        """Feed a top-level window's ``nativeEvent`` here (Windows only)."""
+        if sys.platform != "win32" or event_type != b"windows_generic_MSG":
+            return
+        import ctypes.wintypes
+
+        msg = ctypes.wintypes.MSG.from_address(int(message))
+        if msg.message == WM_TIMECHANGE or (
+            msg.message == WM_POWERBROADCAST
+            and msg.wParam in (PBT_APMRESUMEAUTOMATIC, PBT_APMRESUMESUSPEND)
+        ):
+            self.recheck()
+            self.clock_changed.emit()
+
+    def _arm(self) -> None:
+        self._timer.start(ms_until_next_midnight())
+
+    def _on_app_state_changed(self, state: Qt.ApplicationState) -> None:
+        if state == Qt.ApplicationState.ApplicationActive:
+            self.recheck()
+            self.clock_changed.emit()
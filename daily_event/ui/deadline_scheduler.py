@@ -0,0 +1,46 @@
+"""Single-shot timer that delivers Work Event deadline reminders."""
+
+from __future__ import annotations
+
+from PySide6.QtCore import QObject, Qt, QTimer
+
+from daily_event.services.deadline_reminders import DeadlineReminders
+
+# QTimer intervals are a signed 32-bit count of milliseconds.
+MAX_INTERVAL_MS = 2**31 - 1
+
+
+class DeadlineScheduler(QObject):
+    """Arms one precise timer for the next planned reminder.
+
+    Planning is ``DeadlineReminders.sync``: one indexed query, repeated only
+    when the date or the Work Event data version changes. Call ``sync`` after
+    Work Event writes and on ``DayBoundaryScheduler.day_changed``.
+    """
+
+    def __init__(self, reminders: DeadlineReminders, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        self._reminders = reminders
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setTimerType(Qt.TimerType.PreciseTimer)
+        self._timer.timeout.connect(self._on_timeout)
+
+    @property
+    def is_armed(self) -> bool:
+        return self._timer.isActive()
+
+    def sync(self, version: int) -> None:
+        if self._reminders.sync(version) or not self._timer.isActive():
+            self._arm()
+
+    def _arm(self) -> None:
+        ms = self._reminders.ms_until_next()
+        if ms is None:
+            self._timer.stop()
+        else:
+            self._timer.start(min(ms, MAX_INTERVAL_MS))
+
+    def _on_timeout(self) -> None:
+        self._reminders.fire_due()
+        self._arm()
@@ -1,12 +1,14 @@
-"""Shared dialogs — Work Event create / edit / detail."""
+"""Shared dialogs — Work Event create / edit / detail, recurrence editor."""
 
 from __future__ import annotations
 
 from datetime import date
-from typing import Any, Optional
+from typing import Any, Iterable, Optional
 
-from PySide6.QtCore import QDate, Qt
+from PySide6.QtCore import QDate, QEvent, Qt
 from PySide6.QtWidgets import (
+    QCheckBox,
+    QComboBox,
     QDateEdit,
     QDialog,
     QHBoxLayout,
@@ -14,25 +16,127 @@ from PySide6.QtWidgets import (
     QLineEdit,
     QMessageBox,
     QPushButton,
+    QSpinBox,
     QTextEdit,
     QVBoxLayout,
     QWidget,
 )
 
+from daily_event.services.daily_event_service import RECURRENCE_RULE_OPTIONS
+from daily_event.services.recurrence import (
+    WEEKDAY_NAMES,
+    RuleSpec,
+    compile_rule,
+    describe_rule,
+    format_rule,
+    parse_rule,
+)
+from daily_event.services.tag_index import parse_tags
+
+_RULE_KINDS: list[tuple[str, str]] = [
+    ("weekdays", "按星期"),
+    ("days", "每 N 天"),
+    ("weeks", "每 N 周"),
+    ("monthly_day", "每月某日"),
+    ("monthly_nth", "每月第 N 个星期几"),
+]
+
+_NO_REPEAT = ""
+_CUSTOM_RULE = "__custom__"
+
+
+class _SubtaskList(QWidget):
+    """Editable checklist: one row per subtask plus an entry line for new ones."""
+
+    def __init__(self, subtasks: Iterable[Any] = (), parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self._rows: list[tuple[QWidget, QCheckBox, QLineEdit]] = []
+        lo = QVBoxLayout(self)
+        lo.setContentsMargins(0, 0, 0, 0)
+        lo.setSpacing(4)
+        self._rows_layout = QVBoxLayout()
+        self._rows_layout.setSpacing(2)
+        lo.addLayout(self._rows_layout)
+        self._new_edit = QLineEdit()
+        self._new_edit.setPlaceholderText("添加子任务，回车确认")
+        self._new_edit.installEventFilter(self)
+        lo.addWidget(self._new_edit)
+        for task in subtasks:
+            self._add_row(task.title, task.is_done)
+
+    def items(self) -> list[tuple[str, bool]]:
+        rows = [(edit.text().strip(), cb.isChecked()) for _, cb, edit in self._rows]
+        pending = self._new_edit.text().strip()
+        if pending:
+            rows.append((pending, False))
+        return [row for row in rows if row[0]]
+
+    def eventFilter(self, obj, event) -> bool:  # noqa: N802
+        # Enter adds the subtask instead of reaching the dialog's default button.
+        if (
+            obj is self._new_edit
+            and event.type() == QEvent.Type.KeyPress
+            and event.key() in (Qt.Key.Key_Return, Qt.Key.Key_Enter)
+        ):
+            self._on_add()
+            return True
+        return super().eventFilter(obj, event)
+
+    def _on_add(self) -> None:
+        title = self._new_edit.text().strip()
+        if title:
+            self._add_row(title, False)
+            self._new_edit.clear()
+
+    def _add_row(self, title: str, done: bool) -> None:
+        row = QWidget()
+        hl = QHBoxLayout(row)
+        hl.setContentsMargins(0, 0, 0, 0)
+        hl.setSpacing(6)
+        cb = QCheckBox()
+        cb.setChecked(done)
+        hl.addWidget(cb)
+        edit = QLineEdit(title)
+        hl.addWidget(edit, stretch=1)
+        remove = QPushButton("\u2715")
+        remove.setFixedWidth(24)
+        remove.setToolTip("删除子任务")
+        remove.clicked.connect(lambda: self._remove_row(row))
+        hl.addWidget(remove)
+        self._rows.append((row, cb, edit))
+        self._rows_layout.addWidget(row)
+
+    def _remove_row(self, row: QWidget) -> None:
+        self._rows = [r for r in self._rows if r[0] is not row]
+        row.deleteLater()
+
 
 class WorkEventDialog(QDialog):
-    """Create or edit a Work Event. Set *event* to pre-fill for editing."""
+    """Create or edit a Work Event. Set *event* to pre-fill for editing.
+
+    In create mode the result dict carries ``recurrence_rule`` ("" for a
+    one-off event). Editing a series occurrence offers "DELETE_SERIES" in
+    addition to "DELETE", which only skips that occurrence. ``tags`` is in
+    the result for one-off events; series occurrences have none. The same
+    goes for ``subtasks`` (``(title, is_done)`` pairs): the caller loads the
+    checklist only when it opens the dialog and passes it in.
+    """
 
     def __init__(
         self,
         parent: QWidget | None = None,
         event: Any = None,
+        tags: list[str] | None = None,
+        known_tags: list[str] | None = None,
+        subtasks: Iterable[Any] = (),
     ) -> None:
         super().__init__(parent)
         self._event = event
         self._result: Optional[dict | str] = None
 
         editing = event is not None
+        in_series = getattr(event, "series_id", None) is not None
+        self._rule = _NO_REPEAT
         self.setWindowTitle("编辑工作事项" if editing else "创建工作事项")
         self.setMinimumWidth(380)
         self.setWindowFlags(self.windowFlags() & ~Qt.WindowType.WindowContextHelpButtonHint)
@@ -78,6 +182,32 @@ class WorkEventDialog(QDialog):
         dates.addLayout(end_box)
         lo.addLayout(dates)
 
+        if not editing:
+            lo.addWidget(QLabel("重复"))
+            self._repeat = QComboBox()
+            self._repeat.addItem("不重复", userData=_NO_REPEAT)
+            for value, label in RECURRENCE_RULE_OPTIONS:
+                self._repeat.addItem(label, userData=value)
+            self._repeat.addItem("自定义…", userData=_CUSTOM_RULE)
+            self._repeat.currentIndexChanged.connect(self._on_repeat_selected)
+            lo.addWidget(self._repeat)
+
+        lo.addWidget(QLabel("标签（可选）"))
+        self._tags_edit = QLineEdit(", ".join(tags or []))
+        self._tags_edit.setPlaceholderText("用逗号或空格分隔，如：客户A, 紧急")
+        if known_tags:
+            self._tags_edit.setToolTip("已有标签：" + "、".join(known_tags))
+        if in_series:
+            self._tags_edit.setEnabled(False)
+            self._tags_edit.setPlaceholderText("重复事项不支持标签")
+        lo.addWidget(self._tags_edit)
+
+        if not in_series:
+            lo.addWidget(QLabel("子任务"))
+        self._subtasks = _SubtaskList(subtasks)
+        self._subtasks.setVisible(not in_series)
+        lo.addWidget(self._subtasks)
+
         lo.addWidget(QLabel("备注（可选）"))
         self._note_edit = QTextEdit()
         self._note_edit.setMaximumHeight(80)
@@ -88,10 +218,15 @@ class WorkEventDialog(QDialog):
 
         btns = QHBoxLayout()
         if editing:
-            del_btn = QPushButton("删除")
+            del_btn = QPushButton("删除本次" if in_series else "删除")
             del_btn.setStyleSheet("color: #c42b1c;")
             del_btn.clicked.connect(self._on_delete)
             btns.addWidget(del_btn)
+        if in_series:
+            series_btn = QPushButton("删除系列")
+            series_btn.setStyleSheet("color: #c42b1c;")
+            series_btn.clicked.connect(self._on_delete_series)
+            btns.addWidget(series_btn)
         btns.addStretch()
         cancel_btn = QPushButton("取消")
         cancel_btn.clicked.connect(self.reject)
@@ -125,8 +260,32 @@ class WorkEventDialog(QDialog):
             "end_date": end,
             "note": self._note_edit.toPlainText().strip(),
         }
+        if self._tags_edit.isEnabled():
+            self._result["tags"] = parse_tags(self._tags_edit.text())
+            self._result["subtasks"] = self._subtasks.items()
+        if self._event is None:
+            self._result["recurrence_rule"] = self._rule
         self.accept()
 
+    def _on_repeat_selected(self) -> None:
+        rule = str(self._repeat.currentData())
+        if rule == _CUSTOM_RULE:
+            dlg = RecurrenceDialog(self._rule or "daily", self._start_edit.date().toPython(), self)
+            if dlg.exec() != QDialog.DialogCode.Accepted or not dlg.result:
+                self._repeat.blockSignals(True)
+                self._repeat.setCurrentIndex(max(0, self._repeat.findData(self._rule)))
+                self._repeat.blockSignals(False)
+                return
+            rule = dlg.result
+            if self._repeat.findData(rule) < 0:
+                self._repeat.blockSignals(True)
+                self._repeat.insertItem(self._repeat.count() - 1, describe_rule(rule), userData=rule)
+                self._repeat.setCurrentIndex(self._repeat.findData(rule))
+                self._repeat.blockSignals(False)
+        self._rule = rule
+        self._tags_edit.setEnabled(not rule)
+        self._subtasks.setEnabled(not rule)
+
     def _on_delete(self) -> None:
         reply = QMessageBox.question(
             self, "确认删除", "确定要删除这个事项吗？",
@@ -135,3 +294,171 @@ class WorkEventDialog(QDialog):
         if reply == QMessageBox.StandardButton.Yes:
             self._result = "DELETE"
             self.accept()
+
+    def _on_delete_series(self) -> None:
+        reply = QMessageBox.question(
+            self, "确认删除", "确定要删除整个重复系列吗？",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+        )
+        if reply == QMessageBox.StandardButton.Yes:
+            self._result = "DELETE_SERIES"
+            self.accept()
+
+
+class RecurrenceDialog(QDialog):
+    """Edit a custom recurrence rule; *anchor* is the event's creation date."""
+
+    def __init__(self, rule: str, anchor: date, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self._anchor = anchor
+        self._result: Optional[str] = None
+        try:
+            spec = parse_rule(rule)
+        except ValueError:
+            spec = parse_rule("daily")
+
+        self.setWindowTitle("自定义间隔")
+        self.setMinimumWidth(380)
+        self.setWindowFlags(self.windowFlags() & ~Qt.WindowType.WindowContextHelpButtonHint)
+
+        lo = QVBoxLayout(self)
+        lo.setSpacing(10)
+        lo.setContentsMargins(20, 16, 20, 16)
+
+        self._kind = QComboBox()
+        for value, label in _RULE_KINDS:
+            self._kind.addItem(label, userData=value)
+        self._kind.setCurrentIndex(max(0, self._kind.findData(spec.kind)))
+        lo.addWidget(self._kind)
+
+        self._interval_row = QWidget()
+        irl = QHBoxLayout(self._interval_row)
+        irl.setContentsMargins(0, 0, 0, 0)
+        irl.addWidget(QLabel("间隔"))
+        self._interval = QSpinBox()
+        self._interval.setRange(1, 365)
+        self._interval.setValue(spec.interval)
+        irl.addWidget(self._interval)
+        irl.addStretch()
+        lo.addWidget(self._interval_row)
+
+        self._weekday_row = QWidget()
+        wrl = QHBoxLayout(self._weekday_row)
+        wrl.setContentsMargins(0, 0, 0, 0)
+        self._weekday_boxes: list[QCheckBox] = []
+        for i, name in enumerate(WEEKDAY_NAMES):
+            cb = QCheckBox(name)
+            cb.setChecked(i in spec.weekdays)
+            wrl.addWidget(cb)
+            self._weekday_boxes.append(cb)
+        lo.addWidget(self._weekday_row)
+
+        self._month_row = QWidget()
+        mrl = QHBoxLayout(self._month_row)
+        mrl.setContentsMargins(0, 0, 0, 0)
+        self._nth = QComboBox()
+        for value, label in [(1, "第1个"), (2, "第2个"), (3, "第3个"), (4, "第4个"), (-1, "最后一个")]:
+            self._nth.addItem(label, userData=value)
+        self._nth.setCurrentIndex(max(0, self._nth.findData(spec.nth)))
+        mrl.addWidget(self._nth)
+        self._month_day = QSpinBox()
+        self._month_day.setRange(1, 31)
+        self._month_day.setValue(spec.month_day)
+        self._month_day.setSuffix(" 日")
+        mrl.addWidget(self._month_day)
+        mrl.addStretch()
+        lo.addWidget(self._month_row)
+
+        lo.addWidget(QLabel("排除日期（可选，逗号分隔 yyyy-mm-dd）"))
+        self._exclusions = QLineEdit(",".join(d.isoformat() for d in spec.exclusions))
+        lo.addWidget(self._exclusions)
+
+        self._preview = QLabel()
+        self._preview.setStyleSheet("font-size: 11px; color: #888;")
+        self._preview.setWordWrap(True)
+        lo.addWidget(self._preview)
+
+        btns = QHBoxLayout()
+        btns.addStretch()
+        cancel_btn = QPushButton("取消")
+        cancel_btn.clicked.connect(self.reject)
+        btns.addWidget(cancel_btn)
+        ok_btn = QPushButton("确定")
+        ok_btn.setStyleSheet(
+            "background: #0067c0; color: white; border: none;"
+            "border-radius: 4px; padding: 6px 20px;"
+        )
+        ok_btn.clicked.connect(self._on_ok)
+        btns.addWidget(ok_btn)
+        lo.addLayout(btns)
+
+        self._kind.currentIndexChanged.connect(self._update_fields)
+        self._interval.valueChanged.connect(self._update_preview)
+        self._nth.currentIndexChanged.connect(self._update_preview)
+        self._month_day.valueChanged.connect(self._update_preview)
+        self._exclusions.textChanged.connect(self._update_preview)
+        for cb in self._weekday_boxes:
+            cb.toggled.connect(self._update_preview)
+        self._update_fields()
+
+    @property
+    def result(self) -> Optional[str]:
+        return self._result
+
+    def _update_fields(self) -> None:
+        kind = self._kind.currentData()
+        self._interval_row.setVisible(kind in ("days", "weeks"))
+        self._weekday_row.setVisible(kind in ("weekdays", "weeks", "monthly_nth"))
+        self._month_row.setVisible(kind in ("monthly_day", "monthly_nth"))
+        self._nth.setVisible(kind == "monthly_nth")
+        self._month_day.setVisible(kind == "monthly_day")
+        self._update_preview()
+
+    def _build_rule(self) -> str:
+        kind = self._kind.currentData()
+        weekdays = tuple(i for i, cb in enumerate(self._weekday_boxes) if cb.isChecked())
+        if kind == "monthly_nth":
+            weekdays = weekdays[:1]
+            if not weekdays:
+                raise ValueError("请选择星期")
+        elif kind == "weekdays" and not weekdays:
+            raise ValueError("请至少选择一天")
+        try:
+            exclusions = tuple(sorted({
+                date.fromisoformat(x.strip())
+                for x in self._exclusions.text().split(",")
+                if x.strip()
+            }))
+        except ValueError:
+            raise ValueError("排除日期格式无效") from None
+        spec = RuleSpec(
+            kind=kind,
+            weekdays=weekdays if kind != "days" else (),
+            interval=self._interval.value(),
+            month_day=self._month_day.value(),
+            nth=self._nth.currentData(),
+            exclusions=exclusions,
+        )
+        return format_rule(spec)
+
+    def _update_preview(self) -> None:
+        try:
+            rule = self._build_rule()
+        except ValueError as exc:
+            self._preview.setText(str(exc))
+            return
+        compiled = compile_rule(rule, self._anchor)
+        upcoming: list[str] = []
+        d = compiled.next_due(date.today())
+        while d is not None and len(upcoming) < 5:
+            upcoming.append(f"{d.month}/{d.day}")
+            d = compiled.next_due(date.fromordinal(d.toordinal() + 1))
+        self._preview.setText("接下来：" + "、".join(upcoming) if upcoming else "该规则不会触发")
+
+    def _on_ok(self) -> None:
+        try:
+            self._result = self._build_rule()
+        except ValueError as exc:
+            QMessageBox.warning(self, "提示", str(exc))
+            return
+        self.accept()
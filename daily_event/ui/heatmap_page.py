@@ -0,0 +1,99 @@
+"""Year-long completion heatmaps for every Daily Event."""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING
+
+from PySide6.QtCore import Qt
+from PySide6.QtWidgets import (
+    QDialog,
+    QLabel,
+    QScrollArea,
+    QVBoxLayout,
+    QWidget,
+)
+
+from daily_event.ui.heatmap_widget import HeatmapWidget
+
+if TYPE_CHECKING:
+    from daily_event.services.daily_event_service import DailyHeatmap
+
+
+class HeatmapPage(QDialog):
+    def __init__(self, heatmaps: list[DailyHeatmap] | None = None, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self.setWindowTitle("打卡热力图")
+        self.setMinimumSize(660, 420)
+        self.setWindowFlags(
+            Qt.WindowType.Tool
+            | Qt.WindowType.WindowTitleHint
+            | Qt.WindowType.WindowCloseButtonHint
+        )
+
+        self.setStyleSheet("QLabel#heatmapTitle { font-size: 13px; font-weight: 600; color: #444; }")
+
+        root = QVBoxLayout(self)
+        root.setContentsMargins(16, 16, 16, 16)
+        root.setSpacing(8)
+
+        heading = QLabel("每日事项 · 近一年打卡")
+        heading.setStyleSheet("font-size: 16px; font-weight: 600; color: #1a1a1a;")
+        root.addWidget(heading)
+
+        self._scroll = QScrollArea()
+        self._scroll.setWidgetResizable(True)
+        self._inner = QWidget()
+        self._inner_lo = QVBoxLayout(self._inner)
+        self._inner_lo.setContentsMargins(0, 0, 0, 0)
+        self._inner_lo.setSpacing(10)
+        self._scroll.setWidget(self._inner)
+        root.addWidget(self._scroll, stretch=1)
+
+        self._widgets: dict[int, HeatmapWidget] = {}
+        self._total: HeatmapWidget | None = None
+        self.set_heatmaps(heatmaps or [])
+
+    def set_heatmaps(self, heatmaps: list[DailyHeatmap]) -> None:
+        """Update in place when the set of events is unchanged; rebuild otherwise."""
+        ids = [h.event_id for h in heatmaps]
+        if self._total is not None and ids == list(self._widgets):
+            for h in heatmaps:
+                self._widgets[h.event_id].set_data(h.start, h.counts)
+            self._set_total(heatmaps)
+            return
+
+        while self._inner_lo.count() > 0:
+            item = self._inner_lo.takeAt(0)
+            w = item.widget()
+            if w:
+                w.deleteLater()
+        self._widgets = {}
+        self._total = None
+
+        if not heatmaps:
+            hint = QLabel("暂无每日事项")
+            hint.setObjectName("emptyHint")
+            hint.setAlignment(Qt.AlignmentFlag.AlignCenter)
+            self._inner_lo.addWidget(hint)
+            self._inner_lo.addStretch()
+            return
+
+        self._total = self._add_row("全部")
+        self._set_total(heatmaps)
+        for h in heatmaps:
+            widget = self._add_row(h.title)
+            widget.set_data(h.start, h.counts)
+            self._widgets[h.event_id] = widget
+        self._inner_lo.addStretch()
+
+    def _set_total(self, heatmaps: list[DailyHeatmap]) -> None:
+        totals = [sum(day) for day in zip(*(h.counts for h in heatmaps))]
+        self._total.set_data(heatmaps[0].start, totals)
+
+    def _add_row(self, title: str) -> HeatmapWidget:
+        lbl = QLabel(title)
+        lbl.setObjectName("heatmapTitle")
+        self._inner_lo.addWidget(lbl)
+        widget = HeatmapWidget()
+        self._inner_lo.addWidget(widget)
+        return widget
@@ -0,0 +1,109 @@
+"""GitHub-style contribution heatmap, painted once into a cached pixmap."""
+
+from __future__ import annotations
+
+from datetime import date, timedelta
+
+from PySide6.QtCore import QRectF, QSize, Qt
+from PySide6.QtGui import QColor, QPainter, QPixmap
+from PySide6.QtWidgets import QToolTip, QWidget
+
+# Empty cell followed by four intensity steps of the accent blue.
+LEVEL_COLORS = ["#ebedf0", "#b3d4f0", "#6aaae0", "#2f80c8", "#0067c0"]
+
+
+class HeatmapWidget(QWidget):
+    """Week columns (Sunday on top), one square per day.
+
+    The grid is rendered into a pixmap keyed by devicePixelRatio and size, so
+    ordinary repaints (scrolling, overlapping windows) are a single blit and
+    the cells are only redrawn when ``set_data`` delivers new counts.
+    """
+
+    CELL = 9
+    GAP = 2
+
+    def __init__(self, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self._start: date = date.today()
+        self._counts: list[int] = []
+        self._max = 1
+        self._pixmap: QPixmap | None = None
+        self._pixmap_key: tuple[float, int, int] | None = None
+        self.setMouseTracking(True)
+
+    def set_data(self, start: date, counts: list[int]) -> None:
+        self._start = start
+        self._counts = counts
+        self._max = max(counts, default=0) or 1
+        self._pixmap = None
+        self.updateGeometry()
+        self.update()
+
+    # -- geometry --
+
+    def _lead(self) -> int:
+        """Blank cells before *start* so that column 0 begins on a Sunday."""
+        return (self._start.weekday() + 1) % 7
+
+    def _weeks(self) -> int:
+        return (self._lead() + len(self._counts) + 6) // 7
+
+    def sizeHint(self) -> QSize:  # noqa: N802
+        step = self.CELL + self.GAP
+        return QSize(max(1, self._weeks()) * step, 7 * step)
+
+    def minimumSizeHint(self) -> QSize:  # noqa: N802
+        return self.sizeHint()
+
+    def _level(self, count: int) -> int:
+        if count <= 0:
+            return 0
+        return min(4, 1 + (count * 4 - 1) // self._max)
+
+    # -- painting --
+
+    def _render(self, dpr: float) -> QPixmap:
+        size = self.size()
+        pm = QPixmap(int(size.width() * dpr), int(size.height() * dpr))
+        pm.setDevicePixelRatio(dpr)
+        pm.fill(Qt.GlobalColor.transparent)
+        p = QPainter(pm)
+        p.setRenderHint(QPainter.RenderHint.Antialiasing)
+        p.setPen(Qt.PenStyle.NoPen)
+        brushes = [QColor(c) for c in LEVEL_COLORS]
+        step = self.CELL + self.GAP
+        lead = self._lead()
+        for i, count in enumerate(self._counts):
+            cell = lead + i
+            p.setBrush(brushes[self._level(count)])
+            p.drawRoundedRect(
+                QRectF((cell // 7) * step, (cell % 7) * step, self.CELL, self.CELL), 2, 2
+            )
+        p.end()
+        return pm
+
+    def paintEvent(self, event) -> None:  # noqa: N802
+        dpr = self.devicePixelRatioF()
+        key = (dpr, self.width(), self.height())
+        if self._pixmap is None or self._pixmap_key != key:
+            self._pixmap = self._render(dpr)
+            self._pixmap_key = key
+        p = QPainter(self)
+        p.drawPixmap(0, 0, self._pixmap)
+        p.end()
+
+    # -- hover --
+
+    def mouseMoveEvent(self, event) -> None:  # noqa: N802
+        step = self.CELL + self.GAP
+        pos = event.position()
+        cell = int(pos.x()) // step * 7 + int(pos.y()) // step
+        i = cell - self._lead()
+        if 0 <= i < len(self._counts) and int(pos.y()) // step < 7:
+            d = self._start + timedelta(days=i)
+            QToolTip.showText(
+                event.globalPosition().toPoint(), f"{d}：{self._counts[i]} 次", self
+            )
+        else:
+            QToolTip.hideText()
@@ -1,14 +1,17 @@
-"""Work Event history page for completed items."""
+"""Work Event history page for completed items, loaded page by page on scroll."""
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from datetime import date, timedelta
+from typing import TYPE_CHECKING, Callable, Optional
 
-from PySide6.QtCore import Qt, Signal
+from PySide6.QtCore import Qt, QTimer, Signal
 from PySide6.QtWidgets import (
+    QComboBox,
     QDialog,
     QHBoxLayout,
     QLabel,
+    QLineEdit,
     QPushButton,
     QScrollArea,
     QVBoxLayout,
@@ -17,12 +20,33 @@ from PySide6.QtWidgets import (
 
 if TYPE_CHECKING:
     from daily_event.domain.models import WorkEvent
+    from daily_event.services.work_event_service import HistoryBatch, HistoryCursor
+
+    HistoryFetch = Callable[..., HistoryBatch]
+
+# Fetch the next page once the scroll position is this close to the bottom.
+LOAD_AHEAD_PX = 240
+SEARCH_DEBOUNCE_MS = 250
+
+_RANGES: list[tuple[str, Optional[int]]] = [
+    ("全部", None),
+    ("近 7 天", 7),
+    ("近 30 天", 30),
+    ("近一年", 365),
+]
 
 
 class HistoryPage(QDialog):
+    """Completed Work Events, newest first.
+
+    *fetch* is ``WorkEventService.get_history_page``; only the first page is
+    loaded when the dialog opens and further pages follow as the list is
+    scrolled, so opening time does not depend on the size of the history.
+    """
+
     delete_requested = Signal(int)
 
-    def __init__(self, events: list[WorkEvent] | None = None, parent: QWidget | None = None) -> None:
+    def __init__(self, fetch: HistoryFetch, parent: QWidget | None = None) -> None:
         super().__init__(parent)
         self.setWindowTitle("历史")
         self.setMinimumSize(480, 360)
@@ -31,7 +55,11 @@ class HistoryPage(QDialog):
             | Qt.WindowType.WindowTitleHint
             | Qt.WindowType.WindowCloseButtonHint
         )
-        self._events: list[WorkEvent] = events or []
+        self._fetch = fetch
+        self._cursor: Optional[HistoryCursor] = None
+        self._exhausted = True
+        self._loading = False
+        self._cards: dict[int, QWidget] = {}
 
         root = QVBoxLayout(self)
         root.setContentsMargins(16, 16, 16, 16)
@@ -41,6 +69,25 @@ class HistoryPage(QDialog):
         heading.setStyleSheet("font-size: 16px; font-weight: 600; color: #1a1a1a;")
         root.addWidget(heading)
 
+        filters = QHBoxLayout()
+        filters.setSpacing(8)
+        self._search = QLineEdit()
+        self._search.setPlaceholderText("搜索标题或备注...")
+        self._search.setClearButtonEnabled(True)
+        filters.addWidget(self._search, stretch=1)
+        self._range = QComboBox()
+        for label, days in _RANGES:
+            self._range.addItem(label, userData=days)
+        filters.addWidget(self._range)
+        root.addLayout(filters)
+
+        self._debounce = QTimer(self)
+        self._debounce.setSingleShot(True)
+        self._debounce.setInterval(SEARCH_DEBOUNCE_MS)
+        self._debounce.timeout.connect(self.reload)
+        self._search.textChanged.connect(self._debounce.start)
+        self._range.currentIndexChanged.connect(self.reload)
+
         self._scroll = QScrollArea()
         self._scroll.setWidgetResizable(True)
         self._scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
@@ -50,27 +97,75 @@ class HistoryPage(QDialog):
         self._inner_lo.setSpacing(8)
         self._scroll.setWidget(self._inner)
         root.addWidget(self._scroll, stretch=1)
-        self.set_events(self._events)
 
-    def set_events(self, events: list[WorkEvent]) -> None:
-        self._events = events
+        bar = self._scroll.verticalScrollBar()
+        bar.valueChanged.connect(self._maybe_load_more)
+        bar.rangeChanged.connect(self._maybe_load_more)
+        self.reload()
+
+    @property
+    def loaded_count(self) -> int:
+        return len(self._cards)
+
+    def reload(self) -> None:
+        """Drop the loaded cards and fetch the first page for the current filters."""
+        self._debounce.stop()
+        self._cards.clear()
         while self._inner_lo.count() > 0:
             item = self._inner_lo.takeAt(0)
             w = item.widget()
             if w:
                 w.deleteLater()
-
-        if not self._events:
-            hint = QLabel("暂无历史记录")
-            hint.setObjectName("emptyHint")
-            hint.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            self._inner_lo.addWidget(hint)
-            self._inner_lo.addStretch()
-            return
-
-        for ev in self._events:
-            self._inner_lo.addWidget(self._build_card(ev))
         self._inner_lo.addStretch()
+        self._cursor = None
+        self._exhausted = False
+        self._load_more()
+
+    def remove_event(self, event_id: int) -> None:
+        card = self._cards.pop(event_id, None)
+        if card is not None:
+            self._inner_lo.removeWidget(card)
+            card.deleteLater()
+        if not self._cards and self._exhausted:
+            self._show_empty_hint()
+
+    def _load_more(self) -> None:
+        if self._loading or self._exhausted:
+            return
+        self._loading = True
+        try:
+            days = self._range.currentData()
+            batch = self._fetch(
+                cursor=self._cursor,
+                since=date.today() - timedelta(days=days - 1) if days else None,
+                text=self._search.text(),
+            )
+            stretch = self._inner_lo.count() - 1
+            for ev in batch.events:
+                if ev.id in self._cards:
+                    continue
+                card = self._build_card(ev)
+                self._cards[ev.id] = card
+                self._inner_lo.insertWidget(stretch, card)
+                stretch += 1
+            self._cursor = batch.next_cursor
+            self._exhausted = batch.next_cursor is None
+            if not self._cards and self._exhausted:
+                self._show_empty_hint()
+        finally:
+            self._loading = False
+
+    def _maybe_load_more(self, *_args) -> None:
+        bar = self._scroll.verticalScrollBar()
+        if bar.value() >= bar.maximum() - LOAD_AHEAD_PX:
+            self._load_more()
+
+    def _show_empty_hint(self) -> None:
+        filtered = bool(self._search.text().strip()) or self._range.currentData() is not None
+        hint = QLabel("没有符合条件的记录" if filtered else "暂无历史记录")
+        hint.setObjectName("emptyHint")
+        hint.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self._inner_lo.insertWidget(0, hint)
 
     def _build_card(self, ev: WorkEvent) -> QWidget:
         card = QWidget()
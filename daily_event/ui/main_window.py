@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from datetime import date
+from datetime import date, timedelta
 from typing import TYPE_CHECKING
 
 from PySide6.QtCore import QPoint, Qt, QTimer
@@ -20,18 +20,27 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
-from daily_event.services.calendar_service import CalendarService
+from daily_event.services.calendar_service import CalendarService, EventSegment
 from daily_event.services.config_service import ConfigService
+from daily_event.services.tag_index import TagIndex
+from daily_event.services.work_event_service import SubtaskProgress
 from daily_event.infra.color_allocator import ColorAllocator
 from daily_event.ui.alarm_page import AlarmPage
+from daily_event.ui.alarm_scheduler import AlarmScheduler
+from daily_event.ui.archive_scheduler import ArchiveScheduler
 from daily_event.ui.calendar_widget import CalendarWidget
+from daily_event.ui.conflict_page import ConflictPage
 from daily_event.ui.daily_panel import DailyPanel
 from daily_event.ui.daily_settings_page import DailySettingsPage
+from daily_event.ui.day_scheduler import DayBoundaryScheduler
+from daily_event.ui.deadline_scheduler import DeadlineScheduler
+from daily_event.ui.heatmap_page import HeatmapPage
 from daily_event.ui.history_page import HistoryPage
 from daily_event.ui.menu_panel import MenuPanel
 from daily_event.ui.stats_page import StatsPage
 from daily_event.ui.styles import get_stylesheet
 from daily_event.ui.work_panel import WorkPanel
+from daily_event.ui.year_page import YearPage
 
 if TYPE_CHECKING:
     from daily_event.app.container import Container
@@ -47,17 +56,33 @@ class MainWindow(QWidget):
         self._daily_service = container.get("daily_service")
         self._work_service = container.get("work_service")
         self._alarm_service = container.get("alarm_service")
+        self._notifier = container.get("notifier")
         self._calendar_service: CalendarService = container.get("calendar_service")
         self._color_allocator: ColorAllocator = container.get("color_allocator")
 
         self._drag_pos: QPoint | None = None
         self._is_snapping = False
         self._snap_threshold: int = self._config.get("snap_threshold", 20)
+        self._workload_threshold: int = self._config.get("workload_threshold", 3)
         self._quit_requested = False
         self._stats_dialog: StatsPage | None = None
+        self._heatmap_dialog: HeatmapPage | None = None
+        self._year_dialog: YearPage | None = None
         self._alarm_dialog: AlarmPage | None = None
         self._history_dialog: HistoryPage | None = None
         self._daily_settings_dialog: DailySettingsPage | None = None
+        self._conflict_dialog: ConflictPage | None = None
+        self._month_titles: dict[int, str] = {}
+        self._month_segments: list[EventSegment] = []
+        self._tag_index: TagIndex | None = None
+        self._month_progress: dict[int, SubtaskProgress] = {}
+        self._visible_work: set[int] | None = None  # None = no tag filter
+        self._selected_work: set[int] = set()
+        self._refresh_pending = False
+        self._day_scheduler = DayBoundaryScheduler(self)
+        self._day_scheduler.day_changed.connect(self._on_day_changed)
+        self._deadline_scheduler = DeadlineScheduler(container.get("deadline_reminders"), self)
+        self._archive_scheduler = ArchiveScheduler(container.get("work_archiver"), self)
 
         self._setup_window()
         self._setup_ui()
@@ -65,6 +90,7 @@ class MainWindow(QWidget):
         self._restore_geometry()
         self._setup_timer()
         self._refresh_all()
+        self._archive_scheduler.start()
 
     # -- window setup -------------------------------------------------------
 
@@ -112,6 +138,8 @@ class MainWindow(QWidget):
 
     def _quit_app(self) -> None:
         self._quit_requested = True
+        self._work_service.shutdown()
+        self._notifier.shutdown()
         QApplication.instance().quit()
 
     # -- UI construction ----------------------------------------------------
@@ -135,9 +163,11 @@ class MainWindow(QWidget):
         cl.setSpacing(0)
 
         self._calendar = CalendarWidget()
+        self._calendar.set_max_slots(self._config.get("calendar_max_slots", 3))
         self._calendar.month_changed.connect(self._on_month_changed)
         self._calendar.date_clicked.connect(self._on_date_clicked)
         self._calendar.event_clicked.connect(self._on_calendar_event_clicked)
+        self._calendar.event_toggled.connect(self._toggle_work_selection)
 
         cl.addWidget(self._create_top_bar())
 
@@ -154,12 +184,17 @@ class MainWindow(QWidget):
         rl.setSpacing(10)
 
         self._daily_panel = DailyPanel(self._daily_service)
-        self._daily_panel.data_changed.connect(self._refresh_all)
+        self._daily_panel.data_changed.connect(self._schedule_refresh)
         rl.addWidget(self._daily_panel, stretch=1)
 
         self._work_panel = WorkPanel(self._work_service, self._color_allocator)
-        self._work_panel.data_changed.connect(self._refresh_all)
+        self._work_panel.data_changed.connect(self._schedule_refresh)
         self._work_panel.event_clicked.connect(self._on_calendar_event_clicked)
+        self._work_panel.selection_toggled.connect(self._toggle_work_selection)
+        self._work_panel.selection_cleared.connect(self._clear_work_selection)
+        self._work_panel.bulk_requested.connect(self._on_bulk_requested)
+        self._work_panel.conflicts_requested.connect(self._show_conflicts)
+        self._work_panel.tag_filter_changed.connect(lambda *_: self._apply_tag_filter())
         rl.addWidget(self._work_panel, stretch=1)
 
         bl.addWidget(right, stretch=1)
@@ -167,6 +202,7 @@ class MainWindow(QWidget):
 
         self._menu_panel = MenuPanel(self)
         self._menu_panel.stats_requested.connect(self._show_stats)
+        self._menu_panel.year_requested.connect(self._show_year)
         self._menu_panel.daily_settings_requested.connect(self._show_daily_settings)
         self._menu_panel.alarm_requested.connect(self._show_alarm)
         self._menu_panel.history_requested.connect(self._show_history)
@@ -221,40 +257,109 @@ class MainWindow(QWidget):
     def _update_month_label(self) -> None:
         self._month_label.setText(f"{self._calendar.month}月 {self._calendar.year}")
 
+    def _schedule_refresh(self) -> None:
+        """Coalesce refresh requests into one ``_refresh_all`` on the next event-loop turn."""
+        if not self._refresh_pending:
+            self._refresh_pending = True
+            QTimer.singleShot(0, self._run_scheduled_refresh)
+
+    def _run_scheduled_refresh(self) -> None:
+        if self._refresh_pending:
+            self._refresh_all()
+
     def _refresh_all(self) -> None:
+        self._refresh_pending = False
         self._daily_panel.refresh()
+        self._refresh_daily_markers()
         self._refresh_work_data()
+        if self._heatmap_dialog and self._heatmap_dialog.isVisible():
+            self._heatmap_dialog.set_heatmaps(self._daily_service.get_heatmaps())
+        if self._year_dialog and self._year_dialog.isVisible():
+            self._load_year(self._year_dialog.year)
+
+    def _refresh_daily_markers(self) -> None:
+        grid_start = self._calendar.grid_start
+        self._calendar.set_daily_due_counts(
+            self._daily_service.get_due_counts(grid_start, grid_start + timedelta(days=41))
+        )
 
     def _refresh_work_data(self) -> None:
-        events = self._work_service.get_for_month(
-            self._calendar.year, self._calendar.month
+        year, month = self._calendar.year, self._calendar.month
+        events = self._work_service.get_for_month(year, month)
+        self._work_service.prefetch_adjacent(year, month)
+
+        self._month_segments = self._calendar_service.layout(
+            self._calendar.grid_start,
+            events,
+            self._work_service.data_version,
+            self._color_allocator.get_color,
         )
-        self._work_panel.set_events(events)
-
-        segments: list = []
-        for ev in events:
-            color = self._color_allocator.get_color(ev.color_index)
-            segs = self._calendar_service.split_range_to_segments(
-                ev.start_date,
-                ev.end_date,
-                self._calendar.grid_start,
-                color,
-                ev.id,
-                ev.title,
+        self._tag_index = self._work_service.get_tag_index(year, month)
+        self._month_progress = self._work_service.get_month_progress(year, month)
+        self._calendar.set_work_progress(
+            {eid: progress.fraction for eid, progress in self._month_progress.items()}
+        )
+        self._work_panel.set_tags({t: self._tag_index.count(t) for t in self._tag_index.tags})
+        self._apply_tag_filter()
+        self._deadline_scheduler.sync(self._work_service.data_version)
+
+        workload = self._calendar_service.cached_workload(
+            self._calendar.grid_start, self._workload_threshold
+        )
+        self._month_titles = {ev.id: ev.title for ev in events}
+        self._calendar.set_workload(workload.counts, self._workload_threshold)
+        self._work_panel.set_conflict_count(len(workload.conflicts))
+        if self._conflict_dialog and self._conflict_dialog.isVisible():
+            self._conflict_dialog.set_conflicts(
+                workload.conflicts, self._month_titles, self._workload_threshold
             )
-            segments.extend(segs)
-        self._calendar_service.assign_slots(segments)
-        self._calendar.set_work_segments(segments)
+
+    def _apply_tag_filter(self) -> None:
+        """Show the month's events matching the panel's tag chips (in memory, no query)."""
+        index = self._tag_index
+        if index is None:
+            return
+        tags = self._work_panel.active_tags
+        events = index.filter(tags, self._work_panel.match_all)
+        self._work_panel.set_events(events, index.tags_of, self._month_progress)
+        if tags:
+            self._visible_work = {ev.id for ev in events}
+            self._calendar.set_work_segments(
+                CalendarService.filter_segments(self._month_segments, self._visible_work)
+            )
+        else:
+            self._visible_work = None
+            self._calendar.set_work_segments(self._month_segments)
 
     # -- event handlers -----------------------------------------------------
 
+    def _on_day_changed(self, today: date) -> None:
+        """Midnight rollover: recompute only what depends on today's date."""
+        self._calendar.set_today(today)
+        self._daily_panel.refresh()
+        self._deadline_scheduler.sync(self._work_service.data_version)
+        self._alarm_scheduler.reschedule()
+        if self._stats_dialog and self._stats_dialog.isVisible():
+            self._stats_dialog.set_stats(
+                self._daily_service.get_all_stats(), self._daily_service.get_trends()
+            )
+        if self._heatmap_dialog and self._heatmap_dialog.isVisible():
+            self._heatmap_dialog.set_heatmaps(self._daily_service.get_heatmaps())
+
     def _on_month_changed(self, year: int, month: int) -> None:
         self._update_month_label()
+        self._refresh_daily_markers()
         self._refresh_work_data()
 
     def _on_date_clicked(self, d: date) -> None:
         events = self._work_service.get_for_date(d)
-        self._work_panel.set_events(events)
+        if self._visible_work is not None:
+            events = [ev for ev in events if ev.id in self._visible_work]
+        self._work_panel.set_events(
+            events,
+            self._tag_index.tags_of if self._tag_index else None,
+            self._work_service.get_progress(ev.id for ev in events),
+        )
 
     def _on_calendar_event_clicked(self, event_id: int) -> None:
         ev = self._work_service.get_by_id(event_id)
@@ -262,28 +367,88 @@ class MainWindow(QWidget):
             return
         from daily_event.ui.dialogs import WorkEventDialog
 
-        dlg = WorkEventDialog(self, ev)
+        dlg = WorkEventDialog(
+            self,
+            ev,
+            tags=self._work_service.get_tags(event_id),
+            known_tags=self._work_service.get_all_tags(),
+            subtasks=self._work_service.get_subtasks(event_id),
+        )
         if dlg.exec() == WorkEventDialog.DialogCode.Accepted:
             r = dlg.result
             if r == "DELETE":
                 self._work_service.delete(event_id)
+                self._selected_work.discard(event_id)
+            elif r == "DELETE_SERIES":
+                self._work_service.delete_series(ev.series_id)
             elif isinstance(r, dict):
                 self._work_service.update(event_id, **r)
             self._refresh_all()
 
+    def _toggle_work_selection(self, event_id: int) -> None:
+        self._selected_work ^= {event_id}
+        self._apply_work_selection()
+
+    def _clear_work_selection(self) -> None:
+        self._selected_work.clear()
+        self._apply_work_selection()
+
+    def _apply_work_selection(self) -> None:
+        self._work_panel.set_selection(self._selected_work)
+        self._calendar.set_selected_events(self._selected_work)
+
+    def _on_bulk_requested(self, action: str, days: int) -> None:
+        ids = list(self._selected_work)
+        if action == "complete":
+            self._work_service.bulk_set_completed(ids, True)
+        elif action == "delete":
+            self._work_service.bulk_delete(ids)
+        elif action == "shift":
+            self._work_service.bulk_shift(ids, days)
+        else:
+            return
+        self._clear_work_selection()
+        self._schedule_refresh()
+
+    def _show_conflicts(self) -> None:
+        workload = self._calendar_service.cached_workload(
+            self._calendar.grid_start, self._workload_threshold
+        )
+        conflicts = workload.conflicts if workload else []
+        if self._conflict_dialog and self._conflict_dialog.isVisible():
+            self._conflict_dialog.set_conflicts(conflicts, self._month_titles, self._workload_threshold)
+            self._conflict_dialog.raise_()
+            self._conflict_dialog.activateWindow()
+            return
+        self._conflict_dialog = ConflictPage(self)
+        self._conflict_dialog.set_conflicts(conflicts, self._month_titles, self._workload_threshold)
+        self._conflict_dialog.date_selected.connect(self._on_conflict_date_selected)
+        self._conflict_dialog.setModal(False)
+        self._conflict_dialog.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose, True)
+        self._conflict_dialog.destroyed.connect(lambda: setattr(self, "_conflict_dialog", None))
+        self._conflict_dialog.show()
+        self._conflict_dialog.raise_()
+        self._conflict_dialog.activateWindow()
+
+    def _on_conflict_date_selected(self, d: date) -> None:
+        self._calendar.select_date(d)
+        self._on_date_clicked(d)
+
     def _on_menu_clicked(self) -> None:
         pos = self._menu_btn.mapToGlobal(QPoint(0, self._menu_btn.height()))
         self._menu_panel.show_at(pos)
 
     def _show_stats(self) -> None:
         stats = self._daily_service.get_all_stats()
+        trends = self._daily_service.get_trends()
         if self._stats_dialog and self._stats_dialog.isVisible():
-            self._stats_dialog.set_stats(stats)
+            self._stats_dialog.set_stats(stats, trends)
             self._stats_dialog.raise_()
             self._stats_dialog.activateWindow()
             return
-        self._stats_dialog = StatsPage(stats, self)
+        self._stats_dialog = StatsPage(stats, trends, self)
         self._stats_dialog.delete_requested.connect(self._on_stats_delete_requested)
+        self._stats_dialog.heatmap_requested.connect(self._show_heatmap)
         self._stats_dialog.setModal(False)
         self._stats_dialog.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose, True)
         self._stats_dialog.destroyed.connect(lambda: setattr(self, "_stats_dialog", None))
@@ -291,12 +456,59 @@ class MainWindow(QWidget):
         self._stats_dialog.raise_()
         self._stats_dialog.activateWindow()
 
+    def _show_heatmap(self) -> None:
+        heatmaps = self._daily_service.get_heatmaps()
+        if self._heatmap_dialog and self._heatmap_dialog.isVisible():
+            self._heatmap_dialog.set_heatmaps(heatmaps)
+            self._heatmap_dialog.raise_()
+            self._heatmap_dialog.activateWindow()
+            return
+        self._heatmap_dialog = HeatmapPage(heatmaps, self)
+        self._heatmap_dialog.setModal(False)
+        self._heatmap_dialog.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose, True)
+        self._heatmap_dialog.destroyed.connect(lambda: setattr(self, "_heatmap_dialog", None))
+        self._heatmap_dialog.show()
+        self._heatmap_dialog.raise_()
+        self._heatmap_dialog.activateWindow()
+
+    def _show_year(self) -> None:
+        if self._year_dialog and self._year_dialog.isVisible():
+            self._load_year(self._calendar.year)
+            self._year_dialog.raise_()
+            self._year_dialog.activateWindow()
+            return
+        self._year_dialog = YearPage(self)
+        self._year_dialog.year_changed.connect(self._load_year)
+        self._year_dialog.month_selected.connect(self._calendar.show_month)
+        self._load_year(self._calendar.year)
+        self._year_dialog.setModal(False)
+        self._year_dialog.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose, True)
+        self._year_dialog.destroyed.connect(lambda: setattr(self, "_year_dialog", None))
+        self._year_dialog.show()
+        self._year_dialog.raise_()
+        self._year_dialog.activateWindow()
+
+    def _load_year(self, year: int) -> None:
+        """One range read (events plus series occurrences), one for completions, then density."""
+        first, last = date(year, 1, 1), date(year, 12, 31)
+        days = (last - first).days + 1
+        events = self._work_service.get_for_range(first, last)
+        density = self._calendar_service.day_density(
+            [ev.start_date.toordinal() for ev in events],
+            [ev.end_date.toordinal() for ev in events],
+            first,
+            days,
+        )
+        done = self._daily_service.get_completion_totals(first, last)
+        self._year_dialog.set_year_data(year, density, done, self._day_scheduler.today)
+
     def _show_alarm(self) -> None:
         if self._alarm_dialog and self._alarm_dialog.isVisible():
             self._alarm_dialog.raise_()
             self._alarm_dialog.activateWindow()
             return
         self._alarm_dialog = AlarmPage(self._alarm_service, self)
+        self._alarm_dialog.alarms_changed.connect(self._alarm_scheduler.reschedule)
         self._alarm_dialog.setModal(False)
         self._alarm_dialog.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose, True)
         self._alarm_dialog.destroyed.connect(lambda: setattr(self, "_alarm_dialog", None))
@@ -326,13 +538,12 @@ class MainWindow(QWidget):
         self._daily_settings_dialog.activateWindow()
 
     def _show_history(self) -> None:
-        events = self._work_service.get_history()
         if self._history_dialog and self._history_dialog.isVisible():
-            self._history_dialog.set_events(events)
+            self._history_dialog.reload()
             self._history_dialog.raise_()
             self._history_dialog.activateWindow()
             return
-        self._history_dialog = HistoryPage(events, self)
+        self._history_dialog = HistoryPage(self._work_service.get_history_page, self)
         self._history_dialog.delete_requested.connect(self._on_history_delete_requested)
         self._history_dialog.setModal(False)
         self._history_dialog.setAttribute(Qt.WidgetAttribute.WA_DeleteOnClose, True)
@@ -345,13 +556,15 @@ class MainWindow(QWidget):
         self._daily_service.delete(event_id)
         self._refresh_all()
         if self._stats_dialog and self._stats_dialog.isVisible():
-            self._stats_dialog.set_stats(self._daily_service.get_all_stats())
+            self._stats_dialog.set_stats(
+                self._daily_service.get_all_stats(), self._daily_service.get_trends()
+            )
 
     def _on_history_delete_requested(self, event_id: int) -> None:
         self._work_service.delete(event_id)
         self._refresh_all()
         if self._history_dialog and self._history_dialog.isVisible():
-            self._history_dialog.set_events(self._work_service.get_history())
+            self._history_dialog.remove_event(event_id)
 
     def _on_daily_settings_delete_requested(self, event_id: int) -> None:
         self._daily_service.delete(event_id)
@@ -368,12 +581,18 @@ class MainWindow(QWidget):
     # -- alarm timer --------------------------------------------------------
 
     def _setup_timer(self) -> None:
-        self._alarm_timer = QTimer(self)
-        self._alarm_timer.timeout.connect(self._check_alarms)
-        self._alarm_timer.start(1000)
+        self._alarm_scheduler = AlarmScheduler(self._alarm_service, self)
+        self._alarm_scheduler.fired.connect(self._on_alarms_fired)
+        self._day_scheduler.clock_changed.connect(self._alarm_scheduler.reschedule)
+        self._alarm_scheduler.reschedule()
+
+    def _on_alarms_fired(self) -> None:
+        if self._alarm_dialog and self._alarm_dialog.isVisible():
+            self._alarm_dialog.reload()
 
-    def _check_alarms(self) -> None:
-        self._alarm_service.check_and_fire()
+    def nativeEvent(self, event_type, message):  # noqa: N802
+        self._day_scheduler.handle_native_message(event_type, message)
+        return super().nativeEvent(event_type, message)
 
     # -- drag handling ------------------------------------------------------
 
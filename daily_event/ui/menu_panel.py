@@ -8,6 +8,7 @@ from PySide6.QtWidgets import QMenu, QWidget
 
 class MenuPanel(QWidget):
     stats_requested = Signal()
+    year_requested = Signal()
     alarm_requested = Signal()
     history_requested = Signal()
     daily_settings_requested = Signal()
@@ -19,12 +20,15 @@ class MenuPanel(QWidget):
         menu = QMenu(self)
         menu.setObjectName("hamburgerMenu")
         stats_action = menu.addAction("累计")
+        year_action = menu.addAction("年视图")
         daily_settings_action = menu.addAction("每日事项设置")
         alarm_action = menu.addAction("闹钟")
         history_action = menu.addAction("历史")
         action = menu.exec(global_pos)
         if action == stats_action:
             self.stats_requested.emit()
+        elif action == year_action:
+            self.year_requested.emit()
         elif action == daily_settings_action:
             self.daily_settings_requested.emit()
         elif action == alarm_action:
@@ -0,0 +1,53 @@
+"""Tiny line chart for a rolling completion rate."""
+
+from __future__ import annotations
+
+from typing import Optional
+
+from PySide6.QtCore import QPointF, QSize, Qt
+from PySide6.QtGui import QColor, QPainter, QPainterPath, QPen
+from PySide6.QtWidgets import QWidget
+
+
+class SparklineWidget(QWidget):
+    """Plots values in ``[0, 1]``; ``None`` entries (nothing due) break the line."""
+
+    def __init__(self, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self._values: list[Optional[float]] = []
+        self.setFixedSize(self.sizeHint())
+
+    def set_values(self, values: list[Optional[float]]) -> None:
+        self._values = values
+        self.update()
+
+    def sizeHint(self) -> QSize:  # noqa: N802
+        return QSize(120, 28)
+
+    def paintEvent(self, event) -> None:  # noqa: N802
+        n = len(self._values)
+        if n < 2:
+            return
+        w, h = self.width() - 2, self.height() - 2
+        step = w / (n - 1)
+        path = QPainterPath()
+        pen_down = False
+        for i, v in enumerate(self._values):
+            if v is None:
+                pen_down = False
+                continue
+            pt = QPointF(1 + i * step, 1 + (1.0 - v) * h)
+            if pen_down:
+                path.lineTo(pt)
+            else:
+                path.moveTo(pt)
+                pen_down = True
+
+        p = QPainter(self)
+        p.setRenderHint(QPainter.RenderHint.Antialiasing)
+        p.setPen(QPen(QColor("#e0e0e0"), 1))
+        p.drawLine(QPointF(1, 1 + h), QPointF(1 + w, 1 + h))
+        p.setPen(QPen(QColor("#0067c0"), 1.5))
+        p.setBrush(Qt.BrushStyle.NoBrush)
+        p.drawPath(path)
+        p.end()
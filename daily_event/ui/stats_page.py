@@ -16,14 +16,22 @@ from PySide6.QtWidgets import (
     QWidget,
 )
 
+from daily_event.ui.sparkline_widget import SparklineWidget
+
 if TYPE_CHECKING:
-    from daily_event.services.daily_event_service import DailyStats
+    from daily_event.services.daily_event_service import DailyStats, DailyTrend
 
 
 class StatsPage(QDialog):
     delete_requested = Signal(int)
-
-    def __init__(self, stats: list[DailyStats] | None = None, parent: QWidget | None = None) -> None:
+    heatmap_requested = Signal()
+
+    def __init__(
+        self,
+        stats: list[DailyStats] | None = None,
+        trends: dict[int, DailyTrend] | None = None,
+        parent: QWidget | None = None,
+    ) -> None:
         super().__init__(parent)
         self.setWindowTitle("累计统计")
         self.setMinimumSize(480, 360)
@@ -33,13 +41,25 @@ class StatsPage(QDialog):
             | Qt.WindowType.WindowCloseButtonHint
         )
         self._stats: list[DailyStats] = stats or []
+        self._trends: dict[int, DailyTrend] = trends or {}
 
         root = QVBoxLayout(self)
         root.setContentsMargins(16, 16, 16, 16)
 
+        header = QHBoxLayout()
         heading = QLabel("每日事项 · 累计统计")
         heading.setStyleSheet("font-size: 16px; font-weight: 600; color: #1a1a1a; margin-bottom: 8px;")
-        root.addWidget(heading)
+        header.addWidget(heading)
+        header.addStretch()
+        heatmap_btn = QPushButton("热力图")
+        heatmap_btn.setFixedHeight(26)
+        heatmap_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        heatmap_btn.setStyleSheet(
+            "font-size:11px; color:#0067c0; border:1px solid #b3d4f0; border-radius:4px; padding:2px 10px;"
+        )
+        heatmap_btn.clicked.connect(self.heatmap_requested.emit)
+        header.addWidget(heatmap_btn)
+        root.addLayout(header)
 
         self._scroll = QScrollArea()
         self._scroll.setWidgetResizable(True)
@@ -50,10 +70,11 @@ class StatsPage(QDialog):
         self._inner_lo.setSpacing(8)
         self._scroll.setWidget(self._inner)
         root.addWidget(self._scroll)
-        self.set_stats(self._stats)
+        self.set_stats(self._stats, self._trends)
 
-    def set_stats(self, stats: list[DailyStats]) -> None:
+    def set_stats(self, stats: list[DailyStats], trends: dict[int, DailyTrend] | None = None) -> None:
         self._stats = stats
+        self._trends = trends or {}
         while self._inner_lo.count() > 0:
             item = self._inner_lo.takeAt(0)
             w = item.widget()
@@ -100,6 +121,21 @@ class StatsPage(QDialog):
         del_btn.clicked.connect(lambda checked=False, eid=s.event_id: self._confirm_delete(eid))
         row.addWidget(del_btn)
         lo.addLayout(row)
+
+        trend = self._trends.get(s.event_id)
+        if trend is not None:
+            trend_row = QHBoxLayout()
+            trend_row.setSpacing(16)
+            trend_row.addWidget(_metric("近7天", _pct(trend.rate_7)))
+            trend_row.addWidget(_metric("近30天", _pct(trend.rate_30)))
+            trend_row.addWidget(_metric("近90天", _pct(trend.rate_90)))
+            trend_row.addWidget(_metric("周环比", _delta(trend.week_over_week)))
+            trend_row.addStretch()
+            spark = SparklineWidget()
+            spark.set_values(trend.sparkline)
+            spark.setToolTip("近90天 · 7日滚动完成率")
+            trend_row.addWidget(spark)
+            lo.addLayout(trend_row)
         return card
 
     def _confirm_delete(self, event_id: int) -> None:
@@ -113,6 +149,16 @@ class StatsPage(QDialog):
             self.delete_requested.emit(event_id)
 
 
+def _pct(rate: float | None) -> str:
+    return "—" if rate is None else f"{rate:.0%}"
+
+
+def _delta(delta: float | None) -> str:
+    if delta is None:
+        return "—"
+    return f"{delta * 100:+.0f}%"
+
+
 def _metric(label: str, value: str) -> QWidget:
     w = QWidget()
     lo = QVBoxLayout(w)
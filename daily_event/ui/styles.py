@@ -101,6 +101,44 @@ def get_stylesheet() -> str:
         border: 1px solid rgba(0, 0, 0, 0.12);
         box-shadow: 0 2px 4px rgba(0,0,0,0.02);
     }
+    QWidget#itemCard[selected="true"] {
+        background-color: #eaf3fc;
+        border: 1px solid #0067c0;
+    }
+
+    QPushButton#conflictButton {
+        color: #c42b1c;
+        background: transparent;
+        border: 1px solid #e0b4b0;
+        border-radius: 10px;
+        padding: 1px 8px;
+        font-size: 11px;
+    }
+
+    QWidget#bulkBar {
+        background-color: #eaf3fc;
+        border-radius: 6px;
+    }
+
+    QPushButton#tagChip, QPushButton#tagModeButton {
+        color: #555555;
+        background: #f3f3f3;
+        border: 1px solid #e0e0e0;
+        border-radius: 10px;
+        padding: 1px 8px;
+        font-size: 11px;
+    }
+
+    QPushButton#tagChip:checked {
+        color: #ffffff;
+        background: #0067c0;
+        border: 1px solid #0067c0;
+    }
+
+    QPushButton#tagModeButton {
+        background: transparent;
+        border: 1px dashed #c8c8c8;
+    }
 
     QLabel#emptyHint {
         color: #aaaaaa;
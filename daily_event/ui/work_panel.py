@@ -2,7 +2,7 @@
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+from typing import TYPE_CHECKING, Callable, Iterable, Mapping
 
 from PySide6.QtCore import Qt, Signal
 from PySide6.QtWidgets import (
@@ -10,8 +10,10 @@ from PySide6.QtWidgets import (
     QDialog,
     QHBoxLayout,
     QLabel,
+    QMessageBox,
     QPushButton,
     QScrollArea,
+    QSpinBox,
     QVBoxLayout,
     QWidget,
 )
@@ -19,14 +21,15 @@ from PySide6.QtWidgets import (
 if TYPE_CHECKING:
     from daily_event.domain.models import WorkEvent
     from daily_event.infra.color_allocator import ColorAllocator
-    from daily_event.services.work_event_service import WorkEventService
+    from daily_event.services.work_event_service import SubtaskProgress, WorkEventService
 
 
 class _WorkItemWidget(QWidget):
-    """Single row: coloured dot + title + date range."""
+    """Single row: coloured dot + title + date range. Ctrl+click toggles selection."""
 
     clicked = Signal(int)
     completed_toggled = Signal(int, bool)
+    selection_toggled = Signal(int)
 
     def __init__(
         self,
@@ -36,6 +39,8 @@ class _WorkItemWidget(QWidget):
         end_date,
         color_hex: str,
         is_completed: bool,
+        tags: Iterable[str] = (),
+        progress: SubtaskProgress | None = None,
         parent: QWidget | None = None,
     ) -> None:
         super().__init__(parent)
@@ -66,6 +71,20 @@ class _WorkItemWidget(QWidget):
             lbl.setStyleSheet("font-size: 13px; color: #2c2c2c; font-weight: 500;")
         lo.addWidget(lbl, stretch=1)
 
+        if tags:
+            tag_lbl = QLabel(" ".join(f"#{t}" for t in tags))
+            tag_lbl.setStyleSheet("font-size: 11px; color: #0067c0;")
+            lo.addWidget(tag_lbl)
+
+        if progress is not None:
+            done_all = progress.done == progress.total
+            prog_lbl = QLabel(f"\u2611 {progress.done}/{progress.total}")
+            prog_lbl.setToolTip("已完成的子任务")
+            prog_lbl.setStyleSheet(
+                f"font-size: 11px; color: {'#107c10' if done_all else '#666'};"
+            )
+            lo.addWidget(prog_lbl)
+
         span = QLabel(f"{start_date.month}/{start_date.day} - {end_date.month}/{end_date.day}")
         span.setStyleSheet("font-size: 11px; color: #888;" if not is_completed else "font-size: 11px; color: #aaa;")
         lo.addWidget(span)
@@ -73,17 +92,44 @@ class _WorkItemWidget(QWidget):
     def _on_toggled(self, checked: bool) -> None:
         self.completed_toggled.emit(self._eid, checked)
 
+    def set_selected(self, selected: bool) -> None:
+        if self.property("selected") == selected:
+            return
+        self.setProperty("selected", selected)
+        self.style().unpolish(self)
+        self.style().polish(self)
+
     def mousePressEvent(self, event) -> None:  # noqa: N802
         if event.button() == Qt.MouseButton.LeftButton:
-            self.clicked.emit(self._eid)
+            if event.modifiers() & Qt.KeyboardModifier.ControlModifier:
+                self.selection_toggled.emit(self._eid)
+            else:
+                self.clicked.emit(self._eid)
             event.accept()
         else:
             super().mousePressEvent(event)
 
 
 class WorkPanel(QWidget):
+    """Work Event list. Ctrl+click selects several items for the bulk action bar.
+
+    The selection itself is owned by the caller (shared with the calendar):
+    the panel emits ``selection_toggled`` / ``selection_cleared`` and renders
+    whatever ``set_selection`` hands back. ``bulk_requested`` carries the
+    action ("complete" / "delete" / "shift") and the shift in days.
+
+    The tag chips work the same way: toggling one emits
+    ``tag_filter_changed(tags, match_all)`` and the caller hands the
+    filtered events back through ``set_events``.
+    """
+
     data_changed = Signal()
     event_clicked = Signal(int)
+    selection_toggled = Signal(int)
+    selection_cleared = Signal()
+    bulk_requested = Signal(str, int)
+    conflicts_requested = Signal()
+    tag_filter_changed = Signal(object, bool)  # set[str], match_all
 
     def __init__(
         self,
@@ -94,6 +140,10 @@ class WorkPanel(QWidget):
         super().__init__(parent)
         self._service = service
         self._colors = color_allocator
+        self._selection: set[int] = set()
+        self._items: dict[int, _WorkItemWidget] = {}
+        self._chips: dict[str, QPushButton] = {}
+        self._match_all = True
         self._setup_ui()
 
     def _setup_ui(self) -> None:
@@ -106,12 +156,20 @@ class WorkPanel(QWidget):
         title.setObjectName("panelTitle")
         header.addWidget(title)
         header.addStretch()
+        self._conflict_btn = QPushButton()
+        self._conflict_btn.setObjectName("conflictButton")
+        self._conflict_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        self._conflict_btn.setToolTip("工作量超出上限的日期")
+        self._conflict_btn.clicked.connect(self.conflicts_requested.emit)
+        self._conflict_btn.hide()
+        header.addWidget(self._conflict_btn)
         self._add_btn = QPushButton("+")
         self._add_btn.setObjectName("addButton")
         self._add_btn.setFixedSize(28, 28)
         self._add_btn.clicked.connect(self._on_add)
         header.addWidget(self._add_btn)
         root.addLayout(header)
+        root.addWidget(self._create_tag_bar())
 
         scroll = QScrollArea()
         scroll.setWidgetResizable(True)
@@ -124,6 +182,61 @@ class WorkPanel(QWidget):
         self._list_layout.addStretch()
         scroll.setWidget(self._list_widget)
         root.addWidget(scroll)
+        root.addWidget(self._create_bulk_bar())
+
+    def _create_tag_bar(self) -> QWidget:
+        self._tag_bar = QWidget()
+        self._tag_layout = QHBoxLayout(self._tag_bar)
+        self._tag_layout.setContentsMargins(0, 0, 0, 0)
+        self._tag_layout.setSpacing(4)
+        self._mode_btn = QPushButton()
+        self._mode_btn.setObjectName("tagModeButton")
+        self._mode_btn.setCursor(Qt.CursorShape.PointingHandCursor)
+        self._mode_btn.clicked.connect(self._on_mode_clicked)
+        self._tag_layout.addStretch()
+        self._tag_layout.addWidget(self._mode_btn)
+        self._update_mode_button()
+        self._tag_bar.hide()
+        return self._tag_bar
+
+    def _create_bulk_bar(self) -> QWidget:
+        self._bulk_bar = QWidget()
+        self._bulk_bar.setObjectName("bulkBar")
+        lo = QHBoxLayout(self._bulk_bar)
+        lo.setContentsMargins(8, 4, 8, 4)
+        lo.setSpacing(6)
+        self._bulk_label = QLabel()
+        lo.addWidget(self._bulk_label)
+        lo.addStretch()
+
+        done_btn = QPushButton("完成")
+        done_btn.clicked.connect(lambda: self.bulk_requested.emit("complete", 0))
+        lo.addWidget(done_btn)
+
+        self._shift_days = QSpinBox()
+        self._shift_days.setRange(-365, 365)
+        self._shift_days.setValue(1)
+        self._shift_days.setSuffix(" 天")
+        lo.addWidget(self._shift_days)
+        shift_btn = QPushButton("顺延")
+        shift_btn.clicked.connect(
+            lambda: self.bulk_requested.emit("shift", self._shift_days.value())
+        )
+        lo.addWidget(shift_btn)
+
+        del_btn = QPushButton("删除")
+        del_btn.setStyleSheet("color: #c42b1c;")
+        del_btn.clicked.connect(self._on_bulk_delete)
+        lo.addWidget(del_btn)
+
+        clear_btn = QPushButton("\u2715")
+        clear_btn.setFixedWidth(28)
+        clear_btn.setToolTip("取消选择")
+        clear_btn.clicked.connect(self.selection_cleared.emit)
+        lo.addWidget(clear_btn)
+
+        self._bulk_bar.hide()
+        return self._bulk_bar
 
     # -- actions ---
 
@@ -132,16 +245,54 @@ class WorkPanel(QWidget):
             return
         from daily_event.ui.dialogs import WorkEventDialog
 
-        dlg = WorkEventDialog(self)
+        dlg = WorkEventDialog(self, known_tags=self._service.get_all_tags())
         if dlg.exec() == QDialog.DialogCode.Accepted and isinstance(dlg.result, dict):
             r = dlg.result
-            self._service.create(r["title"], r["start_date"], r["end_date"], r["note"])
-            self.refresh()
+            if r.get("recurrence_rule"):
+                self._service.create_series(
+                    r["title"],
+                    r["recurrence_rule"],
+                    r["start_date"],
+                    (r["end_date"] - r["start_date"]).days,
+                    note=r["note"],
+                )
+            else:
+                self._service.create(
+                    r["title"],
+                    r["start_date"],
+                    r["end_date"],
+                    r["note"],
+                    r.get("tags", ()),
+                    r.get("subtasks", ()),
+                )
             self.data_changed.emit()
 
     def _on_item_clicked(self, event_id: int) -> None:
         self.event_clicked.emit(event_id)
 
+    def _on_bulk_delete(self) -> None:
+        reply = QMessageBox.question(
+            self, "确认删除", f"确定要删除选中的 {len(self._selection)} 个事项吗？",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No,
+        )
+        if reply == QMessageBox.StandardButton.Yes:
+            self.bulk_requested.emit("delete", 0)
+
+    def _on_chip_toggled(self) -> None:
+        self._update_mode_button()
+        self.tag_filter_changed.emit(self.active_tags, self._match_all)
+
+    def _on_mode_clicked(self) -> None:
+        self._match_all = not self._match_all
+        self._update_mode_button()
+        if self.active_tags:
+            self.tag_filter_changed.emit(self.active_tags, self._match_all)
+
+    def _update_mode_button(self) -> None:
+        self._mode_btn.setText("全部匹配" if self._match_all else "任一匹配")
+        self._mode_btn.setToolTip("点击切换：事项需带全部 / 任一所选标签")
+        self._mode_btn.setVisible(len(self.active_tags) > 1)
+
     def _on_item_toggled(self, event_id: int, checked: bool) -> None:
         if not self._service:
             return
@@ -156,7 +307,49 @@ class WorkPanel(QWidget):
         events = self._service.get_all()
         self.set_events(events)
 
-    def set_events(self, events: list) -> None:
+    @property
+    def active_tags(self) -> set[str]:
+        return {name for name, chip in self._chips.items() if chip.isChecked()}
+
+    @property
+    def match_all(self) -> bool:
+        return self._match_all
+
+    def set_tags(self, counts: dict[str, int]) -> None:
+        """Show one chip per tag (with its event count); checked chips stay checked."""
+        active = self.active_tags
+        for chip in self._chips.values():
+            chip.deleteLater()
+        self._chips.clear()
+        for i, name in enumerate(sorted(counts)):
+            chip = QPushButton(f"{name} {counts[name]}")
+            chip.setObjectName("tagChip")
+            chip.setCheckable(True)
+            chip.setCursor(Qt.CursorShape.PointingHandCursor)
+            chip.setChecked(name in active)
+            chip.toggled.connect(self._on_chip_toggled)
+            self._tag_layout.insertWidget(i, chip)
+            self._chips[name] = chip
+        self._update_mode_button()
+        self._tag_bar.setVisible(bool(self._chips))
+
+    def set_conflict_count(self, count: int) -> None:
+        self._conflict_btn.setText(f"\u26a0 {count}")
+        self._conflict_btn.setVisible(count > 0)
+
+    def set_selection(self, event_ids: set[int]) -> None:
+        self._selection = set(event_ids)
+        for eid, item in self._items.items():
+            item.set_selected(eid in self._selection)
+        self._bulk_label.setText(f"已选 {len(self._selection)} 项")
+        self._bulk_bar.setVisible(bool(self._selection))
+
+    def set_events(
+        self,
+        events: list,
+        tags_of: Callable[[int], Iterable[str]] | None = None,
+        progress: Mapping[int, SubtaskProgress] | None = None,
+    ) -> None:
         self._clear_list()
         if not events:
             hint = QLabel("暂无工作事项")
@@ -173,13 +366,19 @@ class WorkPanel(QWidget):
                     ev.end_date,
                     color,
                     ev.is_completed,
+                    tags_of(ev.id) if tags_of else (),
+                    progress.get(ev.id) if progress else None,
                 )
                 w.clicked.connect(self._on_item_clicked)
                 w.completed_toggled.connect(self._on_item_toggled)
+                w.selection_toggled.connect(self.selection_toggled.emit)
+                w.set_selected(ev.id in self._selection)
+                self._items[ev.id] = w
                 self._list_layout.addWidget(w)
         self._list_layout.addStretch()
 
     def _clear_list(self) -> None:
+        self._items.clear()
         while self._list_layout.count() > 0:
             item = self._list_layout.takeAt(0)
             w = item.widget()
@@ -0,0 +1,261 @@
+"""Year overview — twelve mini months with work density and daily completion dots."""
+
+from __future__ import annotations
+
+import calendar as cal_mod
+from datetime import date
+
+from PySide6.QtCore import QPointF, QRectF, QSize, Qt, Signal
+from PySide6.QtGui import QColor, QFont, QPainter, QPixmap
+from PySide6.QtWidgets import (
+    QDialog,
+    QGridLayout,
+    QHBoxLayout,
+    QLabel,
+    QPushButton,
+    QScrollArea,
+    QToolTip,
+    QVBoxLayout,
+    QWidget,
+)
+
+WEEKDAYS = ["日", "一", "二", "三", "四", "五", "六"]
+
+
+class MiniMonthWidget(QWidget):
+    """One month as a 7×6 grid; cell shade = open Work Events, dot = Daily completions.
+
+    Everything except the hover ring is rendered once into a pixmap keyed by
+    devicePixelRatio and size, so hovering only blits it and draws one outline.
+    """
+
+    clicked = Signal(int, int)  # year, month
+
+    CELL = 20
+    TITLE_H = 22
+    HEADER_H = 14
+
+    def __init__(self, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self._year = 2000
+        self._month = 1
+        self._lead = 0
+        self._density: list[int] = []
+        self._done: list[int] = []
+        self._max = 1
+        self._today: date | None = None
+        self._hover = -1
+        self._pixmap: QPixmap | None = None
+        self._pixmap_key: tuple[float, int, int] | None = None
+        self.setMouseTracking(True)
+        self.setCursor(Qt.CursorShape.PointingHandCursor)
+        self.setFixedSize(self.sizeHint())
+
+    def set_data(
+        self,
+        year: int,
+        month: int,
+        density: list[int],
+        done: list[int],
+        max_density: int,
+        today: date,
+    ) -> None:
+        self._year, self._month = year, month
+        self._lead = (date(year, month, 1).weekday() + 1) % 7
+        self._density = density
+        self._done = done
+        self._max = max(1, max_density)
+        self._today = today
+        self._pixmap = None
+        self.update()
+
+    def sizeHint(self) -> QSize:  # noqa: N802
+        return QSize(7 * self.CELL, self.TITLE_H + self.HEADER_H + 6 * self.CELL)
+
+    def _cell_rect(self, index: int) -> QRectF:
+        cell = self._lead + index
+        return QRectF(
+            (cell % 7) * self.CELL,
+            self.TITLE_H + self.HEADER_H + (cell // 7) * self.CELL,
+            self.CELL,
+            self.CELL,
+        )
+
+    def _render(self, dpr: float) -> QPixmap:
+        pm = QPixmap(int(self.width() * dpr), int(self.height() * dpr))
+        pm.setDevicePixelRatio(dpr)
+        pm.fill(Qt.GlobalColor.transparent)
+        p = QPainter(pm)
+        p.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        font = QFont(p.font())
+        font.setPointSize(10)
+        font.setBold(True)
+        p.setFont(font)
+        p.setPen(QColor(26, 26, 26))
+        p.drawText(
+            QRectF(0, 0, self.width(), self.TITLE_H),
+            Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter,
+            f"{self._month}月",
+        )
+
+        font.setPointSize(7)
+        font.setBold(False)
+        p.setFont(font)
+        p.setPen(QColor(150, 150, 150))
+        for i, name in enumerate(WEEKDAYS):
+            p.drawText(
+                QRectF(i * self.CELL, self.TITLE_H, self.CELL, self.HEADER_H),
+                Qt.AlignmentFlag.AlignCenter,
+                name,
+            )
+
+        for i, count in enumerate(self._density):
+            rect = self._cell_rect(i)
+            inner = rect.adjusted(1, 1, -1, -1)
+            if count:
+                alpha = 40 + int(170 * count / self._max)
+                p.setPen(Qt.PenStyle.NoPen)
+                p.setBrush(QColor(0, 103, 192, alpha))
+                p.drawRoundedRect(inner, 3, 3)
+            d = date(self._year, self._month, i + 1)
+            if d == self._today:
+                p.setPen(QColor(0, 103, 192))
+                p.setBrush(Qt.BrushStyle.NoBrush)
+                p.drawRoundedRect(inner, 3, 3)
+            p.setPen(QColor(255, 255, 255) if count and count * 2 > self._max else QColor(60, 60, 60))
+            p.drawText(rect.adjusted(0, -3, 0, -3), Qt.AlignmentFlag.AlignCenter, str(i + 1))
+            if self._done[i]:
+                p.setPen(Qt.PenStyle.NoPen)
+                p.setBrush(QColor(16, 124, 16))
+                p.drawEllipse(QPointF(rect.center().x(), rect.bottom() - 4), 1.6, 1.6)
+        p.end()
+        return pm
+
+    def paintEvent(self, event) -> None:  # noqa: N802
+        dpr = self.devicePixelRatioF()
+        key = (dpr, self.width(), self.height())
+        if self._pixmap is None or self._pixmap_key != key:
+            self._pixmap = self._render(dpr)
+            self._pixmap_key = key
+        p = QPainter(self)
+        p.drawPixmap(0, 0, self._pixmap)
+        if 0 <= self._hover < len(self._density):
+            p.setRenderHint(QPainter.RenderHint.Antialiasing)
+            p.setPen(QColor(0, 0, 0, 90))
+            p.setBrush(Qt.BrushStyle.NoBrush)
+            p.drawRoundedRect(self._cell_rect(self._hover).adjusted(0.5, 0.5, -0.5, -0.5), 3, 3)
+        p.end()
+
+    def _index_at(self, pos: QPointF) -> int:
+        y = pos.y() - self.TITLE_H - self.HEADER_H
+        if y < 0:
+            return -1
+        i = int(y // self.CELL) * 7 + int(pos.x() // self.CELL) - self._lead
+        return i if 0 <= i < len(self._density) else -1
+
+    def mouseMoveEvent(self, event) -> None:  # noqa: N802
+        i = self._index_at(event.position())
+        if i != self._hover:
+            self._hover = i
+            self.update()
+        if i >= 0:
+            d = date(self._year, self._month, i + 1)
+            QToolTip.showText(
+                event.globalPosition().toPoint(),
+                f"{d}：进行中 {self._density[i]} 项 · 打卡 {self._done[i]} 次",
+                self,
+            )
+        else:
+            QToolTip.hideText()
+
+    def leaveEvent(self, event) -> None:  # noqa: N802
+        if self._hover != -1:
+            self._hover = -1
+            self.update()
+
+    def mousePressEvent(self, event) -> None:  # noqa: N802
+        if event.button() == Qt.MouseButton.LeftButton:
+            self.clicked.emit(self._year, self._month)
+            event.accept()
+        else:
+            super().mousePressEvent(event)
+
+
+class YearPage(QDialog):
+    year_changed = Signal(int)
+    month_selected = Signal(int, int)
+
+    def __init__(self, parent: QWidget | None = None) -> None:
+        super().__init__(parent)
+        self.setWindowTitle("年视图")
+        self.setMinimumSize(680, 600)
+        self.setWindowFlags(
+            Qt.WindowType.Tool
+            | Qt.WindowType.WindowTitleHint
+            | Qt.WindowType.WindowCloseButtonHint
+        )
+        self._year = date.today().year
+
+        root = QVBoxLayout(self)
+        root.setContentsMargins(16, 16, 16, 16)
+        root.setSpacing(8)
+
+        header = QHBoxLayout()
+        prev_btn = QPushButton("◀")
+        prev_btn.setObjectName("navButton")
+        prev_btn.setFixedSize(28, 28)
+        prev_btn.clicked.connect(lambda: self.year_changed.emit(self._year - 1))
+        self._title = QLabel()
+        self._title.setStyleSheet("font-size: 16px; font-weight: 600; color: #1a1a1a;")
+        next_btn = QPushButton("▶")
+        next_btn.setObjectName("navButton")
+        next_btn.setFixedSize(28, 28)
+        next_btn.clicked.connect(lambda: self.year_changed.emit(self._year + 1))
+        header.addWidget(prev_btn)
+        header.addWidget(self._title)
+        header.addWidget(next_btn)
+        header.addStretch()
+        legend = QLabel("底色：进行中的工作事项  ·  绿点：当日有打卡")
+        legend.setStyleSheet("font-size: 11px; color: #888;")
+        header.addWidget(legend)
+        root.addLayout(header)
+
+        scroll = QScrollArea()
+        scroll.setWidgetResizable(True)
+        scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        inner = QWidget()
+        grid = QGridLayout(inner)
+        grid.setContentsMargins(0, 0, 0, 0)
+        grid.setHorizontalSpacing(18)
+        grid.setVerticalSpacing(12)
+        self._months: list[MiniMonthWidget] = []
+        for m in range(12):
+            widget = MiniMonthWidget()
+            widget.clicked.connect(self.month_selected.emit)
+            grid.addWidget(widget, m // 4, m % 4)
+            self._months.append(widget)
+        scroll.setWidget(inner)
+        root.addWidget(scroll, stretch=1)
+
+    @property
+    def year(self) -> int:
+        return self._year
+
+    def set_year_data(self, year: int, density: list[int], done: list[int], today: date) -> None:
+        """*density* and *done* hold one entry per day of *year*, Jan 1 first."""
+        self._year = year
+        self._title.setText(f"{year} 年")
+        peak = max(density, default=0)
+        offset = 0
+        for m, widget in enumerate(self._months, start=1):
+            days = cal_mod.monthrange(year, m)[1]
+            widget.set_data(
+                year,
+                m,
+                density[offset:offset + days],
+                done[offset:offset + days],
+                peak,
+                today,
+            )
+            offset += days
@@ -0,0 +1,54 @@
+"""Shared fakes and fixtures: a settable clock, recording notifier / sound, a temp database."""
+
+import time
+from datetime import datetime, timedelta
+
+import pytest
+
+from daily_event.infra.database import Database
+
+
+class FakeClock:
+    """A wall clock that only moves when told to."""
+
+    def __init__(self, now: datetime) -> None:
+        self.now = now
+
+    def __call__(self) -> datetime:
+        return self.now
+
+    def advance(self, **kwargs) -> None:
+        self.now += timedelta(**kwargs)
+
+
+class FakeNotification:
+    def __init__(self) -> None:
+        self.sent: list[tuple[str, str]] = []
+
+    def notify(self, title: str, message: str) -> None:
+        self.sent.append((title, message))
+
+
+class FakeSound:
+    def __init__(self) -> None:
+        self.played = 0
+
+    def play_alarm(self) -> None:
+        self.played += 1
+
+
+@pytest.fixture
+def db(tmp_path):
+    return Database(str(tmp_path / "test.db"))
+
+
+@pytest.fixture
+def berlin(monkeypatch):
+    """Run the test in Europe/Berlin local time (DST on 2026-03-29 and 2026-10-25)."""
+    if not hasattr(time, "tzset"):
+        pytest.skip("time.tzset is unavailable")
+    monkeypatch.setenv("TZ", "Europe/Berlin")
+    time.tzset()
+    yield
+    monkeypatch.undo()
+    time.tzset()
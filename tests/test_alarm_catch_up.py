@@ -0,0 +1,174 @@
+"""Tests for clock-jump handling and lateness catch-up of alarms (simulated wall + elapsed clocks)."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+from daily_event.services.alarm_clock import (
+    ELAPSED_COUNTS_SUSPEND,
+    LATE,
+    ON_TIME,
+    STALE,
+    ClockWatch,
+    classify_lateness,
+    drift_check_ms,
+)
+from daily_event.services.alarm_service import AlarmService
+from tests.conftest import FakeNotification, FakeSound
+
+
+class SimClock:
+    """A wall clock and an elapsed clock that can be moved together or apart."""
+
+    def __init__(self, now: datetime) -> None:
+        self.wall = now
+        self.mono = 1000.0
+
+    def now(self) -> datetime:
+        return self.wall
+
+    def elapsed(self) -> float:
+        return self.mono
+
+    def run(self, **kwargs) -> None:
+        """Real time passes (awake or suspended): both clocks move."""
+        seconds = timedelta(**kwargs).total_seconds()
+        self.wall = datetime.fromtimestamp(self.wall.timestamp() + seconds)
+        self.mono += seconds
+
+    def jump(self, **kwargs) -> None:
+        """The wall clock is set (NTP, user): only the wall clock moves."""
+        self.wall += timedelta(**kwargs)
+
+
+def _service(db, clock, **kwargs):
+    return AlarmService(
+        db, FakeNotification(), FakeSound(), clock=clock.now, elapsed=clock.elapsed, **kwargs
+    )
+
+
+def test_classify_and_drift():
+    assert classify_lateness(30, 3600) == ON_TIME
+    assert classify_lateness(600, 3600) == LATE
+    assert classify_lateness(3600, 3600) == STALE
+
+    clock = SimClock(datetime(2026, 5, 1, 8, 0))
+    watch = ClockWatch(clock.now, clock.elapsed)
+    clock.run(hours=8)  # suspend counted by the elapsed clock
+    assert watch.drift() == 0
+    clock.jump(minutes=-5)
+    assert watch.drift() == -300
+    assert watch.drift() == 0
+
+
+def test_drift_check_interval_adapts_to_the_wait():
+    minute, hour = 60_000, 3_600_000
+    assert drift_check_ms(5_000) == 5_000  # due before the next check
+    assert drift_check_ms(3 * minute) == minute
+    assert drift_check_ms(8 * hour) == 2 * hour
+
+    ms, wakes = 8 * hour, 0  # one alarm 8 h away, no clock jump
+    while ms:
+        ms -= drift_check_ms(ms)
+        wakes += 1
+    assert wakes < 30  # vs. 480 with a fixed one-minute cap
+
+
+def test_ntp_jump_moves_countdowns_not_clock_alarms(db):
+    clock = SimClock(datetime(2026, 5, 1, 8, 0))
+    service = _service(db, clock)
+    countdown = service.create_countdown("泡茶", 30)
+    scheduled = service.create_scheduled("开会", 8, 12)
+
+    clock.run(minutes=5)
+    clock.jump(minutes=10)  # wall clock corrected forward
+    assert [a.id for a in service.fire_due()] == [scheduled]  # 08:12 has passed on the wall
+    assert service._notification.sent == [("闹钟提醒", "开会（晚了 3 分钟）")]
+    assert service.clock_jumps == 1
+    assert service.ms_until_next() == 25 * 60 * 1000  # countdown keeps its duration
+    assert {a.id: a.target_time for a in service.get_all()}[countdown] == datetime(2026, 5, 1, 8, 40)
+
+    clock.jump(hours=-1)  # and back
+    clock.run(minutes=25)
+    assert [a.id for a in service.fire_due()] == [countdown]
+    assert service._notification.sent[-1] == ("闹钟提醒", "泡茶")
+
+
+def test_sleep_missed_by_the_elapsed_clock_keeps_countdowns(db):
+    assert ClockWatch().counts_suspend == ELAPSED_COUNTS_SUSPEND
+    clock = SimClock(datetime(2026, 5, 1, 8, 0))
+    assert ClockWatch(clock.now, clock.elapsed).counts_suspend
+    service = _service(db, clock, elapsed_counts_suspend=False)
+    short = service.create_countdown("泡茶", 30)
+    service.create_countdown("煮饭", 180)
+    service.ms_until_next()
+
+    clock.jump(hours=2)  # asleep, or a forward jump: this elapsed clock cannot tell
+    assert [a.id for a in service.fire_due()] == [short]
+    assert service.clock_jumps == 0
+    assert service.ms_until_next() == 60 * 60 * 1000  # not pushed back by two hours
+
+    clock.jump(minutes=-10)  # backward jumps are still re-anchored
+    assert service.ms_until_next() == 60 * 60 * 1000
+    assert service.clock_jumps == 1
+
+
+def test_countdown_loaded_from_db_keeps_remaining_time(db):
+    clock = SimClock(datetime(2026, 5, 1, 8, 0))
+    _service(db, clock).create_countdown("", 20)
+    clock.run(minutes=5)
+    service = _service(db, clock)  # e.g. after a restart
+    clock.jump(minutes=-30)
+    assert service.ms_until_next() == 15 * 60 * 1000
+
+
+@pytest.mark.parametrize(
+    "policy, sent, played, statuses",
+    [
+        ("fire", ["晨跑（晚了 8 小时）", "午饭（晚了 30 分钟）"], 1, ["fired", "fired"]),
+        ("summarize", ["午饭（晚了 30 分钟）", "错过的闹钟"], 1, ["fired", "fired"]),
+        ("drop", ["午饭（晚了 30 分钟）"], 1, ["missed", "fired"]),
+    ],
+)
+def test_catch_up_after_suspend(db, policy, sent, played, statuses):
+    clock = SimClock(datetime(2026, 5, 1, 0, 0))
+    service = _service(db, clock, catch_up=policy)
+    service.create_scheduled("晨跑", 0, 30)
+    service.create_scheduled("午饭", 8, 0)
+    service.create_scheduled("下班", 18, 0)
+    service.ms_until_next()
+
+    clock.run(hours=8, minutes=30)  # asleep all night
+    assert len(service.fire_due()) == 2
+    assert service.clock_jumps == 0  # a suspend is lateness, not a clock jump
+    got = [message if title == "闹钟提醒" else title for title, message in service._notification.sent]
+    assert got == sent
+    assert service._sound.played == played
+    assert [a.status for a in sorted(service.get_all(), key=lambda a: a.id)][:2] == statuses
+    assert service.next_fire_at() == datetime(2026, 5, 1, 18, 0)
+
+
+def test_dst_transitions(db, berlin):
+    # Spring forward: 02:00 -> 03:00 on 2026-03-29.
+    clock = SimClock(datetime(2026, 3, 29, 1, 45))
+    service = _service(db, clock)
+    countdown = service.create_countdown("", 30)
+    service.create_scheduled("", 3, 30)
+    assert service.next_fire_at() == datetime(2026, 3, 29, 3, 15)
+    assert service.ms_until_next() == 30 * 60 * 1000
+    clock.run(minutes=30)
+    assert [a.id for a in service.fire_due()] == [countdown]
+    assert service.ms_until_next() == 15 * 60 * 1000  # 03:30 is 45 real minutes after 01:45
+    clock.run(minutes=15)
+    assert len(service.fire_due()) == 1
+
+    # Fall back: 03:00 -> 02:00 on 2026-10-25; wall time repeats but nothing fires early.
+    clock.wall = datetime(2026, 10, 25, 2, 45)
+    service.check_clock()
+    countdown = service.create_countdown("", 30)
+    assert service.ms_until_next() == 30 * 60 * 1000
+    clock.run(minutes=29)
+    assert clock.wall < datetime(2026, 10, 25, 2, 45)  # second pass through 02:xx
+    assert service.fire_due() == []
+    clock.run(minutes=1)
+    assert [a.id for a in service.fire_due()] == [countdown]
@@ -0,0 +1,86 @@
+"""Tests for the alarm list model: in-memory countdowns and per-row repaints (simulated clock)."""
+
+from datetime import datetime, timedelta
+
+import pytest
+
+pytest.importorskip("PySide6")
+
+from daily_event.domain.models import Alarm  # noqa: E402
+from daily_event.ui.alarm_list import AlarmListModel, RemainingRole  # noqa: E402
+from tests.conftest import FakeClock  # noqa: E402
+
+
+def _alarm(alarm_id: int, label: str, target: datetime, status: str = "pending") -> Alarm:
+    return Alarm(
+        id=alarm_id, label=label, mode="scheduled", target_time=target, status=status, repeat_rule=""
+    )
+
+
+@pytest.fixture
+def clock():
+    return FakeClock(datetime(2026, 5, 1, 8, 0))
+
+
+@pytest.fixture
+def model(clock):
+    model = AlarmListModel(clock)
+    model.changes = []
+    model.resets = 0
+    model.dataChanged.connect(
+        lambda top, bottom, roles: model.changes.append((top.row(), bottom.row(), list(roles)))
+    )
+    model.modelReset.connect(lambda: setattr(model, "resets", model.resets + 1))
+    return model
+
+
+def _rows(clock):
+    now = clock.now
+    return [
+        _alarm(1, "泡茶", now + timedelta(minutes=5)),
+        _alarm(2, "开会", now + timedelta(hours=1)),
+        _alarm(3, "午饭", now - timedelta(hours=1), status="fired"),
+        _alarm(4, "出差", now + timedelta(days=2, minutes=30)),
+    ]
+
+
+def _remaining(model):
+    return [model.index(row).data(RemainingRole) for row in range(model.rowCount())]
+
+
+def test_tick_emits_one_range_per_run_of_changed_rows(model, clock):
+    model.set_alarms(_rows(clock))
+    assert model.resets == 1 and model.changes == []
+    assert _remaining(model) == ["5:00", "1:00:00", "", "2天0小时"]
+
+    clock.advance(seconds=1)
+    assert model.tick() == 2  # the fired row has no countdown, the 2-day one shows hours
+    assert model.changes == [(0, 1, [RemainingRole])]
+    assert _remaining(model) == ["4:59", "59:59", "", "2天0小时"]
+
+    model.changes.clear()
+    assert model.tick() == 0 and model.changes == []
+
+    clock.advance(hours=1)
+    assert model.tick(first=1, last=3) == 2  # row 0 is outside the visible range
+    assert model.changes == [(1, 1, [RemainingRole]), (3, 3, [RemainingRole])]
+    assert _remaining(model)[0] == "4:59"
+
+
+def test_set_alarms_updates_changed_rows_in_place(model, clock):
+    rows = _rows(clock)
+    model.set_alarms(rows)
+
+    changed = _rows(clock)
+    changed[1].status = "cancelled"
+    changed[2].label = "晚饭"
+    model.set_alarms(changed)
+    assert model.resets == 1  # same ids: no reset
+    assert model.changes == [(1, 2, [])]
+    assert _remaining(model)[1] == "" and model.index(2).data() == "晚饭"
+
+    model.set_alarms(changed[::-1])  # new order: one reset, no per-row signals
+    assert model.resets == 2 and len(model.changes) == 1
+    assert model.has_pending
+    model.set_alarms([])
+    assert model.rowCount() == 0 and model.tick() == 0 and not model.has_pending
@@ -0,0 +1,133 @@
+"""Tests for recurring alarms (simulated clock)."""
+
+from datetime import date, datetime, timedelta
+
+import pytest
+from sqlalchemy import text
+
+from daily_event.infra.database import CURRENT_SCHEMA_VERSION, Database
+from daily_event.services.alarm_service import (
+    AlarmService,
+    describe_repeat,
+    is_valid_repeat,
+    next_occurrence,
+)
+from tests.conftest import FakeClock, FakeNotification, FakeSound
+
+
+def test_next_occurrence():
+    anchor = date(2026, 5, 1)  # a Friday
+    at_8 = datetime(2026, 5, 1, 8, 0)
+    assert next_occurrence("daily", at_8, datetime(2026, 5, 1, 7, 59), anchor) == at_8
+    assert next_occurrence("daily", at_8, at_8, anchor) == datetime(2026, 5, 2, 8, 0)
+    assert next_occurrence("workday", at_8, at_8, anchor) == datetime(2026, 5, 4, 8, 0)
+    assert next_occurrence("weekdays:2", at_8, at_8, anchor) == datetime(2026, 5, 6, 8, 0)
+    # Every 3 hours: missed steps are skipped, the phase is kept.
+    assert next_occurrence("hours:3", at_8, datetime(2026, 5, 1, 16, 30), anchor) == datetime(2026, 5, 1, 17, 0)
+    assert next_occurrence("hours:3", at_8, datetime(2026, 5, 1, 17, 0), anchor) == datetime(2026, 5, 1, 20, 0)
+
+    assert is_valid_repeat("hours:2") and is_valid_repeat("weekdays:0,6")
+    assert not is_valid_repeat("hours:0") and not is_valid_repeat("weekdays:")
+    assert describe_repeat("hours:4") == "每4小时" and describe_repeat("workday") == "工作日"
+
+
+def test_hour_steps_are_real_hours_across_dst(db, berlin):
+    def real_hours(start, end):
+        return (end.timestamp() - start.timestamp()) / 3600
+
+    anchor = date(2026, 3, 29)
+    # Spring forward (02:00 -> 03:00): one real hour after 01:30 is 03:30, not the missing 02:30.
+    spring = datetime(2026, 3, 29, 1, 30)
+    nxt = next_occurrence("hours:1", spring, spring, anchor)
+    assert nxt == datetime(2026, 3, 29, 3, 30) and real_hours(spring, nxt) == 1
+    nxt = next_occurrence("hours:3", spring, datetime(2026, 3, 29, 4, 0), anchor)
+    assert nxt == datetime(2026, 3, 29, 5, 30) and real_hours(spring, nxt) == 3
+
+    # Fall back (03:00 -> 02:00): 02:30 comes twice, an hour apart.
+    fall = datetime(2026, 10, 25, 2, 30)
+    nxt = next_occurrence("hours:1", fall, fall, anchor)
+    assert (nxt, nxt.fold) == (datetime(2026, 10, 25, 2, 30), 1) and real_hours(fall, nxt) == 1
+    nxt = next_occurrence("hours:2", fall, fall, anchor)
+    assert nxt == datetime(2026, 10, 25, 3, 30) and real_hours(fall, nxt) == 2
+
+    # The service rings every real hour through the night.
+    clock = FakeClock(datetime(2026, 10, 25, 0, 30))
+    service = AlarmService(db, FakeNotification(), FakeSound(), clock=clock)
+    service.create_recurring("", "hours:1")
+    fired = []
+    for _ in range(4):
+        clock.now = service.next_fire_at()
+        assert service.fire_due()
+        fired.append(clock.now.timestamp())
+    assert [b - a for a, b in zip(fired, fired[1:])] == [3600] * 3
+
+
+def test_recurring_alarm_reschedules_its_own_row(db):
+    clock = FakeClock(datetime(2026, 5, 1, 9, 0))  # Friday
+    service = AlarmService(db, FakeNotification(), FakeSound(), clock=clock)
+    aid = service.create_recurring("站会", "workday", 8, 30)
+    assert service.next_fire_at() == datetime(2026, 5, 4, 8, 30)
+
+    clock.now = datetime(2026, 5, 4, 8, 30)
+    assert [a.id for a in service.fire_due()] == [aid]
+    assert service.next_fire_at() == datetime(2026, 5, 5, 8, 30)
+    (alarm,) = service.get_all()
+    assert (alarm.status, alarm.target_time, alarm.repeat_rule) == ("pending", datetime(2026, 5, 5, 8, 30), "workday")
+
+    clock.now = datetime(2026, 5, 8, 12, 0)  # asleep for four mornings: one catch-up, not four
+    assert len(service.fire_due()) == 1
+    assert service.next_fire_at() == datetime(2026, 5, 11, 8, 30)
+    assert len(service._notification.sent) == 2
+
+    reloaded = AlarmService(db, FakeNotification(), FakeSound(), clock=clock)
+    assert reloaded.next_fire_at() == datetime(2026, 5, 11, 8, 30)
+    service.cancel(aid)
+    assert service.next_fire_at() is None
+    with pytest.raises(ValueError):
+        service.create_recurring("", "hours:0")
+
+
+def test_interval_rule_keeps_the_creation_day_as_anchor(db):
+    clock = FakeClock(datetime(2026, 1, 1, 9, 0))  # the real clock is months away
+    service = AlarmService(db, FakeNotification(), FakeSound(), clock=clock)
+    service.create_recurring("浇花", "every:2d", 8, 0)
+    assert service.next_fire_at() == datetime(2026, 1, 3, 8, 0)
+
+    clock.now = datetime(2026, 1, 3, 8, 0)
+    assert len(service.fire_due()) == 1
+    assert service.next_fire_at() == datetime(2026, 1, 5, 8, 0)
+    assert service.get_all()[0].created_at == datetime(2026, 1, 1, 9, 0)
+
+
+def test_hundreds_of_recurring_alarms_over_a_day(db):
+    clock = FakeClock(datetime(2026, 5, 1, 0, 0))
+    service = AlarmService(db, FakeNotification(), FakeSound(), clock=clock)
+    for i in range(300):
+        service.create_recurring("", f"hours:{1 + i % 6}")
+    expected = sum(24 // (1 + i % 6) for i in range(300))
+
+    fired = wakeups = 0
+    end = clock.now + timedelta(days=1)
+    while service.next_fire_at() <= end:
+        clock.now = service.next_fire_at()
+        fired += len(service.fire_due())
+        wakeups += 1
+    assert fired == expected
+    assert wakeups == 24  # one wakeup per distinct instant, not per alarm or per tick
+    assert service.pending_count == 300
+
+
+def test_migration_from_v11(tmp_path):
+    path = str(tmp_path / "test.db")
+    with Database(path).session_scope() as session:
+        session.execute(text("ALTER TABLE alarms DROP COLUMN repeat_rule"))
+        session.execute(text("UPDATE schema_version SET version = 11"))
+
+    db = Database(path)
+    with db.session_scope() as session:
+        assert session.execute(text("SELECT version FROM schema_version")).scalar() == CURRENT_SCHEMA_VERSION
+    clock = FakeClock(datetime(2026, 5, 1, 9, 0))
+    service = AlarmService(db, FakeNotification(), FakeSound(), clock=clock)
+    service.create_countdown("", 5)
+    service.create_recurring("", "daily", 7, 0)
+    assert sorted(a.repeat_rule for a in service.get_all()) == ["", "daily"]
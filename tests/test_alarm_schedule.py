@@ -0,0 +1,111 @@
+"""Tests for the in-memory alarm schedule (simulated clock)."""
+
+import random
+from datetime import datetime, timedelta
+
+from sqlalchemy import event as sa_event
+
+from daily_event.services.alarm_service import AlarmService, format_remaining
+from tests.conftest import FakeClock, FakeNotification, FakeSound
+
+
+def _service(db, clock):
+    return AlarmService(db, FakeNotification(), FakeSound(), clock=clock)
+
+
+def _statements(db):
+    statements = []
+    sa_event.listen(db._engine, "before_cursor_execute", lambda *args: statements.append(args[2]))
+    return statements
+
+
+def test_fires_at_target_in_order(db):
+    clock = FakeClock(datetime(2026, 5, 1, 8, 0, 0, 250000))
+    service = _service(db, clock)
+    assert service.ms_until_next() is None
+
+    late = service.create_countdown("", 10)
+    soon = service.create_countdown("泡茶", 3)
+    at_nine = service.create_scheduled("", 9, 0)
+    assert service.ms_until_next() == 3 * 60 * 1000
+
+    clock.advance(minutes=3, microseconds=-1000)
+    assert service.fire_due() == []
+    assert service.ms_until_next() == 1  # rounded up, never early
+    clock.advance(microseconds=1000)
+    assert [a.id for a in service.fire_due()] == [soon]
+    assert service._notification.sent == [("闹钟提醒", "泡茶")]
+
+    clock.advance(minutes=57)
+    assert [a.id for a in service.fire_due()] == [late, at_nine]
+    assert service.ms_until_next() is None and service.pending_count == 0
+    assert service._sound.played == 2  # one sound per batch
+    assert {a.status for a in service.get_all()} == {"fired"}
+
+
+def test_cancel_and_idle_do_not_query(db):
+    clock = FakeClock(datetime(2026, 5, 1, 8, 0))
+    service = _service(db, clock)
+    aid = service.create_countdown("", 5)
+    keep = service.create_countdown("", 6)
+
+    statements = _statements(db)
+    service.cancel(aid)
+    cancel_queries = len(statements)
+    assert service.ms_until_next() == 6 * 60 * 1000
+    for _ in range(100):
+        clock.advance(seconds=1)
+        assert service.fire_due() == []
+    assert len(statements) == cancel_queries  # polling the schedule never hits SQLite
+
+    clock.advance(minutes=6)
+    assert [a.id for a in service.fire_due()] == [keep]
+    assert service.get_all()[-1].status == "cancelled"
+
+
+def test_schedule_loads_once_and_fires_overdue(db):
+    clock = FakeClock(datetime(2026, 5, 1, 8, 0))
+    first = _service(db, clock)
+    a = first.create_countdown("", 1)
+    b = first.create_countdown("", 30)
+
+    clock.advance(minutes=5)  # app was closed past the first alarm
+    second = _service(db, clock)
+    assert second.ms_until_next() == 0
+    assert second.queries == 1
+    assert [x.id for x in second.fire_due()] == [a]
+    assert second.ms_until_next() == 25 * 60 * 1000
+    assert second.queries == 1
+    assert b in {x.id for x in second.get_all() if x.status == "pending"}
+
+
+def test_heap_matches_brute_force(db):
+    rng = random.Random(46)
+    clock = FakeClock(datetime(2026, 5, 1, 8, 0))
+    service = _service(db, clock)
+    pending: dict[int, datetime] = {}
+    for _ in range(300):
+        op = rng.random()
+        if op < 0.5:
+            minutes = rng.randrange(1, 120)
+            pending[service.create_countdown("", minutes)] = clock.now + timedelta(minutes=minutes)
+        elif op < 0.7 and pending:
+            aid = rng.choice(list(pending))
+            service.cancel(aid)
+            del pending[aid]
+        else:
+            clock.advance(minutes=rng.randrange(20))
+            due = sorted((t, i) for i, t in pending.items() if t <= clock.now)
+            assert [a.id for a in service.fire_due()] == [i for _, i in due]
+            for _, i in due:
+                del pending[i]
+        expected = min(pending.values(), default=None)
+        assert service.next_fire_at() == expected
+
+
+def test_format_remaining():
+    now = datetime(2026, 5, 1, 8, 0)
+    assert format_remaining(now + timedelta(seconds=245.2), now) == "4:06"  # rounded up
+    assert format_remaining(now + timedelta(hours=1, minutes=2, seconds=3), now) == "1:02:03"
+    assert format_remaining(now + timedelta(days=2, hours=3, minutes=59), now) == "2天3小时"
+    assert format_remaining(now - timedelta(seconds=5), now) == "0:00"
@@ -0,0 +1,98 @@
+"""Tests for the cached, incrementally updated calendar layout."""
+
+import random
+from dataclasses import dataclass
+from datetime import date, timedelta
+
+from daily_event.services.calendar_service import CalendarService, MonthLayout
+
+GRID = date(2026, 2, 1)  # a Sunday
+
+
+@dataclass
+class _Ev:
+    id: int
+    start_date: date
+    end_date: date
+    title: str = "T"
+    color_index: int = 0
+
+
+def _color(index):
+    return f"#{index:06d}"
+
+
+def _slots(segments):
+    return {(s.event_id, s.row): s.slot for s in segments}
+
+
+def _assert_no_overlap(segments):
+    for a in segments:
+        for b in segments:
+            if a is not b and a.row == b.row and a.slot == b.slot:
+                assert a.end_col < b.start_col or b.end_col < a.start_col
+
+
+def _random_events(rng, n, first_id=1):
+    events = []
+    for i in range(n):
+        start = GRID + timedelta(days=rng.randrange(42))
+        events.append(_Ev(first_id + i, start, start + timedelta(days=rng.randrange(9))))
+    return events
+
+
+def test_fresh_layout_matches_assign_slots():
+    events = _random_events(random.Random(3), 40)
+    layout = MonthLayout(GRID)
+    layout.update(events, _color)
+    expected = []
+    for ev in events:
+        expected += CalendarService.split_range_to_segments(
+            ev.start_date, ev.end_date, GRID, _color(0), ev.id, ev.title
+        )
+    CalendarService.assign_slots(expected)
+    assert _slots(layout.segments) == _slots(expected)
+
+
+def test_incremental_edits_keep_other_slots():
+    rng = random.Random(7)
+    events = _random_events(rng, 30)
+    layout = MonthLayout(GRID)
+    layout.update(events, _color)
+    for step in range(50):
+        before = _slots(layout.segments)
+        victim = rng.randrange(len(events))
+        if step % 3 == 0:
+            events.pop(victim)
+        elif step % 3 == 1:
+            events += _random_events(rng, 1, first_id=100 + step)
+        else:
+            ev = events[victim]
+            events[victim] = _Ev(ev.id, ev.start_date + timedelta(days=1), ev.end_date + timedelta(days=2))
+        changed = {ev.id for ev in events} ^ {eid for eid, _ in before}
+        if step % 3 == 2:
+            changed.add(events[victim].id)
+        layout.update(events, _color)
+        after = _slots(layout.segments)
+        for key, slot in before.items():
+            if key[0] not in changed and key in after:
+                assert after[key] == slot
+        _assert_no_overlap(layout.segments)
+        assert {s.event_id for s in layout.segments} <= {ev.id for ev in events}
+
+
+def test_title_change_resplits_only_that_event():
+    events = [_Ev(1, date(2026, 2, 2), date(2026, 2, 10)), _Ev(2, date(2026, 2, 20), date(2026, 2, 20))]
+    layout = MonthLayout(GRID)
+    layout.update(events, _color)
+    events[1] = _Ev(2, date(2026, 2, 20), date(2026, 2, 20), title="新标题")
+    assert layout.update(events, _color) == {2}
+    assert [s.title for s in layout.segments if s.event_id == 2] == ["新标题"]
+
+
+def test_service_cache_by_version():
+    service = CalendarService()
+    events = [_Ev(1, date(2026, 2, 2), date(2026, 2, 3))]
+    first = service.layout(GRID, events, 1, _color)
+    assert service.layout(GRID, [], 1, _color) is first  # same version: untouched
+    assert service.layout(GRID, [], 2, _color) == []
@@ -1,5 +1,7 @@
 """Tests for work event date-range to calendar grid segment splitting."""
 
+import random
+from collections import defaultdict
 from datetime import date, timedelta
 
 from daily_event.services.calendar_service import CalendarService, EventSegment
@@ -100,3 +102,40 @@ def test_three_weeks_span():
         grid_start, "#000", 1, "T",
     )
     assert len(segs) == 3
+
+
+def _reference_slots(segments):
+    """The original linear-probe assignment, kept as an oracle."""
+    by_row = defaultdict(list)
+    for seg in segments:
+        by_row[seg.row].append(seg)
+    result = {}
+    for row_segs in by_row.values():
+        row_segs.sort(key=lambda s: (s.start_col, s.event_id))
+        occupied = []
+        for seg in row_segs:
+            used = {slot for end_col, slot in occupied if end_col >= seg.start_col}
+            slot = 0
+            while slot in used:
+                slot += 1
+            result[(seg.event_id, seg.row)] = slot
+            occupied.append((seg.end_col, slot))
+    return result
+
+
+def test_heap_slots_match_linear_probe():
+    rng = random.Random(11)
+    for _ in range(30):
+        segs = []
+        for i in range(rng.randrange(1, 80)):
+            start = rng.randrange(7)
+            segs.append(EventSegment(rng.randrange(6), start, rng.randrange(start, 7), "#000", i, "T"))
+        CalendarService.assign_slots(segs)
+        assert {(s.event_id, s.row): s.slot for s in segs} == _reference_slots(segs)
+
+
+def test_overflow_counts_per_cell():
+    segs = [EventSegment(0, 0, 2, "#000", i, "T") for i in range(5)]
+    CalendarService.assign_slots(segs)
+    assert CalendarService.overflow_counts(segs, 3) == {(0, 0): 2, (0, 1): 2, (0, 2): 2}
+    assert CalendarService.overflow_counts(segs, 0) == {}
@@ -0,0 +1,78 @@
+"""Tests for rolling completion-rate analytics."""
+
+import random
+from datetime import date, timedelta
+
+import pytest
+
+from daily_event.infra.database import Database
+from daily_event.services import analytics
+from daily_event.services.analytics import SPAN_DAYS, compute_trends
+from daily_event.services.daily_event_service import DailyEventService
+
+
+def _random_rows(seed: int, n: int = 20):
+    rng = random.Random(seed)
+    done_rows, due_rows = [], []
+    for _ in range(n):
+        due = [1 if rng.random() < rng.choice((0.0, 0.3, 1.0)) else 0 for _ in range(SPAN_DAYS)]
+        done = [d if rng.random() < 0.7 else 0 for d in due]
+        done_rows.append(done)
+        due_rows.append(due)
+    return done_rows, due_rows
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_numpy_matches_python(seed):
+    pytest.importorskip("numpy")
+    done_rows, due_rows = _random_rows(seed)
+    fast = compute_trends(done_rows, due_rows, use_numpy=True)
+    slow = compute_trends(done_rows, due_rows, use_numpy=False)
+    for a, b in zip(fast, slow):
+        assert a.rates == pytest.approx(b.rates)
+        assert a.sparkline == pytest.approx(b.sparkline)
+        assert a.week_over_week == pytest.approx(b.week_over_week)
+
+
+def test_rates_match_direct_count():
+    done_rows, due_rows = _random_rows(42, n=5)
+    for row, done, due in zip(compute_trends(done_rows, due_rows, use_numpy=False), done_rows, due_rows):
+        for win in analytics.RATE_WINDOWS:
+            n_due = sum(due[-win:])
+            expected = sum(done[-win:]) / n_due if n_due else None
+            assert row.rates[win] == pytest.approx(expected)
+        assert len(row.sparkline) == analytics.SPARKLINE_DAYS
+
+
+def test_completions_on_non_due_days_ignored():
+    due = [(SPAN_DAYS - k) % 2 for k in range(SPAN_DAYS)]  # every other day, today due
+    done = [1] * SPAN_DAYS
+    for use_numpy in {False, analytics.HAVE_NUMPY}:
+        row = compute_trends([done], [due], use_numpy=use_numpy)[0]
+        assert row.rates == {win: 1.0 for win in analytics.RATE_WINDOWS}
+        missed = done[:-2] + [0, 0]  # today and yesterday not done, one of them due
+        row = compute_trends([missed], [due], use_numpy=use_numpy)[0]
+        assert row.rates[7] == pytest.approx(3 / 4)  # 4 due days in the last week, 1 missed
+
+
+def test_short_rows_rejected():
+    with pytest.raises(ValueError):
+        compute_trends([[0] * 10], [[1] * 10])
+
+
+def test_service_trends_and_cache(tmp_path):
+    service = DailyEventService(Database(str(tmp_path / "test.db")))
+    today = date.today()
+    eid = service.create("跑步")
+    for k in range(7):
+        if k % 2 == 0:
+            service.complete_today(eid, today - timedelta(k))
+
+    trend = service.get_trends(today)[eid]
+    # Created today: only today is due, and it is done.
+    assert trend.rate_7 == 1.0 and trend.rate_90 == 1.0
+    assert trend.week_over_week is None
+    assert service.get_trends(today) is service.get_trends(today)
+
+    service.uncomplete_today(eid, today)
+    assert service.get_trends(today)[eid].rate_7 == 0.0
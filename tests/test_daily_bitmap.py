@@ -0,0 +1,99 @@
+"""Tests for bitmap completion storage — bit ops, storage modes, migration."""
+
+import random
+from datetime import date, timedelta
+
+import pytest
+
+from daily_event.infra.database import Database
+from daily_event.services.completion_bitmap import CompletionBitmap, encode_dates, set_day
+from daily_event.services.daily_event_service import DailyEventService, calc_streak
+
+
+def test_bitmap_membership_and_total_across_years():
+    dates = {date(2025, 12, 30), date(2025, 12, 31), date(2026, 1, 1), date(2028, 12, 31)}
+    bm = CompletionBitmap.from_dates(dates)
+    assert len(bm) == 4
+    assert bm.to_set() == dates
+    assert date(2026, 1, 2) not in bm
+    assert bm.last() == date(2028, 12, 31)
+
+
+def test_bitmap_streak_crosses_year_boundary():
+    today = date(2026, 1, 3)
+    dates = {today - timedelta(i) for i in range(10)}
+    bm = CompletionBitmap.from_dates(dates)
+    assert bm.run_ending_at(today) == 10
+    assert calc_streak(bm, today) == (10, 10)
+
+
+def test_bitmap_matches_set_streak_randomized():
+    rng = random.Random(7)
+    today = date(2026, 2, 27)
+    for _ in range(200):
+        dates = {today - timedelta(rng.randrange(60)) for _ in range(rng.randrange(40))}
+        assert calc_streak(CompletionBitmap.from_dates(dates), today) == calc_streak(dates, today)
+
+
+def test_bitmap_count_between():
+    dates = {date(2026, 3, d) for d in (1, 2, 5, 31)}
+    bm = CompletionBitmap.from_dates(dates)
+    assert bm.count_between(date(2026, 3, 2), date(2026, 3, 30)) == 2
+    assert bm.count_between(date(2020, 1, 1), date(2030, 1, 1)) == 4
+    assert bm.count_between(date(2026, 4, 1), date(2026, 3, 1)) == 0
+
+
+def test_set_day_clears_bit():
+    blob = encode_dates([date(2026, 5, 1)])[2026]
+    assert set_day(blob, date(2026, 5, 1), False) == bytes(len(blob))
+
+
+@pytest.mark.parametrize("storage", ["bitmap", "verify"])
+def test_service_storage_modes(tmp_path, storage):
+    service = DailyEventService(Database(str(tmp_path / "test.db")), storage=storage)
+    today = date(2026, 2, 27)
+    eid = service.create("阅读")
+    for i in range(1, 4):
+        service.complete_today(eid, today - timedelta(i))
+    visible = service.get_visible(today)
+    assert visible == [(eid, "阅读", 3)]
+
+    service.complete_today(eid, today)
+    assert service.get_visible(today) == []
+    service.uncomplete_today(eid, today)
+    assert service.get_visible(today)[0][2] == 3
+    assert service.verify_mismatches == 0
+
+
+def test_sync_storage_round_trip(tmp_path):
+    path = str(tmp_path / "test.db")
+    today = date(2026, 2, 27)
+    rows = DailyEventService(Database(path))
+    eid = rows.create("冥想")
+    for i in range(5):
+        rows.complete_today(eid, today - timedelta(i))
+    before = rows.get_visible(today + timedelta(days=1))
+
+    bitmap = DailyEventService(Database(path), storage="bitmap")
+    assert bitmap.sync_storage() == 5
+    assert bitmap.get_visible(today + timedelta(days=1)) == before
+
+    back = DailyEventService(Database(path), storage="rows")
+    assert back.sync_storage() == 5
+    assert back.get_visible(today + timedelta(days=1)) == before
+
+
+def test_verify_mode_reports_mismatch(tmp_path):
+    path = str(tmp_path / "test.db")
+    today = date(2026, 2, 27)
+    rows = DailyEventService(Database(path))
+    eid = rows.create("健身")
+    rows.complete_today(eid, today)
+
+    verify = DailyEventService(Database(path), storage="verify")
+    verify.get_visible(today)
+    assert verify.verify_mismatches == 1
+    verify.sync_storage()
+    verify.verify_mismatches = 0
+    verify.get_visible(today)
+    assert verify.verify_mismatches == 0
@@ -0,0 +1,77 @@
+"""Tests for the versioned read cache in DailyEventService."""
+
+from datetime import date, timedelta
+
+import pytest
+
+from daily_event.infra.database import Database
+from daily_event.services.daily_event_service import DailyEventService
+
+TODAY = date.today()
+
+
+@pytest.fixture
+def service(tmp_path):
+    return DailyEventService(Database(str(tmp_path / "test.db")))
+
+
+def test_repeat_reads_hit_cache_without_sqlite(service, monkeypatch):
+    eid = service.create("读书")
+    first = service.get_visible(TODAY)
+    service.get_all_stats(TODAY)
+    assert service.cache_misses == 2
+
+    def fail():
+        raise AssertionError("database touched on a cache hit")
+
+    monkeypatch.setattr(service._db, "session_scope", fail)
+    assert service.get_visible(TODAY) == first == [(eid, "读书", 0)]
+    assert service.get_all_stats(TODAY)[0].event_id == eid
+    assert service.cache_hits == 2 and service.cache_misses == 2
+
+
+@pytest.mark.parametrize(
+    "write",
+    [
+        lambda s, eid: s.create("新"),
+        lambda s, eid: s.delete(eid),
+        lambda s, eid: s.complete_today(eid, TODAY),
+        lambda s, eid: s.uncomplete_today(eid, TODAY),
+        lambda s, eid: s.set_recurrence_rule(eid, "weekly"),
+    ],
+    ids=["create", "delete", "complete", "uncomplete", "set_rule"],
+)
+def test_every_write_invalidates(service, write):
+    eid = service.create("跑步")
+    service.complete_today(eid, TODAY - timedelta(days=1))
+    service.get_visible(TODAY)
+    service.get_all_stats(TODAY)
+    version = service.data_version
+
+    write(service, eid)
+
+    assert service.data_version > version
+    misses = service.cache_misses
+    assert service.get_visible(TODAY) == DailyEventService._compute_visible(service, TODAY)
+    assert service.get_all_stats(TODAY) == DailyEventService._compute_stats(service, TODAY)
+    assert service.cache_misses == misses + 2
+
+
+def test_complete_then_uncomplete_round_trip(service):
+    eid = service.create("冥想")
+    assert [i[0] for i in service.get_visible(TODAY)] == [eid]
+    service.complete_today(eid, TODAY)
+    assert service.get_visible(TODAY) == []
+    assert service.get_all_stats(TODAY)[0].total_done == 1
+    service.uncomplete_today(eid, TODAY)
+    assert [i[0] for i in service.get_visible(TODAY)] == [eid]
+    assert service.get_all_stats(TODAY)[0].total_done == 0
+
+
+def test_date_change_misses(service):
+    eid = service.create("喝水")
+    service.complete_today(eid, TODAY)
+    assert service.get_visible(TODAY) == []
+    tomorrow = TODAY + timedelta(days=1)
+    assert [i[0] for i in service.get_visible(tomorrow)] == [eid]
+    assert service.cache_misses == 2 and service.cache_hits == 0
@@ -0,0 +1,33 @@
+"""Tests for the per-event completion heatmap query."""
+
+from datetime import date, timedelta
+
+import pytest
+
+from daily_event.infra.database import Database
+from daily_event.services.daily_event_service import DailyEventService
+
+
+@pytest.mark.parametrize("storage", ["rows", "bitmap"])
+def test_heatmap_window_and_counts(tmp_path, storage):
+    service = DailyEventService(Database(str(tmp_path / "test.db")), storage=storage)
+    today = date(2026, 1, 10)
+    a = service.create("A")
+    b = service.create("B")
+    for d in (today, today - timedelta(5), today - timedelta(364), today - timedelta(365)):
+        service.complete_today(a, d)
+    service.complete_today(b, today - timedelta(1))
+
+    maps = {h.event_id: h for h in service.get_heatmaps(today)}
+    assert maps[a].start == today - timedelta(364)
+    assert len(maps[a].counts) == 365
+    assert sum(maps[a].counts) == 3  # the 365-days-ago completion falls outside
+    assert maps[a].counts[0] == 1 and maps[a].counts[-1] == 1
+    assert maps[b].counts[-2] == 1 and sum(maps[b].counts) == 1
+
+
+def test_heatmap_includes_events_without_completions(tmp_path):
+    service = DailyEventService(Database(str(tmp_path / "test.db")))
+    eid = service.create("新习惯")
+    [h] = service.get_heatmaps(date(2026, 3, 1), days=30)
+    assert h.event_id == eid and h.counts == [0] * 30
@@ -0,0 +1,62 @@
+"""Tests for local-midnight arithmetic and day-change detection."""
+
+import os
+import time
+from datetime import date, datetime, timedelta
+
+import pytest
+
+from daily_event.services.day_boundary import (
+    ROLLOVER_SLACK_MS,
+    DayTracker,
+    ms_until_next_midnight,
+)
+
+
+def test_ms_until_midnight_plain_day():
+    now = datetime(2026, 3, 1, 23, 59, 0)
+    assert ms_until_next_midnight(now) == 60_000 + ROLLOVER_SLACK_MS
+
+
+def test_ms_until_midnight_at_midnight_is_full_day():
+    now = datetime(2026, 1, 15, 0, 0, 0)
+    assert ms_until_next_midnight(now) == 24 * 3600 * 1000 + ROLLOVER_SLACK_MS
+
+
+@pytest.fixture
+def berlin_tz():
+    if not hasattr(time, "tzset"):
+        pytest.skip("time.tzset unavailable on this platform")
+    old = os.environ.get("TZ")
+    os.environ["TZ"] = "Europe/Berlin"
+    time.tzset()
+    yield
+    if old is None:
+        del os.environ["TZ"]
+    else:
+        os.environ["TZ"] = old
+    time.tzset()
+
+
+def test_ms_until_midnight_across_dst(berlin_tz):
+    # 2026-03-29: clocks jump 02:00 -> 03:00, so that day has 23 hours.
+    assert ms_until_next_midnight(datetime(2026, 3, 29, 0, 0)) == 23 * 3600 * 1000 + ROLLOVER_SLACK_MS
+    # 2026-10-25: clocks fall back 03:00 -> 02:00, 25 hours.
+    assert ms_until_next_midnight(datetime(2026, 10, 25, 0, 0)) == 25 * 3600 * 1000 + ROLLOVER_SLACK_MS
+
+
+def test_tracker_reports_each_change_once():
+    clock = [date(2026, 5, 1)]
+    tracker = DayTracker(lambda: clock[0])
+    assert tracker.check() is None
+    clock[0] += timedelta(days=1)
+    assert tracker.check() == date(2026, 5, 2)
+    assert tracker.check() is None
+    assert tracker.current == date(2026, 5, 2)
+
+
+def test_tracker_follows_clock_set_backwards():
+    clock = [date(2026, 5, 2)]
+    tracker = DayTracker(lambda: clock[0])
+    clock[0] = date(2026, 5, 1)
+    assert tracker.check() == date(2026, 5, 1)
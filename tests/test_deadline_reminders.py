@@ -0,0 +1,133 @@
+"""Tests for Work Event deadline reminders (simulated clock)."""
+
+from datetime import date, datetime, time, timedelta
+
+import pytest
+from sqlalchemy import text
+
+from daily_event.infra.color_allocator import ColorAllocator
+from daily_event.infra.database import CURRENT_SCHEMA_VERSION, Database
+from daily_event.services.deadline_reminders import DeadlineReminders, parse_remind_at
+from daily_event.services.work_event_service import WorkEventService
+from tests.conftest import FakeClock, FakeNotification
+
+
+@pytest.fixture
+def service(db):
+    svc = WorkEventService(db, ColorAllocator())
+    yield svc
+    svc.shutdown()
+
+
+def _reminders(service, now, **kwargs):
+    clock, notification = FakeClock(now), FakeNotification()
+    return DeadlineReminders(service._db, notification, clock=clock, **kwargs), clock, notification
+
+
+def test_plans_day_before_and_morning_of(service):
+    today = date(2026, 6, 10)
+    due_today = service.create("今天", today - timedelta(days=3), today)
+    due_tomorrow = service.create("明天", today, today + timedelta(days=1))
+    service.create("后天", today, today + timedelta(days=2))
+    done = service.create("已完成", today, today)
+    service.set_completed(done, True)
+
+    reminders, clock, notification = _reminders(service, datetime(2026, 6, 10, 7, 30))
+    planned = reminders.plan()
+    assert [(r.event_id, r.days_left) for r in planned] == [(due_today, 0), (due_tomorrow, 1)]
+    assert reminders.next_fire_at() == datetime(2026, 6, 10, 9, 0)
+    assert reminders.ms_until_next() == 90 * 60 * 1000
+    clock.advance(microseconds=500)
+    assert reminders.ms_until_next() == 90 * 60 * 1000  # rounded up: the timer never fires early
+    clock.advance(microseconds=-500)
+
+    assert reminders.fire_due() == []
+    clock.advance(minutes=90)
+    assert len(reminders.fire_due()) == 2
+    assert notification.sent == [("截止提醒（2 项）", "「今天」今天截止\n「明天」明天截止")]
+    assert reminders.next_fire_at() is None and reminders.ms_until_next() is None
+
+
+def test_late_start_catches_up_and_never_repeats(service):
+    today = date(2026, 6, 10)
+    eid = service.create("报告", today, today + timedelta(days=1))
+    reminders, clock, notification = _reminders(service, datetime(2026, 6, 10, 15, 0))
+    reminders.sync(service.data_version)
+    assert reminders.ms_until_next() == 0
+    assert [r.event_id for r in reminders.fire_due()] == [eid]
+
+    # An unrelated write re-plans, but the sent reminder stays sent.
+    service.create("新任务", today, today + timedelta(days=5))
+    assert reminders.sync(service.data_version)
+    assert reminders.pending == []
+    assert not reminders.sync(service.data_version)
+
+    # Next morning the same event gets its "morning of" reminder.
+    clock.advance(hours=18)
+    assert reminders.sync(service.data_version)
+    assert reminders.planned_day == date(2026, 6, 11)
+    assert [r.days_left for r in reminders.pending] == [0]
+    assert reminders.fire_due()
+    assert notification.sent[-1] == ("截止提醒", "「报告」今天截止")
+
+
+def test_sent_reminders_survive_restart(service):
+    today = date(2026, 6, 10)
+    eid = service.create("周报", today, today + timedelta(days=1))
+    reminders, _, notification = _reminders(service, datetime(2026, 6, 10, 9, 5))
+    reminders.plan()
+    assert [r.event_id for r in reminders.fire_due()] == [eid]
+
+    # The app restarts after remind_at: nothing is sent again that day.
+    restarted, clock, notification = _reminders(service, datetime(2026, 6, 10, 11, 0))
+    assert restarted.plan() == []
+    assert restarted.fire_due() == [] and notification.sent == []
+
+    # The next day's reminder is new, and the past deadline's rows are pruned.
+    restarted, clock, notification = _reminders(service, datetime(2026, 6, 12, 9, 0))
+    restarted.plan()
+    with service._db.session_scope() as session:
+        assert session.execute(text("SELECT COUNT(*) FROM deadline_reminders_sent")).scalar() == 0
+
+
+def test_query_runs_once_per_day_and_version(service):
+    today = date(2026, 6, 10)
+    eid = service.create("评审", today, today + timedelta(days=3))
+    reminders, clock, _ = _reminders(
+        service, datetime(2026, 6, 10, 8, 0), days_before=[3, 0], remind_at=time(8, 30)
+    )
+    for _ in range(5):
+        reminders.sync(service.data_version)
+    assert reminders.queries == 1
+    assert [(r.days_left, r.fire_at) for r in reminders.pending] == [(3, datetime(2026, 6, 10, 8, 30))]
+
+    service.set_completed(eid, True)
+    reminders.sync(service.data_version)
+    assert reminders.queries == 2 and reminders.pending == []
+
+    clock.advance(days=1)
+    reminders.sync(service.data_version)
+    assert reminders.queries == 3
+
+
+def test_deadline_query_uses_index_and_migrates_from_v7(tmp_path):
+    path = str(tmp_path / "test.db")
+    with Database(path).session_scope() as session:
+        session.execute(text("DROP INDEX ix_work_events_deadline"))
+        session.execute(text("UPDATE schema_version SET version = 7"))
+
+    db = Database(path)
+    with db.session_scope() as session:
+        assert session.execute(text("SELECT version FROM schema_version")).scalar() == CURRENT_SCHEMA_VERSION
+        plan = " ".join(
+            row[-1]
+            for row in session.execute(
+                text(
+                    "EXPLAIN QUERY PLAN SELECT id FROM work_events "
+                    "WHERE is_completed = 0 AND end_date IN ('2026-06-10', '2026-06-11')"
+                )
+            )
+        )
+    assert "ix_work_events_deadline" in plan
+    assert parse_remind_at("7:05") == time(7, 5)
+    assert parse_remind_at("soon") == time(9, 0)
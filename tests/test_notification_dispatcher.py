@@ -0,0 +1,114 @@
+"""Tests for the background notification dispatcher and burst coalescing."""
+
+import threading
+from datetime import datetime, timedelta
+
+from sqlalchemy import event as sa_event
+
+from daily_event.infra.database import Database
+from daily_event.infra.notification_dispatcher import NotificationDispatcher, coalesce
+from daily_event.services.alarm_service import AlarmService
+from tests.conftest import FakeSound
+
+
+class GatedNotification:
+    """Backend whose ``prewarm`` holds the worker until released; records threads."""
+
+    def __init__(self) -> None:
+        self.entered = threading.Event()
+        self.release = threading.Event()
+        self.sent: list[tuple[str, str]] = []
+        self.threads: set[str] = set()
+        self.prewarmed = False
+
+    def prewarm(self) -> None:
+        self.entered.set()
+        self.release.wait(5)
+        self.prewarmed = True
+        self.threads.add(threading.current_thread().name)
+
+    def notify(self, title: str, message: str) -> None:
+        self.sent.append((title, message))
+        self.threads.add(threading.current_thread().name)
+
+
+def test_coalesce():
+    assert coalesce([("a", "1")]) == [("a", "1")]
+    merged = coalesce([("闹钟提醒", f"闹钟 {i}") for i in range(7)] + [("截止提醒", "x")])
+    assert merged[0][0] == "闹钟提醒（7 项）"
+    assert merged[0][1].splitlines() == [f"闹钟 {i}" for i in range(5)] + ["…等 7 项"]
+    assert merged[1] == ("截止提醒", "x")
+
+
+def test_burst_is_enqueued_fast_and_sent_once():
+    backend, sound = GatedNotification(), FakeSound()
+    dispatcher = NotificationDispatcher(backend, sound, window=0.1)
+    dispatcher.prewarm()
+    assert backend.entered.wait(5)  # the worker is busy until released
+
+    for i in range(30):
+        dispatcher.notify("闹钟提醒", f"闹钟 {i}")
+        dispatcher.play_alarm()
+    assert backend.sent == [] and sound.played == 0  # callers only enqueued
+    backend.release.set()
+    assert dispatcher.flush(timeout=5)
+
+    assert backend.prewarmed
+    assert len(backend.sent) == 1 and backend.sent[0][0] == "闹钟提醒（30 项）"
+    assert sound.played == 1
+    assert backend.threads == {"notification-dispatcher"}
+
+    dispatcher.notify("截止提醒", "later")  # a new burst after the window
+    assert dispatcher.flush(timeout=5)
+    assert backend.sent[-1] == ("截止提醒", "later")
+    dispatcher.shutdown()
+
+
+def test_failing_backend_does_not_stop_the_worker(caplog):
+    class Broken:
+        def notify(self, title: str, message: str) -> None:
+            if title == "坏":
+                raise OSError("toast backend gone")
+            sent.append(title)
+
+        def play_alarm(self) -> None:
+            raise OSError("no audio device")
+
+    def explode() -> None:
+        raise RuntimeError("boom")
+
+    sent: list[str] = []
+    dispatcher = NotificationDispatcher(Broken(), Broken(), window=0)
+    dispatcher.notify("坏", "x")
+    dispatcher.notify("好", "y")
+    dispatcher.play_alarm()
+    dispatcher._put(explode)
+    assert dispatcher.flush(timeout=5)
+    dispatcher.notify("之后", "z")
+    assert dispatcher.flush(timeout=5)
+    assert "之后" in sent and "好" in sent
+    assert len([r for r in caplog.records if r.levelname == "ERROR"]) == 3
+    dispatcher.shutdown()
+
+
+def test_alarms_notify_after_the_transaction(tmp_path):
+    db = Database(str(tmp_path / "test.db"))
+    log: list[str] = []
+    sa_event.listen(db._engine, "commit", lambda conn: log.append("commit"))
+
+    class Recorder:
+        def notify(self, title: str, message: str) -> None:
+            log.append("notify")
+
+        def play_alarm(self) -> None:
+            log.append("sound")
+
+    now = datetime(2026, 5, 1, 8, 0)
+    service = AlarmService(db, Recorder(), Recorder(), clock=lambda: now)
+    for _ in range(3):
+        service.create_countdown("", 1)
+    service.next_fire_at()
+    now += timedelta(minutes=1)
+    log.clear()
+    assert len(service.fire_due()) == 3
+    assert log == ["commit", "notify", "notify", "notify", "sound"]
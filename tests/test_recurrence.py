@@ -0,0 +1,124 @@
+"""Tests for the recurrence engine — parsing, due checks and bulk expansion."""
+
+import random
+from datetime import date, timedelta
+
+import pytest
+
+from daily_event.services.daily_event_service import RECURRENCE_RULE_OPTIONS
+from daily_event.services.recurrence import (
+    compile_rule,
+    describe_rule,
+    format_rule,
+    is_valid_rule,
+    parse_rule,
+)
+
+RULES = [
+    "daily",
+    "workday",
+    "weekend",
+    "every_2_days",
+    "every_3_days",
+    "weekly",
+    "weekdays:0,2,4",
+    "every:5d",
+    "every:2w",
+    "every:3w:1,4",
+    "monthly:31",
+    "monthly:2:0",
+    "monthly:-1:4",
+    "weekdays:0,1,2,3,4;except=2026-03-02,2026-03-03",
+]
+
+
+def _legacy_is_due(rule, created_at, today):
+    """The original hard-coded implementation, kept as an oracle."""
+    if rule == "workday":
+        return today.weekday() < 5
+    if rule == "weekend":
+        return today.weekday() >= 5
+    if rule == "every_2_days":
+        return (today - created_at).days % 2 == 0
+    if rule == "every_3_days":
+        return (today - created_at).days % 3 == 0
+    if rule == "weekly":
+        return (today - created_at).days % 7 == 0
+    return True
+
+
+def test_legacy_options_still_valid_and_equivalent():
+    created = date(2026, 2, 11)
+    for rule, _ in RECURRENCE_RULE_OPTIONS[:6]:
+        compiled = compile_rule(rule, created)
+        for k in range(-30, 60):
+            d = created + timedelta(k)
+            assert compiled.is_due(d) == _legacy_is_due(rule, created, d), (rule, d)
+
+
+@pytest.mark.parametrize("rule", RULES)
+def test_bulk_expansion_matches_per_day_check(rule):
+    anchor = date(2026, 1, 14)
+    compiled = compile_rule(rule, anchor)
+    start, end = date(2025, 11, 20), date(2026, 6, 3)
+    brute = [
+        start + timedelta(k)
+        for k in range((end - start).days + 1)
+        if compiled.is_due(start + timedelta(k))
+    ]
+    assert compiled.due_dates(start, end) == brute
+
+
+@pytest.mark.parametrize("rule", RULES)
+def test_next_and_prev_due(rule):
+    rng = random.Random(rule)
+    compiled = compile_rule(rule, date(2026, 1, 14))
+    for _ in range(100):
+        d = date(2026, 1, 1) + timedelta(rng.randrange(365))
+        nxt = compiled.next_due(d)
+        prv = compiled.prev_due(d)
+        assert nxt >= d and compiled.is_due(nxt)
+        assert prv <= d and compiled.is_due(prv)
+        assert compiled.due_dates(prv, nxt)[0] == prv
+        inner = compiled.due_dates(prv + timedelta(1), nxt - timedelta(1))
+        assert inner == [] or prv == nxt
+
+
+def test_monthly_rules():
+    by_day = compile_rule("monthly:31", date(2026, 1, 1))
+    assert by_day.due_dates(date(2026, 1, 1), date(2026, 4, 30)) == [
+        date(2026, 1, 31), date(2026, 2, 28), date(2026, 3, 31), date(2026, 4, 30),
+    ]
+    last_friday = compile_rule("monthly:-1:4", date(2026, 1, 1))
+    assert last_friday.next_due(date(2026, 3, 1)) == date(2026, 3, 27)
+    second_monday = compile_rule("monthly:2:0", date(2026, 1, 1))
+    assert second_monday.prev_due(date(2026, 3, 8)) == date(2026, 2, 9)
+
+
+def test_every_n_weeks_with_weekdays():
+    compiled = compile_rule("every:2w:0,3", date(2026, 3, 4))  # a Wednesday
+    assert compiled.due_dates(date(2026, 3, 1), date(2026, 3, 31)) == [
+        date(2026, 3, 2), date(2026, 3, 5), date(2026, 3, 16), date(2026, 3, 19),
+        date(2026, 3, 30),
+    ]
+
+
+def test_exclusions_are_skipped():
+    compiled = compile_rule("daily;except=2026-03-02", date(2026, 1, 1))
+    assert not compiled.is_due(date(2026, 3, 2))
+    assert compiled.next_due(date(2026, 3, 2)) == date(2026, 3, 3)
+    assert compiled.prev_due(date(2026, 3, 2)) == date(2026, 3, 1)
+
+
+def test_parse_format_round_trip_and_validation():
+    for rule in RULES[6:]:
+        assert format_rule(parse_rule(rule)) == rule
+    for bad in ("", "hourly", "weekdays:7", "every:0d", "monthly:5:9", "daily;except=x"):
+        assert not is_valid_rule(bad)
+    assert describe_rule("weekdays:0,2,4") == "每周一、周三、周五"
+    assert describe_rule("monthly:-1:4") == "每月最后一个周五"
+
+
+def test_full_year_expansion_count():
+    compiled = compile_rule("weekdays:0,2,4", date(2026, 1, 1))
+    assert len(compiled.due_dates(date(2026, 1, 1), date(2026, 12, 31))) == 156
@@ -0,0 +1,115 @@
+"""Tests for recurrence-aware streaks — jump walk vs. a day-by-day oracle."""
+
+import random
+from datetime import date, timedelta
+
+import pytest
+
+from daily_event.infra.database import Database
+from daily_event.services.completion_bitmap import CompletionBitmap
+from daily_event.services.daily_event_service import (
+    DailyEventService,
+    calc_recurring_streak,
+    calc_streak,
+)
+from daily_event.services.recurrence import compile_rule
+
+RULES = [
+    "daily",
+    "workday",
+    "weekend",
+    "every_2_days",
+    "every_3_days",
+    "weekly",
+    "weekdays:1,3",
+    "every:2w:0,4",
+    "monthly:10",
+    "monthly:-1:6",
+    "daily;except=2026-02-20,2026-02-21",
+]
+
+
+def _oracle(completed, rule, today, grace):
+    """Scan every calendar day backwards from *today*; no jumping."""
+    horizon = min(completed) - timedelta(days=40) if completed else today
+    due_days = []
+    d = today
+    while d >= horizon:
+        if rule.is_due(d):
+            due_days.append(d)
+        d -= timedelta(days=1)
+
+    streak = 0
+    following = rule.next_due(today + timedelta(days=1))
+    for i, due in enumerate(due_days):
+        nxt = due_days[i - 1] if i else following
+        window = [due + timedelta(k) for k in range(grace + 1)]
+        window = [w for w in window if nxt is None or w < nxt]
+        done = any(w in completed for w in window)
+        if i == 0 and not done and today <= due + timedelta(days=grace):
+            continue
+        if not done:
+            break
+        streak += 1
+    return streak, len(completed)
+
+
+@pytest.mark.parametrize("rule_text", RULES)
+def test_matches_bruteforce_oracle(rule_text):
+    rng = random.Random(rule_text)
+    for _ in range(150):
+        anchor = date(2026, 1, 1) + timedelta(rng.randrange(30))
+        today = date(2026, 3, 1) + timedelta(rng.randrange(60))
+        rule = compile_rule(rule_text, anchor)
+        grace = rng.choice([0, 0, 1, 2])
+        density = rng.random()
+        completed = {
+            today - timedelta(k) for k in range(rng.randrange(1, 120)) if rng.random() < density
+        }
+        expected = _oracle(completed, rule, today, grace)
+        assert calc_recurring_streak(completed, rule, today, grace) == expected
+        bitmap = CompletionBitmap.from_dates(completed)
+        assert calc_recurring_streak(bitmap, rule, today, grace) == expected
+
+
+def test_daily_rule_matches_calc_streak():
+    rule = compile_rule("daily", date(2026, 1, 1))
+    today = date(2026, 2, 27)
+    dates = {today - timedelta(1), today - timedelta(2), today - timedelta(4)}
+    assert calc_recurring_streak(dates, rule, today) == calc_streak(dates, today) == (2, 3)
+
+
+def test_weekly_streak_counts_weeks():
+    anchor = date(2026, 1, 2)  # Friday
+    rule = compile_rule("weekly", anchor)
+    fridays = {anchor + timedelta(weeks=k) for k in range(6)}
+    today = anchor + timedelta(weeks=5, days=3)
+    assert calc_recurring_streak(fridays, rule, today) == (6, 6)
+
+
+def test_grace_days_accept_late_completion():
+    anchor = date(2026, 1, 5)  # Monday
+    rule = compile_rule("every_3_days", anchor)
+    late = {date(2026, 1, 6), date(2026, 1, 8), date(2026, 1, 11)}
+    today = date(2026, 1, 11)
+    assert calc_recurring_streak(late, rule, today, grace_days=0)[0] == 2
+    assert calc_recurring_streak(late, rule, today, grace_days=1)[0] == 3
+
+
+def test_pending_due_date_does_not_break_streak():
+    anchor = date(2026, 1, 1)
+    rule = compile_rule("every_2_days", anchor)
+    done = {date(2026, 1, 1), date(2026, 1, 3)}
+    assert calc_recurring_streak(done, rule, date(2026, 1, 4))[0] == 2
+    assert calc_recurring_streak(done, rule, date(2026, 1, 5))[0] == 2  # Jan 5 still open
+    assert calc_recurring_streak(done, rule, date(2026, 1, 6))[0] == 0  # Jan 5 missed
+
+
+def test_service_streak_respects_recurrence(tmp_path):
+    service = DailyEventService(Database(str(tmp_path / "test.db")))
+    eid = service.create("周报", recurrence_rule="weekdays:0")
+    mondays = [date(2026, 2, 2), date(2026, 2, 9), date(2026, 2, 16)]
+    for d in mondays:
+        service.complete_today(eid, d)
+    today = date(2026, 2, 23)
+    assert service.get_visible(today) == [(eid, "周报", 3)]
@@ -0,0 +1,37 @@
+"""Randomized equivalence of batch segment splitting with the per-event function."""
+
+import random
+from datetime import date, timedelta
+
+import pytest
+
+from daily_event.services.calendar_service import CalendarService
+
+
+def _reference(starts, ends, ids, grid_start):
+    out = []
+    for s, e, eid in zip(starts, ends, ids):
+        for seg in CalendarService.split_range_to_segments(
+            date.fromordinal(s), date.fromordinal(e), grid_start, "#000", eid, "T"
+        ):
+            out.append((seg.row, seg.start_col, seg.end_col, seg.event_id))
+    return out
+
+
+@pytest.mark.parametrize("use_numpy", [False, True], ids=["python", "numpy"])
+@pytest.mark.parametrize("seed", range(20))
+def test_batch_matches_per_event(seed, use_numpy):
+    if use_numpy:
+        pytest.importorskip("numpy")
+    rng = random.Random(seed)
+    grid_start = date(2026, 1, 4) + timedelta(weeks=rng.randrange(-200, 200))
+    g0 = grid_start.toordinal()
+    starts, ends, ids = [], [], []
+    for i in range(rng.randrange(0, 300)):
+        s = g0 + rng.randrange(-60, 80)
+        e = s + rng.randrange(-3, 70)  # includes reversed and grid-spanning ranges
+        starts.append(s)
+        ends.append(e)
+        ids.append(i)
+    got = CalendarService.split_ranges_batch(starts, ends, ids, grid_start, use_numpy=use_numpy)
+    assert list(got.spans()) == _reference(starts, ends, ids, grid_start)
@@ -0,0 +1,126 @@
+"""Tests for archiving old completed Work Events into the cold table."""
+
+from datetime import date, datetime, timedelta
+
+import pytest
+from sqlalchemy import func, select, text
+
+from daily_event.domain.models import WorkEvent, WorkEventArchive, WorkEventTag, WorkSubtask
+from daily_event.infra.color_allocator import ColorAllocator
+from daily_event.infra.database import CURRENT_SCHEMA_VERSION, Database
+from daily_event.services.work_archive import WorkArchiver
+from daily_event.services.work_event_service import WorkEventService
+
+NOW = datetime(2026, 10, 1, 12, 0)
+
+
+@pytest.fixture
+def service(db):
+    svc = WorkEventService(db, ColorAllocator())
+    yield svc
+    svc.shutdown()
+
+
+def _completed(db, days_ago):
+    """Insert completed events with the given completion ages; returns their ids."""
+    with db.session_scope() as session:
+        events = [
+            WorkEvent(
+                title=f"任务 {i}",
+                start_date=date(2026, 1, 1),
+                end_date=date(2026, 1, 2),
+                is_completed=True,
+                completed_at=NOW - timedelta(days=d, minutes=i),
+            )
+            for i, d in enumerate(days_ago)
+        ]
+        session.add_all(events)
+        session.flush()
+        return [ev.id for ev in events]
+
+
+def _count(db, model):
+    with db.session_scope() as session:
+        return session.execute(select(func.count()).select_from(model)).scalar()
+
+
+def test_batches_move_only_old_completed_events(db, service):
+    _completed(db, [200] * 5 + [100] * 3 + [10] * 4)
+    service.create("进行中", date(2026, 1, 1), date(2026, 1, 2))
+    archiver = WorkArchiver(db, older_than_days=90, batch_size=3, clock=lambda: NOW)
+
+    assert archiver.pending() == 8
+    assert archiver.archive_batch() == 3
+    assert archiver.archive_all() == 5
+    assert archiver.archive_batch() == 0
+    assert _count(db, WorkEventArchive) == 8
+    assert _count(db, WorkEvent) == 5
+    with db.session_scope() as session:
+        archived = session.execute(select(WorkEventArchive)).scalars().all()
+    assert all(ev.archived_at == NOW and ev.completed_at < NOW - timedelta(days=90) for ev in archived)
+
+    assert WorkArchiver(db, older_than_days=0, clock=lambda: NOW).archive_batch() == 0
+
+
+def test_history_pages_span_both_tables(db, service):
+    ids = _completed(db, [i * 20 for i in range(12)])
+    WorkArchiver(db, older_than_days=90, clock=lambda: NOW).archive_all()
+    assert 0 < _count(db, WorkEventArchive) < 12
+
+    seen, cursor = [], None
+    while True:
+        batch = service.get_history_page(limit=5, cursor=cursor)
+        seen.extend(ev.id for ev in batch.events)
+        if batch.next_cursor is None:
+            break
+        cursor = batch.next_cursor
+    assert seen == ids  # newest completion first, no gaps or repeats
+    assert [ev.id for ev in service.get_history()] == ids
+
+    since = (NOW - timedelta(days=130)).date()
+    until = (NOW - timedelta(days=50)).date()
+    window = service.get_history_page(since=since, until=until).events
+    assert [ev.id for ev in window] == ids[3:7]
+    assert [ev.id for ev in service.get_history_page(text="任务 11").events] == [ids[11]]
+
+
+def test_ids_are_not_reused_and_archived_events_delete(db, service):
+    eid = service.create("归档", date(2026, 1, 1), date(2026, 1, 1), tags=["内部"], subtasks=[("a", True)])
+    service.set_completed(eid, True)
+    with db.session_scope() as session:
+        session.get(WorkEvent, eid).completed_at = NOW - timedelta(days=365)
+    assert WorkArchiver(db, clock=lambda: NOW).archive_all() == 1
+
+    assert service.create("新建", date(2026, 1, 1), date(2026, 1, 1)) > eid
+    assert service.get_tags(eid) == ["内部"]
+    service.delete(eid)
+    assert _count(db, WorkEventArchive) == 0
+    assert _count(db, WorkEventTag) == 0
+    assert _count(db, WorkSubtask) == 0
+
+
+def test_migration_from_v10(tmp_path):
+    path = str(tmp_path / "test.db")
+    with Database(path).session_scope() as session:
+        session.execute(text("DROP TABLE work_events_archive"))
+        session.execute(text("DROP TABLE work_events"))
+        session.execute(text(
+            "CREATE TABLE work_events (id INTEGER NOT NULL PRIMARY KEY, title VARCHAR(200) NOT NULL, "
+            "start_date DATE NOT NULL, end_date DATE NOT NULL, note TEXT, color_index INTEGER NOT NULL, "
+            "is_completed BOOLEAN NOT NULL, completed_at DATETIME, created_at DATETIME NOT NULL)"
+        ))
+        session.execute(text(
+            "INSERT INTO work_events VALUES (7, '旧事件', '2026-01-01', '2026-01-02', '', 2, 0, NULL, "
+            "'2026-01-01 00:00:00')"
+        ))
+        session.execute(text("UPDATE schema_version SET version = 10"))
+
+    db = Database(path)
+    with db.session_scope() as session:
+        assert session.execute(text("SELECT version FROM schema_version")).scalar() == CURRENT_SCHEMA_VERSION
+        ddl = session.execute(text("SELECT sql FROM sqlite_master WHERE name = 'work_events'")).scalar()
+    assert "AUTOINCREMENT" in ddl
+    svc = WorkEventService(db, ColorAllocator())
+    assert svc.get_by_id(7).title == "旧事件"
+    assert svc.create("迁移", date(2026, 1, 1), date(2026, 1, 2)) == 8
+    svc.shutdown()
@@ -0,0 +1,86 @@
+"""Tests for set-based bulk operations on Work Events."""
+
+from datetime import date
+
+import pytest
+from sqlalchemy import event
+
+from daily_event.infra.color_allocator import ColorAllocator
+from daily_event.infra.database import Database
+from daily_event.services.work_event_service import BULK_CHUNK, WorkEventService
+from daily_event.services.work_series import occurrence_id
+
+
+@pytest.fixture
+def service(tmp_path):
+    svc = WorkEventService(Database(str(tmp_path / "test.db")), ColorAllocator())
+    yield svc
+    svc.shutdown()
+
+
+def _count_commits(service):
+    commits = []
+    event.listen(service._db._engine, "commit", lambda conn: commits.append(1))
+    return commits
+
+
+def test_bulk_complete_and_reopen_in_one_transaction(service):
+    ids = [service.create(f"e{i}", date(2026, 4, 1), date(2026, 4, 2)) for i in range(BULK_CHUNK + 20)]
+    service.get_for_month(2026, 4)
+    commits = _count_commits(service)
+    assert service.bulk_set_completed(ids + ids[:5], True) == len(ids)
+    assert len(commits) == 1
+    assert service.get_for_month(2026, 4) == []
+    assert {e.id for e in service.get_history()} == set(ids)
+    assert len({e.completed_at for e in service.get_history()}) == 1
+
+    assert service.bulk_set_completed(ids[:3], True) == 0
+    assert service.bulk_set_completed(ids[:3], False) == 3
+    assert sorted(e.id for e in service.get_for_month(2026, 4)) == ids[:3]
+    assert all(service.get_by_id(i).completed_at is None for i in ids[:3])
+
+
+def test_bulk_shift_and_delete_invalidate_touched_months(service):
+    a = service.create("a", date(2026, 1, 30), date(2026, 1, 31))
+    b = service.create("b", date(2026, 3, 10), date(2026, 3, 12))
+    c = service.create("c", date(2026, 5, 1), date(2026, 5, 1))
+    for m in range(1, 6):
+        service.get_for_month(2026, m)
+
+    assert service.bulk_shift([a, b], 3) == 2
+    assert [service.is_cached(2026, m) for m in range(1, 6)] == [False, False, False, True, True]
+    assert (service.get_by_id(a).start_date, service.get_by_id(a).end_date) == (date(2026, 2, 2), date(2026, 2, 3))
+    assert service.get_by_id(b).end_date == date(2026, 3, 15)
+    assert [e.id for e in service.get_for_month(2026, 2)] == [a]
+
+    assert service.bulk_shift([c], -1) == 1
+    assert service.get_by_id(c).start_date == date(2026, 4, 30)
+    assert service.bulk_shift([c], 0) == 0
+
+    service.get_for_month(2026, 2)
+    assert service.bulk_delete([b, c, 9999]) == 2
+    assert service.is_cached(2026, 2)
+    assert service.get_for_month(2026, 3) == [] and service.get_for_month(2026, 4) == []
+    assert [e.id for e in service.get_all()] == [a]
+
+
+def test_bulk_on_series_occurrences(service):
+    sid = service.create_series("站会", "daily", date(2026, 6, 1))
+    row = service.create("单次", date(2026, 6, 2), date(2026, 6, 2))
+    occ = [occurrence_id(sid, date(2026, 6, d)) for d in (3, 4, 5)]
+
+    assert service.bulk_set_completed([occ[0], row], True) == 2
+    assert service.bulk_delete([occ[1]]) == 1
+    assert service.bulk_shift([occ[2]], 10) == 1
+    june = service.get_for_month(2026, 6)
+    series_days = {e.start_date.day for e in june if e.id < 0}
+    assert {3, 4, 5}.isdisjoint(series_days) and len(series_days) == 27
+    moved = [e for e in june if e.id > 0]
+    assert [(e.title, e.start_date) for e in moved] == [("站会", date(2026, 6, 15))]
+
+    assert service.bulk_set_completed([occ[0]], False) == 1
+    assert 3 in {e.start_date.day for e in service.get_for_month(2026, 6) if e.id < 0}
+
+    service.delete_series(sid)
+    assert service.bulk_delete([occurrence_id(sid, date(2026, 6, 7))]) == 0
+    assert [e.id for e in service.get_for_month(2026, 6)] == [moved[0].id]
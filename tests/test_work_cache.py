@@ -0,0 +1,84 @@
+"""Tests for the WorkEventService month cache and prefetch."""
+
+from concurrent.futures import wait
+from datetime import date
+
+import pytest
+
+from daily_event.infra.color_allocator import ColorAllocator
+from daily_event.infra.database import Database
+from daily_event.services.work_event_service import WorkEventService
+
+
+@pytest.fixture
+def service(tmp_path):
+    svc = WorkEventService(Database(str(tmp_path / "test.db")), ColorAllocator(), cache_capacity=4)
+    yield svc
+    svc.shutdown()
+
+
+def _no_db(service, monkeypatch):
+    def fail():
+        raise AssertionError("database touched on a cache hit")
+
+    monkeypatch.setattr(service._db, "session_scope", fail)
+
+
+def test_month_date_and_id_served_from_cache(service, monkeypatch):
+    eid = service.create("评审", date(2026, 3, 30), date(2026, 4, 2))
+    assert [e.id for e in service.get_for_month(2026, 4)] == [eid]
+    _no_db(service, monkeypatch)
+    assert [e.id for e in service.get_for_month(2026, 4)] == [eid]
+    assert [e.id for e in service.get_for_date(date(2026, 4, 2))] == [eid]
+    assert service.get_for_date(date(2026, 4, 3)) == []
+    assert service.get_by_id(eid).title == "评审"
+    assert service.cache_misses == 1
+
+
+def test_writes_invalidate_only_touched_months(service):
+    for m in (1, 2, 3, 4):
+        service.get_for_month(2026, m)
+    eid = service.create("迁移", date(2026, 2, 27), date(2026, 3, 1))
+    assert [service.is_cached(2026, m) for m in (1, 2, 3, 4)] == [True, False, False, True]
+    service.get_for_month(2026, 2)
+    service.get_for_month(2026, 3)
+
+    service.update(eid, start_date=date(2026, 4, 5), end_date=date(2026, 4, 6))
+    assert [service.is_cached(2026, m) for m in (1, 2, 3, 4)] == [True, False, False, False]
+    assert [e.id for e in service.get_for_month(2026, 4)] == [eid]
+    assert service.get_for_month(2026, 2) == []
+
+    service.set_completed(eid, True)
+    assert service.get_for_month(2026, 4) == []
+    service.set_completed(eid, False)
+    assert [e.id for e in service.get_for_month(2026, 4)] == [eid]
+
+    service.delete(eid)
+    assert service.get_for_month(2026, 4) == []
+
+
+def test_lru_eviction(service):
+    for m in range(1, 6):
+        service.get_for_month(2026, m)
+    assert not service.is_cached(2026, 1)
+    service.get_for_month(2026, 2)  # touch, so 3 is now least recent
+    service.get_for_month(2026, 6)
+    assert service.is_cached(2026, 2) and not service.is_cached(2026, 3)
+
+
+def test_prefetch_adjacent_months(service, monkeypatch):
+    a = service.create("十二月", date(2025, 12, 10), date(2025, 12, 11))
+    b = service.create("二月", date(2026, 2, 1), date(2026, 2, 1))
+    wait(service.prefetch_adjacent(2026, 1))
+    assert service.is_cached(2025, 12) and service.is_cached(2026, 2)
+    _no_db(service, monkeypatch)
+    assert [e.id for e in service.get_for_month(2025, 12)] == [a]
+    assert [e.id for e in service.get_for_month(2026, 2)] == [b]
+
+
+def test_stale_prefetch_is_discarded(service):
+    version = service.data_version
+    service.create("并发写入", date(2026, 5, 3), date(2026, 5, 3))
+    service._store((2026, 5), [], version)  # a read that started before the write
+    assert not service.is_cached(2026, 5)
+    assert len(service.get_for_month(2026, 5)) == 1
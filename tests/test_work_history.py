@@ -0,0 +1,111 @@
+"""Tests for keyset-paginated Work Event history."""
+
+import random
+from datetime import date, datetime, timedelta
+
+import pytest
+from sqlalchemy import text
+
+from daily_event.domain.models import WorkEvent
+from daily_event.infra.color_allocator import ColorAllocator
+from daily_event.infra.database import Database
+from daily_event.services.work_event_service import WorkEventService
+
+
+@pytest.fixture
+def service(tmp_path):
+    svc = WorkEventService(Database(str(tmp_path / "test.db")), ColorAllocator())
+    yield svc
+    svc.shutdown()
+
+
+def _seed(service, n, seed=39):
+    rng = random.Random(seed)
+    base = datetime(2026, 1, 1, 9)
+    with service._db.session_scope() as session:
+        for i in range(n):
+            done = rng.random() < 0.8
+            # Duplicate timestamps exercise the id tie-break; None mimics pre-v3 rows.
+            at = base + timedelta(hours=rng.randrange(n // 4 + 1)) if rng.random() < 0.9 else None
+            session.add(
+                WorkEvent(
+                    title=f"任务 {i}" + (" 100%_done" if i % 17 == 0 else ""),
+                    start_date=date(2026, 1, 1),
+                    end_date=date(2026, 1, 2),
+                    note="周报" if i % 5 == 0 else "",
+                    is_completed=done,
+                    completed_at=at if done else None,
+                )
+            )
+
+
+def _all_pages(service, limit, **filters):
+    events, cursor, pages = [], None, 0
+    while True:
+        batch = service.get_history_page(limit=limit, cursor=cursor, **filters)
+        events.extend(batch.events)
+        pages += 1
+        if batch.next_cursor is None:
+            return events, pages
+        cursor = batch.next_cursor
+
+
+def _expected_order(events):
+    dated = sorted((e for e in events if e.completed_at), key=lambda e: (e.completed_at, e.id), reverse=True)
+    undated = sorted((e for e in events if not e.completed_at), key=lambda e: e.id, reverse=True)
+    return [e.id for e in dated + undated]
+
+
+@pytest.mark.parametrize("limit", [1, 7, 50, 1000])
+def test_pages_cover_history_once_in_order(service, limit):
+    _seed(service, 300)
+    events, pages = _all_pages(service, limit)
+    assert [e.id for e in events] == _expected_order(service.get_history())
+    assert pages == max(1, -(-len(events) // limit))
+
+
+def test_text_and_date_filters(service):
+    _seed(service, 300)
+    history = service.get_history()
+
+    events, _ = _all_pages(service, 9, text="100%_")
+    assert [e.id for e in events] == _expected_order([e for e in history if "100%_" in e.title])
+    events, _ = _all_pages(service, 9, text="周报")
+    assert [e.id for e in events] == _expected_order([e for e in history if e.note == "周报"])
+
+    since, until = date(2026, 1, 3), date(2026, 1, 5)
+    events, _ = _all_pages(service, 9, since=since, until=until)
+    assert [e.id for e in events] == _expected_order(
+        [e for e in history if e.completed_at and since <= e.completed_at.date() <= until]
+    )
+
+
+def test_cursor_survives_deletes_and_new_completions(service):
+    ids = [service.create(f"e{i}", date(2026, 1, 1), date(2026, 1, 1)) for i in range(6)]
+    for eid in ids:
+        service.set_completed(eid, True)
+    first = service.get_history_page(limit=3)
+    assert [e.id for e in first.events] == ids[::-1][:3]
+
+    service.delete(ids[1])
+    newer = service.create("new", date(2026, 1, 1), date(2026, 1, 1))
+    service.set_completed(newer, True)
+    rest = service.get_history_page(limit=3, cursor=first.next_cursor)
+    assert [e.id for e in rest.events] == [ids[2], ids[0]]
+    assert rest.next_cursor is None
+
+
+def test_history_index_and_migration(tmp_path):
+    path = str(tmp_path / "test.db")
+    with Database(path).session_scope() as session:
+        session.execute(text("DROP INDEX ix_work_events_history"))
+        session.execute(text("UPDATE schema_version SET version = 6"))
+    db = Database(path)
+    with db.session_scope() as session:
+        plan = session.execute(
+            text(
+                "EXPLAIN QUERY PLAN SELECT id FROM work_events WHERE is_completed = 1 "
+                "AND completed_at IS NOT NULL ORDER BY completed_at DESC, id DESC LIMIT 51"
+            )
+        ).all()
+    assert "ix_work_events_history" in " ".join(str(row[-1]) for row in plan)
@@ -0,0 +1,166 @@
+"""Tests for recurring Work Events (series expansion, exceptions, completion)."""
+
+import random
+from datetime import date, timedelta
+
+import pytest
+from sqlalchemy import text
+
+from daily_event.infra.color_allocator import ColorAllocator
+from daily_event.infra.database import CURRENT_SCHEMA_VERSION, Database
+from daily_event.services.recurrence import compile_rule
+from daily_event.services.work_event_service import WorkEventService
+from daily_event.services.work_series import (
+    SeriesEntry,
+    SeriesIndex,
+    is_occurrence_id,
+    occurrence_id,
+    split_occurrence_id,
+)
+
+
+@pytest.fixture
+def service(tmp_path):
+    svc = WorkEventService(Database(str(tmp_path / "test.db")), ColorAllocator())
+    yield svc
+    svc.shutdown()
+
+
+def test_occurrence_id_round_trip():
+    rng = random.Random(38)
+    for _ in range(200):
+        sid = rng.randrange(1, 1 << 30)
+        d = date.fromordinal(rng.randrange(1, date.max.toordinal() + 1))
+        oid = occurrence_id(sid, d)
+        assert is_occurrence_id(oid)
+        assert split_occurrence_id(oid) == (sid, d)
+    assert not is_occurrence_id(1)
+
+
+def test_expansion_matches_rule_and_overlaps_window():
+    rng = random.Random(7)
+    rules = ["daily", "weekly", "every_3_days", "weekdays:0,2,4", "monthly:31", "workday"]
+    for _ in range(30):
+        # Several series per index, so rule patterns are shared between them.
+        entries, expected = [], []
+        start = date(2026, 1, 1) + timedelta(days=rng.randrange(365))
+        end = start + timedelta(days=rng.randrange(42))
+        for sid in range(1, 8):
+            rule = rng.choice(rules)
+            anchor = date(2026, 1, 1) + timedelta(days=rng.randrange(200))
+            duration = rng.randrange(4)
+            until = anchor + timedelta(days=rng.randrange(20, 300)) if rng.random() < 0.5 else None
+            skipped = [start + timedelta(days=rng.randrange(-3, 42)) for _ in range(rng.randrange(3))]
+            entries.append(SeriesEntry(sid, f"t{sid}", "", rule, anchor, duration, until, sid, skipped))
+
+            compiled = compile_rule(rule, anchor)
+            first = start - timedelta(days=duration)
+            candidates = (first + timedelta(days=i) for i in range((end - first).days + 1))
+            expected += [
+                (d, sid, d + timedelta(days=duration))
+                for d in candidates
+                if d >= anchor
+                and (until is None or d <= until)
+                and d not in skipped
+                and compiled.is_due(d)
+            ]
+        batch = SeriesIndex(entries).expand(start, end)
+        got = batch.spans()
+        assert [(o.start_date, o.series_id, o.end_date) for o in got] == sorted(expected)
+        assert [o.id for o in got] == batch.ids() == [occurrence_id(o.series_id, o.start_date) for o in got]
+        assert all(o.title == f"t{o.series_id}" and o.color_index == o.series_id for o in got)
+
+
+def test_series_appears_in_month_and_respects_until(service):
+    sid = service.create_series("周会", "weekly", date(2026, 3, 2), until_date=date(2026, 3, 23))
+    march = service.get_for_month(2026, 3)
+    assert [o.start_date.day for o in march] == [2, 9, 16, 23]
+    assert all(o.series_id == sid for o in march)
+    assert service.get_for_month(2026, 4) == []
+    assert service.get_for_date(date(2026, 3, 9))[0].title == "周会"
+
+    with pytest.raises(ValueError):
+        service.create_series("坏规则", "every:0d", date(2026, 3, 2))
+
+
+def test_skip_complete_and_detach_occurrence(service):
+    service.create_series("日报", "daily", date(2026, 5, 1), duration_days=1)
+    eid = service.create("单次", date(2026, 5, 10), date(2026, 5, 10))
+    occ = {o.start_date: o for o in service.get_for_month(2026, 5) if o.id < 0}
+    assert len(occ) == 31 and service.get_by_id(eid).title == "单次"
+
+    service.delete(occ[date(2026, 5, 3)].id)
+    service.set_completed(occ[date(2026, 5, 4)].id, True)
+    starts = {o.start_date for o in service.get_for_month(2026, 5) if o.id < 0}
+    assert date(2026, 5, 3) not in starts and date(2026, 5, 4) not in starts
+    assert service.get_by_id(occ[date(2026, 5, 3)].id) is None
+    done = service.get_by_id(occ[date(2026, 5, 4)].id)
+    assert done.is_completed and done.completed_at is not None
+
+    service.set_completed(occ[date(2026, 5, 4)].id, False)
+    assert date(2026, 5, 4) in {o.start_date for o in service.get_for_month(2026, 5)}
+
+    service.update(occ[date(2026, 5, 6)].id, title="改期", start_date=date(2026, 5, 7), end_date=date(2026, 5, 7))
+    by_title = {}
+    for o in service.get_for_month(2026, 5):
+        by_title.setdefault(o.title, []).append(o)
+    assert [(o.start_date, o.id > 0) for o in by_title["改期"]] == [(date(2026, 5, 7), True)]
+    assert date(2026, 5, 6) not in {o.start_date for o in by_title["日报"]}
+
+    def fail(*args):
+        raise RuntimeError("disk full")
+
+    service._write_tags = fail  # the new event cannot be stored: the occurrence must stay
+    with pytest.raises(RuntimeError):
+        service.update(occ[date(2026, 5, 8)].id, title="改期", tags=["x"])
+    assert service.get_by_id(occ[date(2026, 5, 8)].id).title == "日报"
+    assert len(service.get_for_month(2026, 5)) == 31
+
+
+def test_occurrence_write_invalidates_the_month_it_ends_in(tmp_path):
+    db = Database(str(tmp_path / "test.db"))
+    first = WorkEventService(db, ColorAllocator())
+    sid = first.create_series("跨月", "monthly:31", date(2026, 1, 31), duration_days=2)
+    first.shutdown()
+
+    service = WorkEventService(db, ColorAllocator())  # series index not loaded yet
+    service.get_for_month(2026, 2)
+    assert service.is_cached(2026, 2)
+    service._series = None
+    service.delete(occurrence_id(sid, date(2026, 1, 31)))
+    assert not service.is_cached(2026, 2)
+    assert [o.start_date for o in service.get_for_month(2026, 2)] == [date(2026, 2, 28)]
+    service.shutdown()
+
+
+def test_series_writes_invalidate_cache(service):
+    for m in (4, 5, 6):
+        service.get_for_month(2026, m)
+    sid = service.create_series("月报", "monthly:1", date(2026, 1, 1))
+    assert not any(service.is_cached(2026, m) for m in (4, 5, 6))
+    for m in (4, 5, 6):
+        assert len(service.get_for_month(2026, m)) == 1
+
+    service.delete(occurrence_id(sid, date(2026, 5, 1)))
+    assert [service.is_cached(2026, m) for m in (4, 5, 6)] == [True, False, True]
+    assert service.get_for_month(2026, 5) == []
+
+    service.delete_series(sid)
+    assert service.get_for_month(2026, 4) == []
+    assert service.get_series(sid) is None
+
+
+def test_migration_from_v5(tmp_path):
+    path = str(tmp_path / "test.db")
+    with Database(path).session_scope() as session:
+        for table in ("work_occurrence_completions", "work_series_exceptions", "work_series"):
+            session.execute(text(f"DROP TABLE {table}"))
+        session.execute(text("UPDATE schema_version SET version = 5"))
+
+    db = Database(path)
+    with db.session_scope() as session:
+        assert session.execute(text("SELECT version FROM schema_version")).scalar() == CURRENT_SCHEMA_VERSION
+    svc = WorkEventService(db, ColorAllocator())
+    svc.create_series("周会", "weekly", date(2026, 3, 2))
+    assert len(svc.get_for_month(2026, 3)) == 5
+    svc.shutdown()
@@ -0,0 +1,105 @@
+"""Tests for Work Event subtasks and the grouped progress aggregate."""
+
+from datetime import date
+
+import pytest
+from sqlalchemy import event as sa_event
+from sqlalchemy import func, select, text
+from sqlalchemy.exc import InvalidRequestError
+
+from daily_event.domain.models import WorkEvent, WorkSubtask
+from daily_event.infra.color_allocator import ColorAllocator
+from daily_event.infra.database import CURRENT_SCHEMA_VERSION, Database
+from daily_event.services.work_event_service import SubtaskProgress, WorkEventService
+from daily_event.services.work_series import occurrence_id
+
+
+@pytest.fixture
+def service(tmp_path):
+    svc = WorkEventService(Database(str(tmp_path / "test.db")), ColorAllocator())
+    yield svc
+    svc.shutdown()
+
+
+def _count_statements(service):
+    statements = []
+    sa_event.listen(
+        service._db._engine, "before_cursor_execute", lambda *args: statements.append(args[2])
+    )
+    return statements
+
+
+def test_subtasks_round_trip_and_progress(service):
+    a = service.create(
+        "发布", date(2026, 5, 1), date(2026, 5, 3), subtasks=[("打包", True), ("  ", False), ("上线", False)]
+    )
+    b = service.create("无清单", date(2026, 5, 2), date(2026, 5, 2))
+    sid = service.create_series("晨会", "daily", date(2026, 5, 1))
+
+    assert [(t.title, t.is_done, t.position) for t in service.get_subtasks(a)] == [
+        ("打包", True, 0),
+        ("上线", False, 1),
+    ]
+    assert service.get_subtasks(occurrence_id(sid, date(2026, 5, 1))) == []
+    progress = service.get_progress([a, b, occurrence_id(sid, date(2026, 5, 1))])
+    assert progress == {a: SubtaskProgress(1, 2)}
+    assert progress[a].fraction == 0.5
+
+    month = service.get_month_progress(2026, 5)
+    assert service.get_month_progress(2026, 5) is month
+    service.update(a, subtasks=[("打包", True), ("上线", True), ("复盘", False)])
+    assert service.get_month_progress(2026, 5)[a] == SubtaskProgress(2, 3)
+    service.set_subtasks(b, [("写文档", True)])
+    assert service.get_month_progress(2026, 5)[b].fraction == 1.0
+
+
+def test_progress_for_500_events_is_one_query(service):
+    with service._db.session_scope() as session:
+        events = [
+            WorkEvent(title=f"任务 {i}", start_date=date(2026, 6, 1), end_date=date(2026, 6, 2))
+            for i in range(500)
+        ]
+        session.add_all(events)
+        session.flush()
+        session.add_all(
+            WorkSubtask(event_id=ev.id, title=f"步骤 {k}", is_done=k < i % 4, position=k)
+            for i, ev in enumerate(events)
+            for k in range(3)
+        )
+        ids = [ev.id for ev in events]
+
+    statements = _count_statements(service)
+    progress = service.get_progress(ids)
+    assert len([s for s in statements if "work_subtasks" in s]) == 1
+    assert len(progress) == 500
+    assert all(p.total == 3 and p.done == min(i % 4, 3) for i, p in enumerate(progress[eid] for eid in ids))
+
+    with service._db.session_scope() as session:
+        with pytest.raises(InvalidRequestError):
+            session.get(WorkEvent, ids[0]).subtasks  # never lazy-loaded
+
+
+def test_deleting_events_drops_subtasks(service):
+    ids = [
+        service.create(f"任务 {i}", date(2026, 6, 1), date(2026, 6, 1), subtasks=[("a", False)])
+        for i in range(3)
+    ]
+    service.delete(ids[0])
+    service.bulk_delete(ids[1:])
+    with service._db.session_scope() as session:
+        assert session.execute(select(func.count()).select_from(WorkSubtask)).scalar() == 0
+
+
+def test_migration_from_v9(tmp_path):
+    path = str(tmp_path / "test.db")
+    with Database(path).session_scope() as session:
+        session.execute(text("DROP TABLE work_subtasks"))
+        session.execute(text("UPDATE schema_version SET version = 9"))
+
+    db = Database(path)
+    with db.session_scope() as session:
+        assert session.execute(text("SELECT version FROM schema_version")).scalar() == CURRENT_SCHEMA_VERSION
+    svc = WorkEventService(db, ColorAllocator())
+    eid = svc.create("迁移", date(2026, 1, 1), date(2026, 1, 2), subtasks=[("检查", True)])
+    assert svc.get_progress([eid]) == {eid: SubtaskProgress(1, 1)}
+    svc.shutdown()
@@ -0,0 +1,118 @@
+"""Tests for Work Event tags and the bitmap tag filter index."""
+
+import random
+from datetime import date, timedelta
+from types import SimpleNamespace
+
+import pytest
+from sqlalchemy import func, select, text
+
+from daily_event.domain.models import WorkEventTag
+from daily_event.infra.color_allocator import ColorAllocator
+from daily_event.infra.database import CURRENT_SCHEMA_VERSION, Database
+from daily_event.services.calendar_service import CalendarService
+from daily_event.services.tag_index import TagIndex, parse_tags
+from daily_event.services.work_event_service import WorkEventService
+
+TAGS = ["客户A", "客户B", "内部", "紧急", "评审"]
+
+
+@pytest.fixture
+def service(tmp_path):
+    svc = WorkEventService(Database(str(tmp_path / "test.db")), ColorAllocator())
+    yield svc
+    svc.shutdown()
+
+
+def test_parse_tags():
+    assert parse_tags(" 客户A，紧急、#内部  客户A;") == ["客户A", "紧急", "内部"]
+    assert parse_tags("  ") == []
+
+
+def test_index_matches_brute_force():
+    rng = random.Random(43)
+    for _ in range(30):
+        n = rng.randrange(0, 300)
+        items = [SimpleNamespace(id=i + 1) for i in range(n)]
+        tags = {item.id: rng.sample(TAGS, rng.randrange(4)) for item in items}
+        index = TagIndex(items, tags)
+        for tag in TAGS:
+            assert index.count(tag) == sum(tag in t for t in tags.values())
+        for _ in range(10):
+            wanted = rng.sample(TAGS, rng.randrange(4))
+            every = [it for it in items if all(t in tags[it.id] for t in wanted)]
+            some = [it for it in items if not wanted or any(t in tags[it.id] for t in wanted)]
+            assert index.filter(wanted) == every
+            assert index.filter(wanted, match_all=False) == some
+
+
+def test_tags_round_trip_and_month_index(service):
+    a = service.create("方案", date(2026, 4, 1), date(2026, 4, 3), tags=["客户A", "紧急"])
+    b = service.create("周会", date(2026, 4, 2), date(2026, 4, 2), tags=["内部"])
+    c = service.create("无标签", date(2026, 4, 5), date(2026, 4, 9))
+    service.create_series("日报", "daily", date(2026, 4, 1), until_date=date(2026, 4, 3))
+
+    assert service.get_tags(a) == ["客户A", "紧急"]
+    assert service.get_all_tags() == sorted(["客户A", "紧急", "内部"])
+
+    index = service.get_tag_index(2026, 4)
+    assert service.get_tag_index(2026, 4) is index
+    assert len(index) == 6 and index.tags_of(a) == ("客户A", "紧急")
+    assert [ev.id for ev in index.filter(["紧急"])] == [a]
+    assert {ev.id for ev in index.filter(["紧急", "内部"], match_all=False)} == {a, b}
+    assert len(index.filter([])) == 6
+
+    service.update(c, title="改名", tags=["紧急"])
+    index = service.get_tag_index(2026, 4)
+    assert {ev.id for ev in index.filter(["紧急"])} == {a, c}
+    assert service.get_by_id(c).title == "改名"
+    service.set_tags(a, [])
+    assert [ev.id for ev in service.get_tag_index(2026, 4).filter(["紧急"])] == [c]
+
+
+def test_deleting_events_drops_tag_links(service):
+    ids = [service.create(f"任务 {i}", date(2026, 4, 1), date(2026, 4, 1), tags=["客户B"]) for i in range(3)]
+    service.delete(ids[0])
+    service.bulk_delete(ids[1:])
+    with service._db.session_scope() as session:
+        assert session.execute(select(func.count()).select_from(WorkEventTag)).scalar() == 0
+    assert service.get_all_tags() == []
+
+
+def test_filter_segments_repacks_without_overlap():
+    rng = random.Random(7)
+    grid = date(2026, 3, 1)
+    events = []
+    for i in range(200):
+        start = grid + timedelta(days=rng.randrange(40))
+        events.append(SimpleNamespace(
+            id=i + 1, start_date=start, end_date=start + timedelta(days=rng.randrange(8)),
+            title=f"t{i}", color_index=i % 12,
+        ))
+    full = CalendarService().layout(grid, events, 1, ColorAllocator().get_color)
+    before = [(s.event_id, s.slot) for s in full]
+    keep = {ev.id for ev in events if rng.random() < 0.3}
+    shown = CalendarService.filter_segments(full, keep)
+
+    assert {s.event_id for s in shown} == keep
+    assert [(s.event_id, s.slot) for s in full] == before  # cached layout untouched
+    for a in shown:
+        for b in shown:
+            if a is not b and a.row == b.row and a.start_col <= b.end_col and b.start_col <= a.end_col:
+                assert a.slot != b.slot
+
+
+def test_migration_from_v8(tmp_path):
+    path = str(tmp_path / "test.db")
+    with Database(path).session_scope() as session:
+        session.execute(text("DROP TABLE work_event_tags"))
+        session.execute(text("DROP TABLE tags"))
+        session.execute(text("UPDATE schema_version SET version = 8"))
+
+    db = Database(path)
+    with db.session_scope() as session:
+        assert session.execute(text("SELECT version FROM schema_version")).scalar() == CURRENT_SCHEMA_VERSION
+    svc = WorkEventService(db, ColorAllocator())
+    eid = svc.create("迁移", date(2026, 1, 1), date(2026, 1, 2), tags=["内部"])
+    assert svc.get_tags(eid) == ["内部"]
+    svc.shutdown()
@@ -0,0 +1,92 @@
+"""Tests for sweep-line workload / overlap detection."""
+
+import random
+from datetime import date, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+from daily_event.services.calendar_service import GRID_DAYS, CalendarService, np
+
+GRID = date(2026, 2, 22)  # Sunday
+
+
+def _brute(ranges, first, days, threshold):
+    counts = [sum(1 for s, e, _ in ranges if s <= first + timedelta(days=i) <= e) for i in range(days)]
+    over = [c > threshold for c in counts]
+    runs, i = [], 0
+    while i < days:
+        if over[i]:
+            j = i
+            while j + 1 < days and over[j + 1]:
+                j += 1
+            runs.append((i, j))
+            i = j + 1
+        else:
+            i += 1
+    conflicts = []
+    for a, b in runs:
+        lo, hi = first + timedelta(days=a), first + timedelta(days=b)
+        ids = [eid for s, e, eid in ranges if s <= hi and e >= lo]
+        conflicts.append((lo, hi, max(counts[a:b + 1]), ids))
+    return counts, conflicts
+
+
+def _random_ranges(rng, n):
+    ranges = []
+    for eid in range(1, n + 1):
+        s = GRID + timedelta(days=rng.randrange(-10, GRID_DAYS + 5))
+        ranges.append((s, s + timedelta(days=rng.randrange(0, 12)), eid))
+    return ranges
+
+
+@pytest.mark.parametrize("use_numpy", [False, True])
+def test_matches_brute_force(use_numpy):
+    if use_numpy and np is None:
+        pytest.skip("NumPy not installed")
+    rng = random.Random(41)
+    for _ in range(200):
+        ranges = _random_ranges(rng, rng.randrange(0, 40))
+        threshold = rng.randrange(1, 6)
+        wl = CalendarService.workload(
+            [s.toordinal() for s, _, _ in ranges],
+            [e.toordinal() for _, e, _ in ranges],
+            [eid for _, _, eid in ranges],
+            GRID,
+            GRID_DAYS,
+            threshold,
+            use_numpy=use_numpy,
+        )
+        counts, conflicts = _brute(ranges, GRID, GRID_DAYS, threshold)
+        assert wl.counts == counts
+        assert [(c.start, c.end, c.peak, c.event_ids) for c in wl.conflicts] == conflicts
+
+
+def test_threshold_edges_and_disabled():
+    ranges = [(GRID, GRID + timedelta(days=GRID_DAYS - 1), eid) for eid in (1, 2, 3)]
+    starts = [s.toordinal() for s, _, _ in ranges]
+    ends = [e.toordinal() for _, e, _ in ranges]
+    args = (starts, ends, [1, 2, 3], GRID, GRID_DAYS)
+    assert CalendarService.workload(*args, 3).conflicts == []
+    whole = CalendarService.workload(*args, 2).conflicts
+    assert [(c.start, c.end, c.event_ids) for c in whole] == [(GRID, GRID + timedelta(days=41), [1, 2, 3])]
+    disabled = CalendarService.workload(*args, 0)
+    assert disabled.conflicts == [] and disabled.count_on(GRID) == 3
+    assert disabled.count_on(GRID - timedelta(days=1)) == 0
+
+
+def test_workload_cached_with_layout():
+    svc = CalendarService()
+    events = [
+        SimpleNamespace(id=i, start_date=date(2026, 3, 2), end_date=date(2026, 3, 4), color_index=0, title=str(i))
+        for i in (1, 2, 3)
+    ]
+    assert svc.cached_workload(GRID, 2) is None
+    svc.layout(GRID, events, 1, lambda _: "#000")
+    first = svc.cached_workload(GRID, 2)
+    assert [c.event_ids for c in first.conflicts] == [[1, 2, 3]]
+    assert svc.cached_workload(GRID, 2) is first
+
+    svc.layout(GRID, events[:2], 2, lambda _: "#000")
+    assert svc.cached_workload(GRID, 2).conflicts == []
+    assert svc.cached_workload(GRID, 1).conflicts[0].event_ids == [1, 2]
@@ -0,0 +1,67 @@
+"""Tests for the year-overview data path: range query, density and completion totals."""
+
+import random
+from datetime import date, timedelta
+
+import pytest
+
+from daily_event.infra.color_allocator import ColorAllocator
+from daily_event.infra.database import Database
+from daily_event.services.calendar_service import CalendarService
+from daily_event.services.daily_event_service import DailyEventService
+from daily_event.services.work_event_service import WorkEventService
+
+FIRST = date(2026, 1, 1)
+DAYS = 365
+
+
+@pytest.mark.parametrize("use_numpy", [False, True], ids=["python", "numpy"])
+def test_density_matches_naive_count(use_numpy):
+    if use_numpy:
+        pytest.importorskip("numpy")
+    rng = random.Random(5)
+    starts, ends = [], []
+    for _ in range(300):
+        s = FIRST + timedelta(days=rng.randrange(-40, DAYS + 20))
+        starts.append(s)
+        ends.append(s + timedelta(days=rng.randrange(-2, 60)))
+    got = CalendarService.day_density(
+        [d.toordinal() for d in starts], [d.toordinal() for d in ends], FIRST, DAYS, use_numpy=use_numpy
+    )
+    expected = [
+        sum(1 for s, e in zip(starts, ends) if s <= FIRST + timedelta(days=k) <= e) for k in range(DAYS)
+    ]
+    assert got == expected
+
+
+def test_range_query_and_completion_totals(tmp_path):
+    db = Database(str(tmp_path / "test.db"))
+    work = WorkEventService(db, ColorAllocator())
+    daily = DailyEventService(db)
+    inside = work.create("跨年", date(2025, 12, 30), date(2026, 1, 2))
+    work.create("明年", date(2027, 1, 1), date(2027, 1, 1))
+    done = work.create("已完成", date(2026, 6, 1), date(2026, 6, 1))
+    work.set_completed(done, True)
+    assert [e.id for e in work.get_for_range(FIRST, date(2026, 12, 31))] == [inside]
+
+    a, b = daily.create("A"), daily.create("B")
+    daily.complete_today(a, date(2026, 3, 1))
+    daily.complete_today(b, date(2026, 3, 1))
+    daily.complete_today(b, date(2025, 12, 31))
+    totals = daily.get_completion_totals(FIRST, date(2026, 12, 31))
+    assert len(totals) == DAYS and sum(totals) == 2
+    assert totals[(date(2026, 3, 1) - FIRST).days] == 2
+
+
+def test_range_includes_series_occurrences(tmp_path):
+    work = WorkEventService(Database(str(tmp_path / "test.db")), ColorAllocator())
+    work.create_series("月报", "monthly:15", date(2025, 11, 15), duration_days=1)
+    events = work.get_for_range(FIRST, date(2026, 12, 31))
+    starts = [ev.start_date.toordinal() for ev in events]
+    density = CalendarService.day_density(starts, [ev.end_date.toordinal() for ev in events], FIRST, DAYS)
+    for month in range(1, 13):
+        k = (date(2026, month, 15) - FIRST).days
+        assert density[k - 1 : k + 3] == [0, 1, 1, 0]
+        in_month = [ev.id for ev in events if ev.start_date.month == month]
+        assert in_month == [ev.id for ev in work.get_for_month(2026, month)]
+    work.shutdown()